@@ -0,0 +1,8 @@
+"""
+Package benchmarks
+------------------
+Mesures de performance des algorithmes du cœur (hors tests unitaires).
+
+Chaque module se lance indépendamment, par exemple :
+    python -m benchmarks.bench_bfs_direction --nodes 100000
+"""
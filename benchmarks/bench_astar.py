@@ -0,0 +1,66 @@
+"""
+Benchmark : A* (heuristique de coordonnées) contre Dijkstra sur des
+requêtes point à point dans un graphe de type routier.
+
+Pour chaque requête, on compte les nœuds développés par les deux
+algorithmes (Dijkstra = A* avec une heuristique nulle) et on mesure le
+temps moyen. Les poids des chemins trouvés sont vérifiés égaux.
+
+Usage:
+    python -m benchmarks.bench_astar                  # ~250k nœuds
+    python -m benchmarks.bench_astar --nodes 50000 --queries 50
+"""
+
+import argparse
+import random
+import time
+
+from src.app.core import a_star_path, coordinate_heuristic, path_weight
+
+from .generators import node_name, road_graph
+
+
+def run(nodes: int, queries: int) -> None:
+    """Compare A* et Dijkstra sur des paires de nœuds aléatoires."""
+    print("Construction du graphe...")
+    graph = road_graph(nodes)
+    n = len(graph)
+    print(f"routier : {n} nœuds, {len(graph.edges())} arêtes")
+    
+    begin = time.perf_counter()
+    coordinate_heuristic(graph)
+    print(f"  calibrage de l'heuristique  {(time.perf_counter() - begin) * 1e3:8.1f} ms (une fois)")
+    
+    rng = random.Random(0)
+    pairs = [(node_name(rng.randrange(n)), node_name(rng.randrange(n))) for _ in range(queries)]
+    results = {}
+    for label, heuristic in [("dijkstra", lambda node, goal: 0), ("a*", None)]:
+        expanded = 0
+        weights = []
+        begin = time.perf_counter()
+        for a, b in pairs:
+            stats = {}
+            weights.append(path_weight(graph, a_star_path(graph, a, b, heuristic, stats)))
+            expanded += stats["expanded"]
+        elapsed = (time.perf_counter() - begin) / queries
+        results[label] = (expanded / queries, elapsed, weights)
+        print(f"  {label:<9} {expanded / queries:10.0f} nœuds développés/requête"
+              f"  {elapsed * 1e3:8.1f} ms/requête")
+    
+    (e_dij, t_dij, w_dij), (e_ast, t_ast, w_ast) = results["dijkstra"], results["a*"]
+    assert all(abs(x - y) < 1e-6 for x, y in zip(w_dij, w_ast)), "poids différents"
+    print(f"  gain A* : ×{e_dij / max(e_ast, 1):.1f} en nœuds développés, "
+          f"×{t_dij / t_ast:.1f} en temps")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--nodes", type=int, default=250_000, help="Nombre de nœuds visé")
+    parser.add_argument("--queries", type=int, default=20, help="Nombre de requêtes")
+    args = parser.parse_args()
+    run(args.nodes, args.queries)
+
+
+if __name__ == "__main__":
+    main()
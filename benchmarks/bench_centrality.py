@@ -0,0 +1,70 @@
+"""
+Benchmark : centralité d'intermédiarité exacte vs échantillonnée.
+
+Pour un graphe routier et un graphe social, mesure :
+    - le calcul exact (toutes les sources), en un seul processus puis
+      réparti sur --workers processus ;
+    - l'approximation par échantillonnage de k sources, pour chaque k :
+      temps, recouvrement du top 10 avec le calcul exact et erreur
+      moyenne rapportée au score maximal.
+
+Usage:
+    python -m benchmarks.bench_centrality
+    python -m benchmarks.bench_centrality --nodes 5000 --samples 32 128 512 --workers 8
+"""
+
+import argparse
+import os
+
+from src.app.core import betweenness_centrality
+
+from .generators import power_law_graph, road_graph, timed
+
+
+TOP = 10
+
+
+def top(scores: dict[str, float]) -> set[str]:
+    """Les TOP nœuds de plus forte centralité."""
+    return set(sorted(scores, key=scores.get, reverse=True)[:TOP])
+
+
+def run(nodes: int, samples: list[int], workers: int) -> None:
+    """Lance le benchmark sur un graphe routier et un graphe social."""
+    cases = [
+        ("routier", road_graph(nodes)),
+        ("power-law m=4", power_law_graph(nodes, m=4)),
+    ]
+    for label, graph in cases:
+        print(f"{label} : {len(graph)} nœuds, {len(graph.edges())} arêtes")
+        t_exact, exact = timed(betweenness_centrality, graph, repeat=1)
+        print(f"  exact, 1 processus      {t_exact:8.2f}s")
+        if workers > 1:
+            t_parallel, _ = timed(betweenness_centrality, graph, workers=workers, repeat=1)
+            print(f"  exact, {workers:2d} processus     {t_parallel:8.2f}s "
+                  f"(accélération ×{t_exact / t_parallel:.1f})")
+        reference = top(exact)
+        peak = max(exact.values()) or 1.0
+        for k in samples:
+            t_sampled, estimate = timed(betweenness_centrality, graph, samples=k, workers=workers,
+                                        repeat=1)
+            error = sum(abs(estimate[v] - exact[v]) for v in exact) / len(exact) / peak
+            overlap = len(top(estimate) & reference)
+            print(f"  k = {k:5d} sources       {t_sampled:8.2f}s (×{t_exact / t_sampled:5.1f}), "
+                  f"top {TOP} : {overlap}/{TOP}, erreur moyenne {error:.2%}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--nodes", type=int, default=3000, help="Nombre de nœuds")
+    parser.add_argument("--samples", type=int, nargs="+", default=[16, 64, 256],
+                        help="Nombres de sources échantillonnées")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="Nombre de processus")
+    args = parser.parse_args()
+    run(args.nodes, args.samples, args.workers)
+
+
+if __name__ == "__main__":
+    main()
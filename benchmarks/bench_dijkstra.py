@@ -0,0 +1,66 @@
+"""
+Benchmark : Dijkstra (heapq, suppression paresseuse) sur grandes grilles
+pondérées et graphes de type routier.
+
+Mesure, pour chaque graphe :
+    - dijkstra_distances depuis un nœud (exploration complète) ;
+    - dijkstra_path moyen sur des paires aléatoires (arrêt anticipé) ;
+    - bfs_path sur les mêmes paires, pour situer le surcoût des poids.
+
+Usage:
+    python -m benchmarks.bench_dijkstra                 # ~1M arêtes
+    python -m benchmarks.bench_dijkstra --edges 200000 --queries 5
+"""
+
+import argparse
+import random
+import time
+
+from src.app.core import bfs_path, dijkstra_distances, dijkstra_path
+
+from .generators import node_name, road_graph, timed, weighted_grid_graph
+
+
+def run(edges: int, queries: int) -> None:
+    """Lance le benchmark sur une grille pondérée et un graphe routier."""
+    side = int((edges / 2) ** 0.5)
+    print("Construction des graphes...")
+    cases = [
+        (f"grille {side}x{side}", weighted_grid_graph(side, side)),
+        ("routier", road_graph(int(edges / 2.1))),
+    ]
+    rng = random.Random(0)
+    for label, graph in cases:
+        n = len(graph)
+        m = len(graph.edges())
+        pairs = [(node_name(rng.randrange(n)), node_name(rng.randrange(n))) for _ in range(queries)]
+        t_all, distances = timed(dijkstra_distances, graph, node_name(0), repeat=1)
+        
+        begin = time.perf_counter()
+        for a, b in pairs:
+            dijkstra_path(graph, a, b)
+        t_path = (time.perf_counter() - begin) / queries
+        
+        begin = time.perf_counter()
+        for a, b in pairs:
+            bfs_path(graph, a, b)
+        t_bfs = (time.perf_counter() - begin) / queries
+        
+        print(f"{label} : {n} nœuds, {m} arêtes")
+        print(f"  dijkstra_distances  {t_all:8.2f}s ({len(distances)} nœuds, "
+              f"{m / t_all / 1e6:.2f} M arêtes/s)")
+        print(f"  dijkstra_path       {t_path * 1e3:8.1f} ms/requête")
+        print(f"  bfs_path            {t_bfs * 1e3:8.1f} ms/requête (non pondéré)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--edges", type=int, default=1_000_000, help="Nombre d'arêtes visé")
+    parser.add_argument("--queries", type=int, default=10, help="Nombre de requêtes point à point")
+    args = parser.parse_args()
+    run(args.edges, args.queries)
+
+
+if __name__ == "__main__":
+    main()
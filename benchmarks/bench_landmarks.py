@@ -0,0 +1,82 @@
+"""
+Benchmark : oracle de distances par repères vs bfs_path.
+
+Mesure le coût du prétraitement (et de la relecture de l'index sur
+disque), la mémoire des tables, puis le temps moyen par requête pour :
+    - les bornes seules (sans parcours) ;
+    - la distance exacte ALT (avec le nombre moyen de nœuds étendus) ;
+    - bfs_path() en référence.
+
+Usage:
+    python -m benchmarks.bench_landmarks
+    python -m benchmarks.bench_landmarks --nodes 200000 --landmarks 16
+"""
+
+import argparse
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from src.app.core import DistanceOracle, LandmarkIndex, bfs_path
+
+from .generators import grid_graph, node_name, power_law_graph, timed
+
+
+def run(nodes: int, landmarks: int, queries: int) -> None:
+    """Lance le benchmark sur un graphe routier (grille) et un graphe social."""
+    side = int(nodes ** 0.5)
+    cases = [
+        (f"grille {side}x{side}", grid_graph(side, side)),
+        ("power-law m=4", power_law_graph(nodes, m=4)),
+    ]
+    rng = random.Random(0)
+    for label, graph in cases:
+        n = len(graph)
+        pairs = [(node_name(rng.randrange(n)), node_name(rng.randrange(n))) for _ in range(queries)]
+        oracle = DistanceOracle(graph, landmarks)
+        begin = time.perf_counter()
+        index = oracle.index
+        t_build = time.perf_counter() - begin
+        with tempfile.TemporaryDirectory() as tmp:
+            index_file = Path(tmp) / "graph.landmarks"
+            index.save(index_file)
+            t_load, _ = timed(LandmarkIndex.load, index_file, graph, repeat=1)
+
+        begin = time.perf_counter()
+        for a, b in pairs:
+            oracle.bounds(a, b)
+        t_bounds = (time.perf_counter() - begin) / queries
+
+        expanded = 0
+        begin = time.perf_counter()
+        for a, b in pairs:
+            oracle.shortest_path(a, b)
+            expanded += oracle.last_expanded
+        t_alt = (time.perf_counter() - begin) / queries
+
+        begin = time.perf_counter()
+        for a, b in pairs:
+            bfs_path(graph, a, b)
+        t_bfs = (time.perf_counter() - begin) / queries
+
+        print(f"{label} : {n} nœuds, {landmarks} repères")
+        print(f"  prétraitement {t_build:.2f}s, relecture {t_load:.2f}s, "
+              f"tables {index.memory_bytes() / 1024:.0f} Kio")
+        print(f"  bornes     {t_bounds * 1e6:9.1f} µs/requête")
+        print(f"  ALT exact  {t_alt * 1e3:9.2f} ms/requête ({expanded / queries:.0f} nœuds étendus)")
+        print(f"  bfs_path   {t_bfs * 1e3:9.2f} ms/requête")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--nodes", type=int, default=40_000, help="Nombre de nœuds")
+    parser.add_argument("--landmarks", type=int, default=8, help="Nombre de repères")
+    parser.add_argument("--queries", type=int, default=50, help="Nombre de requêtes")
+    args = parser.parse_args()
+    run(args.nodes, args.landmarks, args.queries)
+
+
+if __name__ == "__main__":
+    main()
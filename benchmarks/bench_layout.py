@@ -0,0 +1,85 @@
+"""
+Benchmark : disposition par forces (Barnes-Hut) vs disposition circulaire.
+
+Pour des graphes routiers de chaque taille (noms des nœuds mélangés :
+sinon l'ordre alphabétique suit les rangées de la grille et avantage la
+disposition circulaire), mesure :
+    - le temps d'une itération, en pur Python (jusqu'à --python-max
+      nœuds) et avec NumPy ;
+    - la qualité de la disposition après --iterations itérations :
+      longueur moyenne des arêtes rapportée à la distance moyenne entre
+      deux nœuds tirés au hasard (plus c'est petit, plus les voisins
+      sont proches les uns des autres), comparée à celle de auto_layout.
+
+Usage:
+    python -m benchmarks.bench_layout
+    python -m benchmarks.bench_layout --sizes 1000 10000 100000 --iterations 30
+"""
+
+import argparse
+import math
+import random
+
+from src.app.core import Graph
+from src.app.ui import layout
+from src.app.ui.render import auto_layout
+
+from .generators import road_graph, timed
+
+
+def shuffled(graph: Graph, seed: int = 0) -> Graph:
+    """Copie du graphe dont les nœuds sont renommés dans un ordre aléatoire."""
+    names = graph.nodes()
+    renamed = names[:]
+    random.Random(seed).shuffle(renamed)
+    mapping = dict(zip(names, renamed))
+    copy = Graph()
+    for name in renamed:
+        copy.add_node(name)
+    for a, b in graph.edges():
+        copy.add_edge(mapping[a], mapping[b])
+    return copy
+
+
+def edge_ratio(graph, positions: dict[str, tuple[float, float]], samples: int = 2000) -> float:
+    """Longueur moyenne des arêtes / distance moyenne entre deux nœuds au hasard."""
+    edges = graph.edges()
+    mean_edge = sum(math.dist(positions[a], positions[b]) for a, b in edges) / len(edges)
+    rng = random.Random(0)
+    nodes = graph.nodes()
+    mean_pair = sum(math.dist(positions[rng.choice(nodes)], positions[rng.choice(nodes)])
+                    for _ in range(samples)) / samples
+    return mean_edge / mean_pair
+
+
+def run(sizes: list[int], iterations: int, python_max: int) -> None:
+    """Lance le benchmark pour chaque taille."""
+    print(f"{'nœuds':>8} {'python/it':>10} {'numpy/it':>10} {'total':>8}  {'cercle':>7} {'forces':>7}")
+    for n in sizes:
+        graph = shuffled(road_graph(n))
+        per_iteration = []
+        for vectorized, enabled in ((False, n <= python_max), (True, layout.HAS_NUMPY)):
+            if enabled:
+                elapsed, _ = timed(layout.force_layout, graph, iterations=1, vectorized=vectorized, repeat=1)
+                per_iteration.append(f"{elapsed:>9.3f}s")
+            else:
+                per_iteration.append(f"{'-':>10}")
+        t_total, positions = timed(layout.force_layout, graph, iterations=iterations, repeat=1)
+        print(f"{n:>8} {per_iteration[0]} {per_iteration[1]} {t_total:>7.1f}s  "
+              f"{edge_ratio(graph, auto_layout(graph)):>7.3f} {edge_ratio(graph, positions):>7.3f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10_000, 100_000],
+                        help="Nombres de nœuds")
+    parser.add_argument("--iterations", type=int, default=30, help="Itérations de la disposition")
+    parser.add_argument("--python-max", type=int, default=10_000,
+                        help="Taille maximale mesurée en pur Python")
+    args = parser.parse_args()
+    run(args.sizes, args.iterations, args.python_max)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Benchmark : index d'atteignabilité (bitset / intervalles) vs parcours.
+
+Pour des graphes de dépendances de tailles croissantes, mesure pour
+chaque méthode d'étiquetage :
+    - le temps de construction et la mémoire des étiquettes ;
+    - le temps moyen de can_reach() sur des paires aléatoires ;
+    - le temps moyen d'énumération de reachable_from() ;
+et, en référence, le parcours complet algorithms.reachable_from().
+
+La fermeture transitive (bitset) répond en O(1) mais sa mémoire croît
+comme le carré du nombre de composantes : au-delà de --bitset-max
+composantes, elle n'est pas mesurée.
+
+Usage:
+    python -m benchmarks.bench_reachability
+    python -m benchmarks.bench_reachability --sizes 10000 100000 1000000 --queries 500
+"""
+
+import argparse
+import random
+import time
+
+from src.app.core import reachable_from
+from src.app.core.reachability import ReachabilityIndex
+
+from .generators import dependency_graph, node_name, timed
+
+
+def measure(method: str, t_build: float, index: ReachabilityIndex,
+            pairs: list[tuple[str, str]], sources: list[str]) -> None:
+    """Affiche construction, mémoire et temps de requête d'un index."""
+    begin = time.perf_counter()
+    positive = sum(index.can_reach(a, b) for a, b in pairs)
+    t_query = (time.perf_counter() - begin) / len(pairs)
+
+    begin = time.perf_counter()
+    for a in sources:
+        index.reachable_from(a)
+    t_enum = (time.perf_counter() - begin) / len(sources)
+
+    print(f"  {method:<9} construction {t_build:6.2f}s, étiquettes "
+          f"{index.memory_bytes() / 1024:9.0f} Kio")
+    print(f"            can_reach      {t_query * 1e6:10.1f} µs/requête "
+          f"({positive / len(pairs):.0%} positives)")
+    print(f"            reachable_from {t_enum * 1e3:10.2f} ms/requête")
+
+
+def run(sizes: list[int], queries: int, bitset_max: int) -> None:
+    """Lance le benchmark pour chaque taille de graphe."""
+    rng = random.Random(0)
+    for n in sizes:
+        graph = dependency_graph(n)
+        pairs = [(node_name(rng.randrange(n)), node_name(rng.randrange(n))) for _ in range(queries)]
+        sources = [a for a, _ in pairs[:max(1, queries // 20)]]
+
+        begin = time.perf_counter()
+        for a in sources:
+            reachable_from(graph, a)
+        t_traversal = (time.perf_counter() - begin) / len(sources)
+
+        t_build, index = timed(ReachabilityIndex, graph, method="intervals", repeat=1)
+        components = index.component_count()
+        print(f"dépendances : {n} nœuds, {len(graph.edges())} arcs, {components} composantes")
+        print(f"  parcours reachable_from        {t_traversal * 1e3:10.2f} ms/requête")
+        measure("intervals", t_build, index, pairs, sources)
+        if components > bitset_max:
+            print(f"  bitset    ignoré ({components} composantes > {bitset_max})")
+            continue
+        t_build, index = timed(ReachabilityIndex, graph, method="bitset", repeat=1)
+        measure("bitset", t_build, index, pairs, sources)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 300_000],
+                        help="Tailles de graphes (nœuds)")
+    parser.add_argument("--queries", type=int, default=1000, help="Nombre de requêtes can_reach")
+    parser.add_argument("--bitset-max", type=int, default=50_000,
+                        help="Nombre maximal de composantes pour la fermeture transitive")
+    args = parser.parse_args()
+    run(args.sizes, args.queries, args.bitset_max)
+
+
+if __name__ == "__main__":
+    main()
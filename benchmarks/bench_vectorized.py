@@ -0,0 +1,68 @@
+"""
+Benchmark : moteur vectorisé NumPy vs chemin pur Python.
+
+Pour chaque graphe, mesure le coût de l'instantané CSR (payé une fois par
+version du graphe) puis celui de bfs, reachable_from et connected_components
+sur chacun des deux chemins, et vérifie que les résultats sont identiques.
+
+Usage:
+    python -m benchmarks.bench_vectorized
+    python -m benchmarks.bench_vectorized --nodes 500000 --repeat 1
+"""
+
+import argparse
+import sys
+
+from src.app.core import algorithms, vectorized
+
+from .generators import grid_graph, node_name, power_law_graph, random_graph, timed
+
+
+def pure_python(function, *args):
+    """Appelle function en désactivant la délégation au moteur vectorisé."""
+    threshold = vectorized.VECTORIZE_THRESHOLD
+    vectorized.VECTORIZE_THRESHOLD = float("inf")
+    try:
+        return function(*args)
+    finally:
+        vectorized.VECTORIZE_THRESHOLD = threshold
+
+
+def run(nodes: int, repeat: int) -> None:
+    """Lance le benchmark sur trois familles de graphes."""
+    side = int(nodes ** 0.5)
+    cases = [
+        ("power-law m=8", power_law_graph(nodes, m=8)),
+        ("aléatoire d=3", random_graph(nodes, 3)),
+        (f"grille {side}x{side}", grid_graph(side, side)),
+    ]
+    operations = [
+        ("bfs", algorithms.bfs, vectorized.bfs, (node_name(0),)),
+        ("reachable_from", algorithms.reachable_from, vectorized.reachable_from, (node_name(0),)),
+        ("components", algorithms.connected_components, vectorized.connected_components, ()),
+    ]
+    print(f"{'graphe':<20} {'opération':<16} {'python':>9} {'numpy':>9} {'gain':>7}  (CSR)")
+    for label, graph in cases:
+        t_csr, _ = timed(vectorized.CSRGraph.from_graph, graph, repeat=1)
+        vectorized.csr_snapshot(graph)
+        for name, pure, fast, args in operations:
+            t_pure, expected = timed(pure_python, pure, graph, *args, repeat=repeat)
+            t_fast, result = timed(fast, graph, *args, repeat=repeat)
+            assert result == expected, f"{name} : résultats différents"
+            print(f"{label:<20} {name:<16} {t_pure:>8.3f}s {t_fast:>8.3f}s "
+                  f"{t_pure / t_fast:>6.1f}x  ({t_csr:.3f}s)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--nodes", type=int, default=100_000, help="Nombre de nœuds")
+    parser.add_argument("--repeat", type=int, default=3, help="Répétitions (meilleur temps)")
+    args = parser.parse_args()
+    if not vectorized.HAS_NUMPY:
+        sys.exit("NumPy n'est pas installé : pip install -e \".[fast]\"")
+    run(args.nodes, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,193 @@
+"""
+Module benchmarks.generators
+----------------------------
+Générateurs de graphes synthétiques pour les benchmarks.
+
+Les nœuds sont nommés "n0000042" : l'ordre alphabétique coïncide avec
+l'ordre numérique, ce qui garde les parcours lisibles.
+"""
+
+import math
+import random
+import time
+from collections.abc import Callable
+
+from src.app.core import DiGraph, Graph
+
+
+# Classes de routes de road_graph(hierarchy=True) : (une ligne sur, vitesse)
+ROAD_CLASSES = [(8, 2), (32, 4)]
+
+
+def node_name(i: int) -> str:
+    """Nom canonique du i-ème nœud."""
+    return f"n{i:07d}"
+
+
+def random_graph(n: int, avg_degree: float, seed: int = 0) -> Graph:
+    """
+    Graphe aléatoire (type Erdős–Rényi) à degré moyen fixé.
+    
+    Args:
+        n: Nombre de nœuds
+        avg_degree: Degré moyen visé
+        seed: Graine du générateur
+    """
+    rng = random.Random(seed)
+    g = Graph()
+    for i in range(n):
+        g.add_node(node_name(i))
+    for _ in range(int(n * avg_degree / 2)):
+        a, b = rng.randrange(n), rng.randrange(n)
+        if a != b:
+            g.add_edge(node_name(a), node_name(b))
+    return g
+
+
+def power_law_graph(n: int, m: int = 4, seed: int = 0) -> Graph:
+    """
+    Graphe à attachement préférentiel (Barabási–Albert).
+    
+    Faible diamètre et quelques hubs : le cas typique des réseaux sociaux.
+    
+    Args:
+        n: Nombre de nœuds
+        m: Nombre d'arêtes ajoutées par nouveau nœud
+        seed: Graine du générateur
+    """
+    rng = random.Random(seed)
+    g = Graph()
+    # Chaque extrémité d'arête est répétée : tirer dedans = tirer selon le degré
+    endpoints = []
+    for i in range(min(n, m + 1)):
+        g.add_node(node_name(i))
+        for j in range(i):
+            g.add_edge(node_name(i), node_name(j))
+            endpoints += [i, j]
+    for i in range(m + 1, n):
+        targets = set()
+        while len(targets) < m:
+            targets.add(rng.choice(endpoints))
+        for j in targets:
+            g.add_edge(node_name(i), node_name(j))
+            endpoints += [i, j]
+    return g
+
+
+def grid_graph(width: int, height: int) -> Graph:
+    """Grille width × height (diamètre élevé, degré ≤ 4)."""
+    g = Graph()
+    for y in range(height):
+        for x in range(width):
+            i = y * width + x
+            g.add_node(node_name(i))
+            if x > 0:
+                g.add_edge(node_name(i), node_name(i - 1))
+            if y > 0:
+                g.add_edge(node_name(i), node_name(i - width))
+    return g
+
+
+def weighted_grid_graph(width: int, height: int, seed: int = 0,
+                        max_weight: int = 100) -> Graph:
+    """Grille width × height aux poids entiers aléatoires dans [1, max_weight]."""
+    rng = random.Random(seed)
+    g = Graph()
+    for y in range(height):
+        for x in range(width):
+            i = y * width + x
+            g.add_node(node_name(i))
+            if x > 0:
+                g.add_edge(node_name(i), node_name(i - 1), rng.randint(1, max_weight))
+            if y > 0:
+                g.add_edge(node_name(i), node_name(i - width), rng.randint(1, max_weight))
+    return g
+
+
+def road_graph(n: int, seed: int = 0, hierarchy: bool = False) -> Graph:
+    """
+    Graphe de type réseau routier (quasi planaire, degré moyen ≈ 4).
+    
+    Les nœuds sont des points d'une grille perturbée ; chacun est relié
+    à ses voisins droit/bas (avec quelques routes manquantes) et parfois
+    en diagonale. Chaque nœud porte sa position ; le poids est la longueur
+    euclidienne du tronçon, arrondie au millième supérieur (jamais plus
+    courte qu'à vol d'oiseau).
+    
+    Avec hierarchy=True, le poids devient un temps de parcours : une ligne
+    et une colonne sur ROAD_CLASSES[0][0] sont des nationales complètes
+    (vitesse ×2), une sur ROAD_CLASSES[1][0] des autoroutes (vitesse ×4).
+    C'est cette hiérarchie, présente dans les vrais réseaux, qu'exploitent
+    les hiérarchies de contraction.
+    """
+    rng = random.Random(seed)
+    side = max(1, int(n ** 0.5))
+    points = [(x + rng.uniform(-0.3, 0.3), y + rng.uniform(-0.3, 0.3))
+              for y in range(side) for x in range(side)]
+    g = Graph()
+    
+    def speed(line: int) -> int:
+        factor = 1
+        for period, line_speed in ROAD_CLASSES:
+            if hierarchy and line % period == 0:
+                factor = line_speed
+        return factor
+    
+    def connect(i: int, j: int, factor: int = 1) -> None:
+        (x1, y1), (x2, y2) = points[i], points[j]
+        length = math.hypot(x1 - x2, y1 - y2) / factor
+        g.add_edge(node_name(i), node_name(j), math.ceil(length * 1000) / 1000)
+    
+    for i in range(len(points)):
+        g.add_node(node_name(i))
+        g.set_position(node_name(i), *points[i])
+        x, y = i % side, i // side
+        if x > 0 and (speed(y) > 1 or rng.random() < 0.9):
+            connect(i, i - 1, speed(y))
+        if y > 0 and (speed(x) > 1 or rng.random() < 0.9):
+            connect(i, i - side, speed(x))
+        if x > 0 and y > 0 and rng.random() < 0.3:
+            connect(i, i - side - 1)
+    return g
+
+
+def dependency_graph(n: int, avg_degree: float = 2.0, back_ratio: float = 0.02,
+                     seed: int = 0) -> DiGraph:
+    """
+    Graphe orienté de dépendances (paquets, tâches...).
+    
+    Chaque nœud dépend d'environ avg_degree nœuds plus anciens, choisis
+    de préférence parmi les récents (localité). Une fraction back_ratio
+    des arcs pointe au contraire vers un nœud plus récent, ce qui crée
+    des cycles, donc des composantes fortement connexes non triviales.
+    
+    Args:
+        n: Nombre de nœuds
+        avg_degree: Nombre moyen d'arcs sortants par nœud
+        back_ratio: Proportion d'arcs « remontants »
+        seed: Graine du générateur
+    """
+    rng = random.Random(seed)
+    g = DiGraph()
+    for i in range(n):
+        g.add_node(node_name(i))
+    for i in range(1, n):
+        for _ in range(int(avg_degree) + (rng.random() < avg_degree % 1)):
+            j = max(0, i - 1 - int(rng.expovariate(1 / 50)))
+            if rng.random() < back_ratio:
+                j = min(n - 1, i + 1 + int(rng.expovariate(1 / 50)))
+            g.add_edge(node_name(i), node_name(j))
+    return g
+
+
+def timed(function: Callable, *args, repeat: int = 3, **kwargs) -> tuple[float, object]:
+    """
+    Exécute function plusieurs fois et retourne (meilleur temps en s, résultat).
+    """
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        begin = time.perf_counter()
+        result = function(*args, **kwargs)
+        best = min(best, time.perf_counter() - begin)
+    return best, result
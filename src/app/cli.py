@@ -9,6 +9,8 @@ Très utile pour debug et tests rapides.
 Usage:
     python -m src.app.cli --load graph.json --dfs A
     python -m src.app.cli --load graph.json --bfs A --goal B
+    python -m src.app.cli --load graph.json --info --budget 5
+    python -m src.app.cli --load graph.json --k-core 3 --save core.json
     python -m src.app.cli --create --nodes A B C --edges A-B B-C --save test.json
 """
 
@@ -18,13 +20,23 @@ from pathlib import Path
 
 from .core import (
     Graph,
-    dfs,
-    bfs,
-    shortest_path,
+    articulation_points,
+    biconnected_components,
+    bridges,
+    cached_dfs,
+    cached_bfs,
+    cached_shortest_path,
+    diameter_bounds,
     is_connected,
+    k_core,
+    path_weight,
     load_graph,
+    radius_bounds,
     save_graph,
+    transitivity,
+    triangle_counts,
 )
+from .core.eccentricity import INFO_TIME_BUDGET, format_bounds
 
 
 def create_parser() -> argparse.ArgumentParser:
@@ -50,6 +62,9 @@ Exemples:
   
   # Plus court chemin
   python -m src.app.cli --load graph.json --bfs A --goal C
+  
+  # Exporter seulement le 3-cœur (partie dense du graphe)
+  python -m src.app.cli --load graph.json --k-core 3 --save core.json
         """
     )
     
@@ -62,11 +77,15 @@ Exemples:
     parser.add_argument("--nodes", nargs="+", help="Liste des nœuds (si --create)")
     parser.add_argument("--edges", nargs="+", help="Liste des arêtes au format A-B (si --create)")
     
-    # Sauvegarde
+    # Filtrage et sauvegarde
+    parser.add_argument("--k-core", type=int, metavar="K",
+                        help="Ne garder que le k-cœur (nœuds de nombre de cœur ≥ K)")
     parser.add_argument("--save", type=str, help="Sauvegarder le graphe en JSON")
     
     # Opérations
     parser.add_argument("--info", action="store_true", help="Afficher les infos du graphe")
+    parser.add_argument("--budget", type=float, default=INFO_TIME_BUDGET,
+                        help="Budget en secondes pour le diamètre et le rayon (--info)")
     parser.add_argument("--dfs", type=str, help="Lancer DFS depuis un nœud")
     parser.add_argument("--bfs", type=str, help="Lancer BFS depuis un nœud")
     parser.add_argument("--goal", type=str, help="Nœud cible (pour chemin)")
@@ -89,23 +108,42 @@ def build_graph_from_args(nodes: list[str], edges: list[str]) -> Graph:
     Raises:
         ValueError: Si le format des arêtes est invalide
     """
-    # TODO: implémenter
-    # 1. Créer un graphe
-    # 2. Ajouter les nœuds
-    # 3. Parser et ajouter les arêtes (format "A-B")
-    pass
+    graph = Graph()
+    for node in nodes:
+        graph.add_node(node)
+    for edge in edges:
+        parts = edge.split("-")
+        if len(parts) != 2 or not parts[0] or not parts[1]:
+            raise ValueError(f"Arête invalide '{edge}' (format attendu : A-B)")
+        graph.add_edge(parts[0], parts[1])
+    return graph
 
 
-def print_graph_info(graph: Graph):
+def print_graph_info(graph: Graph, time_budget: float = INFO_TIME_BUDGET):
     """
     Affiche des informations sur un graphe.
     
     Args:
         graph: Le graphe à analyser
+        time_budget: Budget en secondes pour le diamètre et le rayon,
+                     encadrés si le calcul exact ne tient pas dans le budget
     """
-    # TODO: implémenter
-    # Afficher: nombre de nœuds, arêtes, connexité, liste des nœuds
-    pass
+    print(f"Nœuds   : {len(graph)}")
+    print(f"Arêtes  : {len(graph.edges())}")
+    print(f"Connexe : {'oui' if is_connected(graph) else 'non'}")
+    print(f"Liste   : {', '.join(graph.nodes())}")
+    points = articulation_points(graph)
+    edges = bridges(graph)
+    print(f"Points d'articulation : {', '.join(points) if points else 'aucun'}")
+    print(f"Ponts   : {', '.join(f'{a}-{b}' for a, b in edges) if edges else 'aucun'}")
+    print(f"Blocs biconnexes : {len(biconnected_components(graph))}")
+    print(f"Triangles : {sum(triangle_counts(graph).values()) // 3} "
+          f"(clustering global {transitivity(graph):.3f})")
+    if graph.is_directed():
+        print("Diamètre : non calculé (graphe orienté)")
+        return
+    print(f"Diamètre : {format_bounds(diameter_bounds(graph, time_budget / 2))}")
+    print(f"Rayon   : {format_bounds(radius_bounds(graph, time_budget=time_budget / 2))}")
 
 
 def main():
@@ -113,14 +151,6 @@ def main():
     parser = create_parser()
     args = parser.parse_args()
     
-    # TODO: implémenter la logique principale
-    # 
-    # Structure suggérée:
-    # 1. Charger ou créer le graphe
-    # 2. Effectuer les opérations demandées
-    # 3. Sauvegarder si --save
-    # 4. Gérer les erreurs proprement
-    
     try:
         # Chargement/création du graphe
         if args.load:
@@ -135,21 +165,32 @@ def main():
             graph = build_graph_from_args(args.nodes, args.edges or [])
             print(f"✓ Graphe créé ({len(graph)} nœuds)")
         
+        if args.k_core is not None:
+            total = len(graph)
+            graph = k_core(graph, args.k_core)
+            print(f"✓ {args.k_core}-cœur extrait ({len(graph)} nœuds sur {total})")
+        
         # Opérations
         if args.info:
-            print_graph_info(graph)
+            print_graph_info(graph, args.budget)
         
         if args.dfs:
-            # TODO: implémenter DFS
-            pass
+            print(f"DFS depuis {args.dfs} : {' → '.join(cached_dfs(graph, args.dfs))}")
         
         if args.bfs:
-            # TODO: implémenter BFS
-            pass
+            print(f"BFS depuis {args.bfs} : {' → '.join(cached_bfs(graph, args.bfs))}")
+            if args.goal:
+                path = cached_shortest_path(graph, args.bfs, args.goal)
+                if path is None:
+                    print(f"Aucun chemin entre {args.bfs} et {args.goal}")
+                else:
+                    summary = f"{len(path) - 1} arêtes"
+                    if graph.is_weighted():
+                        summary += f", poids total {path_weight(graph, path):g}"
+                    print(f"Plus court chemin : {' → '.join(path)} ({summary})")
         
         if args.connected:
-            # TODO: implémenter vérification connexité
-            pass
+            print(f"Connexe : {'oui' if is_connected(graph) else 'non'}")
         
         # Sauvegarde
         if args.save:
@@ -4,29 +4,103 @@ Package core
 Cœur algorithmique du projet (100% testable, indépendant de l'UI).
 """
 
-from .graph import Graph
+from .graph import Graph, DiGraph
 from .algorithms import (
     dfs,
     dfs_path,
     bfs,
     bfs_path,
+    bfs_direction_optimizing,
+    bfs_limited,
+    dfs_limited,
+    k_hop_neighborhood,
+    induced_subgraph,
     is_connected,
     reachable_from,
+    connected_components,
+    strongly_connected_components,
+    articulation_points,
+    bridges,
+    biconnected_components,
+    core_numbers,
+    k_core,
     shortest_path,
+    dijkstra_distances,
+    dijkstra_path,
+    path_weight,
+    a_star_path,
+    coordinate_heuristic,
+    euclidean_distance,
+    haversine_distance,
+    ResultCache,
+    result_cache,
+    cached_dfs,
+    cached_bfs,
+    cached_shortest_path,
 )
-from .io import save_graph, load_graph, graph_to_dict, dict_to_graph
+from .io import save_graph, load_graph, graph_to_dict, dict_to_graph, graph_fingerprint
+from .landmarks import LandmarkIndex, DistanceOracle
+from .contraction import ContractionHierarchy, ContractionRouter
+from .reachability import ReachabilityIndex, can_reach
+from .eccentricity import diameter, diameter_bounds, eccentricity_bounds, radius_bounds
+from .centrality import betweenness_centrality
+from .triangles import triangle_counts, clustering, transitivity, average_clustering
+from .stats import GraphStats, graph_stats
 
 __all__ = [
     "Graph",
+    "DiGraph",
     "dfs",
     "dfs_path",
     "bfs",
     "bfs_path",
+    "bfs_direction_optimizing",
+    "bfs_limited",
+    "dfs_limited",
+    "k_hop_neighborhood",
+    "induced_subgraph",
     "is_connected",
     "reachable_from",
+    "connected_components",
+    "strongly_connected_components",
+    "articulation_points",
+    "bridges",
+    "biconnected_components",
+    "core_numbers",
+    "k_core",
     "shortest_path",
+    "dijkstra_distances",
+    "dijkstra_path",
+    "path_weight",
+    "a_star_path",
+    "coordinate_heuristic",
+    "euclidean_distance",
+    "haversine_distance",
+    "ResultCache",
+    "result_cache",
+    "cached_dfs",
+    "cached_bfs",
+    "cached_shortest_path",
     "save_graph",
     "load_graph",
     "graph_to_dict",
     "dict_to_graph",
+    "graph_fingerprint",
+    "LandmarkIndex",
+    "DistanceOracle",
+    "ContractionHierarchy",
+    "ContractionRouter",
+    "ReachabilityIndex",
+    "can_reach",
+    "diameter",
+    "diameter_bounds",
+    "eccentricity_bounds",
+    "radius_bounds",
+    "betweenness_centrality",
+    "triangle_counts",
+    "clustering",
+    "transitivity",
+    "average_clustering",
+    "GraphStats",
+    "graph_stats",
 ]
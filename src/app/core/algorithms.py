@@ -5,10 +5,21 @@ Implémentation des algorithmes de parcours de graphes (DFS, BFS)
 et résolution de problèmes classiques.
 
 Paliers B, C, D.
+
+Au-delà de vectorized.VECTORIZE_THRESHOLD nœuds, et si NumPy est installé,
+bfs, is_connected, reachable_from et connected_components délèguent au
+moteur vectorisé (core/vectorized.py), qui produit les mêmes résultats.
 """
 
-from collections import deque
+import heapq
+import math
+import threading
+from collections import OrderedDict, deque
+from collections.abc import Callable
+from copy import copy
+from weakref import WeakKeyDictionary
 from .graph import Graph
+from . import vectorized
 
 
 # ============================================================================
@@ -53,9 +64,23 @@ def dfs(graph: Graph, start: str) -> list[str]:
            - Marquer comme visité
            - Empiler tous ses voisins non visités
     """
-    # TODO: implémenter DFS
-    # Astuce : pile = list, visited = set
-    pass
+    if not graph.has_node(start):
+        raise ValueError(f"le noeud {start!r} n'existe pas")
+    
+    order = []
+    visited = set()
+    stack = [start]
+    while stack:
+        node = stack.pop()
+        if node in visited:
+            continue
+        visited.add(node)
+        order.append(node)
+        # Empiler à l'envers pour dépiler le plus petit voisin en premier
+        for neighbor in reversed(graph.neighbors(node)):
+            if neighbor not in visited:
+                stack.append(neighbor)
+    return order
 
 
 def dfs_path(graph: Graph, start: str, goal: str) -> list[str] | None:
@@ -79,12 +104,27 @@ def dfs_path(graph: Graph, start: str, goal: str) -> list[str] | None:
         ['A', 'B', 'C']
     
     Algorithme:
-        Variante de DFS où on stocke le chemin complet dans la pile.
-        Pile contient des tuples (nœud, chemin_jusqu'ici).
+        Variante de DFS où la pile contient des tuples (nœud, parent).
+        Le parent est mémorisé à la première visite, et le chemin est
+        reconstruit en remontant les parents depuis goal (pas de copie
+        de chemin à chaque empilement).
     """
-    # TODO: implémenter
-    # Astuce : pile contient (noeud, chemin) où chemin est une liste
-    pass
+    if not graph.has_node(start) or not graph.has_node(goal):
+        raise ValueError("le noeud de départ ou d'arrivée n'existe pas")
+    
+    parents = {}
+    stack = [(start, None)]
+    while stack:
+        node, parent = stack.pop()
+        if node in parents:
+            continue
+        parents[node] = parent
+        if node == goal:
+            return _build_path(parents, goal)
+        for neighbor in reversed(graph.neighbors(node)):
+            if neighbor not in parents:
+                stack.append((neighbor, node))
+    return None
 
 
 # ============================================================================
@@ -124,9 +164,23 @@ def bfs(graph: Graph, start: str) -> list[str]:
            - Marquer comme visité
            - Enfiler tous ses voisins non visités
     """
-    # TODO: implémenter BFS
-    # Astuce : file = deque(), visited = set
-    pass
+    if not graph.has_node(start):
+        raise ValueError(f"le noeud {start!r} n'existe pas")
+    if vectorized.should_vectorize(graph):
+        return vectorized.bfs(graph, start)
+    
+    order = []
+    # Marquer à l'enfilage : chaque nœud n'entre qu'une fois dans la file
+    visited = {start}
+    queue = deque([start])
+    while queue:
+        node = queue.popleft()
+        order.append(node)
+        for neighbor in graph.neighbors(node):
+            if neighbor not in visited:
+                visited.add(neighbor)
+                queue.append(neighbor)
+    return order
 
 
 def bfs_path(graph: Graph, start: str, goal: str) -> list[str] | None:
@@ -155,11 +209,375 @@ def bfs_path(graph: Graph, start: str, goal: str) -> list[str] | None:
         ['A', 'C']
     
     Algorithme:
-        Variante de BFS où on stocke le chemin complet dans la file.
-        File contient des tuples (nœud, chemin_jusqu'ici).
+        Variante de BFS qui mémorise le parent de chaque nœud découvert,
+        puis reconstruit le chemin en remontant depuis goal.
+    """
+    if not graph.has_node(start) or not graph.has_node(goal):
+        raise ValueError("le noeud de départ ou d'arrivée n'existe pas")
+    
+    parents = {start: None}
+    queue = deque([start])
+    while queue:
+        node = queue.popleft()
+        if node == goal:
+            return _build_path(parents, goal)
+        for neighbor in graph.neighbors(node):
+            if neighbor not in parents:
+                parents[neighbor] = node
+                queue.append(neighbor)
+    return None
+
+
+# ============================================================================
+# Parcours à profondeur limitée et voisinage à k sauts
+# ============================================================================
+
+def bfs_limited(graph: Graph, start: str, max_depth: int) -> list[str]:
+    """
+    BFS qui s'arrête à max_depth arêtes du départ.
+    
+    Le résultat est le préfixe de bfs(graph, start) formé des nœuds à
+    distance ≤ max_depth : seul le voisinage est exploré, le coût ne dépend
+    pas de la taille du reste du graphe.
+    
+    Args:
+        graph: Le graphe à parcourir
+        start: Le nœud de départ
+        max_depth: Distance maximale (0 → seulement start)
+    
+    Returns:
+        Liste des nœuds visités, couche par couche
+    
+    Raises:
+        ValueError: Si le nœud de départ n'existe pas ou si max_depth < 0
+    
+    Exemple:
+        >>> g = Graph()
+        >>> g.add_edge("A", "B")
+        >>> g.add_edge("B", "C")
+        >>> g.add_edge("C", "D")
+        >>> bfs_limited(g, "A", 2)
+        ['A', 'B', 'C']
+    """
+    if not graph.has_node(start):
+        raise ValueError(f"le noeud {start!r} n'existe pas")
+    if max_depth < 0:
+        raise ValueError("max_depth doit être positif ou nul")
+    
+    order = [start]
+    visited = {start}
+    frontier = [start]
+    for _ in range(max_depth):
+        next_frontier = []
+        for node in frontier:
+            for neighbor in graph.neighbors(node):
+                if neighbor not in visited:
+                    visited.add(neighbor)
+                    next_frontier.append(neighbor)
+        if not next_frontier:
+            break
+        order.extend(next_frontier)
+        frontier = next_frontier
+    return order
+
+
+def dfs_limited(graph: Graph, start: str, max_depth: int) -> list[str]:
+    """
+    DFS qui n'étend pas les nœuds situés à max_depth arêtes (dans la pile).
+    
+    Un nœud déjà visité mais revu à une profondeur plus faible est étendu
+    à nouveau : ainsi, tous les nœuds à distance ≤ max_depth sont visités,
+    même si le DFS les a d'abord atteints par un chemin plus long.
+    
+    Args:
+        graph: Le graphe à parcourir
+        start: Le nœud de départ
+        max_depth: Profondeur maximale (0 → seulement start)
+    
+    Returns:
+        Liste des nœuds dans l'ordre de leur première visite
+    
+    Raises:
+        ValueError: Si le nœud de départ n'existe pas ou si max_depth < 0
+    
+    Exemple:
+        >>> g = Graph()
+        >>> g.add_edge("A", "B")
+        >>> g.add_edge("B", "C")
+        >>> g.add_edge("A", "C")
+        >>> g.add_edge("C", "D")
+        >>> dfs_limited(g, "A", 2)
+        ['A', 'B', 'C', 'D']  # C atteint via B (profondeur 2), revu depuis A (1)
+    
+    Note:
+        Chaque nœud est étendu au plus max_depth + 1 fois : le coût reste
+        proportionnel à la taille du voisinage, pas à celle du graphe.
+    """
+    if not graph.has_node(start):
+        raise ValueError(f"le noeud {start!r} n'existe pas")
+    if max_depth < 0:
+        raise ValueError("max_depth doit être positif ou nul")
+    
+    order = []
+    depth_of = {}
+    stack = [(start, 0)]
+    while stack:
+        node, depth = stack.pop()
+        if node in depth_of:
+            if depth_of[node] <= depth:
+                continue
+        else:
+            order.append(node)
+        depth_of[node] = depth
+        if depth < max_depth:
+            for neighbor in reversed(graph.neighbors(node)):
+                if depth_of.get(neighbor, max_depth + 1) > depth + 1:
+                    stack.append((neighbor, depth + 1))
+    return order
+
+
+def k_hop_neighborhood(graph: Graph, start: str, k: int) -> set[str]:
+    """
+    Retourne les nœuds à au plus k sauts de start (start inclus).
+    
+    Args:
+        graph: Le graphe
+        start: Nœud central
+        k: Nombre maximal de sauts
+    
+    Returns:
+        Ensemble des nœuds du voisinage
+    
+    Raises:
+        ValueError: Si le nœud n'existe pas ou si k < 0
+    
+    Exemple:
+        >>> g = Graph()
+        >>> g.add_edge("Paris", "Lyon")
+        >>> g.add_edge("Lyon", "Marseille")
+        >>> k_hop_neighborhood(g, "Paris", 1)
+        {'Paris', 'Lyon'}
+        >>> induced_subgraph(g, k_hop_neighborhood(g, "Paris", 1)).edges()
+        [('Lyon', 'Paris')]
+    """
+    return set(bfs_limited(graph, start, k))
+
+
+def induced_subgraph(graph: Graph, nodes) -> Graph:
+    """
+    Construit le sous-graphe induit par un ensemble de nœuds.
+    
+    Args:
+        graph: Le graphe d'origine
+        nodes: Nœuds à conserver (itérable)
+    
+    Returns:
+        Nouveau graphe (de même type, poids et positions conservés)
+        contenant ces nœuds et les arêtes entre eux
+    
+    Raises:
+        ValueError: Si un nœud n'existe pas dans le graphe
+    
+    Note:
+        Le coût est proportionnel à la somme des degrés des nœuds gardés.
+    """
+    kept = set(nodes)
+    subgraph = type(graph)()
+    subgraph.geographic = graph.geographic
+    weighted = graph.is_weighted()
+    for node in sorted(kept):
+        subgraph.add_node(node)
+        position = graph.position(node)
+        if position is not None:
+            subgraph.set_position(node, *position)
+        for neighbor, weight in graph.weighted_neighbors(node):
+            if neighbor in kept and (graph.is_directed() or node <= neighbor):
+                subgraph.add_edge(node, neighbor, weight if weighted else None)
+    return subgraph
+
+
+# ============================================================================
+# BFS à optimisation de direction (top-down / bottom-up)
+# ============================================================================
+
+# Seuils de bascule (Beamer et al.) : on passe en bottom-up quand les arêtes
+# sortant de la frontière dépassent 1/ALPHA des arêtes non explorées, et on
+# revient en top-down quand la frontière retombe sous 1/BETA des nœuds.
+# En mode ordonné, le bottom-up doit examiner tous les voisins (recherche du
+# parent de rang minimal) : la bascule est donc moins agressive.
+DIRECTION_ALPHA = 14
+DIRECTION_ALPHA_ORDERED = 4
+DIRECTION_BETA = 24
+
+
+def bfs_direction_optimizing(graph: Graph, start: str, ordered: bool = True,
+                             alpha: int | None = None,
+                             beta: int = DIRECTION_BETA) -> list[str]:
+    """
+    BFS qui alterne entre exploration top-down et bottom-up.
+    
+    Sur les graphes de faible diamètre (réseaux sociaux...), les couches
+    du milieu contiennent une grande partie du graphe : en top-down, presque
+    tous les voisins testés sont déjà visités. En bottom-up, on parcourt à
+    l'inverse les nœuds NON visités et on cherche un parent dans la frontière,
+    ce qui coûte beaucoup moins cher quand la frontière est énorme.
+    
+    Args:
+        graph: Le graphe à parcourir
+        start: Le nœud de départ
+        ordered: True (défaut) pour produire exactement le même ordre que bfs().
+                 False relâche l'ordre à l'intérieur des couches traitées en
+                 bottom-up (triées alphabétiquement) : les couches restent
+                 identiques, mais la recherche de parent s'arrête au premier
+                 voisin trouvé, ce qui est plus rapide.
+        alpha: Seuil de passage en bottom-up (défaut : DIRECTION_ALPHA_ORDERED
+               en mode ordonné, DIRECTION_ALPHA sinon)
+        beta: Seuil de retour en top-down
+    
+    Returns:
+        Liste des nœuds visités, couche par couche
+    
+    Raises:
+        ValueError: Si le nœud de départ n'existe pas
+    
+    Exemple:
+        >>> g = Graph()
+        >>> g.add_edge("A", "B")
+        >>> g.add_edge("A", "C")
+        >>> g.add_edge("B", "D")
+        >>> bfs_direction_optimizing(g, "A")
+        ['A', 'B', 'C', 'D']  # Identique à bfs()
+    
+    Note:
+        Le parcours travaille sur un instantané indexé du graphe (entiers
+        0..n-1 dans l'ordre alphabétique), avec un bytearray pour les visités.
+        L'instantané est gardé d'un appel à l'autre tant que graph.version
+        ne change pas : seul le premier parcours paie sa construction (O(V + E)).
+        Sur un DiGraph, le bottom-up demanderait les arcs entrants : on
+        délègue alors simplement à bfs().
+    """
+    if not graph.has_node(start):
+        raise ValueError(f"le noeud {start!r} n'existe pas")
+    if graph.is_directed():
+        return bfs(graph, start)
+    
+    _, names, index, adjacency = _indexed_snapshot(graph)
+    order = _bfs_direction_optimizing_ids(adjacency, index[start], ordered, alpha, beta)
+    return [names[i] for i in order]
+
+
+def _index_graph(graph: Graph) -> tuple[list[str], dict[str, int], list[list[int]]]:
+    """
+    Construit un instantané indexé du graphe.
+    
+    Les nœuds sont numérotés dans l'ordre alphabétique : les listes
+    d'adjacence d'entiers restent donc triées dans le même ordre que
+    graph.neighbors(), ce qui préserve le déterminisme des parcours.
+    
+    Returns:
+        (noms, index nom → entier, listes d'adjacence d'entiers)
+    """
+    names = graph.nodes()
+    index = {name: i for i, name in enumerate(names)}
+    adjacency = [[index[neighbor] for neighbor in graph.neighbors(name)] for name in names]
+    return names, index, adjacency
+
+
+# Par graphe : (version, noms, index, listes d'adjacence), voir _indexed_snapshot()
+_indexed_snapshots: "WeakKeyDictionary[Graph, tuple]" = WeakKeyDictionary()
+
+
+def _indexed_snapshot(graph: Graph) -> tuple[int, list[str], dict[str, int], list[list[int]]]:
+    """
+    Instantané _index_graph() mis en cache, reconstruit seulement quand
+    graph.version change (comme vectorized.csr_snapshot). Il est partagé
+    entre les appels : ne pas le modifier.
+    
+    Returns:
+        (version, noms, index nom → entier, listes d'adjacence d'entiers)
+    """
+    snapshot = _indexed_snapshots.get(graph)
+    if snapshot is None or snapshot[0] != graph.version:
+        snapshot = (graph.version, *_index_graph(graph))
+        _indexed_snapshots[graph] = snapshot
+    return snapshot
+
+
+def _bfs_direction_optimizing_ids(adjacency: list[list[int]], source: int,
+                                  ordered: bool = True,
+                                  alpha: int | None = None,
+                                  beta: int = DIRECTION_BETA) -> list[int]:
+    """
+    Cœur de bfs_direction_optimizing() sur un graphe indexé.
+    
+    Invariant utilisé par le bottom-up : un nœud non visité ne peut avoir
+    de voisin visité que dans la frontière courante (sinon il aurait été
+    découvert plus tôt). Le bytearray des visités sert donc aussi d'ensemble
+    frontière, à condition de ne marquer la couche suivante qu'en fin de passe.
     """
-    # TODO: implémenter
-    pass
+    if alpha is None:
+        alpha = DIRECTION_ALPHA_ORDERED if ordered else DIRECTION_ALPHA
+    n = len(adjacency)
+    visited = bytearray(n)
+    visited[source] = 1
+    # rank[u] = position de u dans la frontière courante (mode ordered)
+    rank = [0] * n if ordered else None
+    
+    order = [source]
+    frontier = [source]
+    unvisited = None
+    edges_frontier = len(adjacency[source])
+    edges_unexplored = sum(len(neighbors) for neighbors in adjacency) - edges_frontier
+    top_down = True
+    
+    while frontier:
+        if top_down and edges_frontier > edges_unexplored / alpha:
+            top_down = False
+        elif not top_down and len(frontier) < n / beta:
+            top_down = True
+        
+        if top_down:
+            next_frontier = []
+            for u in frontier:
+                for v in adjacency[u]:
+                    if not visited[v]:
+                        visited[v] = 1
+                        next_frontier.append(v)
+            unvisited = None
+        else:
+            if unvisited is None:
+                unvisited = [v for v in range(n) if not visited[v]]
+            if ordered:
+                for position, u in enumerate(frontier):
+                    rank[u] = position
+                # Un seau par parent : parcourir u par ordre croissant
+                # donne directement l'ordre (rang du parent, nom) de bfs()
+                buckets = [[] for _ in frontier]
+                for u in unvisited:
+                    best = -1
+                    for v in adjacency[u]:
+                        if visited[v] and (best < 0 or rank[v] < best):
+                            best = rank[v]
+                    if best >= 0:
+                        buckets[best].append(u)
+                next_frontier = [u for bucket in buckets for u in bucket]
+            else:
+                next_frontier = []
+                for u in unvisited:
+                    for v in adjacency[u]:
+                        if visited[v]:
+                            next_frontier.append(u)
+                            break
+            for u in next_frontier:
+                visited[u] = 1
+            unvisited = [u for u in unvisited if not visited[u]]
+        
+        order.extend(next_frontier)
+        edges_frontier = sum(len(adjacency[u]) for u in next_frontier)
+        edges_unexplored -= edges_frontier
+        frontier = next_frontier
+    
+    return order
 
 
 # ============================================================================
@@ -196,10 +614,19 @@ def is_connected(graph: Graph) -> bool:
         1. Choisir un nœud de départ arbitraire
         2. Faire un parcours (DFS ou BFS) depuis ce nœud
         3. Vérifier si tous les nœuds ont été visités
+    
+    Note:
+        Sur un DiGraph, il s'agit de la connexité faible (sens des arcs
+        ignoré) ; voir strongly_connected_components() pour la forte.
     """
-    # TODO: implémenter
-    # Astuce : réutiliser dfs() ou bfs()
-    pass
+    if graph.is_directed():
+        return len(connected_components(graph)) <= 1
+    if vectorized.should_vectorize(graph):
+        return vectorized.is_connected(graph)
+    nodes = graph.nodes()
+    if not nodes:
+        return True
+    return len(dfs(graph, nodes[0])) == len(nodes)
 
 
 def reachable_from(graph: Graph, start: str) -> set[str]:
@@ -223,9 +650,60 @@ def reachable_from(graph: Graph, start: str) -> set[str]:
         >>> reachable_from(g, "A")
         {'A', 'B'}
     """
-    # TODO: implémenter
-    # Astuce : réutiliser dfs() et convertir en set
-    pass
+    if not graph.has_node(start):
+        raise ValueError(f"le noeud {start!r} n'existe pas")
+    if vectorized.should_vectorize(graph):
+        return vectorized.reachable_from(graph, start)
+    return set(dfs(graph, start))
+
+
+def connected_components(graph: Graph) -> list[list[str]]:
+    """
+    Retourne les composantes connexes du graphe.
+    
+    Args:
+        graph: Le graphe à analyser
+    
+    Returns:
+        Liste des composantes, chacune triée alphabétiquement,
+        ordonnées par leur plus petit nœud
+    
+    Exemple:
+        >>> g = Graph()
+        >>> g.add_edge("C", "D")
+        >>> g.add_edge("A", "B")
+        >>> g.add_node("E")
+        >>> connected_components(g)
+        [['A', 'B'], ['C', 'D'], ['E']]
+    
+    Note:
+        Sur un DiGraph, ce sont les composantes faiblement connexes.
+    """
+    directed = graph.is_directed()
+    if not directed and vectorized.should_vectorize(graph):
+        return vectorized.connected_components(graph)
+    
+    components = []
+    seen = set()
+    for node in graph.nodes():
+        if node in seen:
+            continue
+        seen.add(node)
+        component = [node]
+        queue = deque([node])
+        while queue:
+            current = queue.popleft()
+            links = graph.neighbors(current)
+            if directed:
+                links += graph.predecessors(current)
+            for neighbor in links:
+                if neighbor not in seen:
+                    seen.add(neighbor)
+                    component.append(neighbor)
+                    queue.append(neighbor)
+        component.sort()
+        components.append(component)
+    return components
 
 
 def shortest_path(graph: Graph, start: str, goal: str) -> list[str] | None:
@@ -233,6 +711,8 @@ def shortest_path(graph: Graph, start: str, goal: str) -> list[str] | None:
     Trouve le plus court chemin entre deux nœuds.
     
     Wrapper autour de bfs_path() pour plus de clarté sémantique.
+    Si le graphe porte des poids (graph.is_weighted()), délègue à
+    dijkstra_path() : le chemin minimise alors la somme des poids.
     
     Args:
         graph: Le graphe à parcourir
@@ -250,15 +730,805 @@ def shortest_path(graph: Graph, start: str, goal: str) -> list[str] | None:
         >>> shortest_path(g, "A", "C")
         ['A', 'B', 'C']
     """
-    # TODO: implémenter
-    # Astuce : appeler bfs_path()
-    pass
+    if graph.is_weighted():
+        return dijkstra_path(graph, start, goal)
+    return bfs_path(graph, start, goal)
+
+
+# ============================================================================
+# Graphes orientés : composantes fortement connexes
+# ============================================================================
+
+def strongly_connected_components(graph: Graph) -> list[list[str]]:
+    """
+    Retourne les composantes fortement connexes du graphe.
+    
+    Deux nœuds sont dans la même composante si chacun peut atteindre
+    l'autre en suivant le sens des arcs. Sur un Graph non orienté, ce
+    sont les composantes connexes.
+    
+    Algorithme de Tarjan en version itérative (pile explicite) : un seul
+    parcours en profondeur, O(V + E), sans limite de récursion même sur
+    des millions de nœuds.
+    
+    Args:
+        graph: Le graphe à analyser (DiGraph ou Graph)
+    
+    Returns:
+        Liste des composantes, chacune triée alphabétiquement. Les
+        composantes sont dans l'ordre topologique inverse du graphe
+        condensé : une composante n'a d'arcs que vers des composantes
+        qui la précèdent dans la liste.
+    
+    Exemple:
+        >>> g = DiGraph()
+        >>> g.add_edge("A", "B")
+        >>> g.add_edge("B", "A")
+        >>> g.add_edge("B", "C")
+        >>> strongly_connected_components(g)
+        [['C'], ['A', 'B']]
+    """
+    names, _, adjacency = _index_graph(graph)
+    return [
+        sorted(names[v] for v in component)
+        for component in _strongly_connected_ids(adjacency)
+    ]
+
+
+def _strongly_connected_ids(adjacency: list[list[int]]) -> list[list[int]]:
+    """
+    Cœur de strongly_connected_components() sur un graphe indexé.
+    
+    Tarjan itératif : work remplace la pile d'appels, et position[v]
+    mémorise le prochain successeur de v à examiner quand on y revient.
+    """
+    n = len(adjacency)
+    order = [-1] * n          # rang de découverte
+    low = [0] * n             # plus petit rang atteignable depuis le sous-arbre
+    position = [0] * n
+    on_stack = bytearray(n)
+    stack = []
+    components = []
+    counter = 0
+    for root in range(n):
+        if order[root] >= 0:
+            continue
+        order[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = 1
+        work = [root]
+        while work:
+            v = work[-1]
+            successors = adjacency[v]
+            i = position[v]
+            descended = False
+            while i < len(successors):
+                w = successors[i]
+                i += 1
+                if order[w] < 0:
+                    order[w] = low[w] = counter
+                    counter += 1
+                    stack.append(w)
+                    on_stack[w] = 1
+                    work.append(w)
+                    descended = True
+                    break
+                if on_stack[w] and order[w] < low[v]:
+                    low[v] = order[w]
+            position[v] = i
+            if descended:
+                continue
+            work.pop()
+            if work and low[v] < low[work[-1]]:
+                low[work[-1]] = low[v]
+            if low[v] == order[v]:
+                component = []
+                while True:
+                    w = stack.pop()
+                    on_stack[w] = 0
+                    component.append(w)
+                    if w == v:
+                        break
+                components.append(component)
+    return components
+
+
+# ============================================================================
+# Résilience : points d'articulation, ponts, composantes biconnexes
+# ============================================================================
+
+def articulation_points(graph: Graph) -> list[str]:
+    """
+    Retourne les points d'articulation du graphe.
+    
+    Un point d'articulation est un nœud dont la suppression augmente le
+    nombre de composantes connexes (une ville critique du réseau).
+    
+    Args:
+        graph: Le graphe à analyser (sens des arcs ignoré pour un DiGraph)
+    
+    Returns:
+        Liste triée des points d'articulation
+    
+    Exemple:
+        >>> g = Graph()
+        >>> g.add_edge("A", "B")
+        >>> g.add_edge("B", "C")
+        >>> articulation_points(g)
+        ['B']
+    
+    Note:
+        Un seul parcours en profondeur (voir _biconnected_ids), O(V + E),
+        au lieu de retirer chaque nœud et de relancer is_connected().
+    """
+    names, adjacency = _undirected_index(graph)
+    cut, _, _ = _biconnected_ids(adjacency)
+    return [names[v] for v in range(len(names)) if cut[v]]
+
+
+def bridges(graph: Graph) -> list[tuple[str, str]]:
+    """
+    Retourne les ponts du graphe.
+    
+    Un pont est une arête dont la suppression augmente le nombre de
+    composantes connexes.
+    
+    Args:
+        graph: Le graphe à analyser (sens des arcs ignoré pour un DiGraph)
+    
+    Returns:
+        Liste triée de tuples (a, b) avec a < b
+    
+    Exemple:
+        >>> g = Graph()
+        >>> g.add_edge("A", "B")
+        >>> g.add_edge("B", "C")
+        >>> g.add_edge("C", "A")
+        >>> g.add_edge("C", "D")
+        >>> bridges(g)
+        [('C', 'D')]
+    """
+    names, adjacency = _undirected_index(graph)
+    _, bridge_ids, _ = _biconnected_ids(adjacency)
+    return sorted(tuple(sorted((names[u], names[v]))) for u, v in bridge_ids)
+
+
+def biconnected_components(graph: Graph) -> list[list[str]]:
+    """
+    Retourne les composantes biconnexes (blocs) du graphe.
+    
+    Chaque arête appartient à exactement un bloc ; deux blocs partagent
+    au plus un nœud, qui est alors un point d'articulation. Un pont forme
+    un bloc à lui seul. Les nœuds isolés n'appartiennent à aucun bloc.
+    
+    Args:
+        graph: Le graphe à analyser (sens des arcs ignoré pour un DiGraph)
+    
+    Returns:
+        Liste des blocs (nœuds triés), triée
+    
+    Exemple:
+        >>> g = Graph()
+        >>> g.add_edge("A", "B")
+        >>> g.add_edge("B", "C")
+        >>> g.add_edge("C", "A")
+        >>> g.add_edge("C", "D")
+        >>> biconnected_components(g)
+        [['A', 'B', 'C'], ['C', 'D']]
+    """
+    names, adjacency = _undirected_index(graph)
+    _, _, blocks = _biconnected_ids(adjacency)
+    return sorted(
+        sorted({names[v] for edge in block for v in edge})
+        for block in blocks
+    )
+
+
+def _undirected_index(graph: Graph) -> tuple[list[str], list[list[int]]]:
+    """Instantané indexé (voir _index_graph), arcs rendus symétriques pour un DiGraph."""
+    names, index, adjacency = _index_graph(graph)
+    if graph.is_directed():
+        for v, name in enumerate(names):
+            adjacency[v] = sorted(set(adjacency[v]).union(
+                index[p] for p in graph.predecessors(name)))
+    return names, adjacency
+
+
+def _biconnected_ids(adjacency: list[list[int]]):
+    """
+    Hopcroft–Tarjan itératif sur un graphe indexé non orienté.
+    
+    low[v] est le plus petit rang de découverte atteignable depuis le
+    sous-arbre de v avec au plus un arc arrière. Pour un enfant v de u :
+    - low[v] ≥ disc[u] : u sépare le sous-arbre de v (point d'articulation,
+      sauf la racine qui l'est si elle a au moins deux enfants), et les
+      arêtes empilées depuis (u, v) forment un bloc ;
+    - low[v] > disc[u] : l'arête (u, v) est un pont.
+    
+    Returns:
+        (bytearray des points d'articulation, liste des ponts (u, v),
+         liste des blocs sous forme de listes d'arêtes)
+    """
+    n = len(adjacency)
+    disc = [-1] * n
+    low = [0] * n
+    parent = [-1] * n
+    position = [0] * n
+    cut = bytearray(n)
+    bridge_ids = []
+    blocks = []
+    edges = []
+    counter = 0
+    for root in range(n):
+        if disc[root] >= 0:
+            continue
+        disc[root] = low[root] = counter
+        counter += 1
+        root_children = 0
+        work = [root]
+        while work:
+            v = work[-1]
+            neighbors = adjacency[v]
+            i = position[v]
+            descended = False
+            while i < len(neighbors):
+                w = neighbors[i]
+                i += 1
+                if disc[w] < 0:
+                    parent[w] = v
+                    disc[w] = low[w] = counter
+                    counter += 1
+                    edges.append((v, w))
+                    work.append(w)
+                    descended = True
+                    if v == root:
+                        root_children += 1
+                    break
+                if w != parent[v] and disc[w] < disc[v]:
+                    # Arc arrière vers un ancêtre (empilé une seule fois)
+                    edges.append((v, w))
+                    if disc[w] < low[v]:
+                        low[v] = disc[w]
+            position[v] = i
+            if descended:
+                continue
+            work.pop()
+            if not work:
+                continue
+            u = work[-1]
+            if low[v] < low[u]:
+                low[u] = low[v]
+            if low[v] >= disc[u]:
+                if u != root:
+                    cut[u] = 1
+                if low[v] > disc[u]:
+                    bridge_ids.append((u, v))
+                block = []
+                while True:
+                    edge = edges.pop()
+                    block.append(edge)
+                    if edge == (u, v):
+                        break
+                blocks.append(block)
+        if root_children > 1:
+            cut[root] = 1
+    return cut, bridge_ids, blocks
+
+
+# ============================================================================
+# Décomposition en k-cœurs
+# ============================================================================
+
+def core_numbers(graph: Graph) -> dict[str, int]:
+    """
+    Calcule le nombre de cœur (core number) de chaque nœud.
+    
+    Le k-cœur est le plus grand sous-graphe où chaque nœud a au moins k
+    voisins ; le nombre de cœur d'un nœud est le plus grand k tel qu'il
+    appartienne au k-cœur.
+    
+    Args:
+        graph: Le graphe à analyser (sens des arcs ignoré pour un DiGraph,
+               boucles ignorées)
+    
+    Returns:
+        Dictionnaire {nœud: nombre de cœur}
+    
+    Exemple:
+        >>> g = Graph()
+        >>> g.add_edge("A", "B")
+        >>> g.add_edge("B", "C")
+        >>> g.add_edge("C", "A")
+        >>> g.add_edge("C", "D")
+        >>> core_numbers(g)
+        {'A': 2, 'B': 2, 'C': 2, 'D': 1}
+    
+    Note:
+        Algorithme de Batagelj et Zaversnik, O(V + E) (voir _core_numbers_ids).
+    """
+    names, adjacency = _undirected_index(graph)
+    return dict(zip(names, _core_numbers_ids(adjacency)))
+
+
+def k_core(graph: Graph, k: int) -> Graph:
+    """
+    Extrait le k-cœur du graphe.
+    
+    Retirer les nœuds peu connectés réduit le graphe à sa partie dense
+    avant un rendu ou un algorithme coûteux.
+    
+    Args:
+        graph: Le graphe d'origine
+        k: Degré minimal dans le sous-graphe
+    
+    Returns:
+        Sous-graphe induit par les nœuds de nombre de cœur ≥ k (même type,
+        poids et positions conservés), éventuellement vide
+    
+    Raises:
+        ValueError: Si k est négatif
+    
+    Exemple:
+        >>> g = Graph()
+        >>> g.add_edge("A", "B")
+        >>> g.add_edge("B", "C")
+        >>> g.add_edge("C", "A")
+        >>> g.add_edge("C", "D")   # D n'a qu'un voisin
+        >>> k_core(g, 2).nodes()
+        ['A', 'B', 'C']
+    """
+    if k < 0:
+        raise ValueError(f"k doit être positif ou nul : {k}")
+    cores = core_numbers(graph)
+    return induced_subgraph(graph, [node for node, core in cores.items() if core >= k])
+
+
+def _core_numbers_ids(adjacency: list[list[int]]) -> list[int]:
+    """
+    Batagelj–Zaversnik sur un graphe indexé non orienté.
+    
+    Les nœuds sont rangés par degré croissant dans vertices, chaque
+    degré occupant un « seau » contigu qui commence à starts[d]. On
+    retire les nœuds dans cet ordre ; retirer v décrémente le degré de
+    ses voisins de degré supérieur, que l'on déplace en tête de leur
+    seau puis dans le seau précédent, en O(1) par arête.
+    
+    Returns:
+        degree[v] = nombre de cœur de v
+    """
+    n = len(adjacency)
+    adjacency = [[u for u in neighbors if u != v] for v, neighbors in enumerate(adjacency)]
+    degree = [len(neighbors) for neighbors in adjacency]
+    starts = [0] * (max(degree, default=0) + 1)
+    for d in degree:
+        starts[d] += 1
+    total = 0
+    for d, count in enumerate(starts):
+        starts[d] = total
+        total += count
+    vertices = [0] * n
+    position = [0] * n
+    filled = starts[:]
+    for v, d in enumerate(degree):
+        position[v] = filled[d]
+        vertices[filled[d]] = v
+        filled[d] += 1
+    for i in range(n):
+        v = vertices[i]
+        for u in adjacency[v]:
+            du = degree[u]
+            if du > degree[v]:
+                # Échange u avec le premier nœud de son seau, puis recule la
+                # frontière du seau : u passe dans le seau du degré du - 1
+                first = starts[du]
+                w = vertices[first]
+                if u != w:
+                    vertices[position[u]], vertices[first] = w, u
+                    position[w], position[u] = position[u], first
+                starts[du] += 1
+                degree[u] = du - 1
+    return degree
+
+
+# ============================================================================
+# Plus courts chemins pondérés (Dijkstra)
+# ============================================================================
+
+def dijkstra_distances(graph: Graph, start: str) -> dict[str, float]:
+    """
+    Distances pondérées depuis start vers tous les nœuds atteignables.
+    
+    Tas binaire (heapq) avec suppression paresseuse : au lieu de diminuer
+    la priorité d'un nœud déjà dans le tas, on en pousse une nouvelle copie
+    et on ignore les copies périmées au moment de les dépiler.
+    
+    Args:
+        graph: Le graphe (poids positifs ou nuls)
+        start: Nœud de départ
+    
+    Returns:
+        Dictionnaire {nœud: distance} des nœuds atteignables (start inclus)
+    
+    Raises:
+        ValueError: Si le nœud de départ n'existe pas
+    
+    Exemple:
+        >>> g = Graph()
+        >>> g.add_edge("Paris", "Lyon", 465)
+        >>> g.add_edge("Lyon", "Marseille", 315)
+        >>> dijkstra_distances(g, "Paris")
+        {'Paris': 0, 'Lyon': 465, 'Marseille': 780}
+    """
+    if not graph.has_node(start):
+        raise ValueError(f"le noeud {start!r} n'existe pas")
+    
+    distances = {start: 0}
+    settled = {}
+    heap = [(0, start)]
+    while heap:
+        distance, node = heapq.heappop(heap)
+        if node in settled:
+            continue
+        settled[node] = distance
+        for neighbor, weight in graph.weighted_neighbors(node):
+            candidate = distance + weight
+            if candidate < distances.get(neighbor, math.inf):
+                distances[neighbor] = candidate
+                heapq.heappush(heap, (candidate, neighbor))
+    return settled
+
+
+def dijkstra_path(graph: Graph, start: str, goal: str) -> list[str] | None:
+    """
+    Plus court chemin pondéré entre deux nœuds (Dijkstra).
+    
+    S'arrête dès que goal est dépilé : seuls les nœuds plus proches de
+    start que goal sont explorés. À distance égale, les nœuds sont
+    dépilés par ordre alphabétique (résultat déterministe).
+    
+    Args:
+        graph: Le graphe (poids positifs ou nuls)
+        start: Nœud de départ
+        goal: Nœud cible
+    
+    Returns:
+        Liste des nœuds du chemin, ou None si goal n'est pas atteignable
+    
+    Raises:
+        ValueError: Si l'un des nœuds n'existe pas
+    
+    Exemple:
+        >>> g = Graph()
+        >>> g.add_edge("A", "B", 1)
+        >>> g.add_edge("B", "C", 1)
+        >>> g.add_edge("A", "C", 5)
+        >>> dijkstra_path(g, "A", "C")
+        ['A', 'B', 'C']  # 2 < 5, bien que plus long en nombre d'arêtes
+    """
+    if not graph.has_node(start) or not graph.has_node(goal):
+        raise ValueError("le noeud de départ ou d'arrivée n'existe pas")
+    
+    distances = {start: 0}
+    parents = {start: None}
+    settled = set()
+    heap = [(0, start)]
+    while heap:
+        distance, node = heapq.heappop(heap)
+        if node in settled:
+            continue
+        if node == goal:
+            return _build_path(parents, goal)
+        settled.add(node)
+        for neighbor, weight in graph.weighted_neighbors(node):
+            candidate = distance + weight
+            if candidate < distances.get(neighbor, math.inf):
+                distances[neighbor] = candidate
+                parents[neighbor] = node
+                heapq.heappush(heap, (candidate, neighbor))
+    return None
+
+
+# ============================================================================
+# Recherche A* (heuristique de coordonnées)
+# ============================================================================
+
+# Rayon moyen de la Terre en km (haversine_distance)
+EARTH_RADIUS_KM = 6371.0088
+
+# Par graphe : (version, geographic, facteur d'échelle, positions)
+_heuristic_data: "WeakKeyDictionary[Graph, tuple]" = WeakKeyDictionary()
+
+
+def euclidean_distance(p: tuple[float, float], q: tuple[float, float]) -> float:
+    """Distance euclidienne entre deux points (x, y)."""
+    return math.hypot(p[0] - q[0], p[1] - q[1])
+
+
+def haversine_distance(p: tuple[float, float], q: tuple[float, float]) -> float:
+    """
+    Distance orthodromique en km entre deux points (longitude, latitude).
+    
+    Exemple:
+        >>> round(haversine_distance((2.3522, 48.8566), (4.8357, 45.764)))
+        392
+    """
+    lon1, lat1, lon2, lat2 = map(math.radians, (p[0], p[1], q[0], q[1]))
+    a = (math.sin((lat2 - lat1) / 2) ** 2
+         + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2)
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+def coordinate_heuristic(graph: Graph) -> Callable[[str, str], float] | None:
+    """
+    Heuristique A* tirée des positions des nœuds.
+    
+    Distance haversine si graph.geographic, euclidienne sinon, multipliée
+    par un facteur d'échelle : le plus petit rapport poids / longueur sur
+    l'ensemble des arêtes. Ce facteur rend l'heuristique admissible et
+    consistante quelles que soient les unités (km routiers, pixels de la
+    mise en page, arêtes non pondérées...) : aucune arête ne « rapporte »
+    plus que sa longueur à vol d'oiseau fois le facteur.
+    
+    Le facteur est calculé en O(m) puis mis en cache tant que le graphe
+    (version) ne change pas.
+    
+    Args:
+        graph: Le graphe
+    
+    Returns:
+        Fonction heuristic(node, goal), ou None si un nœud n'a pas de position
+    """
+    if not graph.has_positions():
+        return None
+    metric = haversine_distance if graph.geographic else euclidean_distance
+    data = _heuristic_data.get(graph)
+    if data is None or data[:2] != (graph.version, graph.geographic):
+        positions = {node: graph.position(node) for node in graph.nodes()}
+        scale = math.inf
+        for node, point in positions.items():
+            for neighbor, weight in graph.weighted_neighbors(node):
+                length = metric(point, positions[neighbor])
+                if length > 0:
+                    scale = min(scale, weight / length)
+        if scale == math.inf:
+            scale = 0
+        data = (graph.version, graph.geographic, scale, positions)
+        _heuristic_data[graph] = data
+    _, _, scale, positions = data
+    
+    def heuristic(node: str, goal: str) -> float:
+        return scale * metric(positions[node], positions[goal])
+    
+    return heuristic
+
+
+def a_star_path(graph: Graph, start: str, goal: str,
+                heuristic: Callable[[str, str], float] | None = None,
+                stats: dict | None = None) -> list[str] | None:
+    """
+    Plus court chemin pondéré par A*.
+    
+    Comme dijkstra_path(), mais la file de priorité est ordonnée par
+    distance + heuristic(nœud, goal) : la recherche est guidée vers goal
+    et développe beaucoup moins de nœuds sur les requêtes point à point.
+    
+    Sans heuristique explicite, coordinate_heuristic(graph) est utilisée ;
+    si des nœuds n'ont pas de position, on se replie sur shortest_path()
+    (BFS ou Dijkstra selon que le graphe est pondéré ou non).
+    
+    Args:
+        graph: Le graphe (poids positifs ou nuls)
+        start: Nœud de départ
+        goal: Nœud cible
+        heuristic: Estimation heuristic(node, goal) de la distance restante.
+                   Elle doit être admissible (ne jamais surestimer) et
+                   consistante pour que le chemin soit optimal.
+        stats: Dictionnaire optionnel rempli avec "algorithm" ("a*", "bfs"
+               ou "dijkstra") et, pour A*, "expanded" (nœuds développés)
+    
+    Returns:
+        Liste des nœuds du chemin, ou None si goal n'est pas atteignable
+    
+    Raises:
+        ValueError: Si l'un des nœuds n'existe pas
+    
+    Exemple:
+        >>> g = load_graph("example_graph.json")   # villes positionnées
+        >>> a_star_path(g, "Lille", "Marseille")
+        ['Lille', 'Paris', 'Lyon', 'Marseille']
+    """
+    if not graph.has_node(start) or not graph.has_node(goal):
+        raise ValueError("le noeud de départ ou d'arrivée n'existe pas")
+    if stats is None:
+        stats = {}
+    if heuristic is None:
+        heuristic = coordinate_heuristic(graph)
+        if heuristic is None:
+            stats["algorithm"] = "dijkstra" if graph.is_weighted() else "bfs"
+            return shortest_path(graph, start, goal)
+    stats["algorithm"] = "a*"
+    
+    distances = {start: 0}
+    parents = {start: None}
+    settled = set()
+    heap = [(heuristic(start, goal), start)]
+    try:
+        while heap:
+            _, node = heapq.heappop(heap)
+            if node in settled:
+                continue
+            if node == goal:
+                return _build_path(parents, goal)
+            settled.add(node)
+            distance = distances[node]
+            for neighbor, weight in graph.weighted_neighbors(node):
+                candidate = distance + weight
+                if candidate < distances.get(neighbor, math.inf):
+                    distances[neighbor] = candidate
+                    parents[neighbor] = node
+                    heapq.heappush(heap, (candidate + heuristic(neighbor, goal), neighbor))
+        return None
+    finally:
+        stats["expanded"] = len(settled)
+
+
+# ============================================================================
+# Cache des résultats (LRU versionné)
+# ============================================================================
+
+class ResultCache:
+    """
+    Cache LRU borné des résultats d'algorithmes.
+    
+    Clé : (fonction, arguments, version du graphe). Graph.version change à
+    chaque modification et n'est jamais réutilisée : un graphe modifié ne
+    retrouve donc jamais un ancien résultat, et les entrées périmées sont
+    évincées naturellement par l'ordre LRU.
+    
+    Taille : chaque entrée compte pour len(résultat) (1 pour None ou un
+    booléen). Le cache est borné à la fois en nombre d'entrées et en taille
+    totale.
+    
+    Le cache est partagé entre threads (l'UI lance ses calculs dans un pool) :
+    les accès aux entrées sont protégés par un verrou, le calcul lui-même
+    se fait hors verrou.
+    
+    Exemple:
+        >>> cache = ResultCache(max_entries=100)
+        >>> cache.call(bfs, g, "A")   # calcul (miss)
+        >>> cache.call(bfs, g, "A")   # instantané (hit)
+        >>> cache.stats()["hits"]
+        1
+    """
+    
+    def __init__(self, max_entries: int = 256, max_size: int = 2_000_000):
+        """
+        Args:
+            max_entries: Nombre maximal de résultats conservés
+            max_size: Taille totale maximale (somme des len des résultats)
+        """
+        self.max_entries = max_entries
+        self.max_size = max_size
+        self._entries: OrderedDict[tuple, tuple[object, int]] = OrderedDict()
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+    
+    def call(self, function: Callable, graph: Graph, *args):
+        """
+        Retourne function(graph, *args), depuis le cache si possible.
+        
+        Le résultat rendu est une copie : l'appelant peut la modifier sans
+        corrompre le cache. Les exceptions (nœud inexistant...) ne sont pas
+        mises en cache.
+        """
+        key = (function, args, graph.version)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return copy(entry[0])
+            self.misses += 1
+        
+        result = function(graph, *args)
+        size = len(result) if hasattr(result, "__len__") else 1
+        if size <= self.max_size:
+            with self._lock:
+                if key not in self._entries:
+                    self._entries[key] = (result, size)
+                    self.size += size
+                    self._evict()
+        return copy(result)
+    
+    def _evict(self) -> None:
+        """Retire les entrées les moins récemment utilisées jusqu'à respecter les bornes."""
+        while len(self._entries) > self.max_entries or self.size > self.max_size:
+            _, (_, size) = self._entries.popitem(last=False)
+            self.size -= size
+            self.evictions += 1
+    
+    def clear(self) -> None:
+        """Vide le cache (les statistiques sont conservées)."""
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+    
+    def stats(self) -> dict:
+        """
+        Retourne les statistiques du cache.
+        
+        Returns:
+            Dictionnaire {hits, misses, evictions, entries, size, hit_rate}
+        """
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "size": self.size,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Cache partagé par l'UI et la CLI
+result_cache = ResultCache()
+
+
+def cached_dfs(graph: Graph, start: str) -> list[str]:
+    """dfs() via le cache partagé."""
+    return result_cache.call(dfs, graph, start)
+
+
+def cached_bfs(graph: Graph, start: str) -> list[str]:
+    """bfs() via le cache partagé."""
+    return result_cache.call(bfs, graph, start)
+
+
+def cached_shortest_path(graph: Graph, start: str, goal: str) -> list[str] | None:
+    """shortest_path() via le cache partagé."""
+    return result_cache.call(shortest_path, graph, start, goal)
 
 
 # ============================================================================
 # Fonctions utilitaires (optionnel, mais utile pour debug)
 # ============================================================================
 
+def _build_path(parents: dict[str, str | None], goal: str) -> list[str]:
+    """Reconstruit le chemin start → goal à partir d'un dictionnaire de parents."""
+    path = [goal]
+    while parents[path[-1]] is not None:
+        path.append(parents[path[-1]])
+    path.reverse()
+    return path
+
+
+def path_weight(graph: Graph, path: list[str] | None) -> float:
+    """
+    Retourne le poids total d'un chemin (somme des poids de ses arêtes).
+    
+    Args:
+        graph: Le graphe
+        path: Liste de nœuds ou None
+    
+    Returns:
+        Somme des poids, ou math.inf si path est None
+    
+    Raises:
+        ValueError: Si deux nœuds consécutifs ne sont pas reliés
+    """
+    if path is None:
+        return math.inf
+    return sum(graph.weight(a, b) for a, b in zip(path, path[1:]))
+
+
 def path_length(path: list[str] | None) -> int:
     """
     Retourne la longueur d'un chemin (nombre d'arêtes).
@@ -0,0 +1,463 @@
+"""
+Module core.contraction
+-----------------------
+Hiérarchies de contraction (contraction hierarchies) pour les requêtes
+de plus court chemin pondéré sur de grands réseaux routiers.
+
+Prétraitement : les nœuds sont « contractés » un par un, du moins
+important au plus important. Contracter v, c'est le retirer du graphe
+restant en ajoutant un raccourci u—w (poids d(u, v) + d(v, w)) pour
+chaque paire de voisins dont le plus court chemin passe par v ; une
+recherche locale (témoin) évite les raccourcis inutiles. L'ordre est
+choisi par différence d'arêtes : raccourcis ajoutés - arêtes retirées.
+
+Requêtes : Dijkstra bidirectionnel qui ne suit que les arêtes
+« montantes » (vers un nœud contracté plus tard). Les deux recherches
+ne visitent que quelques centaines de nœuds, puis les raccourcis du
+chemin trouvé sont dépliés récursivement en arêtes du graphe.
+
+La hiérarchie peut être sauvegardée à côté du fichier du graphe, et le
+routeur la reconstruit paresseusement quand le graphe change.
+"""
+
+import heapq
+import json
+import math
+import sys
+from array import array
+from pathlib import Path
+
+from .graph import Graph
+from .algorithms import _index_graph
+from .io import graph_fingerprint, sidecar_path
+
+
+# Extension du fichier de hiérarchie rangé à côté du graphe
+INDEX_SUFFIX = ".ch"
+
+# Nœuds stabilisés au plus par recherche de témoin (au-delà, on ajoute le
+# raccourci : il peut être superflu, jamais faux)
+WITNESS_LIMIT = 60
+
+_MAGIC = b"GXCONTRACTION1\n"
+_NO_MIDDLE = -1
+
+
+class ContractionHierarchy:
+    """
+    Graphe montant d'une hiérarchie de contraction, au format CSR.
+
+    Attributs:
+        names: Nœuds (ordre alphabétique), identifiants 0..n-1
+        rank: rank[v] = position de v dans l'ordre de contraction
+        offsets: Arêtes montantes de v : indices offsets[v]..offsets[v+1]-1
+        targets: Extrémité haute de chaque arête montante
+        weights: Poids de chaque arête montante
+        middles: Nœud contourné par un raccourci (-1 pour une arête du graphe)
+        fingerprint: Empreinte du graphe indexé (voir io.graph_fingerprint)
+    """
+
+    def __init__(self, names: list[str], rank: array, offsets: array, targets: array,
+                 weights: array, middles: array, fingerprint: str):
+        self.names = names
+        self.index = {name: i for i, name in enumerate(names)}
+        self.rank = rank
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        self.middles = middles
+        self.fingerprint = fingerprint
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def build(cls, graph: Graph, witness_limit: int = WITNESS_LIMIT) -> "ContractionHierarchy":
+        """
+        Contracte tous les nœuds du graphe.
+
+        File de priorité paresseuse : la priorité d'un nœud (différence
+        d'arêtes + nombre de voisins déjà contractés, pour répartir les
+        contractions) est recalculée quand il arrive en tête, et il est
+        remis dans la file si elle a augmenté.
+
+        Args:
+            graph: Le graphe à indexer (poids positifs ou nuls)
+            witness_limit: Nœuds stabilisés au plus par recherche de témoin
+
+        Returns:
+            La hiérarchie construite
+
+        Raises:
+            TypeError: Si le graphe est orienté
+        """
+        if graph.is_directed():
+            raise TypeError("la hiérarchie de contraction suppose un graphe non orienté")
+        names, index, _ = _index_graph(graph)
+        n = len(names)
+        # Graphe restant : remaining[u][v] = poids de l'arête (ou du raccourci)
+        remaining = [{} for _ in range(n)]
+        middle = {}
+        for u, name in enumerate(names):
+            for neighbor, weight in graph.weighted_neighbors(name):
+                v = index[neighbor]
+                if v != u:
+                    remaining[u][v] = weight
+
+        deleted = [0] * n
+
+        def priority(v: int, shortcuts: list) -> int:
+            return len(shortcuts) - len(remaining[v]) + deleted[v]
+
+        heap = [(priority(v, _shortcuts(remaining, v, witness_limit)), v) for v in range(n)]
+        heapq.heapify(heap)
+        rank = array("i", [0] * n)
+        upward = [None] * n
+        order = 0
+        while heap:
+            _, v = heapq.heappop(heap)
+            shortcuts = _shortcuts(remaining, v, witness_limit)
+            current = priority(v, shortcuts)
+            if heap and current > heap[0][0]:
+                heapq.heappush(heap, (current, v))
+                continue
+            rank[v] = order
+            order += 1
+            upward[v] = [
+                (u, w, middle.get((min(u, v), max(u, v)), _NO_MIDDLE))
+                for u, w in remaining[v].items()
+            ]
+            for u, x, w in shortcuts:
+                if w < remaining[u].get(x, math.inf):
+                    remaining[u][x] = remaining[x][u] = w
+                    middle[(min(u, x), max(u, x))] = v
+            for u in remaining[v]:
+                del remaining[u][v]
+                deleted[u] += 1
+            remaining[v] = {}
+
+        offsets = array("i", [0])
+        targets, weights, middles = array("i"), array("d"), array("i")
+        for v in range(n):
+            for u, w, m in sorted(upward[v]):
+                targets.append(u)
+                weights.append(w)
+                middles.append(m)
+            offsets.append(len(targets))
+        return cls(names, rank, offsets, targets, weights, middles, graph_fingerprint(graph))
+
+    # ------------------------------------------------------------------
+    # Requêtes
+    # ------------------------------------------------------------------
+
+    def query(self, a: str, b: str) -> tuple[float, list[str] | None, int]:
+        """
+        Plus court chemin pondéré entre a et b.
+
+        Returns:
+            (distance, chemin, nœuds stabilisés). La distance vaut math.inf
+            et le chemin None si b n'est pas atteignable depuis a.
+
+        Raises:
+            KeyError: Si a ou b n'est pas indexé
+        """
+        source, target = self.index[a], self.index[b]
+        if source == target:
+            return 0, [a], 0
+        offsets, targets, weights = self.offsets, self.targets, self.weights
+        distances = ({source: 0}, {target: 0})
+        parents = ({source: -1}, {target: -1})
+        heaps = ([(0, source)], [(0, target)])
+        best, meeting, settled = math.inf, -1, 0
+        while heaps[0] or heaps[1]:
+            for side in (0, 1):
+                heap = heaps[side]
+                if not heap:
+                    continue
+                d, u = heapq.heappop(heap)
+                dist = distances[side]
+                if d > dist[u]:
+                    continue
+                if d >= best:
+                    # Toute arête montante restante ne peut que rallonger
+                    heap.clear()
+                    continue
+                settled += 1
+                other = distances[1 - side].get(u)
+                if other is not None and d + other < best:
+                    best, meeting = d + other, u
+                for i in range(offsets[u], offsets[u + 1]):
+                    v = targets[i]
+                    candidate = d + weights[i]
+                    if candidate < dist.get(v, math.inf):
+                        dist[v] = candidate
+                        parents[side][v] = u
+                        heapq.heappush(heap, (candidate, v))
+        if meeting < 0:
+            return math.inf, None, settled
+
+        up = self._chain(parents[0], meeting)
+        down = self._chain(parents[1], meeting)
+        path = [source]
+        for u, v in zip(up, up[1:]):
+            path += self._unpack(u, v)[1:]
+        down.reverse()
+        for u, v in zip(down, down[1:]):
+            path += self._unpack(u, v)[1:]
+        return best, [self.names[v] for v in path], settled
+
+    def distance(self, a: str, b: str) -> float:
+        """Distance pondérée entre a et b (math.inf si non atteignable)."""
+        return self.query(a, b)[0]
+
+    def shortest_path(self, a: str, b: str) -> list[str] | None:
+        """Chemin le plus court entre a et b, raccourcis dépliés (ou None)."""
+        return self.query(a, b)[1]
+
+    @staticmethod
+    def _chain(parents: dict[int, int], node: int) -> list[int]:
+        """Chaîne de parents depuis l'origine d'une recherche jusqu'à node."""
+        chain = [node]
+        while parents[chain[-1]] != -1:
+            chain.append(parents[chain[-1]])
+        chain.reverse()
+        return chain
+
+    def _middle(self, u: int, v: int) -> int:
+        """Nœud contourné par l'arête montante entre u et v."""
+        low, high = (u, v) if self.rank[u] < self.rank[v] else (v, u)
+        for i in range(self.offsets[low], self.offsets[low + 1]):
+            if self.targets[i] == high:
+                return self.middles[i]
+        raise KeyError((u, v))
+
+    def _unpack(self, u: int, v: int) -> list[int]:
+        """Déplie l'arête (éventuellement raccourci) u—v en chemin du graphe."""
+        path = [u]
+        stack = [v]
+        current = u
+        while stack:
+            middle = self._middle(current, stack[-1])
+            if middle == _NO_MIDDLE:
+                current = stack.pop()
+                path.append(current)
+            else:
+                stack.append(middle)
+        return path
+
+    # ------------------------------------------------------------------
+    # Persistance
+    # ------------------------------------------------------------------
+
+    def save(self, filepath: str | Path) -> None:
+        """
+        Sauvegarde la hiérarchie (en-tête JSON + tableaux binaires bruts).
+
+        Comme pour LandmarkIndex, les noms des nœuds sont redonnés par le
+        graphe au chargement, dont l'empreinte est vérifiée.
+        """
+        header = {
+            "fingerprint": self.fingerprint,
+            "nodes": len(self.names),
+            "edges": len(self.targets),
+            "byteorder": sys.byteorder,
+        }
+        with open(filepath, "wb") as f:
+            f.write(_MAGIC)
+            f.write(json.dumps(header).encode("utf-8") + b"\n")
+            for values in self._arrays():
+                values.tofile(f)
+
+    @classmethod
+    def load(cls, filepath: str | Path, graph: Graph) -> "ContractionHierarchy":
+        """
+        Charge une hiérarchie sauvegardée pour ce graphe.
+
+        Raises:
+            FileNotFoundError: Si le fichier n'existe pas
+            ValueError: Si le fichier est invalide ou ne correspond pas au graphe
+        """
+        with open(filepath, "rb") as f:
+            if f.readline() != _MAGIC:
+                raise ValueError(f"{filepath} n'est pas une hiérarchie de contraction")
+            try:
+                header = json.loads(f.readline())
+            except json.JSONDecodeError as e:
+                raise ValueError(f"en-tête invalide dans {filepath}") from e
+            if not isinstance(header, dict):
+                raise ValueError(f"en-tête invalide dans {filepath}")
+            fingerprint = graph_fingerprint(graph)
+            try:
+                if header["fingerprint"] != fingerprint:
+                    raise ValueError("la hiérarchie ne correspond pas au graphe (empreinte différente)")
+                n, m = header["nodes"], header["edges"]
+                arrays = []
+                for typecode, size in (("i", n), ("i", n + 1), ("i", m), ("d", m), ("i", m)):
+                    values = array(typecode)
+                    try:
+                        values.fromfile(f, size)
+                    except EOFError as e:
+                        raise ValueError(f"hiérarchie tronquée : {filepath}") from e
+                    if header["byteorder"] != sys.byteorder:
+                        values.byteswap()
+                    arrays.append(values)
+            except (KeyError, TypeError) as e:
+                raise ValueError(f"en-tête invalide dans {filepath}") from e
+        return cls(graph.nodes(), *arrays, fingerprint)
+
+    def _arrays(self) -> tuple[array, ...]:
+        return self.rank, self.offsets, self.targets, self.weights, self.middles
+
+    def shortcut_count(self) -> int:
+        """Nombre de raccourcis ajoutés par la contraction."""
+        return sum(1 for m in self.middles if m != _NO_MIDDLE)
+
+    def memory_bytes(self) -> int:
+        """Taille des tableaux de la hiérarchie en octets."""
+        return sum(len(a) * a.itemsize for a in self._arrays())
+
+    def __repr__(self) -> str:
+        return (f"ContractionHierarchy(nodes={len(self.names)}, "
+                f"edges={len(self.targets)}, shortcuts={self.shortcut_count()})")
+
+
+class ContractionRouter:
+    """
+    Requêtes de plus court chemin pondéré via une ContractionHierarchy.
+
+    Même cycle de vie que landmarks.DistanceOracle : la hiérarchie est
+    reconstruite paresseusement quand Graph.version change, et relue
+    depuis index_path (puis réécrite après reconstruction) si fourni.
+
+    Exemple:
+        >>> router = ContractionRouter.for_file(graph, "france.json")
+        >>> router.shortest_path("Lille", "Marseille")
+        ['Lille', 'Paris', 'Lyon', 'Marseille']
+        >>> router.distance("Lille", "Marseille")
+        1005.0
+    """
+
+    def __init__(self, graph: Graph, index_path: str | Path | None = None,
+                 witness_limit: int = WITNESS_LIMIT):
+        """
+        Args:
+            graph: Le graphe interrogé
+            index_path: Fichier où persister la hiérarchie (optionnel)
+            witness_limit: Voir ContractionHierarchy.build
+        """
+        self.graph = graph
+        self.index_path = Path(index_path) if index_path is not None else None
+        self.witness_limit = witness_limit
+        self.last_settled = 0
+        self._hierarchy: ContractionHierarchy | None = None
+        self._version = None
+
+    @classmethod
+    def for_file(cls, graph: Graph, graph_path: str | Path) -> "ContractionRouter":
+        """Routeur dont la hiérarchie est rangée à côté du fichier du graphe."""
+        return cls(graph, sidecar_path(graph_path, INDEX_SUFFIX))
+
+    @property
+    def hierarchy(self) -> ContractionHierarchy:
+        """Hiérarchie à jour (chargée ou reconstruite si le graphe a changé)."""
+        if self._version != self.graph.version:
+            self._refresh()
+        return self._hierarchy
+
+    def _refresh(self) -> None:
+        hierarchy = None
+        if self.index_path is not None and self.index_path.exists():
+            try:
+                hierarchy = ContractionHierarchy.load(self.index_path, self.graph)
+            except ValueError:
+                hierarchy = None
+        if hierarchy is None:
+            hierarchy = ContractionHierarchy.build(self.graph, self.witness_limit)
+            if self.index_path is not None:
+                hierarchy.save(self.index_path)
+        self._hierarchy = hierarchy
+        self._version = self.graph.version
+
+    def distance(self, a: str, b: str) -> float | None:
+        """
+        Distance pondérée entre a et b.
+
+        Returns:
+            La distance, ou None si b n'est pas atteignable depuis a
+
+        Raises:
+            ValueError: Si a ou b n'existe pas
+        """
+        self._check(a, b)
+        distance, _, self.last_settled = self.hierarchy.query(a, b)
+        return None if distance == math.inf else distance
+
+    def shortest_path(self, a: str, b: str) -> list[str] | None:
+        """
+        Plus court chemin pondéré, de même poids que algorithms.dijkstra_path().
+
+        self.last_settled donne le nombre de nœuds stabilisés par la requête.
+
+        Raises:
+            ValueError: Si a ou b n'existe pas
+        """
+        self._check(a, b)
+        _, path, self.last_settled = self.hierarchy.query(a, b)
+        return path
+
+    def _check(self, a: str, b: str) -> None:
+        if not self.graph.has_node(a) or not self.graph.has_node(b):
+            raise ValueError("le noeud de départ ou d'arrivée n'existe pas")
+
+
+def _shortcuts(remaining: list[dict[int, float]], v: int,
+               witness_limit: int) -> list[tuple[int, int, float]]:
+    """
+    Raccourcis nécessaires pour contracter v dans le graphe restant.
+
+    Pour chaque voisin u, une recherche de Dijkstra bornée depuis u qui
+    évite v cherche un témoin : un chemin vers chaque autre voisin x au
+    plus aussi court que u—v—x. Sans témoin, le raccourci (u, x) est requis.
+    """
+    neighbors = list(remaining[v].items())
+    shortcuts = []
+    for i, (u, wu) in enumerate(neighbors[:-1]):
+        others = neighbors[i + 1:]
+        limit = wu + max(w for _, w in others)
+        found = _witness_search(remaining, u, v, {x for x, _ in others}, limit, witness_limit)
+        for x, wx in others:
+            if found.get(x, math.inf) > wu + wx:
+                shortcuts.append((u, x, wu + wx))
+    return shortcuts
+
+
+def _witness_search(remaining: list[dict[int, float]], source: int, excluded: int,
+                    targets: set[int], limit: float, max_settled: int) -> dict[int, float]:
+    """
+    Dijkstra local depuis source, sans passer par excluded.
+
+    S'arrête quand toutes les cibles sont stabilisées, au-delà de la
+    distance limit ou après max_settled nœuds. Les distances rendues
+    (même provisoires) sont des longueurs de chemins réels.
+    """
+    distances = {source: 0}
+    heap = [(0, source)]
+    pending = set(targets)
+    settled = 0
+    while heap and pending and settled < max_settled:
+        d, u = heapq.heappop(heap)
+        if d > distances[u]:
+            continue
+        if d > limit:
+            break
+        pending.discard(u)
+        settled += 1
+        for v, w in remaining[u].items():
+            if v == excluded:
+                continue
+            candidate = d + w
+            if candidate < distances.get(v, math.inf):
+                distances[v] = candidate
+                heapq.heappush(heap, (candidate, v))
+    return distances
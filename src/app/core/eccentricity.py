@@ -0,0 +1,310 @@
+"""
+Module core.eccentricity
+------------------------
+Diamètre, rayon et excentricités (en nombre d'arêtes) sans calculer
+toutes les paires de distances.
+
+- Diamètre exact par iFUB (Crescenzi et al.) : depuis un nœud central
+  u, on calcule l'excentricité des nœuds les plus éloignés de u, niveau
+  par niveau ; une fois les niveaux > i traités,
+  diamètre ≤ max(borne inférieure, 2i). Chaque BFS resserre en outre les
+  bornes d'excentricité de tous les nœuds (Takes et Kosters), ce qui
+  évite le BFS de la plupart des nœuds des derniers niveaux : quelques
+  dizaines de BFS au lieu de n sur les réseaux routiers et les grilles.
+  Sur les graphes « petit monde » (aléatoires, sans échelle), où presque
+  tous les nœuds ont une excentricité proche du diamètre, le nombre de
+  BFS reste élevé : d'où le budget de temps.
+- Excentricités estimées : un BFS depuis k sources échantillonnées
+  encadre l'excentricité de chaque nœud v (inégalité triangulaire) :
+      max(d(s, v), ecc(s) - d(s, v))  ≤  ecc(v)  ≤  d(s, v) + ecc(s)
+
+Les deux calculs acceptent un budget de temps : une fois dépassé, ils
+retournent les bornes obtenues jusque-là, qui restent valides.
+
+Sur un graphe non connexe, chaque nœud a l'excentricité de sa composante
+et le diamètre est le plus grand des diamètres des composantes.
+"""
+
+import random
+import time
+
+from .graph import Graph
+from .algorithms import _index_graph, connected_components
+
+
+# Nombre de sources échantillonnées par défaut pour les excentricités
+DEFAULT_SAMPLES = 16
+
+# Budget par défaut (secondes) des résumés --info et « Infos », partagé
+# entre diamètre et rayon
+INFO_TIME_BUDGET = 1.0
+
+
+def diameter(graph: Graph) -> int:
+    """
+    Diamètre exact du graphe (plus grande distance entre deux nœuds reliés).
+
+    Args:
+        graph: Le graphe (non orienté)
+
+    Returns:
+        Le diamètre, 0 pour un graphe vide ou sans arête
+
+    Raises:
+        TypeError: Si le graphe est orienté
+
+    Exemple:
+        >>> g = Graph()
+        >>> g.add_edge("A", "B")
+        >>> g.add_edge("B", "C")
+        >>> diameter(g)
+        2
+    """
+    return diameter_bounds(graph)[0]
+
+
+def diameter_bounds(graph: Graph, time_budget: float | None = None) -> tuple[int, int]:
+    """
+    Encadre le diamètre, dans la limite d'un budget de temps.
+
+    Deux BFS par composante donnent d'abord des bornes grossières
+    (coût linéaire, toujours payé) ; _component_diameter les resserre ensuite,
+    composante par composante, tant que le budget le permet.
+
+    Args:
+        graph: Le graphe (non orienté)
+        time_budget: Budget en secondes (None = jusqu'au résultat exact)
+
+    Returns:
+        (borne inférieure, borne supérieure), égales si le diamètre est exact
+
+    Raises:
+        TypeError: Si le graphe est orienté
+    """
+    if graph.is_directed():
+        raise TypeError("le diamètre suppose un graphe non orienté")
+    deadline = None if time_budget is None else time.perf_counter() + time_budget
+    _, _, adjacency = _index_graph(graph)
+    distances = [-1] * len(adjacency)
+    seen = bytearray(len(adjacency))
+
+    # Bornes grossières : ecc(r) ≤ diamètre ≤ 2·ecc(r) pour tout nœud r
+    components = []
+    lower = 0
+    for root in range(len(adjacency)):
+        if seen[root]:
+            continue
+        order = _sweep(adjacency, root, distances)
+        farthest = order[-1]
+        upper = 2 * distances[farthest]
+        _reset(order, distances)
+        order = _sweep(adjacency, farthest, distances)
+        found = distances[order[-1]]
+        _reset(order, distances)
+        for v in order:
+            seen[v] = 1
+        lower = max(lower, found)
+        if upper > found:
+            components.append((upper, farthest, order))
+
+    upper = lower
+    highs = [0] * len(adjacency)
+    components.sort(key=lambda component: component[0], reverse=True)
+    for i, (component_upper, start, nodes) in enumerate(components):
+        if component_upper <= lower:
+            break
+        if deadline is not None and time.perf_counter() > deadline:
+            upper = max(upper, max(u for u, _, _ in components[i:]))
+            break
+        low, high = _component_diameter(adjacency, nodes, start, distances, highs, deadline)
+        lower = max(lower, low)
+        upper = max(upper, high)
+    return lower, max(lower, upper)
+
+
+def eccentricity_bounds(graph: Graph, samples: int = DEFAULT_SAMPLES, seed: int = 0,
+                        time_budget: float | None = None) -> dict[str, tuple[int, int]]:
+    """
+    Encadre l'excentricité de chaque nœud à partir de sources échantillonnées.
+
+    Chaque source tirée au hasard coûte un BFS de sa composante ; une
+    composante qui n'en a reçu aucune est ensuite couverte par un BFS
+    supplémentaire, si bien que tous les nœuds ont des bornes finies.
+    L'excentricité d'une source est exacte.
+
+    Args:
+        graph: Le graphe (non orienté)
+        samples: Nombre de sources échantillonnées
+        seed: Graine du tirage des sources
+        time_budget: Budget en secondes pour l'échantillonnage (None = pas
+                     de limite) ; la couverture des composantes est toujours faite
+
+    Returns:
+        Dictionnaire {nœud: (borne inférieure, borne supérieure)}
+
+    Raises:
+        TypeError: Si le graphe est orienté
+
+    Exemple:
+        >>> g = Graph()
+        >>> g.add_edge("A", "B")
+        >>> g.add_edge("B", "C")
+        >>> eccentricity_bounds(g, samples=1)["B"]
+        (1, 1)
+    """
+    if graph.is_directed():
+        raise TypeError("les excentricités supposent un graphe non orienté")
+    deadline = None if time_budget is None else time.perf_counter() + time_budget
+    names, _, adjacency = _index_graph(graph)
+    n = len(names)
+    lows = [0] * n
+    highs = [-1] * n
+    distances = [-1] * n
+
+    def add_source(source: int) -> None:
+        order = _sweep(adjacency, source, distances)
+        radius = distances[order[-1]]
+        for v in order:
+            d = distances[v]
+            low = d if d > radius - d else radius - d
+            if low > lows[v]:
+                lows[v] = low
+            if highs[v] < 0 or d + radius < highs[v]:
+                highs[v] = d + radius
+        _reset(order, distances)
+
+    for source in random.Random(seed).sample(range(n), min(samples, n)):
+        if deadline is not None and time.perf_counter() > deadline:
+            break
+        add_source(source)
+    for v in range(n):
+        if highs[v] < 0:
+            add_source(v)
+    return {name: (lows[v], highs[v]) for v, name in enumerate(names)}
+
+
+def radius_bounds(graph: Graph, samples: int = DEFAULT_SAMPLES, seed: int = 0,
+                  time_budget: float | None = None) -> tuple[int, int]:
+    """
+    Encadre le rayon (plus petite excentricité) de la plus grande
+    composante connexe, à partir de eccentricity_bounds().
+
+    Returns:
+        (borne inférieure, borne supérieure), (0, 0) pour un graphe vide
+
+    Raises:
+        TypeError: Si le graphe est orienté
+    """
+    bounds = eccentricity_bounds(graph, samples, seed, time_budget)
+    if not bounds:
+        return 0, 0
+    largest = max(connected_components(graph), key=len)
+    return min(bounds[v][0] for v in largest), min(bounds[v][1] for v in largest)
+
+
+def format_bounds(bounds: tuple[int, int]) -> str:
+    """
+    Affiche une valeur exacte, ou l'intervalle qui l'encadre.
+
+    Exemple:
+        >>> format_bounds((7, 7)), format_bounds((7, 8))
+        ('7', 'entre 7 et 8')
+    """
+    low, high = bounds
+    return str(low) if low == high else f"entre {low} et {high}"
+
+
+# ============================================================================
+# Fonctions internes (graphe indexé)
+# ============================================================================
+
+def _sweep(adjacency: list[list[int]], source: int, distances: list[int]) -> list[int]:
+    """
+    BFS depuis source : remplit distances (initialisées à -1 dans la
+    composante) et retourne les nœuds visités par distance croissante.
+
+    Le tableau distances est partagé entre les BFS (voir _reset) : un
+    BFS ne coûte que la taille de sa composante, pas n.
+    """
+    distances[source] = 0
+    order = [source]
+    for u in order:
+        depth = distances[u] + 1
+        for v in adjacency[u]:
+            if distances[v] < 0:
+                distances[v] = depth
+                order.append(v)
+    return order
+
+
+def _reset(order: list[int], distances: list[int]) -> None:
+    for v in order:
+        distances[v] = -1
+
+
+def _walk_back(adjacency: list[list[int]], node: int, steps: int, distances: list[int]) -> int:
+    """Remonte de steps arêtes vers la source du BFS dont distances est le résultat."""
+    for _ in range(steps):
+        depth = distances[node] - 1
+        node = next(v for v in adjacency[node] if distances[v] == depth)
+    return node
+
+
+def _component_diameter(adjacency: list[list[int]], nodes: list[int], start: int,
+                        distances: list[int], highs: list[int], deadline: float | None) -> tuple[int, int]:
+    """
+    iFUB élagué par bornes d'excentricité, sur une composante (nodes).
+
+    1. Double balayage depuis start : borne inférieure et milieu du plus
+       long chemin trouvé. Le centre u est ce milieu ou le nœud de plus
+       haut degré, celui des deux dont l'excentricité est la plus petite.
+    2. iFUB : on calcule l'excentricité des nœuds les plus éloignés de u,
+       niveau par niveau. Une fois les niveaux > i traités,
+       diamètre ≤ max(borne inférieure, 2i).
+    3. Chaque BFS depuis s resserre aussi ecc(v) ≤ d(s, v) + ecc(s) pour
+       tous les nœuds : un nœud dont la borne ne dépasse pas la borne
+       inférieure du diamètre ne peut pas l'augmenter, son BFS est sauté.
+
+    Returns:
+        (borne inférieure, borne supérieure) du diamètre de la composante
+    """
+    for v in nodes:
+        highs[v] = len(nodes)
+
+    def visit(source: int) -> list[int]:
+        """BFS depuis source ; met à jour les bornes, laisse distances rempli."""
+        order = _sweep(adjacency, source, distances)
+        radius = distances[order[-1]]
+        for v in order:
+            if distances[v] + radius < highs[v]:
+                highs[v] = distances[v] + radius
+        return order
+
+    order = visit(start)
+    far = order[-1]
+    lower = distances[far]
+    middle = _walk_back(adjacency, far, lower - lower // 2, distances)
+    _reset(order, distances)
+
+    levels = None
+    hub = max(nodes, key=lambda v: len(adjacency[v]))
+    for center in dict.fromkeys((middle, hub)):
+        order = visit(center)
+        if levels is None or distances[order[-1]] < len(levels) - 1:
+            levels = [[] for _ in range(distances[order[-1]] + 1)]
+            for v in order:
+                levels[distances[v]].append(v)
+        _reset(order, distances)
+
+    for i in range(len(levels) - 1, 0, -1):
+        if lower >= 2 * i:
+            break
+        for x in levels[i]:
+            if highs[x] <= lower:
+                continue
+            if deadline is not None and time.perf_counter() > deadline:
+                return lower, max(lower, 2 * i)
+            order = visit(x)
+            lower = max(lower, distances[order[-1]])
+            _reset(order, distances)
+    return lower, lower
@@ -1,13 +1,23 @@
 """
 Module core.graph
 -----------------
-Implémentation d'un graphe non orienté basé sur une liste d'adjacence.
+Implémentation d'un graphe non orienté basé sur une liste d'adjacence,
+et de sa variante orientée (DiGraph).
 
 Ce module doit être TOTALEMENT indépendant de l'UI.
 Tous les tests du palier A doivent passer avec ce fichier.
 """
 
-from typing import Any
+from bisect import bisect_left, insort
+from itertools import count
+
+
+# Compteur partagé par tous les graphes : une valeur de version n'est jamais
+# réutilisée, elle identifie donc à elle seule un état d'un graphe donné.
+_versions = count(1)
+
+# Poids d'une arête ajoutée sans poids explicite
+DEFAULT_WEIGHT = 1
 
 
 class Graph:
@@ -16,7 +26,23 @@ class Graph:
     
     Structure de données : liste d'adjacence (dictionnaire)
     - Clé : nom du nœud (str)
-    - Valeur : liste des voisins (list[str])
+    - Valeur : liste des voisins (list[str]), maintenue triée à l'insertion
+      (bisect) pour que neighbors() n'ait qu'à la copier
+    
+    Les arêtes peuvent porter un poids (distance en km...). Seuls les poids
+    explicites sont stockés, dans un dictionnaire à part ; les autres arêtes
+    valent DEFAULT_WEIGHT. Un graphe sans aucun poids explicite reste un
+    graphe « en nombre d'arêtes » (voir is_weighted()).
+    
+    Les nœuds peuvent aussi porter une position (x, y), utilisée comme
+    heuristique par A* (algorithms.a_star_path). Si l'attribut geographic
+    vaut True, les positions sont des coordonnées (longitude, latitude)
+    en degrés.
+    
+    Chaque modification change le numéro de version (attribut version),
+    ce qui permet aux caches et index dérivés de détecter qu'ils sont périmés.
+    Les statistiques (core.stats.graph_stats), elles, sont mises à jour à
+    chaque modification plutôt que recalculées.
     
     Exemple d'usage:
         >>> g = Graph()
@@ -29,9 +55,26 @@ class Graph:
 
     def __init__(self):
         """Initialise un graphe vide."""
-        # TODO: initialiser la structure de données
-        # Conseil : utiliser un dictionnaire
-        self.graph = {}
+        self.graph: dict[str, list[str]] = {}
+        # Poids explicites, stockés dans les deux sens : _weights[a][b]
+        self._weights: dict[str, dict[str, float]] = {}
+        self._weighted_edges = 0
+        # Positions optionnelles des nœuds : _positions[node] = (x, y)
+        self._positions: dict[str, tuple[float, float]] = {}
+        self.geographic = False
+        # Statistiques incrémentales (core.stats), attachées à la demande
+        self._stats = None
+        self._version = next(_versions)
+    
+    @property
+    def version(self) -> int:
+        """
+        Numéro de version du graphe.
+        
+        Change à chaque modification, et est unique tous graphes confondus :
+        (fonction, arguments, version) suffit comme clé de cache.
+        """
+        return self._version
     
     def add_node(self, node: str) -> None:
         """
@@ -51,19 +94,30 @@ class Graph:
             >>> g.has_node("Paris")
             True
         """
-        # TODO: implémenter
-        pass
+        if not isinstance(node, str):
+            raise TypeError("le noeud doit être une chaîne de caractères")
+        if node not in self.graph:
+            self.graph[node] = []
+            self._version = next(_versions)
+            if self._stats is not None:
+                self._stats._node_added(node)
     
-    def add_edge(self, a: str, b: str) -> None:
+    def add_edge(self, a: str, b: str, weight: float | None = None) -> None:
         """
         Ajoute une arête non orientée entre deux nœuds.
         
-        Si l'arête existe déjà, ne fait rien.
+        Si l'arête existe déjà, ne fait rien (sauf mettre à jour son poids
+        si weight est fourni).
         Si l'un des nœuds n'existe pas, il est créé automatiquement.
         
         Args:
             a: Premier nœud
             b: Deuxième nœud
+            weight: Poids de l'arête (optionnel, nombre positif ou nul)
+        
+        Raises:
+            TypeError: Si weight n'est pas un nombre
+            ValueError: Si weight est négatif
         
         Exemple:
             >>> g = Graph()
@@ -73,9 +127,21 @@ class Graph:
             >>> g.has_edge("Lyon", "Paris")  # Non orienté !
             True
         """
-        # TODO: implémenter
-        # Attention : graphe NON ORIENTÉ → ajouter dans les deux sens
-        pass
+        if weight is not None:
+            self._check_weight(weight)
+        self.add_node(a)
+        self.add_node(b)
+        if self.has_edge(a, b):
+            if weight is not None and self._weights.get(a, {}).get(b) != weight:
+                self._set_weight(a, b, weight)
+                self._version = next(_versions)
+            return
+        self._link(a, b)
+        if weight is not None:
+            self._set_weight(a, b, weight)
+        self._version = next(_versions)
+        if self._stats is not None:
+            self._stats._edge_added(a, b)
     
     def remove_node(self, node: str) -> None:
         """
@@ -87,11 +153,18 @@ class Graph:
         Raises:
             ValueError: Si le nœud n'existe pas
         """
-        # TODO: implémenter
-        # Attention : supprimer aussi le nœud de toutes les listes de voisins
-        if node not in self.graph.keys():
+        if node not in self.graph:
             raise ValueError("le noeud n'existe pas")
-        del self.branch[node]
+        if self._stats is not None:
+            self._stats._node_removing(node)
+        for neighbor in self.graph[node]:
+            if neighbor != node:
+                self._discard(self.graph[neighbor], node)
+            self._drop_weight(node, neighbor)
+        self._weights.pop(node, None)
+        self._positions.pop(node, None)
+        del self.graph[node]
+        self._version = next(_versions)
     
     def remove_edge(self, a: str, b: str) -> None:
         """
@@ -104,9 +177,13 @@ class Graph:
         Raises:
             ValueError: Si l'arête n'existe pas
         """
-        # TODO: implémenter
-        # Attention : graphe NON ORIENTÉ → supprimer dans les deux sens
-        pass
+        if not self.has_edge(a, b):
+            raise ValueError("l'arête n'existe pas")
+        if self._stats is not None:
+            self._stats._edge_removing(a, b)
+        self._unlink(a, b)
+        self._drop_weight(a, b)
+        self._version = next(_versions)
     
     def neighbors(self, node: str) -> list[str]:
         """
@@ -134,19 +211,102 @@ class Graph:
             >>> g.neighbors("A")
             ['B', 'M', 'Z']  # Toujours en ordre alphabétique
         """
-        # TODO: implémenter
-        # ⚠️ IMPORTANT : retourner une COPIE triée, pas la liste interne
-        pass
+        if node not in self.graph:
+            raise ValueError("le noeud n'existe pas")
+        return list(self.graph[node])
     
     def has_node(self, node: str) -> bool:
         """Vérifie si un nœud existe dans le graphe."""
-        # TODO: implémenter
-        return node in self.graph.keys()
+        return node in self.graph
     
     def has_edge(self, a: str, b: str) -> bool:
         """Vérifie si une arête existe entre deux nœuds."""
-        # TODO: implémenter
-        return b in self.graph[a] and a in self.graph[b]
+        if a not in self.graph or b not in self.graph:
+            return False
+        adjacency = self.graph[a]
+        i = bisect_left(adjacency, b)
+        return i < len(adjacency) and adjacency[i] == b
+    
+    def weight(self, a: str, b: str) -> float:
+        """
+        Retourne le poids de l'arête (a, b).
+        
+        Returns:
+            Le poids explicite, ou DEFAULT_WEIGHT si l'arête n'en a pas
+        
+        Raises:
+            ValueError: Si l'arête n'existe pas
+        """
+        if not self.has_edge(a, b):
+            raise ValueError("l'arête n'existe pas")
+        return self._weights.get(a, {}).get(b, DEFAULT_WEIGHT)
+    
+    def weighted_neighbors(self, node: str) -> list[tuple[str, float]]:
+        """
+        Retourne les voisins d'un nœud avec le poids de l'arête.
+        
+        Returns:
+            Liste de tuples (voisin, poids), triée par voisin
+        
+        Raises:
+            ValueError: Si le nœud n'existe pas
+        """
+        if node not in self.graph:
+            raise ValueError("le noeud n'existe pas")
+        weights = self._weights.get(node, {})
+        return [(neighbor, weights.get(neighbor, DEFAULT_WEIGHT)) for neighbor in self.graph[node]]
+    
+    def is_weighted(self) -> bool:
+        """True si au moins une arête porte un poids explicite."""
+        return self._weighted_edges > 0
+    
+    def is_directed(self) -> bool:
+        """False : les arêtes de Graph n'ont pas de sens (voir DiGraph)."""
+        return False
+    
+    def set_position(self, node: str, x: float, y: float) -> None:
+        """
+        Associe une position (x, y) à un nœud existant.
+        
+        Args:
+            node: Nœud à positionner
+            x: Abscisse (ou longitude si geographic)
+            y: Ordonnée (ou latitude si geographic)
+        
+        Raises:
+            ValueError: Si le nœud n'existe pas
+            TypeError: Si x ou y n'est pas un nombre
+        
+        Exemple:
+            >>> g = Graph()
+            >>> g.add_node("Paris")
+            >>> g.set_position("Paris", 2.3522, 48.8566)
+            >>> g.position("Paris")
+            (2.3522, 48.8566)
+        """
+        if node not in self.graph:
+            raise ValueError("le noeud n'existe pas")
+        for value in (x, y):
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                raise TypeError("les coordonnées doivent être des nombres")
+        if self._positions.get(node) != (x, y):
+            self._positions[node] = (x, y)
+            self._version = next(_versions)
+    
+    def position(self, node: str) -> tuple[float, float] | None:
+        """
+        Retourne la position d'un nœud, ou None s'il n'en a pas.
+        
+        Raises:
+            ValueError: Si le nœud n'existe pas
+        """
+        if node not in self.graph:
+            raise ValueError("le noeud n'existe pas")
+        return self._positions.get(node)
+    
+    def has_positions(self) -> bool:
+        """True si le graphe est non vide et que tous ses nœuds ont une position."""
+        return bool(self.graph) and len(self._positions) == len(self.graph)
     
     def nodes(self) -> list[str]:
         """
@@ -155,8 +315,7 @@ class Graph:
         Returns:
             Liste triée des nœuds (ordre alphabétique)
         """
-        # TODO: implémenter
-        pass
+        return sorted(self.graph)
     
     def edges(self) -> list[tuple[str, str]]:
         """
@@ -172,15 +331,161 @@ class Graph:
             >>> g.edges()
             [('A', 'B')]  # Ordre normalisé
         """
-        # TODO: implémenter
-        # Astuce : utiliser un set pour éviter les doublons
-        pass
+        return [
+            (a, b)
+            for a in sorted(self.graph)
+            for b in self.graph[a]
+            if a <= b
+        ]
     
     def __len__(self) -> int:
         """Retourne le nombre de nœuds dans le graphe."""
-        # TODO: implémenter
-        pass
+        return len(self.graph)
+    
+    def _link(self, a: str, b: str) -> None:
+        """Insère l'arête (a, b) dans les listes d'adjacence (deux sens)."""
+        insort(self.graph[a], b)
+        if a != b:
+            insort(self.graph[b], a)
+    
+    def _unlink(self, a: str, b: str) -> None:
+        """Retire l'arête (a, b) des listes d'adjacence (deux sens)."""
+        self._discard(self.graph[a], b)
+        if a != b:
+            self._discard(self.graph[b], a)
+    
+    @staticmethod
+    def _check_weight(weight: float) -> None:
+        """Valide un poids d'arête (nombre positif ou nul)."""
+        if isinstance(weight, bool) or not isinstance(weight, (int, float)):
+            raise TypeError("le poids doit être un nombre")
+        if weight < 0 or weight != weight:
+            raise ValueError("le poids doit être positif ou nul")
+    
+    def _set_weight(self, a: str, b: str, weight: float) -> None:
+        """Enregistre le poids explicite de l'arête (a, b) dans les deux sens."""
+        if b not in self._weights.get(a, {}):
+            self._weighted_edges += 1
+        self._weights.setdefault(a, {})[b] = weight
+        self._weights.setdefault(b, {})[a] = weight
+    
+    def _drop_weight(self, a: str, b: str) -> None:
+        """Oublie le poids explicite de l'arête (a, b), s'il existe."""
+        if b in self._weights.get(a, {}):
+            self._weighted_edges -= 1
+            del self._weights[a][b]
+            self._weights[b].pop(a, None)
+    
+    @staticmethod
+    def _discard(adjacency: list[str], node: str) -> None:
+        """Retire node d'une liste d'adjacence triée (recherche dichotomique)."""
+        i = bisect_left(adjacency, node)
+        if i < len(adjacency) and adjacency[i] == node:
+            del adjacency[i]
     
     def __repr__(self) -> str:
         """Représentation lisible du graphe pour debug."""
-        return f"Graph(nodes={len(self)}, edges={len(self.edges())})"
+        return f"{type(self).__name__}(nodes={len(self)}, edges={len(self.edges())})"
+
+
+class DiGraph(Graph):
+    """
+    Représente un graphe orienté.
+    
+    Même API que Graph, mais add_edge(a, b) ne crée que l'arc a → b :
+    - self.graph[node] : successeurs (liste triée), renvoyés par neighbors()
+    - self._predecessors[node] : prédécesseurs (liste triée)
+    
+    Les algorithmes de parcours (dfs, bfs, chemins, Dijkstra...) suivent
+    neighbors() et suivent donc le sens des arcs sans modification.
+    
+    Exemple d'usage:
+        >>> g = DiGraph()
+        >>> g.add_edge("A", "B")
+        >>> g.has_edge("A", "B"), g.has_edge("B", "A")
+        (True, False)
+        >>> g.predecessors("B")
+        ['A']
+    """
+    
+    def __init__(self):
+        """Initialise un graphe orienté vide."""
+        self._predecessors: dict[str, list[str]] = {}
+        super().__init__()
+    
+    def add_node(self, node: str) -> None:
+        """Ajoute un nœud (voir Graph.add_node)."""
+        super().add_node(node)
+        self._predecessors.setdefault(node, [])
+    
+    def remove_node(self, node: str) -> None:
+        """
+        Supprime un nœud, ses arcs sortants et ses arcs entrants.
+        
+        Raises:
+            ValueError: Si le nœud n'existe pas
+        """
+        if node not in self.graph:
+            raise ValueError("le noeud n'existe pas")
+        if self._stats is not None:
+            self._stats._node_removing(node)
+        for successor in self.graph[node]:
+            self._discard(self._predecessors[successor], node)
+            self._drop_weight(node, successor)
+        for predecessor in self._predecessors[node]:
+            self._discard(self.graph[predecessor], node)
+            self._drop_weight(predecessor, node)
+        self._weights.pop(node, None)
+        self._positions.pop(node, None)
+        del self.graph[node]
+        del self._predecessors[node]
+        self._version = next(_versions)
+    
+    def predecessors(self, node: str) -> list[str]:
+        """
+        Retourne les nœuds qui ont un arc vers node.
+        
+        Returns:
+            Liste triée des prédécesseurs
+        
+        Raises:
+            ValueError: Si le nœud n'existe pas
+        """
+        if node not in self.graph:
+            raise ValueError("le noeud n'existe pas")
+        return list(self._predecessors[node])
+    
+    def is_directed(self) -> bool:
+        """True : add_edge(a, b) ne crée que l'arc a → b."""
+        return True
+    
+    def edges(self) -> list[tuple[str, str]]:
+        """
+        Retourne la liste de tous les arcs du graphe.
+        
+        Returns:
+            Liste de tuples (source, cible), triée
+        """
+        return [(a, b) for a in sorted(self.graph) for b in self.graph[a]]
+    
+    def _link(self, a: str, b: str) -> None:
+        """Insère l'arc a → b (successeurs de a, prédécesseurs de b)."""
+        insort(self.graph[a], b)
+        insort(self._predecessors[b], a)
+    
+    def _unlink(self, a: str, b: str) -> None:
+        """Retire l'arc a → b."""
+        self._discard(self.graph[a], b)
+        self._discard(self._predecessors[b], a)
+    
+    def _set_weight(self, a: str, b: str, weight: float) -> None:
+        """Enregistre le poids explicite de l'arc a → b."""
+        if b not in self._weights.get(a, {}):
+            self._weighted_edges += 1
+        self._weights.setdefault(a, {})[b] = weight
+    
+    def _drop_weight(self, a: str, b: str) -> None:
+        """Oublie le poids explicite de l'arc a → b, s'il existe."""
+        if b in self._weights.get(a, {}):
+            self._weighted_edges -= 1
+            del self._weights[a][b]
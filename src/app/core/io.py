@@ -6,9 +6,10 @@ Import/Export de graphes au format JSON.
 Palier E.
 """
 
+import hashlib
 import json
 from pathlib import Path
-from .graph import Graph
+from .graph import DiGraph, Graph
 
 
 # ============================================================================
@@ -25,6 +26,13 @@ def save_graph(graph: Graph, filepath: str | Path) -> None:
         "edges": [["A", "B"], ["B", "C"]]
     }
     
+    Si le graphe est pondéré, chaque arête porte son poids en 3e élément :
+        "edges": [["Paris", "Lyon", 465], ["Lyon", "Marseille", 315]]
+    
+    Les positions des nœuds, s'il y en a, sont écrites sous "positions"
+    (et "geographic": true pour des coordonnées longitude/latitude).
+    Un DiGraph est marqué "directed": true.
+    
     Args:
         graph: Le graphe à sauvegarder
         filepath: Chemin du fichier de sortie
@@ -37,10 +45,8 @@ def save_graph(graph: Graph, filepath: str | Path) -> None:
         >>> g.add_edge("A", "B")
         >>> save_graph(g, "my_graph.json")
     """
-    # TODO: implémenter
-    # Astuce : utiliser graph.nodes() et graph.edges()
-    # Convertir les edges en liste de listes pour JSON
-    pass
+    with open(filepath, "w", encoding="utf-8") as f:
+        json.dump(graph_to_dict(graph), f, ensure_ascii=False, indent=2)
 
 
 def load_graph(filepath: str | Path) -> Graph:
@@ -53,6 +59,10 @@ def load_graph(filepath: str | Path) -> Graph:
         "edges": [["A", "B"], ["B", "C"]]
     }
     
+    Une arête peut porter un poids en 3e élément : ["Paris", "Lyon", 465].
+    Clés optionnelles : "positions" ({nœud: [x, y]}), "geographic" et
+    "directed" (true pour charger un DiGraph).
+    
     Args:
         filepath: Chemin du fichier à charger
     
@@ -69,14 +79,14 @@ def load_graph(filepath: str | Path) -> Graph:
         >>> g.has_node("A")
         True
     """
-    # TODO: implémenter
-    # Astuce :
-    # 1. Ouvrir et parser le JSON
-    # 2. Créer un graphe vide
-    # 3. Ajouter les nœuds
-    # 4. Ajouter les arêtes
-    # 5. Gérer les exceptions proprement
-    pass
+    with open(filepath, "r", encoding="utf-8") as f:
+        try:
+            data = json.load(f)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"JSON invalide dans {filepath} : {e}") from e
+    if not isinstance(data, dict):
+        raise ValueError("le fichier doit contenir un objet JSON")
+    return dict_to_graph(data)
 
 
 def graph_to_dict(graph: Graph) -> dict:
@@ -88,15 +98,36 @@ def graph_to_dict(graph: Graph) -> dict:
     
     Returns:
         Dictionnaire avec clés "nodes" et "edges"
+        (arêtes [a, b, poids] si le graphe est pondéré), plus "positions"
+        et "geographic" si des nœuds sont positionnés, "directed" pour
+        un DiGraph
     
     Exemple:
         >>> g = Graph()
         >>> g.add_edge("A", "B")
         >>> graph_to_dict(g)
         {'nodes': ['A', 'B'], 'edges': [['A', 'B']]}
+        >>> g.add_edge("A", "B", 2.5)
+        >>> graph_to_dict(g)
+        {'nodes': ['A', 'B'], 'edges': [['A', 'B', 2.5]]}
     """
-    # TODO: implémenter
-    pass
+    if graph.is_weighted():
+        edges = [[a, b, graph.weight(a, b)] for a, b in graph.edges()]
+    else:
+        edges = [[a, b] for a, b in graph.edges()]
+    data = {"nodes": graph.nodes(), "edges": edges}
+    if graph.is_directed():
+        data["directed"] = True
+    positions = {
+        node: list(graph.position(node))
+        for node in data["nodes"]
+        if graph.position(node) is not None
+    }
+    if positions:
+        data["positions"] = positions
+        if graph.geographic:
+            data["geographic"] = True
+    return data
 
 
 def dict_to_graph(data: dict) -> Graph:
@@ -107,10 +138,14 @@ def dict_to_graph(data: dict) -> Graph:
         data: Dictionnaire avec clés "nodes" et "edges"
               - "nodes": liste de chaînes ["A", "B", "C"]
               - "edges": liste de paires [["A", "B"], ["B", "C"]]
-                         (ou tuples : [("A", "B"), ("B", "C")])
+                         (ou tuples : [("A", "B"), ("B", "C")]),
+                         éventuellement pondérées : ["A", "B", 2.5]
+              - "positions" (optionnel) : {"A": [x, y], ...}
+              - "geographic" (optionnel) : positions en (longitude, latitude)
+              - "directed" (optionnel) : true pour un graphe orienté
     
     Returns:
-        Le graphe créé
+        Le graphe créé (DiGraph si "directed" vaut true)
     
     Raises:
         KeyError: Si les clés requises sont absentes
@@ -119,8 +154,10 @@ def dict_to_graph(data: dict) -> Graph:
     Validation:
         - Clés "nodes" et "edges" doivent exister
         - "nodes" : liste de chaînes
-        - "edges" : liste de paires [a, b] ou (a, b)
+        - "edges" : liste de paires [a, b] ou de triplets [a, b, poids]
         - Chaque arête doit référencer des nœuds existants
+        - Le poids doit être un nombre positif ou nul
+        - Chaque position doit référencer un nœud existant et être [x, y]
     
     Exemple:
         >>> data = {'nodes': ['A', 'B'], 'edges': [['A', 'B']]}
@@ -128,14 +165,84 @@ def dict_to_graph(data: dict) -> Graph:
         >>> g.has_edge("A", "B")
         True
     """
-    # TODO: implémenter
-    # Validation requise :
-    # 1. Vérifier que "nodes" et "edges" existent
-    # 2. Créer un graphe vide
-    # 3. Ajouter tous les nœuds
-    # 4. Pour chaque arête :
-    #    - Vérifier format (liste/tuple de 2 éléments)
-    #    - Vérifier que a et b existent dans nodes
-    #    - Ajouter l'arête
-    # 5. Gérer les exceptions proprement
-    pass
+    nodes = data["nodes"]
+    edges = data["edges"]
+    if not isinstance(nodes, list) or not isinstance(edges, list):
+        raise ValueError("'nodes' et 'edges' doivent être des listes")
+    
+    graph = DiGraph() if data.get("directed", False) else Graph()
+    for node in nodes:
+        if not isinstance(node, str):
+            raise ValueError(f"nœud invalide : {node!r}")
+        graph.add_node(node)
+    for edge in edges:
+        if not isinstance(edge, (list, tuple)) or len(edge) not in (2, 3):
+            raise ValueError(f"arête invalide : {edge!r}")
+        a, b = edge[0], edge[1]
+        weight = edge[2] if len(edge) == 3 else None
+        if not graph.has_node(a) or not graph.has_node(b):
+            raise ValueError(f"l'arête {edge!r} référence un nœud inconnu")
+        try:
+            graph.add_edge(a, b, weight)
+        except TypeError as e:
+            raise ValueError(f"poids invalide pour l'arête {edge!r}") from e
+    positions = data.get("positions", {})
+    if not isinstance(positions, dict):
+        raise ValueError("'positions' doit être un objet {nœud: [x, y]}")
+    for node, point in positions.items():
+        if not graph.has_node(node):
+            raise ValueError(f"position d'un nœud inconnu : {node!r}")
+        if not isinstance(point, (list, tuple)) or len(point) != 2:
+            raise ValueError(f"position invalide pour {node!r} : {point!r}")
+        try:
+            graph.set_position(node, point[0], point[1])
+        except TypeError as e:
+            raise ValueError(f"position invalide pour {node!r} : {point!r}") from e
+    graph.geographic = bool(data.get("geographic", False))
+    return graph
+
+
+# ============================================================================
+# Fichiers associés (index précalculés rangés à côté du graphe)
+# ============================================================================
+
+def graph_fingerprint(graph: Graph) -> str:
+    """
+    Empreinte stable de la structure du graphe (SHA-256 hexadécimal).
+    
+    Contrairement à Graph.version, qui ne vit que le temps du processus,
+    l'empreinte ne dépend que des nœuds, des arêtes et de leurs poids :
+    elle permet de vérifier qu'un index sauvegardé sur disque correspond
+    bien au graphe.
+    
+    Exemple:
+        >>> g1, g2 = Graph(), Graph()
+        >>> g1.add_edge("A", "B")
+        >>> g2.add_edge("B", "A")
+        >>> graph_fingerprint(g1) == graph_fingerprint(g2)
+        True
+    """
+    digest = hashlib.sha256()
+    if graph.is_directed():
+        digest.update(b"directed\x00")
+    for node in graph.nodes():
+        digest.update(node.encode("utf-8"))
+        digest.update(b"\x00")
+        for neighbor, weight in graph.weighted_neighbors(node):
+            digest.update(neighbor.encode("utf-8"))
+            if graph.is_weighted():
+                digest.update(repr(weight).encode("ascii"))
+            digest.update(b"\x01")
+        digest.update(b"\x02")
+    return digest.hexdigest()
+
+
+def sidecar_path(filepath: str | Path, suffix: str) -> Path:
+    """
+    Chemin d'un fichier associé à un fichier de graphe.
+    
+    Exemple:
+        >>> sidecar_path("data/france.json", ".landmarks")
+        PosixPath('data/france.landmarks')
+    """
+    return Path(filepath).with_suffix(suffix)
@@ -0,0 +1,407 @@
+"""
+Module core.landmarks
+---------------------
+Oracle de distances par points de repère (landmarks).
+
+Prétraitement : un BFS complet depuis chacun des k repères, dont les
+distances sont stockées dans des tableaux compacts (array, 2 octets par
+nœud et par repère tant que les distances tiennent sur 16 bits).
+
+Requêtes (inégalité triangulaire, pour tout repère L):
+    |d(L, a) - d(L, b)|  ≤  d(a, b)  ≤  d(a, L) + d(L, b)
+
+- bornes inférieure et supérieure en O(k), sans parcours ;
+- distance exacte par recherche A* guidée par la borne inférieure
+  (algorithme ALT), qui n'explore qu'une petite partie du graphe.
+
+L'index peut être sauvegardé à côté du fichier du graphe, et l'oracle
+le reconstruit paresseusement quand le graphe change.
+"""
+
+import heapq
+import json
+import math
+import sys
+from array import array
+from pathlib import Path
+
+from .graph import Graph
+from .algorithms import _index_graph
+from .io import graph_fingerprint, sidecar_path
+
+
+# Nombre de repères par défaut
+DEFAULT_LANDMARKS = 8
+
+# Extension du fichier d'index rangé à côté du graphe
+INDEX_SUFFIX = ".landmarks"
+
+_MAGIC = b"GXLANDMARKS1\n"
+_UNREACHABLE_16 = 0xFFFF
+
+
+class LandmarkIndex:
+    """
+    Tables de distances depuis les repères.
+
+    Attributs:
+        names: Nœuds (ordre alphabétique), identifiants 0..n-1
+        landmarks: Identifiants des repères
+        tables: Une table par repère : tables[i][v] = d(repère i, v)
+        unreachable: Valeur sentinelle des nœuds non atteignables
+        fingerprint: Empreinte du graphe indexé (voir io.graph_fingerprint)
+    """
+
+    def __init__(self, names: list[str], landmarks: list[int], tables: list[array],
+                 unreachable: int, fingerprint: str):
+        self.names = names
+        self.index = {name: i for i, name in enumerate(names)}
+        self.landmarks = landmarks
+        self.tables = tables
+        self.unreachable = unreachable
+        self.fingerprint = fingerprint
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def build(cls, graph: Graph, count: int = DEFAULT_LANDMARKS) -> "LandmarkIndex":
+        """
+        Choisit count repères et calcule leurs tables de distances.
+
+        Sélection « la plus lointaine » : le premier repère est le nœud de
+        plus haut degré, chaque suivant est le nœud le plus éloigné des
+        repères déjà choisis. Les nœuds non atteints comptent comme
+        infiniment loin : chaque composante finit par recevoir un repère.
+
+        Args:
+            graph: Le graphe à indexer
+            count: Nombre de repères (borné par le nombre de nœuds)
+
+        Returns:
+            L'index construit
+
+        Raises:
+            TypeError: Si le graphe est orienté (bornes fondées sur la symétrie)
+        """
+        if graph.is_directed():
+            raise TypeError("l'index de repères suppose un graphe non orienté")
+        names, _, adjacency = _index_graph(graph)
+        n = len(names)
+        landmarks = []
+        raw_tables = []
+        if n:
+            # Distance minimale aux repères déjà choisis (-1 = jamais atteint)
+            nearest = [-1] * n
+            current = max(range(n), key=lambda v: (len(adjacency[v]), -v))
+            for _ in range(min(count, n)):
+                distances = _bfs_distances(adjacency, current)
+                landmarks.append(current)
+                raw_tables.append(distances)
+                for v, d in enumerate(distances):
+                    if d >= 0 and (nearest[v] < 0 or d < nearest[v]):
+                        nearest[v] = d
+                current = max(range(n), key=lambda v: (nearest[v] < 0, nearest[v], -v))
+                if nearest[current] == 0:
+                    break
+
+        longest = max((max(t) for t in raw_tables), default=0)
+        if longest < _UNREACHABLE_16:
+            typecode, unreachable = "H", _UNREACHABLE_16
+        else:
+            typecode, unreachable = "i", -1
+        tables = [
+            array(typecode, (d if d >= 0 else unreachable for d in distances))
+            for distances in raw_tables
+        ]
+        return cls(names, landmarks, tables, unreachable, graph_fingerprint(graph))
+
+    # ------------------------------------------------------------------
+    # Bornes
+    # ------------------------------------------------------------------
+
+    def bounds(self, a: str, b: str) -> tuple[float, float]:
+        """
+        Encadre la distance d(a, b) en O(nombre de repères).
+
+        Returns:
+            (borne inférieure, borne supérieure). La borne inférieure vaut
+            math.inf si un repère prouve que a et b ne sont pas connectés ;
+            la borne supérieure vaut math.inf si aucun repère ne les relie.
+
+        Raises:
+            KeyError: Si a ou b n'est pas indexé
+        """
+        return self._bounds_ids(self.index[a], self.index[b])
+
+    def lower_bound(self, a: str, b: str) -> float:
+        """Borne inférieure de d(a, b) (voir bounds)."""
+        return self.bounds(a, b)[0]
+
+    def upper_bound(self, a: str, b: str) -> float:
+        """Borne supérieure de d(a, b) (voir bounds)."""
+        return self.bounds(a, b)[1]
+
+    def _bounds_ids(self, u: int, v: int) -> tuple[float, float]:
+        unreachable = self.unreachable
+        lower, upper = 0, math.inf
+        for table in self.tables:
+            du, dv = table[u], table[v]
+            if du == unreachable or dv == unreachable:
+                if du != dv:
+                    return math.inf, math.inf
+                continue
+            lower = max(lower, abs(du - dv))
+            upper = min(upper, du + dv)
+        return lower, upper
+
+    # ------------------------------------------------------------------
+    # Persistance
+    # ------------------------------------------------------------------
+
+    def save(self, filepath: str | Path) -> None:
+        """
+        Sauvegarde l'index (en-tête JSON + tables binaires brutes).
+
+        Les noms des nœuds ne sont pas stockés : ils sont redonnés par le
+        graphe au chargement, dont l'empreinte est vérifiée.
+        """
+        header = {
+            "fingerprint": self.fingerprint,
+            "nodes": len(self.names),
+            "landmarks": [self.names[v] for v in self.landmarks],
+            "typecode": self.tables[0].typecode if self.tables else "H",
+            "unreachable": self.unreachable,
+            "byteorder": sys.byteorder,
+        }
+        with open(filepath, "wb") as f:
+            f.write(_MAGIC)
+            f.write(json.dumps(header).encode("utf-8") + b"\n")
+            for table in self.tables:
+                table.tofile(f)
+
+    @classmethod
+    def load(cls, filepath: str | Path, graph: Graph) -> "LandmarkIndex":
+        """
+        Charge un index sauvegardé pour ce graphe.
+
+        Raises:
+            FileNotFoundError: Si le fichier n'existe pas
+            ValueError: Si le fichier est invalide ou ne correspond pas au graphe
+        """
+        with open(filepath, "rb") as f:
+            if f.readline() != _MAGIC:
+                raise ValueError(f"{filepath} n'est pas un index de repères")
+            try:
+                header = json.loads(f.readline())
+            except json.JSONDecodeError as e:
+                raise ValueError(f"en-tête invalide dans {filepath}") from e
+            fingerprint = graph_fingerprint(graph)
+            try:
+                if header["fingerprint"] != fingerprint:
+                    raise ValueError("l'index ne correspond pas au graphe (empreinte différente)")
+                names = graph.nodes()
+                index = {name: i for i, name in enumerate(names)}
+                landmarks = [index[name] for name in header["landmarks"]]
+                tables = []
+                for _ in landmarks:
+                    table = array(header["typecode"])
+                    try:
+                        table.fromfile(f, header["nodes"])
+                    except EOFError as e:
+                        raise ValueError(f"index tronqué : {filepath}") from e
+                    if header["byteorder"] != sys.byteorder:
+                        table.byteswap()
+                    tables.append(table)
+                unreachable = header["unreachable"]
+            except (KeyError, TypeError) as e:
+                raise ValueError(f"en-tête invalide dans {filepath}") from e
+        return cls(names, landmarks, tables, unreachable, fingerprint)
+
+    def memory_bytes(self) -> int:
+        """Taille des tables de distances en octets."""
+        return sum(len(t) * t.itemsize for t in self.tables)
+
+    def __repr__(self) -> str:
+        return f"LandmarkIndex(nodes={len(self.names)}, landmarks={len(self.landmarks)})"
+
+
+class DistanceOracle:
+    """
+    Requêtes de distance rapides sur un graphe, via un LandmarkIndex.
+
+    Les distances sont des nombres d'arêtes (BFS) : les poids d'un graphe
+    pondéré sont ignorés.
+
+    L'index est reconstruit paresseusement (à la requête suivante) quand
+    Graph.version change. Si index_path est fourni, l'index est relu
+    depuis ce fichier quand son empreinte correspond, et réécrit après
+    chaque reconstruction.
+
+    Exemple:
+        >>> oracle = DistanceOracle.for_file(graph, "france.json")
+        >>> oracle.bounds("Paris", "Lyon")
+        (1, 1)
+        >>> oracle.distance("Paris", "Marseille")
+        2
+    """
+
+    def __init__(self, graph: Graph, landmarks: int = DEFAULT_LANDMARKS,
+                 index_path: str | Path | None = None):
+        """
+        Args:
+            graph: Le graphe interrogé
+            landmarks: Nombre de repères
+            index_path: Fichier où persister l'index (optionnel)
+        """
+        self.graph = graph
+        self.landmarks = landmarks
+        self.index_path = Path(index_path) if index_path is not None else None
+        self.last_expanded = 0
+        self._index: LandmarkIndex | None = None
+        self._adjacency: list[list[int]] = []
+        self._version = None
+
+    @classmethod
+    def for_file(cls, graph: Graph, graph_path: str | Path,
+                 landmarks: int = DEFAULT_LANDMARKS) -> "DistanceOracle":
+        """Oracle dont l'index est rangé à côté du fichier du graphe."""
+        return cls(graph, landmarks, sidecar_path(graph_path, INDEX_SUFFIX))
+
+    @property
+    def index(self) -> LandmarkIndex:
+        """Index à jour (chargé ou reconstruit si le graphe a changé)."""
+        if self._version != self.graph.version:
+            self._refresh()
+        return self._index
+
+    def _refresh(self) -> None:
+        index = None
+        if self.index_path is not None and self.index_path.exists():
+            try:
+                index = LandmarkIndex.load(self.index_path, self.graph)
+            except ValueError:
+                index = None
+        if index is None:
+            index = LandmarkIndex.build(self.graph, self.landmarks)
+            if self.index_path is not None:
+                index.save(self.index_path)
+        _, _, self._adjacency = _index_graph(self.graph)
+        self._index = index
+        self._version = self.graph.version
+
+    def bounds(self, a: str, b: str) -> tuple[float, float]:
+        """Encadrement de d(a, b) sans parcours (voir LandmarkIndex.bounds)."""
+        self._check(a, b)
+        return self.index.bounds(a, b)
+
+    def distance(self, a: str, b: str) -> int | None:
+        """
+        Distance exacte (en nombre d'arêtes) entre a et b.
+
+        Returns:
+            La distance, ou None si b n'est pas atteignable depuis a
+
+        Raises:
+            ValueError: Si a ou b n'existe pas
+        
+        Note:
+            Quand les bornes coïncident (fréquent si un repère est proche
+            de l'un des deux nœuds), la réponse est donnée sans parcours.
+        """
+        lower, upper = self.bounds(a, b)
+        if lower == math.inf:
+            return None
+        if lower == upper:
+            self.last_expanded = 0
+            return lower
+        path = self.shortest_path(a, b)
+        return None if path is None else len(path) - 1
+
+    def shortest_path(self, a: str, b: str) -> list[str] | None:
+        """
+        Plus court chemin par recherche ALT (A* + bornes des repères).
+
+        Même longueur (en nombre d'arêtes) que bfs_path(), mais seuls les
+        nœuds dont la borne inférieure reste compatible avec le plus court
+        chemin sont explorés. self.last_expanded donne le nombre de nœuds
+        étendus. Les poids sont ignorés : sur un graphe pondéré, le chemin
+        peut différer de algorithms.shortest_path() (Dijkstra).
+
+        Raises:
+            ValueError: Si a ou b n'existe pas
+        """
+        self._check(a, b)
+        index = self.index
+        source, target = index.index[a], index.index[b]
+        self.last_expanded = 0
+        lower, _ = index._bounds_ids(source, target)
+        if lower == math.inf:
+            return None
+
+        tables = index.tables
+        unreachable = index.unreachable
+        # Colonnes utiles de la cible : (table, d(repère, cible))
+        columns = [(t, t[target]) for t in tables if t[target] != unreachable]
+
+        def heuristic(v: int) -> int:
+            best = 0
+            for table, dt in columns:
+                dv = table[v]
+                diff = dv - dt if dv > dt else dt - dv
+                if diff > best:
+                    best = diff
+            return best
+
+        adjacency = self._adjacency
+        parents = {source: -1}
+        cost = {source: 0}
+        # (f, -g, v) : à f égal, on préfère le nœud le plus profond
+        heap = [(heuristic(source), 0, source)]
+        while heap:
+            _, negative_g, u = heapq.heappop(heap)
+            g = -negative_g
+            if g > cost[u]:
+                continue
+            self.last_expanded += 1
+            if u == target:
+                return self._rebuild(parents, target)
+            for v in adjacency[u]:
+                if g + 1 < cost.get(v, math.inf):
+                    cost[v] = g + 1
+                    parents[v] = u
+                    heapq.heappush(heap, (g + 1 + heuristic(v), -(g + 1), v))
+        return None
+
+    def _rebuild(self, parents: dict[int, int], target: int) -> list[str]:
+        names = self._index.names
+        path = []
+        v = target
+        while v != -1:
+            path.append(names[v])
+            v = parents[v]
+        path.reverse()
+        return path
+
+    def _check(self, a: str, b: str) -> None:
+        if not self.graph.has_node(a) or not self.graph.has_node(b):
+            raise ValueError("le noeud de départ ou d'arrivée n'existe pas")
+
+
+def _bfs_distances(adjacency: list[list[int]], source: int) -> list[int]:
+    """Distances BFS depuis source sur un graphe indexé (-1 = non atteint)."""
+    distances = [-1] * len(adjacency)
+    distances[source] = 0
+    frontier = [source]
+    depth = 0
+    while frontier:
+        depth += 1
+        next_frontier = []
+        for u in frontier:
+            for v in adjacency[u]:
+                if distances[v] < 0:
+                    distances[v] = depth
+                    next_frontier.append(v)
+        frontier = next_frontier
+    return distances
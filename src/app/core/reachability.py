@@ -0,0 +1,319 @@
+"""
+Module core.reachability
+------------------------
+Index d'atteignabilité pour graphes orientés : « A peut-il atteindre B ? »
+sans parcourir le graphe à chaque requête.
+
+Prétraitement :
+1. Condensation : chaque composante fortement connexe devient un sommet
+   d'un DAG (algorithms._strongly_connected_ids). Tarjan numérote les
+   composantes puits d'abord : un arc c → d du DAG vérifie toujours d < c,
+   ce qui donne gratuitement un premier test négatif.
+2. Étiquettes, au choix :
+   - "bitset" : fermeture transitive exacte, un entier Python par
+     composante (bit d levé si d est atteignable). Requête O(1), mais
+     mémoire en O(C²) bits dans le pire cas.
+   - "intervals" : k étiquettes d'intervalles par composante (GRAIL),
+     issues de parcours en profondeur d'ordres aléatoires. Si d est
+     atteignable depuis c, l'intervalle de d est inclus dans celui de c :
+     une non-inclusion répond « non » immédiatement, sinon un parcours
+     du DAG élagué par les étiquettes tranche. Mémoire O(k·C).
+"""
+
+import random
+from array import array
+from weakref import WeakKeyDictionary
+
+from .graph import Graph
+from .algorithms import _index_graph, _strongly_connected_ids
+
+
+# Au-delà de ce nombre de composantes, "auto" choisit les intervalles
+BITSET_MAX_COMPONENTS = 20_000
+
+# Nombre d'étiquettes d'intervalles par composante
+DEFAULT_INTERVALS = 3
+
+METHODS = ("auto", "bitset", "intervals")
+
+
+class ReachabilityIndex:
+    """
+    Index d'atteignabilité d'un graphe (orienté ou non).
+
+    Attributs:
+        names: Nœuds (ordre alphabétique), identifiants 0..n-1
+        component: component[v] = composante fortement connexe du nœud v
+        dag_offsets, dag_targets: Arcs du DAG condensé (format CSR)
+        member_offsets, members: Nœuds de chaque composante (format CSR)
+        method: "bitset" ou "intervals"
+        closure: Fermeture transitive (méthode "bitset")
+        lows, highs: Étiquettes d'intervalles (méthode "intervals")
+        version: Version du graphe indexé
+    """
+
+    def __init__(self, graph: Graph, method: str = "auto",
+                 intervals: int = DEFAULT_INTERVALS, seed: int = 0):
+        """
+        Construit l'index (voir la documentation du module).
+
+        Args:
+            graph: Le graphe à indexer
+            method: "bitset", "intervals" ou "auto" (bitset tant que le
+                    DAG a au plus BITSET_MAX_COMPONENTS composantes)
+            intervals: Nombre d'étiquettes d'intervalles
+            seed: Graine des ordres de parcours aléatoires
+
+        Raises:
+            ValueError: Si method est inconnue
+        """
+        if method not in METHODS:
+            raise ValueError(f"méthode inconnue : {method!r} (attendu : {', '.join(METHODS)})")
+        self.names, self.index, adjacency = _index_graph(graph)
+        self.version = graph.version
+        components = _strongly_connected_ids(adjacency)
+        count = len(components)
+
+        self.component = array("i", [0] * len(self.names))
+        self.member_offsets = array("i", [0])
+        self.members = array("i")
+        for c, nodes in enumerate(components):
+            for v in nodes:
+                self.component[v] = c
+            self.members.extend(sorted(nodes))
+            self.member_offsets.append(len(self.members))
+
+        self.dag_offsets = array("i", [0])
+        self.dag_targets = array("i")
+        component = self.component
+        for nodes in components:
+            c = component[nodes[0]]
+            targets = {component[w] for v in nodes for w in adjacency[v]}
+            targets.discard(c)
+            self.dag_targets.extend(sorted(targets))
+            self.dag_offsets.append(len(self.dag_targets))
+
+        if method == "auto":
+            method = "bitset" if count <= BITSET_MAX_COMPONENTS else "intervals"
+        self.method = method
+        self.closure: list[int] = []
+        self.lows: list[array] = []
+        self.highs: list[array] = []
+        if method == "bitset":
+            self._build_closure()
+        else:
+            rng = random.Random(seed)
+            for _ in range(intervals):
+                self._build_intervals(rng)
+
+    # ------------------------------------------------------------------
+    # Construction des étiquettes
+    # ------------------------------------------------------------------
+
+    def _successors(self, c: int) -> array:
+        return self.dag_targets[self.dag_offsets[c]:self.dag_offsets[c + 1]]
+
+    def _build_closure(self) -> None:
+        """Fermeture transitive, puits d'abord (les successeurs sont prêts)."""
+        closure = self.closure
+        for c in range(len(self.dag_offsets) - 1):
+            reach = 1 << c
+            for d in self._successors(c):
+                reach |= closure[d]
+            closure.append(reach)
+
+    def _build_intervals(self, rng: random.Random) -> None:
+        """
+        Une étiquette GRAIL : [plus petit rang postfixe du sous-DAG, rang].
+
+        Parcours en profondeur itératif depuis les composantes dans un ordre
+        aléatoire, successeurs mélangés : chaque étiquette élague des
+        requêtes différentes.
+        """
+        count = len(self.dag_offsets) - 1
+        low = array("i", [-1] * count)
+        high = array("i", [-1] * count)
+        rank = 0
+        roots = list(range(count))
+        rng.shuffle(roots)
+        for root in roots:
+            if high[root] >= 0 or low[root] >= 0:
+                continue
+            low[root] = count          # marque « en cours »
+            work = [(root, self._shuffled(root, rng))]
+            while work:
+                c, pending = work[-1]
+                while pending and (low[pending[-1]] >= 0):
+                    d = pending.pop()
+                    if high[d] >= 0 and low[d] < low[c]:
+                        low[c] = low[d]
+                if pending:
+                    d = pending.pop()
+                    low[d] = count
+                    work.append((d, self._shuffled(d, rng)))
+                    continue
+                work.pop()
+                high[c] = rank
+                low[c] = min(low[c], rank)
+                rank += 1
+                if work:
+                    parent = work[-1][0]
+                    if low[c] < low[parent]:
+                        low[parent] = low[c]
+        self.lows.append(low)
+        self.highs.append(high)
+
+    def _shuffled(self, c: int, rng: random.Random) -> list[int]:
+        successors = list(self._successors(c))
+        rng.shuffle(successors)
+        return successors
+
+    # ------------------------------------------------------------------
+    # Requêtes
+    # ------------------------------------------------------------------
+
+    def can_reach(self, a: str, b: str) -> bool:
+        """
+        True s'il existe un chemin orienté de a vers b (tout nœud s'atteint lui-même).
+
+        Raises:
+            KeyError: Si a ou b n'est pas indexé
+        """
+        return self._reaches(self.component[self.index[a]], self.component[self.index[b]])
+
+    def reachable_from(self, start: str) -> set[str]:
+        """
+        Ensemble des nœuds atteignables depuis start (start inclus).
+
+        Énuméré depuis la fermeture (bitset) ou par parcours du DAG
+        condensé (intervals), jamais par parcours du graphe lui-même.
+
+        Raises:
+            KeyError: Si start n'est pas indexé
+        """
+        source = self.component[self.index[start]]
+        if self.method == "bitset":
+            # bin() est linéaire : bien plus rapide que d'extraire les bits un à un
+            bits = bin(self.closure[source])[:1:-1]
+            components = [c for c, bit in enumerate(bits) if bit == "1"]
+        else:
+            components = self._descendants(source)
+        names, members, offsets = self.names, self.members, self.member_offsets
+        return {names[members[i]] for c in components for i in range(offsets[c], offsets[c + 1])}
+
+    def _reaches(self, c: int, d: int) -> bool:
+        if c == d:
+            return True
+        if d > c:
+            # Tarjan : tout arc du DAG descend vers un numéro plus petit
+            return False
+        if self.method == "bitset":
+            return (self.closure[c] >> d) & 1 == 1
+        if not self._contains(c, d):
+            return False
+        # Parcours du DAG, limité aux composantes dont les étiquettes
+        # contiennent celles de d (et de numéro ≥ d)
+        offsets, targets = self.dag_offsets, self.dag_targets
+        seen = {c}
+        stack = [c]
+        while stack:
+            u = stack.pop()
+            for i in range(offsets[u], offsets[u + 1]):
+                e = targets[i]
+                if e == d:
+                    return True
+                if e > d and e not in seen and self._contains(e, d):
+                    seen.add(e)
+                    stack.append(e)
+        return False
+
+    def _contains(self, c: int, d: int) -> bool:
+        """True si chaque intervalle de d est inclus dans celui de c."""
+        for low, high in zip(self.lows, self.highs):
+            if low[d] < low[c] or high[d] > high[c]:
+                return False
+        return True
+
+    def _descendants(self, source: int) -> list[int]:
+        offsets, targets = self.dag_offsets, self.dag_targets
+        seen = bytearray(self.component_count())
+        seen[source] = 1
+        found = [source]
+        stack = [source]
+        while stack:
+            u = stack.pop()
+            for i in range(offsets[u], offsets[u + 1]):
+                d = targets[i]
+                if not seen[d]:
+                    seen[d] = 1
+                    found.append(d)
+                    stack.append(d)
+        return found
+
+    # ------------------------------------------------------------------
+    # Statistiques
+    # ------------------------------------------------------------------
+
+    def component_count(self) -> int:
+        """Nombre de composantes fortement connexes (sommets du DAG)."""
+        return len(self.dag_offsets) - 1
+
+    def memory_bytes(self) -> int:
+        """Taille des étiquettes (fermeture ou intervalles) en octets."""
+        if self.method == "bitset":
+            return sum((reach.bit_length() + 7) // 8 for reach in self.closure)
+        return sum(len(a) * a.itemsize for a in self.lows + self.highs)
+
+    def __repr__(self) -> str:
+        return (f"ReachabilityIndex(nodes={len(self.names)}, "
+                f"components={self.component_count()}, method={self.method!r})")
+
+
+# Index mis en cache par graphe, invalidés par Graph.version
+_indexes: "WeakKeyDictionary[Graph, ReachabilityIndex]" = WeakKeyDictionary()
+
+
+def reachability_index(graph: Graph) -> ReachabilityIndex:
+    """
+    Retourne l'index d'atteignabilité du graphe, reconstruit s'il a changé.
+
+    Args:
+        graph: Le graphe
+
+    Returns:
+        Index à jour (méthode "auto")
+    """
+    index = _indexes.get(graph)
+    if index is None or index.version != graph.version:
+        index = ReachabilityIndex(graph)
+        _indexes[graph] = index
+    return index
+
+
+def can_reach(graph: Graph, a: str, b: str) -> bool:
+    """
+    Indique si b est atteignable depuis a, via l'index mis en cache.
+
+    Le premier appel (ou le premier après une modification) construit
+    l'index ; les suivants répondent sans parcourir le graphe.
+
+    Args:
+        graph: Le graphe (orienté ou non)
+        a: Nœud de départ
+        b: Nœud cible
+
+    Returns:
+        True s'il existe un chemin de a vers b
+
+    Raises:
+        ValueError: Si a ou b n'existe pas
+
+    Exemple:
+        >>> g = DiGraph()
+        >>> g.add_edge("A", "B")
+        >>> can_reach(g, "A", "B"), can_reach(g, "B", "A")
+        (True, False)
+    """
+    if not graph.has_node(a) or not graph.has_node(b):
+        raise ValueError("le noeud de départ ou d'arrivée n'existe pas")
+    return reachability_index(graph).can_reach(a, b)
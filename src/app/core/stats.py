@@ -0,0 +1,272 @@
+"""
+Module core.stats
+-----------------
+Statistiques d'un graphe tenues à jour au fil des modifications.
+
+Recalculer nombre d'arêtes, connexité, densité et degrés coûte O(V + E)
+à chaque affichage : sur un graphe d'un million d'arêtes, l'ajout d'un
+nœud se paierait d'une seconde de calcul. Ici, une fois attachées au
+graphe (graph_stats), les statistiques sont mises à jour par le graphe
+lui-même, à chaque ajout ou suppression :
+- nombre d'arêtes, somme des degrés et histogramme des degrés : O(1) par
+  extrémité modifiée (O(degré) pour la suppression d'un nœud) ;
+- composantes connexes : union-find (compression de chemin par
+  halving). Un ajout fusionne deux classes en O(α) ; une suppression
+  d'arête peut couper une composante, ce que l'union-find ne sait pas
+  défaire : le nombre de composantes est alors recalculé, une fois, à
+  la consultation suivante (O(V + E)). Supprimer un nœud isolé ou une
+  boucle ne le rend pas périmé.
+
+Degré : nombre de voisins (len(neighbors)) ; sur un DiGraph, degré
+entrant + degré sortant, et composantes faiblement connexes (comme
+is_connected).
+
+Les statistiques sont mises à jour dans le thread qui modifie le graphe :
+elles sont à lire depuis ce même thread (celui de l'UI).
+"""
+
+from collections import Counter
+
+from .graph import Graph
+from .algorithms import connected_components
+
+
+class GraphStats:
+    """
+    Statistiques incrémentales d'un graphe (voir graph_stats()).
+
+    Attributs (lecture seule) : nodes, edges, components, connected,
+    density, degree_histogram, min_degree, max_degree, mean_degree.
+    Tous sont en O(1), sauf l'histogramme et les degrés extrêmes, en
+    O(nombre de degrés distincts) — quelques dizaines en pratique.
+
+    Exemple:
+        >>> g = Graph()
+        >>> stats = graph_stats(g)
+        >>> g.add_edge("A", "B")
+        >>> g.add_edge("C", "D")
+        >>> stats.edges, stats.components, stats.degree_histogram
+        (2, 2, {1: 4})
+        >>> g.add_edge("B", "C")
+        >>> stats.connected, stats.max_degree
+        (True, 2)
+    """
+
+    def __init__(self, graph: Graph):
+        """
+        Calcule les statistiques de graph (O(V + E)).
+
+        Préférer graph_stats(), qui les attache aussi au graphe pour
+        qu'elles soient tenues à jour.
+        """
+        self.graph = graph
+        self._directed = graph.is_directed()
+        self._histogram: Counter[int] = Counter(self._degree(node) for node in graph.graph)
+        self._degree_sum = sum(degree * count for degree, count in self._histogram.items())
+        # Chaque arête compte pour deux dans la somme des degrés, sauf une
+        # boucle non orientée (une seule entrée dans la liste d'adjacence)
+        loops = 0 if self._directed else sum(node in graph.graph[node] for node in graph.graph)
+        self._edges = (self._degree_sum + loops) // 2
+        self._parent: dict[str, str] = {}
+        self._components = 0
+        self._valid = False
+
+    # ------------------------------------------------------------------
+    # Lecture
+    # ------------------------------------------------------------------
+
+    @property
+    def nodes(self) -> int:
+        """Nombre de nœuds."""
+        return len(self.graph)
+
+    @property
+    def edges(self) -> int:
+        """Nombre d'arêtes (d'arcs pour un DiGraph)."""
+        return self._edges
+
+    @property
+    def components(self) -> int:
+        """Nombre de composantes connexes (recalculé si une suppression l'a périmé)."""
+        if not self._valid:
+            self._rebuild()
+        return self._components
+
+    @property
+    def connected(self) -> bool:
+        """True si le graphe est connexe (vrai pour le graphe vide, comme is_connected)."""
+        return self.components <= 1
+
+    @property
+    def density(self) -> float:
+        """Arêtes présentes / arêtes possibles (0 en dessous de deux nœuds)."""
+        n = len(self.graph)
+        if n < 2:
+            return 0.0
+        possible = n * (n - 1) if self._directed else n * (n - 1) / 2
+        return self._edges / possible
+
+    @property
+    def degree_histogram(self) -> dict[int, int]:
+        """Nombre de nœuds par degré, par degré croissant."""
+        return dict(sorted(self._histogram.items()))
+
+    @property
+    def min_degree(self) -> int:
+        """Plus petit degré (0 pour le graphe vide)."""
+        return min(self._histogram, default=0)
+
+    @property
+    def max_degree(self) -> int:
+        """Plus grand degré (0 pour le graphe vide)."""
+        return max(self._histogram, default=0)
+
+    @property
+    def mean_degree(self) -> float:
+        """Degré moyen (0 pour le graphe vide)."""
+        n = len(self.graph)
+        return self._degree_sum / n if n else 0.0
+
+    def summary(self) -> dict:
+        """
+        Toutes les statistiques dans un dictionnaire.
+
+        Returns:
+            {nodes, edges, connected, components, density,
+             degree_histogram, min_degree, max_degree, mean_degree}
+        """
+        components = self.components
+        return {
+            'nodes': self.nodes,
+            'edges': self.edges,
+            'connected': components <= 1,
+            'components': components,
+            'density': self.density,
+            'degree_histogram': self.degree_histogram,
+            'min_degree': self.min_degree,
+            'max_degree': self.max_degree,
+            'mean_degree': self.mean_degree,
+        }
+
+    # ------------------------------------------------------------------
+    # Mises à jour, appelées par Graph (après un ajout, avant une suppression)
+    # ------------------------------------------------------------------
+
+    def _node_added(self, node: str) -> None:
+        self._histogram[0] += 1
+        self._components += 1
+
+    def _edge_added(self, a: str, b: str) -> None:
+        self._edges += 1
+        for node, delta in self._endpoints(a, b):
+            degree = self._degree(node)
+            self._shift(degree - delta, degree)
+            self._degree_sum += delta
+        if self._valid:
+            self._union(a, b)
+
+    def _edge_removing(self, a: str, b: str) -> None:
+        self._edges -= 1
+        for node, delta in self._endpoints(a, b):
+            degree = self._degree(node)
+            self._shift(degree, degree - delta)
+            self._degree_sum -= delta
+        if a != b:
+            self._valid = False
+
+    def _node_removing(self, node: str) -> None:
+        graph = self.graph
+        degree = self._degree(node)
+        successors = graph.graph[node]
+        lost = Counter(other for other in successors if other != node)
+        edges = len(successors)
+        if self._directed:
+            predecessors = graph._predecessors[node]
+            lost.update(other for other in predecessors if other != node)
+            edges += len(predecessors) - (node in predecessors)
+        for other, count in lost.items():
+            d = self._degree(other)
+            self._shift(d, d - count)
+        self._edges -= edges
+        self._degree_sum -= degree + sum(lost.values())
+        self._histogram[degree] -= 1
+        if not self._histogram[degree]:
+            del self._histogram[degree]
+        # Un nœud isolé n'a jamais été fusionné depuis le dernier recalcul :
+        # il forme une classe à lui seul, sans entrée à retirer
+        if degree == 0:
+            self._components -= 1
+        else:
+            self._valid = False
+
+    # ------------------------------------------------------------------
+    # Fonctions internes
+    # ------------------------------------------------------------------
+
+    def _degree(self, node: str) -> int:
+        degree = len(self.graph.graph[node])
+        if self._directed:
+            degree += len(self.graph._predecessors[node])
+        return degree
+
+    def _endpoints(self, a: str, b: str) -> list[tuple[str, int]]:
+        """Nœuds dont le degré change avec l'arête (a, b), et de combien."""
+        if a != b:
+            return [(a, 1), (b, 1)]
+        return [(a, 2 if self._directed else 1)]
+
+    def _shift(self, old: int, new: int) -> None:
+        """Un nœud passe du degré old au degré new dans l'histogramme."""
+        histogram = self._histogram
+        histogram[old] -= 1
+        if not histogram[old]:
+            del histogram[old]
+        histogram[new] += 1
+
+    def _find(self, node: str) -> str:
+        """Représentant de la classe de node (les racines n'ont pas d'entrée)."""
+        parent = self._parent
+        while (up := parent.get(node, node)) != node:
+            parent[node] = parent.get(up, up)
+            node = parent[node]
+        return node
+
+    def _union(self, a: str, b: str) -> None:
+        root_a, root_b = self._find(a), self._find(b)
+        if root_a != root_b:
+            self._parent[root_a] = root_b
+            self._components -= 1
+
+    def _rebuild(self) -> None:
+        """
+        Recalcule le nombre de composantes (connected_components, vectorisé
+        sur les grands graphes) ; chaque nœud pointe sur le premier de la
+        sienne, qui en est la racine.
+        """
+        components = connected_components(self.graph)
+        self._parent = {node: component[0] for component in components for node in component[1:]}
+        self._components = len(components)
+        self._valid = True
+
+
+def graph_stats(graph: Graph) -> GraphStats:
+    """
+    Statistiques de graph, tenues à jour par le graphe à chaque modification.
+
+    Le premier appel les calcule (O(V + E)) et les attache au graphe ; les
+    suivants les retournent telles quelles. Pour construire un gros graphe
+    d'un coup (chargement), mieux vaut les attacher après : la mise à jour
+    à chaque ajout double environ le coût de add_edge.
+
+    Exemple:
+        >>> g = Graph()
+        >>> stats = graph_stats(g)
+        >>> g.add_edge("X", "Y")      # stats mises à jour au passage
+        >>> stats.edges
+        1
+        >>> graph_stats(g) is stats
+        True
+    """
+    if graph._stats is None:
+        graph._stats = GraphStats(graph)
+    return graph._stats
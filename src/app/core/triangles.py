@@ -0,0 +1,166 @@
+"""
+Module core.triangles
+---------------------
+Comptage de triangles et coefficients de clustering.
+
+L'approche naïve teste chaque paire de voisins de chaque nœud :
+O(Σ d²), soit des milliards de tests sur les hubs d'un graphe sans
+échelle. Ici, chaque triangle n'est énuméré qu'une fois depuis son
+sommet de plus petit rang :
+1. les nœuds sont classés par degré croissant ;
+2. adjacence « avant » : on ne garde, pour chaque nœud, que ses voisins
+   de rang supérieur (listes triées). Un hub n'a presque plus de
+   voisins avant : chaque liste est de taille O(√E) ;
+3. pour chaque arête avant (v, u), l'intersection des listes triées de
+   v et de u (fusion linéaire) donne les triangles (v, u, w).
+Coût O(E·√E) au lieu de O(Σ d²).
+
+Le mode parallèle répartit les nœuds v entre des processus
+(voir core/parallel.py).
+
+Un DiGraph est traité comme son graphe non orienté ; les boucles sont
+ignorées.
+"""
+
+from .graph import Graph
+from .algorithms import _undirected_index
+from .parallel import sum_over_chunks
+
+
+def triangle_counts(graph: Graph, workers: int | None = 1) -> dict[str, int]:
+    """
+    Compte les triangles auxquels appartient chaque nœud.
+
+    Args:
+        graph: Le graphe
+        workers: Nombre de processus (None = un par cœur, 1 = sans processus)
+
+    Returns:
+        Dictionnaire {nœud: nombre de triangles}
+
+    Exemple:
+        >>> g = Graph()
+        >>> g.add_edge("A", "B")
+        >>> g.add_edge("B", "C")
+        >>> g.add_edge("C", "A")
+        >>> g.add_edge("C", "D")
+        >>> triangle_counts(g)
+        {'A': 1, 'B': 1, 'C': 1, 'D': 0}
+    """
+    names, _, counts = _triangles(graph, workers)
+    return dict(zip(names, counts))
+
+
+def clustering(graph: Graph, workers: int | None = 1) -> dict[str, float]:
+    """
+    Coefficient de clustering local de chaque nœud.
+
+    Proportion des paires de voisins qui sont elles-mêmes reliées :
+    2·T(v) / (d(v)·(d(v) - 1)), 0 pour un nœud de degré < 2.
+
+    Args:
+        graph: Le graphe
+        workers: Nombre de processus (None = un par cœur, 1 = sans processus)
+
+    Returns:
+        Dictionnaire {nœud: coefficient entre 0 et 1}
+
+    Exemple:
+        >>> g = Graph()
+        >>> g.add_edge("A", "B")
+        >>> g.add_edge("B", "C")
+        >>> g.add_edge("C", "A")
+        >>> g.add_edge("C", "D")
+        >>> clustering(g)
+        {'A': 1.0, 'B': 1.0, 'C': 0.3333333333333333, 'D': 0.0}
+    """
+    names, degrees, counts = _triangles(graph, workers)
+    return {
+        name: 2 * counts[v] / (degrees[v] * (degrees[v] - 1)) if degrees[v] > 1 else 0.0
+        for v, name in enumerate(names)
+    }
+
+
+def transitivity(graph: Graph, workers: int | None = 1) -> float:
+    """
+    Coefficient de clustering global (transitivité).
+
+    3 × nombre de triangles / nombre de chemins de longueur 2 : la
+    probabilité que deux voisins d'un même nœud soient reliés.
+
+    Args:
+        graph: Le graphe
+        workers: Nombre de processus (None = un par cœur, 1 = sans processus)
+
+    Returns:
+        Coefficient entre 0 et 1 (0 sans chemin de longueur 2)
+    """
+    _, degrees, counts = _triangles(graph, workers)
+    triples = sum(d * (d - 1) // 2 for d in degrees)
+    return sum(counts) / triples if triples else 0.0
+
+
+def average_clustering(graph: Graph, workers: int | None = 1) -> float:
+    """
+    Moyenne des coefficients de clustering locaux (0 pour un graphe vide).
+
+    Args:
+        graph: Le graphe
+        workers: Nombre de processus (None = un par cœur, 1 = sans processus)
+    """
+    values = clustering(graph, workers)
+    return sum(values.values()) / len(values) if values else 0.0
+
+
+# ============================================================================
+# Fonctions internes (graphe indexé)
+# ============================================================================
+
+def _triangles(graph: Graph, workers: int | None) -> tuple[list[str], list[int], list[int]]:
+    """
+    Returns:
+        (noms, degrés sans boucles, triangles par nœud)
+    """
+    names, adjacency = _undirected_index(graph)
+    adjacency = [[u for u in neighbors if u != v] for v, neighbors in enumerate(adjacency)]
+    degrees = [len(neighbors) for neighbors in adjacency]
+    rank = [0] * len(names)
+    for i, v in enumerate(sorted(range(len(names)), key=degrees.__getitem__)):
+        rank[v] = i
+    forward = [[u for u in neighbors if rank[u] > rank[v]] for v, neighbors in enumerate(adjacency)]
+    counts = sum_over_chunks(_triangle_ids, forward, list(range(len(names))), len(names), workers)
+    return names, degrees, counts
+
+
+def _triangle_ids(forward: list[list[int]], nodes: list[int]) -> list[int]:
+    """
+    Triangles dont le sommet de plus petit rang est dans nodes.
+
+    Les listes avant sont triées par identifiant (ordre hérité de
+    _index_graph) : leur intersection est une simple fusion.
+
+    Returns:
+        counts[v] = nombre de ces triangles contenant v
+    """
+    counts = [0] * len(forward)
+    for v in nodes:
+        ahead = forward[v]
+        size = len(ahead)
+        for u in ahead:
+            other = forward[u]
+            i = j = 0
+            end = len(other)
+            while i < size and j < end:
+                a = ahead[i]
+                b = other[j]
+                if a < b:
+                    i += 1
+                elif a > b:
+                    j += 1
+                else:
+                    counts[v] += 1
+                    counts[u] += 1
+                    counts[a] += 1
+                    i += 1
+                    j += 1
+    return counts
@@ -0,0 +1,237 @@
+"""
+Module core.vectorized
+----------------------
+Moteur de parcours vectorisé (NumPy) sur un instantané CSR du graphe.
+
+Optionnel : n'est actif que si NumPy est installé (pip install -e ".[fast]").
+Les fonctions de algorithms.py y délèguent automatiquement au-delà de
+VECTORIZE_THRESHOLD nœuds, et les résultats sont identiques à ceux du
+chemin pur Python (même ordre de visite pour bfs).
+
+Format CSR (Compressed Sparse Row):
+    - indptr[i] : début des voisins du nœud i dans indices
+    - indices[indptr[i]:indptr[i + 1]] : voisins de i, triés
+    Les nœuds sont numérotés dans l'ordre alphabétique, comme dans
+    algorithms._index_graph().
+"""
+
+from itertools import chain
+from weakref import WeakKeyDictionary
+
+from .graph import Graph
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - dépend de l'environnement
+    np = None
+
+
+HAS_NUMPY = np is not None
+
+# Nombre de nœuds à partir duquel algorithms.py délègue à ce module
+VECTORIZE_THRESHOLD = 20_000
+
+
+class CSRGraph:
+    """
+    Instantané CSR immuable d'un Graph.
+
+    Attributs:
+        names: Noms des nœuds (ordre alphabétique)
+        index: Dictionnaire nom → entier
+        indptr: Tableau int64 de taille n + 1
+        indices: Tableau int64 des voisins concaténés
+        version: Version du graphe au moment de l'instantané
+    """
+
+    __slots__ = ("names", "index", "indptr", "indices", "version")
+
+    def __init__(self, names: list[str], index: dict[str, int], indptr, indices, version: int):
+        self.names = names
+        self.index = index
+        self.indptr = indptr
+        self.indices = indices
+        self.version = version
+
+    @classmethod
+    def from_graph(cls, graph: Graph) -> "CSRGraph":
+        """Construit l'instantané CSR d'un graphe (O(V + E))."""
+        if not HAS_NUMPY:
+            raise RuntimeError("NumPy est requis pour le moteur vectorisé")
+        names = graph.nodes()
+        index = {name: i for i, name in enumerate(names)}
+        degrees = np.fromiter((len(graph.graph[name]) for name in names), dtype=np.int64, count=len(names))
+        indptr = np.zeros(len(names) + 1, dtype=np.int64)
+        np.cumsum(degrees, out=indptr[1:])
+        flat = chain.from_iterable(graph.graph[name] for name in names)
+        indices = np.array(list(map(index.__getitem__, flat)), dtype=np.int64)
+        return cls(names, index, indptr, indices, graph.version)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __repr__(self) -> str:
+        return f"CSRGraph(nodes={len(self)}, arcs={self.indices.size})"
+
+
+# Instantanés mis en cache par graphe, invalidés par Graph.version
+_snapshots: "WeakKeyDictionary[Graph, CSRGraph]" = WeakKeyDictionary()
+
+
+def csr_snapshot(graph: Graph) -> CSRGraph:
+    """
+    Retourne l'instantané CSR du graphe, reconstruit seulement s'il a changé.
+
+    Args:
+        graph: Le graphe
+
+    Returns:
+        Instantané CSR à jour
+    """
+    snapshot = _snapshots.get(graph)
+    if snapshot is None or snapshot.version != graph.version:
+        snapshot = CSRGraph.from_graph(graph)
+        _snapshots[graph] = snapshot
+    return snapshot
+
+
+def should_vectorize(graph: Graph) -> bool:
+    """True si NumPy est disponible et le graphe assez grand pour en profiter."""
+    return HAS_NUMPY and len(graph) >= VECTORIZE_THRESHOLD
+
+
+# ============================================================================
+# Primitives sur instantané CSR
+# ============================================================================
+
+def expand_frontier(csr: CSRGraph, frontier):
+    """
+    Concatène les listes de voisins des nœuds de la frontière, dans l'ordre.
+
+    C'est exactement la séquence de voisins qu'examinerait un BFS top-down
+    qui parcourt la frontière dans l'ordre.
+    """
+    starts = csr.indptr[frontier]
+    counts = csr.indptr[frontier + 1] - starts
+    total = int(counts.sum())
+    if total == 0:
+        return np.empty(0, dtype=np.int64)
+    # Position de chaque élément dans sa propre liste de voisins
+    row_offsets = np.repeat(np.cumsum(counts) - counts, counts)
+    gather = np.repeat(starts, counts) + (np.arange(total) - row_offsets)
+    return csr.indices[gather]
+
+
+def bfs_order_ids(csr: CSRGraph, source: int):
+    """
+    BFS synchrone par couches, même ordre de visite que algorithms.bfs().
+
+    Dans chaque couche, un nœud est placé à la position de sa première
+    apparition parmi les voisins de la frontière : c'est l'ordre dans
+    lequel le BFS à file l'aurait découvert.
+
+    Returns:
+        Tableau des identifiants dans l'ordre de visite
+    """
+    visited = np.zeros(len(csr), dtype=bool)
+    visited[source] = True
+    frontier = np.array([source], dtype=np.int64)
+    levels = [frontier]
+    while frontier.size:
+        candidates = expand_frontier(csr, frontier)
+        candidates = candidates[~visited[candidates]]
+        if candidates.size == 0:
+            break
+        _, first = np.unique(candidates, return_index=True)
+        frontier = candidates[np.sort(first)]
+        visited[frontier] = True
+        levels.append(frontier)
+    return np.concatenate(levels)
+
+
+def reachable_mask(csr: CSRGraph, source: int):
+    """
+    Masque booléen des nœuds atteignables depuis source.
+
+    Même exploration par couches que bfs_order_ids(), sans reconstruire
+    l'ordre dans les couches.
+    """
+    visited = np.zeros(len(csr), dtype=bool)
+    visited[source] = True
+    frontier = np.array([source], dtype=np.int64)
+    while frontier.size:
+        candidates = expand_frontier(csr, frontier)
+        frontier = np.unique(candidates[~visited[candidates]])
+        visited[frontier] = True
+    return visited
+
+
+def component_labels(csr: CSRGraph):
+    """
+    Étiquette chaque nœud par le plus petit identifiant de sa composante.
+
+    Propagation du minimum entre voisins, avec accrochage (hooking) des
+    racines et saut de pointeurs : en pratique, bien moins d'itérations
+    que le diamètre du graphe (une propagation simple en ferait autant).
+
+    Returns:
+        Tableau int64 des étiquettes
+    """
+    n = len(csr)
+    labels = np.arange(n, dtype=np.int64)
+    non_empty = np.flatnonzero(np.diff(csr.indptr))
+    starts = csr.indptr[non_empty]
+    while True:
+        merged = labels.copy()
+        if csr.indices.size:
+            neighbor_min = np.minimum.reduceat(labels[csr.indices], starts)
+            merged[non_empty] = np.minimum(merged[non_empty], neighbor_min)
+        # La racine de chaque nœud adopte le minimum vu par ce nœud
+        np.minimum.at(merged, labels, merged)
+        while True:
+            jumped = merged[merged]
+            if np.array_equal(jumped, merged):
+                break
+            merged = jumped
+        if np.array_equal(merged, labels):
+            return labels
+        labels = merged
+
+
+# ============================================================================
+# Équivalents vectorisés des fonctions de algorithms.py
+# ============================================================================
+
+def bfs(graph: Graph, start: str) -> list[str]:
+    """Équivalent vectorisé de algorithms.bfs() (start supposé valide)."""
+    csr = csr_snapshot(graph)
+    return [csr.names[i] for i in bfs_order_ids(csr, csr.index[start]).tolist()]
+
+
+def reachable_from(graph: Graph, start: str) -> set[str]:
+    """Équivalent vectorisé de algorithms.reachable_from() (start supposé valide)."""
+    csr = csr_snapshot(graph)
+    mask = reachable_mask(csr, csr.index[start])
+    return {csr.names[i] for i in np.flatnonzero(mask).tolist()}
+
+
+def is_connected(graph: Graph) -> bool:
+    """Équivalent vectorisé de algorithms.is_connected()."""
+    csr = csr_snapshot(graph)
+    if len(csr) == 0:
+        return True
+    return bool(reachable_mask(csr, 0).all())
+
+
+def connected_components(graph: Graph) -> list[list[str]]:
+    """Équivalent vectorisé de algorithms.connected_components()."""
+    csr = csr_snapshot(graph)
+    if len(csr) == 0:
+        return []
+    labels = component_labels(csr)
+    # Tri stable : les composantes sortent par étiquette (= plus petit nœud),
+    # et les nœuds restent triés à l'intérieur de chacune
+    order = np.argsort(labels, kind="stable")
+    boundaries = np.flatnonzero(np.diff(labels[order])) + 1
+    names = csr.names
+    return [[names[i] for i in group.tolist()] for group in np.split(order, boundaries)]
@@ -5,14 +5,25 @@ Interface graphique de l'application.
 """
 
 from .app import GraphExplorerApp, main
+from .background import FutureWatcher, LayoutWorker
 from .controller import GraphController
-from .render import draw_graph, highlight_path, auto_layout
+from .layout import ForceLayout, force_layout
+from .layout_cache import LayoutCache
+from .render import GraphView, draw_graph, highlight_path, auto_layout
+from .spatial import GridIndex
 
 __all__ = [
     "GraphExplorerApp",
     "main",
     "GraphController",
+    "GraphView",
     "draw_graph",
     "highlight_path",
     "auto_layout",
+    "force_layout",
+    "ForceLayout",
+    "LayoutCache",
+    "LayoutWorker",
+    "FutureWatcher",
+    "GridIndex",
 ]
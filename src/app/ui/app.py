@@ -7,8 +7,43 @@ Palier F - Séances 6-8.
 """
 
 import tkinter as tk
-from tkinter import messagebox, filedialog
-from ..core import Graph
+from tkinter import messagebox, filedialog, simpledialog, ttk
+from ..core import Graph, graph_fingerprint, load_graph, save_graph
+from ..core.eccentricity import format_bounds
+from .background import FutureWatcher, LayoutWorker
+from .controller import GraphController
+from .layout import ForceLayout, incremental_layout
+from .layout_cache import LayoutCache
+from .render import (
+    SELECTION_COLOR,
+    ZOOM_STEP,
+    Geometry,
+    animate_traversal,
+    auto_layout,
+    draw_graph,
+    highlight_critical,
+    highlight_path,
+    view_for,
+)
+
+
+# Délai entre deux étapes d'animation (ms), et durée maximale d'une
+# animation (s) : un long parcours colore plusieurs nœuds par image
+ANIMATION_DELAY_MS = 400
+ANIMATION_MAX_SECONDS = 20.0
+SPEEDS = (0.25, 0.5, 1.0, 2.0, 4.0, 8.0)
+
+# Nœuds du parcours affichés dans la barre d'état, au plus
+STATUS_MAX_NODES = 30
+
+# Lignes de l'histogramme des degrés affichées dans les informations, au plus
+HISTOGRAM_MAX_ROWS = 12
+
+# Au-delà de CIRCLE_MAX_NODES nœuds, la disposition circulaire est
+# illisible : refresh() passe à la disposition par forces, calculée en
+# arrière-plan et affichée au fur et à mesure, puis gardée en cache sur
+# disque (LayoutCache) pour la prochaine ouverture du même graphe
+CIRCLE_MAX_NODES = 30
 
 
 class GraphExplorerApp:
@@ -18,7 +53,10 @@ class GraphExplorerApp:
     Fonctionnalités:
     - Créer/charger un graphe
     - Visualiser le graphe
-    - Lancer DFS/BFS avec animation
+    - Lancer DFS/BFS avec animation (pause, vitesse, position) ; les calculs
+      tournent en arrière-plan et peuvent être interrompus (Échap)
+    - Zoomer (molette) et se déplacer (glisser) dans les grands graphes
+    - Sélectionner (clic, Maj + rectangle) et déplacer les nœuds à la souris
     - Sauvegarder le graphe
     """
     
@@ -35,80 +73,583 @@ class GraphExplorerApp:
         
         # Graphe actuel
         self.graph = Graph()
+        self.controller = GraphController(self.graph)
+        self.positions: dict[str, tuple[int, int]] = {}
+        self._layout: LayoutWorker | None = None
+        self._watcher: FutureWatcher | None = None
+        self.layout_cache = LayoutCache()
+        self._source: str | None = None          # fichier d'où vient le graphe
+        self._fingerprint: str | None = None     # empreinte du graphe disposé
+        self._speed_index = SPEEDS.index(1.0)
         
         # Configuration de l'interface
         self._setup_ui()
     
     def _setup_ui(self):
         """Configure tous les widgets de l'interface."""
-        # TODO: implémenter l'interface
-        # Suggestions de structure:
         # 1. Frame haut : boutons de contrôle
-        # 2. Frame gauche : liste des nœuds
-        # 3. Frame centre : Canvas pour dessiner le graphe
-        # 4. Frame bas : zone de status/log
+        top_frame = tk.Frame(self.root)
+        top_frame.pack(side=tk.TOP, fill=tk.X, padx=5, pady=5)
+        buttons = [
+            ("Nouveau", self.new_graph),
+            ("Charger", self.load_graph),
+            ("Sauver", self.save_graph),
+            ("+ Nœud", self.add_node),
+            ("+ Arête", self.add_edge),
+            ("DFS", self.run_dfs),
+            ("BFS", self.run_bfs),
+            ("Chemin", self.run_shortest_path),
+            ("Points critiques", self.show_critical),
+            ("Infos", self.show_info),
+            ("Effacer", self.clear_canvas),
+            ("Interrompre", self.abort_run),
+        ]
+        for text, command in buttons:
+            tk.Button(top_frame, text=text, command=command).pack(side=tk.LEFT, padx=2)
         
-        # Exemple de structure de base:
-        # top_frame = tk.Frame(self.root)
-        # top_frame.pack(side=tk.TOP, fill=tk.X, padx=5, pady=5)
-        # 
-        # tk.Button(top_frame, text="Nouveau", command=self.new_graph).pack(side=tk.LEFT)
-        # tk.Button(top_frame, text="Charger", command=self.load_graph).pack(side=tk.LEFT)
-        # tk.Button(top_frame, text="Sauver", command=self.save_graph).pack(side=tk.LEFT)
-        # ...
+        # 1 bis. Lecture de l'animation : pause, vitesse, position
+        play_frame = tk.Frame(self.root)
+        play_frame.pack(side=tk.TOP, fill=tk.X, padx=5)
+        self.play_button = tk.Button(play_frame, text="Pause", width=8, command=self._toggle_playback)
+        self.play_button.pack(side=tk.LEFT, padx=2)
+        tk.Button(play_frame, text="−", command=lambda: self._change_speed(-1)).pack(side=tk.LEFT)
+        self.speed = tk.StringVar(value="×1")
+        tk.Label(play_frame, textvariable=self.speed, width=5).pack(side=tk.LEFT)
+        tk.Button(play_frame, text="+", command=lambda: self._change_speed(1)).pack(side=tk.LEFT)
+        self.seek = tk.Scale(play_frame, from_=0, to=0, orient=tk.HORIZONTAL, showvalue=False)
+        self.seek.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
+        self.seek.bind("<B1-Motion>", self._seek)
+        self.seek.bind("<ButtonRelease-1>", self._seek)
+        self.step = tk.StringVar()
+        tk.Label(play_frame, textvariable=self.step, width=16, anchor=tk.E).pack(side=tk.LEFT)
         
-        pass
+        # 4. Frame bas : zone de status et progression de la disposition
+        bottom_frame = tk.Frame(self.root)
+        bottom_frame.pack(side=tk.BOTTOM, fill=tk.X)
+        self.progress = ttk.Progressbar(bottom_frame, length=150, mode="determinate")
+        self.progress.pack(side=tk.RIGHT, padx=5)
+        self.hovered = tk.StringVar()
+        tk.Label(bottom_frame, textvariable=self.hovered, width=20, anchor=tk.E).pack(side=tk.RIGHT)
+        self.status = tk.StringVar(value="Prêt")
+        tk.Label(bottom_frame, textvariable=self.status, anchor=tk.W, relief=tk.SUNKEN).pack(
+            side=tk.LEFT, fill=tk.X, expand=True
+        )
+        
+        # 2. Frame gauche : liste des nœuds (sélection du départ)
+        left_frame = tk.Frame(self.root)
+        left_frame.pack(side=tk.LEFT, fill=tk.Y, padx=5, pady=5)
+        tk.Label(left_frame, text="Nœuds").pack(side=tk.TOP)
+        self.node_list = tk.Listbox(left_frame, width=20, exportselection=False)
+        self.node_list.pack(side=tk.TOP, fill=tk.Y, expand=True)
+        self.node_list.bind("<<ListboxSelect>>", self._list_selected)
+        self._rows: dict[str, int] = {}
+        self.summary = tk.StringVar()
+        tk.Label(left_frame, textvariable=self.summary, justify=tk.LEFT, anchor=tk.W).pack(
+            side=tk.TOP, fill=tk.X
+        )
+        
+        # 3. Frame centre : Canvas
+        self.canvas = tk.Canvas(self.root, bg="white")
+        self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=5, pady=5)
+        
+        # Souris : clic sur un nœud pour le sélectionner, glisser un nœud pour
+        # le déplacer, glisser le fond pour déplacer la vue, Maj + clic ou
+        # Maj + glisser pour ajouter à la sélection (nœud, rectangle) ; zoom
+        # à la molette, vue initiale au double-clic. Les nœuds sous le
+        # pointeur sont trouvés par l'index spatial de la vue.
+        self.view = view_for(self.canvas)
+        self._drag = (0.0, 0.0)
+        self._drag_mode: str | None = None    # "pan", "node" ou "band"
+        self._dragged: str | None = None
+        self._band: int | None = None          # rectangle de sélection
+        self._pointer = (0.0, 0.0)
+        self._motion_job: str | None = None
+        self.canvas.bind("<MouseWheel>", lambda event: self._zoom(event, event.delta > 0))
+        self.canvas.bind("<Button-4>", lambda event: self._zoom(event, True))
+        self.canvas.bind("<Button-5>", lambda event: self._zoom(event, False))
+        self.canvas.bind("<ButtonPress-1>", lambda event: self._press(event, extend=False))
+        self.canvas.bind("<Shift-ButtonPress-1>", lambda event: self._press(event, extend=True))
+        self.canvas.bind("<B1-Motion>", self._drag_to)
+        self.canvas.bind("<ButtonRelease-1>", self._release)
+        self.canvas.bind("<Motion>", self._hover)
+        self.canvas.bind("<Double-Button-1>", lambda event: self.view.reset_view())
+        self.canvas.bind("<Configure>", lambda event: self.view.render())
+        self.root.bind("<Escape>", lambda event: self.abort_run())
+    
+    def _zoom(self, event: tk.Event, zoom_in: bool):
+        """Zoome ou dézoome autour du pointeur."""
+        self.view.zoom(ZOOM_STEP if zoom_in else 1 / ZOOM_STEP, event.x, event.y)
+    
+    def _press(self, event: tk.Event, extend: bool):
+        """Début d'un clic : sélection, puis glisser un nœud, la vue ou un rectangle."""
+        node = self.view.node_at(event.x, event.y)
+        self._drag_mode = None
+        if node is not None and extend:
+            self._select(self.view.selected ^ {node})
+        elif node is not None:
+            if node not in self.view.selected:
+                self._select({node})
+            self._drag_mode, self._dragged = "node", node
+        elif extend:
+            self._drag_mode, self._drag = "band", (event.x, event.y)
+            self._band = self.canvas.create_rectangle(event.x, event.y, event.x, event.y,
+                                                      outline=SELECTION_COLOR, dash=(4, 2))
+        else:
+            self._select(set())
+            self._drag_mode = "pan"
+            self._drag = (event.x - self.view.offset[0], event.y - self.view.offset[1])
+    
+    def _drag_to(self, event: tk.Event):
+        """
+        Suit la souris ; le dessin est refait une fois les événements en
+        attente traités (after_idle), pas à chaque mouvement.
+        """
+        self._pointer = (event.x, event.y)
+        if self._drag_mode == "band":
+            self.canvas.coords(self._band, *self._drag, event.x, event.y)
+        elif self._drag_mode is not None and self._motion_job is None:
+            self._motion_job = self.root.after_idle(self._apply_motion)
+    
+    def _apply_motion(self):
+        self._motion_job = None
+        x, y = self._pointer
+        if self._drag_mode == "pan":
+            self.view.pan(x - self._drag[0] - self.view.offset[0], y - self._drag[1] - self.view.offset[1])
+        elif self._drag_mode == "node":
+            self._cancel_layout()
+            self.positions[self._dragged] = self.view.move_node(self._dragged, x, y)
+    
+    def _release(self, event: tk.Event):
+        """Fin d'un clic : dernier déplacement en attente, sélection des nœuds du rectangle."""
+        if self._motion_job is not None:
+            self.root.after_cancel(self._motion_job)
+            self._apply_motion()
+        if self._drag_mode == "band":
+            self.canvas.delete(self._band)
+            self._band = None
+            self._select(self.view.selected | set(self.view.nodes_in(*self._drag, event.x, event.y)))
+        self._drag_mode = None
+    
+    def _hover(self, event: tk.Event):
+        """Affiche le nom du nœud sous le pointeur."""
+        node = self.view.node_at(event.x, event.y)
+        if (node or "") != self.hovered.get():
+            self.hovered.set(node or "")
+            self.canvas.configure(cursor="hand2" if node is not None else "")
+    
+    def _select(self, nodes: set[str]):
+        """Sélectionne des nœuds ; un nœud seul devient aussi le nœud de départ de la liste."""
+        self.view.select(nodes)
+        self.node_list.selection_clear(0, tk.END)
+        if len(nodes) == 1:
+            row = self._rows[next(iter(nodes))]
+            self.node_list.selection_set(row)
+            self.node_list.see(row)
+        if len(nodes) > 1:
+            self.status.set(f"{len(nodes)} nœuds sélectionnés")
+    
+    def _list_selected(self, event: tk.Event):
+        """Sélection dans la liste : le nœud est aussi sélectionné sur le Canvas."""
+        selection = self.node_list.curselection()
+        self.view.select({self.node_list.get(selection[0])} if selection else set())
+    
+    def refresh(self):
+        """
+        Recalcule la disposition et redessine le graphe et la liste des nœuds.
+        
+        Au-delà de CIRCLE_MAX_NODES nœuds, la disposition est d'abord
+        cherchée dans le cache sur disque (_cached_layout). À défaut, le
+        graphe est dessiné aussitôt avec les positions initiales de la
+        disposition par forces, puis redessiné au fil des itérations
+        calculées en arrière-plan (LayoutWorker). Une disposition en cours
+        est annulée.
+        """
+        self._cancel_layout()
+        width, height = self.canvas.winfo_width(), self.canvas.winfo_height()
+        stepper = None
+        self._fingerprint = None
+        cached = None
+        if len(self.graph) > CIRCLE_MAX_NODES:
+            self._fingerprint = graph_fingerprint(self.graph)
+            cached = self._cached_layout()
+        if cached is not None:
+            self.positions = cached
+        elif len(self.graph) > CIRCLE_MAX_NODES:
+            stepper = ForceLayout(self.graph, width, height)
+            self.positions = stepper.positions()
+        else:
+            self.positions = auto_layout(self.graph, width, height)
+        draw_graph(self.canvas, self.graph, self.positions)
+        self.node_list.delete(0, tk.END)
+        nodes = self.graph.nodes()
+        self.node_list.insert(tk.END, *nodes)
+        self._rows = {node: row for row, node in enumerate(nodes)}
+        self._show_summary()
+        if stepper is not None and stepper.total:
+            edges = self.view.edge_keys()
+            self._layout = LayoutWorker(stepper, self.root.after, self._show_layout_progress,
+                                        self._finish_layout, unschedule=self.root.after_cancel,
+                                        prepare=lambda positions: Geometry(positions, edges))
+            self.progress.configure(maximum=stepper.total, value=0)
+            self.status.set(f"Disposition de {len(self.graph)} nœuds en cours…")
+            self._layout.start()
+    
+    def _cached_layout(self) -> dict[str, tuple[float, float]] | None:
+        """
+        Disposition du graphe reprise du cache, ou None.
+        
+        Si le graphe a un peu changé depuis la dernière disposition du même
+        fichier, les nœuds retrouvés gardent leur position et les autres
+        sont placés près de leurs voisins (incremental_layout) ; le
+        résultat est remis en cache sous la nouvelle empreinte.
+        """
+        try:
+            found = self.layout_cache.load(self.graph, self._source, self._fingerprint)
+        except OSError:
+            return None
+        if found is None:
+            return None
+        positions, exact = found
+        if exact:
+            self.status.set(f"Disposition reprise du cache ({len(positions)} nœuds)")
+            return positions
+        reused = len(positions)
+        width, height = self.canvas.winfo_width(), self.canvas.winfo_height()
+        positions.update(incremental_layout(self.graph, positions, center=(width / 2, height / 2)))
+        self._store_layout(positions)
+        self.status.set(f"Disposition reprise du cache pour {reused} nœuds, "
+                        f"{len(self.graph) - reused} placés")
+        return positions
+    
+    def _store_layout(self, positions: dict[str, tuple[float, float]]):
+        """Met la disposition du graphe en cache (sans effet si le disque refuse)."""
+        if self._fingerprint is None:
+            return
+        try:
+            self.layout_cache.save(self.graph, positions, self._source, self._fingerprint)
+        except OSError as e:
+            self.status.set(f"Disposition non mise en cache : {e}")
+    
+    def _cancel_layout(self):
+        """Annule la disposition en arrière-plan (le graphe a changé)."""
+        if self._layout is not None:
+            self._layout.cancel()
+            self._layout = None
+        self.progress.configure(value=0)
+    
+    def _show_layout_progress(self, geometry: Geometry, done: int, total: int):
+        """Dessine un instantané de la disposition en cours."""
+        self.positions = geometry.world
+        self.view.move(geometry)
+        self.progress.configure(value=done)
+    
+    def _finish_layout(self, geometry: Geometry):
+        """Dessine la disposition finale."""
+        self._layout = None
+        self.positions = geometry.world
+        self.view.move(geometry)
+        self.progress.configure(value=0)
+        self.status.set(f"Disposition terminée ({len(geometry.world)} nœuds)")
+        self._store_layout(geometry.world)
+    
+    def _place(self, nodes: list[str]):
+        """
+        Après l'ajout de nœuds ou d'arêtes : place les nouveaux nœuds près
+        de leurs voisins et détend leur voisinage, sans toucher au reste de
+        la disposition ni tout redessiner (incremental_layout, GraphView.update).
+        
+        Args:
+            nodes: Nœud ajouté, ou extrémités de l'arête ajoutée
+        """
+        self._cancel_layout()
+        self.controller.cancel()
+        new = [node for node in nodes if node not in self.positions]
+        width, height = self.view.size()
+        moved = incremental_layout(self.graph, self.positions, nodes,
+                                   center=self.view.to_world(width / 2, height / 2),
+                                   index=self.view.index)
+        self.positions = {**self.positions, **moved}
+        self.view.update(self.graph, self.positions, moved)
+        for node in new:
+            self._rows[node] = len(self._rows)
+        self.node_list.insert(tk.END, *new)
+        self._show_summary()
+    
+    def _show_summary(self):
+        """Résumé sous la liste des nœuds (statistiques incrémentales : O(1) après un ajout)."""
+        info = self.controller.get_graph_info(extended=False)
+        self.summary.set(
+            f"{info['nodes']} nœuds, {info['edges']} arêtes\n"
+            f"{info['components']} composante(s)\n"
+            f"degré {info['min_degree']} à {info['max_degree']} (moy. {info['mean_degree']:.2f})"
+        )
+    
+    def _set_graph(self, graph: Graph, source: str | None = None):
+        """
+        Remplace le graphe courant (et celui du contrôleur).
+        
+        Args:
+            graph: Nouveau graphe
+            source: Fichier d'où il vient (reprise de sa disposition en cache)
+        """
+        self.controller.cancel()
+        self._source = source
+        self.graph = graph
+        self.controller.graph = graph
+        self.view.reset_view()
+        self.refresh()
+    
+    def _selected_node(self, prompt: str = "Nœud de départ :") -> str | None:
+        """Retourne le nœud sélectionné dans la liste, ou le demande."""
+        selection = self.node_list.curselection()
+        if selection:
+            return self.node_list.get(selection[0])
+        return simpledialog.askstring("Nœud", prompt, parent=self.root)
+    
+    def _start_run(self, label: str, method, *args, on_done):
+        """
+        Lance un calcul du contrôleur en arrière-plan (GraphController.submit).
+        
+        Pendant le calcul, la barre d'état affiche la durée écoulée ; Échap
+        l'interrompt. Le résultat est remis dans la boucle Tk à
+        on_done(résultat, durée en ms), une erreur (ValueError) affichée.
+        Un calcul en cours est annulé, de même qu'à chaque modification
+        du graphe.
+        
+        Args:
+            label: Description du calcul pour la barre d'état
+            method: Méthode du contrôleur
+            *args: Ses arguments
+            on_done: Affichage du résultat
+        """
+        if self._watcher is not None:
+            self._watcher.cancel()
+        future = self.controller.submit(method, *args)
+        
+        def done(result):
+            watcher, self._watcher = self._watcher, None
+            on_done(result, watcher.elapsed * 1000)
+        
+        def failed(error: BaseException):
+            self._watcher = None
+            if not isinstance(error, ValueError):
+                raise error
+            self.status.set(f"{label} : erreur")
+            messagebox.showerror("Erreur", str(error))
+        
+        def cancelled():
+            self._watcher = None
+            self.status.set(f"{label} : annulé (le graphe a changé)")
+        
+        self._watcher = FutureWatcher(
+            future, self.root.after, done, on_error=failed,
+            on_tick=lambda elapsed: self.status.set(f"{label}… {elapsed:.1f} s (Échap pour interrompre)"),
+            on_cancel=cancelled, unschedule=self.root.after_cancel,
+        )
+        self._watcher.start()
+    
+    def abort_run(self):
+        """Interrompt le calcul en cours : son résultat sera ignoré."""
+        if self._watcher is None:
+            return
+        elapsed = self._watcher.elapsed
+        self._watcher.cancel()
+        self._watcher = None
+        self.status.set(f"Calcul interrompu après {elapsed:.1f} s")
+    
+    def _run_traversal(self, name: str, execute):
+        """Exécute un parcours via le contrôleur (en arrière-plan), l'affiche et l'anime."""
+        start = self._selected_node()
+        if not start:
+            return
+        self._start_run(f"{name} depuis {start}", execute, start,
+                        on_done=lambda order, elapsed: self._show_traversal(name, start, order, elapsed))
+    
+    def _show_traversal(self, name: str, start: str, order: list[str], elapsed: float):
+        """Dessine et anime le résultat d'un parcours."""
+        draw_graph(self.canvas, self.graph, self.positions)
+        duration = min(len(order) * ANIMATION_DELAY_MS / 1000, ANIMATION_MAX_SECONDS)
+        player = animate_traversal(self.canvas, order, self.positions, duration=duration,
+                                   on_frame=self._show_step)
+        player.speed = SPEEDS[self._speed_index]
+        shown = " → ".join(order[:STATUS_MAX_NODES])
+        if len(order) > STATUS_MAX_NODES:
+            shown += f" → … ({len(order)} nœuds)"
+        stats = self.controller.get_cache_stats()
+        self.status.set(
+            f"{name} depuis {start} ({elapsed:.1f} ms, cache {stats['hits']}/"
+            f"{stats['hits'] + stats['misses']}) : {shown}"
+        )
+    
+    def _show_step(self, position: int, total: int | None):
+        """Après chaque image de l'animation : position, bouton de lecture."""
+        self.seek.configure(to=max(total or 0, position))
+        self.seek.set(position)
+        self.step.set(f"{position} / {total if total is not None else '?'}")
+        player = self.view.animation
+        self.play_button.configure(text="Pause" if player is not None and player.playing else "Lecture")
+    
+    def _toggle_playback(self):
+        """Suspend ou reprend l'animation (la rejoue si elle est finie)."""
+        player = self.view.animation
+        if player is None:
+            return
+        if player.playing:
+            player.pause()
+        else:
+            player.play()
+        self.play_button.configure(text="Pause" if player.playing else "Lecture")
+    
+    def _change_speed(self, direction: int):
+        """Vitesse précédente (-1) ou suivante (+1) de SPEEDS."""
+        self._speed_index = min(len(SPEEDS) - 1, max(0, self._speed_index + direction))
+        speed = SPEEDS[self._speed_index]
+        self.speed.set(f"×{speed:g}")
+        if self.view.animation is not None:
+            self.view.animation.speed = speed
+    
+    def _seek(self, event: tk.Event):
+        """Déplacement du curseur de position : l'animation va à cette étape."""
+        if self.view.animation is not None:
+            self.view.animation.seek(int(self.seek.get()))
     
     def new_graph(self):
         """Crée un nouveau graphe vide."""
-        # TODO: implémenter
-        pass
+        self._set_graph(Graph())
+        self.status.set("Nouveau graphe")
     
     def load_graph(self):
         """Charge un graphe depuis un fichier JSON."""
-        # TODO: implémenter
-        # Astuce : utiliser filedialog.askopenfilename()
-        pass
+        filepath = filedialog.askopenfilename(filetypes=[("JSON", "*.json"), ("Tous", "*.*")])
+        if not filepath:
+            return
+        try:
+            graph = load_graph(filepath)
+        except (OSError, ValueError, KeyError) as e:
+            messagebox.showerror("Erreur de chargement", str(e))
+            return
+        self._set_graph(graph, filepath)
+        note = f" : {self.status.get()}" if len(graph) > CIRCLE_MAX_NODES else ""
+        self.status.set(f"Graphe chargé depuis {filepath} ({len(graph)} nœuds){note}")
     
     def save_graph(self):
         """Sauvegarde le graphe actuel en JSON."""
-        # TODO: implémenter
-        # Astuce : utiliser filedialog.asksaveasfilename()
-        pass
+        filepath = filedialog.asksaveasfilename(defaultextension=".json", filetypes=[("JSON", "*.json")])
+        if not filepath:
+            return
+        try:
+            save_graph(self.graph, filepath)
+        except OSError as e:
+            messagebox.showerror("Erreur de sauvegarde", str(e))
+            return
+        self.status.set(f"Graphe sauvegardé dans {filepath}")
+        # La disposition (nœuds ajoutés, déplacés compris) suit le fichier
+        self._source = filepath
+        if len(self.graph) > CIRCLE_MAX_NODES and self._layout is None:
+            self._fingerprint = graph_fingerprint(self.graph)
+            self._store_layout(self.positions)
     
     def add_node(self):
         """Ajoute un nœud au graphe (via dialogue)."""
-        # TODO: implémenter
-        # Astuce : utiliser tk.simpledialog.askstring()
-        pass
+        node = simpledialog.askstring("Ajouter un nœud", "Nom du nœud :", parent=self.root)
+        if not node:
+            return
+        self.graph.add_node(node)
+        self._place([node])
     
     def add_edge(self):
         """Ajoute une arête au graphe (via dialogue)."""
-        # TODO: implémenter
-        pass
+        a = simpledialog.askstring("Ajouter une arête", "Premier nœud :", parent=self.root)
+        if not a:
+            return
+        b = simpledialog.askstring("Ajouter une arête", "Deuxième nœud :", parent=self.root)
+        if not b:
+            return
+        self.graph.add_edge(a, b)
+        self._place([a, b])
     
     def run_dfs(self):
         """Lance DFS et visualise le résultat."""
-        # TODO: implémenter
-        # Astuce : appeler core.algorithms.dfs()
-        # puis render.py pour visualiser
-        pass
+        self._run_traversal("DFS", self.controller.execute_dfs)
     
     def run_bfs(self):
         """Lance BFS et visualise le résultat."""
-        # TODO: implémenter
-        pass
+        self._run_traversal("BFS", self.controller.execute_bfs)
+    
+    def run_shortest_path(self):
+        """Calcule et surligne le plus court chemin entre deux nœuds."""
+        start = self._selected_node()
+        if not start:
+            return
+        goal = simpledialog.askstring("Chemin", "Nœud d'arrivée :", parent=self.root)
+        if not goal:
+            return
+        
+        def show(path: list[str] | None, elapsed: float):
+            draw_graph(self.canvas, self.graph, self.positions)
+            if path is None:
+                self.status.set(f"Aucun chemin entre {start} et {goal} ({elapsed:.1f} ms)")
+                return
+            highlight_path(self.canvas, path, self.positions)
+            shown = " → ".join(path[:STATUS_MAX_NODES])
+            if len(path) > STATUS_MAX_NODES:
+                shown += f" → … ({len(path)} nœuds)"
+            self.status.set(f"Plus court chemin ({elapsed:.1f} ms) : {shown}")
+        
+        self._start_run(f"Chemin de {start} à {goal}", self.controller.find_shortest_path,
+                        start, goal, on_done=show)
+    
+    def show_critical(self):
+        """Surligne les points d'articulation et les ponts du graphe."""
+        
+        def show(critical: tuple[list[str], list[tuple[str, str]]], elapsed: float):
+            points, edges = critical
+            draw_graph(self.canvas, self.graph, self.positions)
+            highlight_critical(self.canvas, points, edges, self.positions)
+            self.status.set(f"{len(points)} point(s) d'articulation, {len(edges)} pont(s) ({elapsed:.1f} ms)")
+        
+        self._start_run("Points critiques", self.controller.find_critical_elements, on_done=show)
     
     def clear_canvas(self):
-        """Efface le canvas."""
-        # TODO: implémenter
-        pass
+        """Efface les surlignages (redessine le graphe)."""
+        draw_graph(self.canvas, self.graph, self.positions)
+        self.status.set("Prêt")
     
     def show_info(self):
-        """Affiche des infos sur le graphe actuel."""
-        # TODO: implémenter
-        # Exemple : nombre de nœuds, arêtes, connexité...
-        pass
+        """
+        Affiche des infos sur le graphe actuel : statistiques de base
+        immédiates, triangles, diamètre et rayon calculés en arrière-plan.
+        """
+        info = self.controller.get_graph_info(extended=False)
+        
+        def show(extra: dict, elapsed: float):
+            info.update(extra)
+            stats = self.controller.get_cache_stats()
+            extent = ""
+            if info['diameter'] is not None:
+                extent = (f"Diamètre : {format_bounds(info['diameter'])}\n"
+                          f"Rayon : {format_bounds(info['radius'])}\n")
+            rows = list(info['degree_histogram'].items())
+            histogram = ", ".join(f"{degree}: {count}" for degree, count in rows[:HISTOGRAM_MAX_ROWS])
+            if len(rows) > HISTOGRAM_MAX_ROWS:
+                histogram += ", …"
+            self.status.set(f"Informations calculées en {elapsed:.1f} ms")
+            messagebox.showinfo(
+                "Informations",
+                f"Nœuds : {info['nodes']}\n"
+                f"Arêtes : {info['edges']}\n"
+                f"Connexe : {'oui' if info['connected'] else 'non'} "
+                f"({info['components']} composante(s))\n"
+                f"Densité : {info['density']:.3f}\n"
+                f"Degrés : {info['min_degree']} à {info['max_degree']}, "
+                f"moyenne {info['mean_degree']:.2f}\n"
+                f"Nœuds par degré : {histogram}\n"
+                f"Triangles : {info['triangles']} (clustering {info['transitivity']:.3f})\n"
+                f"{extent}"
+                f"Cache : {stats['hits']} hits / {stats['misses']} misses",
+            )
+        
+        self._start_run("Infos", self.controller.get_extended_info, on_done=show)
 
 
 def main():
@@ -116,6 +657,7 @@ def main():
     root = tk.Tk()
     app = GraphExplorerApp(root)
     root.mainloop()
+    app.controller.close()
 
 
 if __name__ == "__main__":
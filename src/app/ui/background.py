@@ -0,0 +1,254 @@
+"""
+Module ui.background
+--------------------
+Calculs en arrière-plan : disposition par forces (LayoutWorker) et suivi,
+depuis la boucle Tk, des algorithmes lancés par le contrôleur (FutureWatcher).
+
+Une disposition de plusieurs milliers de nœuds prend des secondes, voire
+des minutes : calculée dans la boucle Tk, elle gèle la fenêtre. Ici :
+- le graphe est lu dans le thread Tk (construction de ForceLayout), puis
+  les itérations tournent dans un thread de travail, qui ne touche ni au
+  graphe ni aux widgets ;
+- au plus toutes les SNAPSHOT_INTERVAL secondes, et seulement si le
+  précédent a été relevé, le thread dépose un instantané des positions
+  dans une file (queue.Queue) ; la préparation du dessin qui ne dépend
+  que des positions (render.Geometry : index spatial...) est faite dans
+  le thread, pas dans la boucle Tk ;
+- côté Tk, la file est relevée toutes les POLL_INTERVAL_MS ms (after) ;
+  si dessiner un instantané a pris t secondes, le relevé suivant attend
+  de sorte que les instantanés n'occupent pas plus de MAX_DRAW_SHARE du
+  temps de la boucle Tk ;
+- cancel() arrête le thread à la fin de l'itération en cours ; les
+  instantanés déjà en file ne sont plus jamais dessinés.
+
+Le gros du calcul (NumPy) libère le GIL : la fenêtre reste fluide. En pur
+Python, le thread Tk obtient quand même la main toutes les quelques ms.
+
+Dans les deux cas, seul le thread Tk touche aux widgets : les résultats
+passent par une file ou un Future, relevés par after().
+"""
+
+import queue
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future
+
+from .layout import ForceLayout
+
+
+# Délai entre deux relevés de la file par le thread Tk (ms)
+POLL_INTERVAL_MS = 50
+
+# Premier relevé d'un Future (ms) : le délai double ensuite jusqu'à
+# POLL_INTERVAL_MS, un résultat immédiat (cache) s'affiche donc sans attendre
+FIRST_POLL_MS = 1
+
+# Délai minimal entre deux instantanés envoyés par le thread de travail (s)
+SNAPSHOT_INTERVAL = 0.25
+
+# Part maximale du temps de la boucle Tk passée à dessiner les instantanés
+MAX_DRAW_SHARE = 0.25
+
+
+Positions = dict[str, tuple[float, float]]
+
+
+class LayoutWorker:
+    """
+    Fait tourner une ForceLayout dans un thread et remonte sa progression.
+    
+    Args:
+        stepper: Disposition à calculer (construite dans le thread Tk)
+        schedule: Planificateur du thread Tk, au format de widget.after
+                  (délai en ms, fonction) ; retourne un identifiant
+        on_progress: Appelée dans le thread Tk avec (instantané, itérations
+                     faites, itérations prévues)
+        on_done: Appelée dans le thread Tk avec l'instantané final
+        unschedule: Annulation d'un relevé planifié (widget.after_cancel)
+        prepare: Appliquée aux positions dans le thread de travail ; un
+                 instantané est son résultat (les positions si None)
+    
+    Exemple:
+        >>> edges = view.edge_keys()
+        >>> worker = LayoutWorker(ForceLayout(graph), root.after,
+        ...                       on_progress=lambda g, done, total: view.move(g),
+        ...                       on_done=view.move, unschedule=root.after_cancel,
+        ...                       prepare=lambda positions: Geometry(positions, edges))
+        >>> worker.start()
+        >>> worker.cancel()    # le graphe a changé
+    """
+    
+    def __init__(self, stepper: ForceLayout, schedule: Callable[[int, Callable], object],
+                 on_progress: Callable[[object, int, int], None],
+                 on_done: Callable[[object], None],
+                 unschedule: Callable[[object], None] | None = None,
+                 prepare: Callable[[Positions], object] | None = None):
+        self.stepper = stepper
+        self._schedule = schedule
+        self._unschedule = unschedule
+        self._on_progress = on_progress
+        self._on_done = on_done
+        self._prepare = prepare
+        self._queue: queue.Queue = queue.Queue()
+        self._cancelled = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="force-layout", daemon=True)
+        self._job = None
+    
+    @property
+    def cancelled(self) -> bool:
+        """True après cancel()."""
+        return self._cancelled.is_set()
+    
+    @property
+    def running(self) -> bool:
+        """True tant que les positions finales n'ont pas été remises (ni annulé)."""
+        return self._thread.is_alive() or (self._job is not None and not self.cancelled)
+    
+    def start(self) -> None:
+        """Lance le thread de travail et le relevé périodique de la file."""
+        self._thread.start()
+        self._job = self._schedule(POLL_INTERVAL_MS, self._poll)
+    
+    def cancel(self) -> None:
+        """Arrête le calcul ; plus aucun rappel n'aura lieu."""
+        self._cancelled.set()
+        if self._job is not None and self._unschedule is not None:
+            self._unschedule(self._job)
+        self._job = None
+    
+    def join(self, timeout: float | None = None) -> None:
+        """Attend la fin du thread de travail (tests, fermeture)."""
+        self._thread.join(timeout)
+    
+    def _run(self) -> None:
+        """Thread de travail : itère et dépose des instantanés dans la file."""
+        stepper = self.stepper
+        last = time.perf_counter()
+        while not self._cancelled.is_set() and stepper.step():
+            now = time.perf_counter()
+            if now - last >= SNAPSHOT_INTERVAL and stepper.done < stepper.total and self._queue.empty():
+                self._queue.put(("progress", self._snapshot(), stepper.done))
+                last = now
+        if not self._cancelled.is_set():
+            self._queue.put(("done", self._snapshot(), stepper.done))
+    
+    def _snapshot(self) -> object:
+        positions = self.stepper.positions()
+        return positions if self._prepare is None else self._prepare(positions)
+    
+    def _poll(self) -> None:
+        """Thread Tk : dessine l'instantané reçu, puis se replanifie."""
+        self._job = None
+        if self.cancelled:
+            return
+        latest = None
+        try:
+            while True:
+                latest = self._queue.get_nowait()
+        except queue.Empty:
+            pass
+        if latest is not None and latest[0] == "done":
+            self._on_done(latest[1])
+            return
+        delay = POLL_INTERVAL_MS
+        if latest is not None:
+            begin = time.perf_counter()
+            self._on_progress(latest[1], latest[2], self.stepper.total)
+            cost = time.perf_counter() - begin
+            delay = max(delay, round(cost * (1 / MAX_DRAW_SHARE - 1) * 1000))
+        if not self.cancelled:
+            self._job = self._schedule(delay, self._poll)
+
+
+class FutureWatcher:
+    """
+    Relève un Future depuis la boucle Tk et y remet son résultat.
+    
+    Les rappels d'un Future (add_done_callback) s'exécutent dans le thread
+    de travail, où toucher aux widgets est interdit : le Future est donc
+    relevé par after(), d'abord après FIRST_POLL_MS ms puis à un délai qui
+    double jusqu'à POLL_INTERVAL_MS. La durée du calcul est mesurée à la
+    fin réelle du Future, pas au relevé.
+    
+    Args:
+        future: Calcul à suivre (GraphController.submit)
+        schedule: Planificateur du thread Tk, au format de widget.after
+        on_done: Appelée dans le thread Tk avec le résultat
+        on_error: Appelée avec l'exception levée par le calcul ; sans elle,
+                  l'exception est relancée dans la boucle Tk
+        on_tick: Appelée à chaque relevé tant que le calcul tourne, avec la
+                 durée écoulée (s)
+        on_cancel: Appelée si le Future est annulé (calcul périmé, abandon)
+        unschedule: Annulation d'un relevé planifié (widget.after_cancel)
+    
+    Exemple:
+        >>> future = controller.submit(controller.execute_bfs, "A")
+        >>> watcher = FutureWatcher(future, root.after, on_done=show,
+        ...                         on_tick=lambda s: status.set(f"{s:.1f} s"))
+        >>> watcher.start()
+    """
+    
+    def __init__(self, future: Future, schedule: Callable[[int, Callable], object],
+                 on_done: Callable[[object], None],
+                 on_error: Callable[[BaseException], None] | None = None,
+                 on_tick: Callable[[float], None] | None = None,
+                 on_cancel: Callable[[], None] | None = None,
+                 unschedule: Callable[[object], None] | None = None):
+        self.future = future
+        self._schedule = schedule
+        self._unschedule = unschedule
+        self._on_done = on_done
+        self._on_error = on_error
+        self._on_tick = on_tick
+        self._on_cancel = on_cancel
+        self._begin: float | None = None
+        self._end: float | None = None
+        self._delay = FIRST_POLL_MS
+        self._job = None
+    
+    @property
+    def elapsed(self) -> float:
+        """Durée du calcul en secondes (jusqu'à maintenant s'il tourne encore)."""
+        if self._begin is None:
+            return 0.0
+        return (self._end if self._end is not None else time.perf_counter()) - self._begin
+    
+    @property
+    def running(self) -> bool:
+        """True tant que le résultat n'a pas été remis (ni le suivi arrêté)."""
+        return self._job is not None
+    
+    def start(self) -> None:
+        """Commence le suivi (à appeler juste après la soumission)."""
+        self._begin = time.perf_counter()
+        self.future.add_done_callback(self._finished)
+        self._job = self._schedule(self._delay, self._poll)
+    
+    def cancel(self) -> None:
+        """Annule le calcul et arrête le suivi ; plus aucun rappel n'aura lieu."""
+        self.future.cancel()
+        if self._job is not None and self._unschedule is not None:
+            self._unschedule(self._job)
+        self._job = None
+    
+    def _finished(self, future: Future) -> None:
+        """Thread de travail : note l'heure de fin, sans toucher à Tk."""
+        self._end = time.perf_counter()
+    
+    def _poll(self) -> None:
+        """Thread Tk : remet le résultat, ou se replanifie."""
+        self._job = None
+        future = self.future
+        if not future.done():
+            if self._on_tick is not None:
+                self._on_tick(self.elapsed)
+            self._delay = min(self._delay * 2, POLL_INTERVAL_MS)
+            self._job = self._schedule(self._delay, self._poll)
+        elif future.cancelled():
+            if self._on_cancel is not None:
+                self._on_cancel()
+        elif future.exception() is not None and self._on_error is not None:
+            self._on_error(future.exception())
+        else:
+            self._on_done(future.result())
@@ -6,7 +6,30 @@ Fait le lien entre l'interface graphique et le cœur algorithmique.
 Ce module évite de mélanger la logique UI (Tkinter) et la logique métier (core).
 """
 
-from ..core import Graph, dfs, bfs, shortest_path, is_connected
+from collections.abc import Callable
+from concurrent.futures import Future, InvalidStateError, ThreadPoolExecutor
+
+from ..core import (
+    Graph,
+    articulation_points,
+    bridges,
+    is_connected,
+    cached_dfs,
+    cached_bfs,
+    cached_shortest_path,
+    diameter_bounds,
+    graph_stats,
+    radius_bounds,
+    result_cache,
+    transitivity,
+    triangle_counts,
+)
+from ..core.eccentricity import INFO_TIME_BUDGET
+
+
+# Threads du pool de calcul : un calcul abandonné ne peut pas être
+# interrompu et occupe son thread jusqu'à la fin, le suivant prend l'autre
+RUN_WORKERS = 2
 
 
 class GraphController:
@@ -17,16 +40,98 @@ class GraphController:
     - Model : Graph (core)
     - View : app.py, render.py (ui)
     - Controller : ce fichier
+    
+    Les parcours passent par le cache partagé (core.result_cache) : relancer
+    le même DFS/BFS sur un graphe inchangé est instantané.
+    
+    Les méthodes execute_dfs, execute_bfs, find_shortest_path et
+    check_connectivity sont synchrones ; submit() les exécute dans un pool
+    de threads et retourne un Future, pour que l'UI reste réactive pendant
+    un long calcul. Un seul calcul est en cours à la fois : en soumettre un
+    autre, ou modifier le graphe, annule le précédent.
     """
     
-    def __init__(self, graph: Graph):
+    def __init__(self, graph: Graph, workers: int = RUN_WORKERS):
         """
         Initialise le contrôleur avec un graphe.
         
         Args:
             graph: Le graphe à contrôler
+            workers: Nombre de threads du pool de calcul (créé au premier submit)
         """
         self.graph = graph
+        self.workers = workers
+        self._executor: ThreadPoolExecutor | None = None
+        self._run: Future | None = None
+    
+    def submit(self, method: Callable, *args) -> Future:
+        """
+        Exécute une méthode du contrôleur dans le pool de calcul.
+        
+        Le calcul précédent est annulé. Le Future retourné est annulé aussi
+        si le graphe a changé pendant le calcul (version différente, ou
+        autre graphe) : un résultat périmé n'est jamais remis. Un calcul
+        déjà commencé ne peut pas être interrompu (thread Python) : annulé,
+        il se termine en arrière-plan et son résultat est ignoré.
+        
+        Args:
+            method: Méthode du contrôleur (execute_dfs, execute_bfs...)
+            *args: Ses arguments
+        
+        Returns:
+            Future du résultat ; les exceptions de method (ValueError pour
+            un nœud inexistant...) y sont remises
+        
+        Exemple:
+            >>> future = controller.submit(controller.execute_bfs, "A")
+            >>> future.result()
+            ['A', 'B', 'C']
+        """
+        self.cancel()
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(self.workers, thread_name_prefix="graph-run")
+        graph, version = self.graph, self.graph.version
+        run: Future = Future()
+        task = self._executor.submit(method, *args)
+        run.add_done_callback(lambda run: run.cancelled() and task.cancel())
+        task.add_done_callback(lambda task: self._deliver(run, task, graph, version))
+        self._run = run
+        return run
+    
+    def cancel(self) -> bool:
+        """
+        Annule le calcul en cours (à appeler quand le graphe change).
+        
+        Returns:
+            True si un calcul a été annulé
+        """
+        run, self._run = self._run, None
+        return run is not None and run.cancel()
+    
+    @property
+    def busy(self) -> bool:
+        """True si un calcul soumis n'est pas terminé."""
+        return self._run is not None and not self._run.done()
+    
+    def close(self) -> None:
+        """Annule le calcul en cours et libère le pool (fermeture de l'application)."""
+        self.cancel()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+    
+    def _deliver(self, run: Future, task: Future, graph: Graph, version: int) -> None:
+        """Thread de travail : remet le résultat de task à run, s'il est encore à jour."""
+        if task.cancelled() or self.graph is not graph or graph.version != version:
+            run.cancel()
+            return
+        try:
+            if task.exception() is not None:
+                run.set_exception(task.exception())
+            else:
+                run.set_result(task.result())
+        except InvalidStateError:
+            pass    # annulé entre-temps
     
     def execute_dfs(self, start: str) -> list[str]:
         """
@@ -41,9 +146,8 @@ class GraphController:
         Raises:
             ValueError: Si le nœud n'existe pas ou si le graphe est vide
         """
-        # TODO: implémenter
-        # Validation + appel à core.algorithms.dfs()
-        pass
+        self._check_start(start)
+        return cached_dfs(self.graph, start)
     
     def execute_bfs(self, start: str) -> list[str]:
         """
@@ -54,9 +158,12 @@ class GraphController:
         
         Returns:
             Liste des nœuds visités
+        
+        Raises:
+            ValueError: Si le nœud n'existe pas ou si le graphe est vide
         """
-        # TODO: implémenter
-        pass
+        self._check_start(start)
+        return cached_bfs(self.graph, start)
     
     def find_shortest_path(self, start: str, goal: str) -> list[str] | None:
         """
@@ -68,9 +175,14 @@ class GraphController:
         
         Returns:
             Chemin ou None si aucun chemin
+        
+        Raises:
+            ValueError: Si l'un des nœuds n'existe pas
         """
-        # TODO: implémenter
-        pass
+        self._check_start(start)
+        if not self.graph.has_node(goal):
+            raise ValueError(f"Le nœud '{goal}' n'existe pas")
+        return cached_shortest_path(self.graph, start, goal)
     
     def check_connectivity(self) -> bool:
         """
@@ -79,24 +191,94 @@ class GraphController:
         Returns:
             True si connexe, False sinon
         """
-        # TODO: implémenter
-        pass
+        return is_connected(self.graph)
+    
+    def find_critical_elements(self) -> tuple[list[str], list[tuple[str, str]]]:
+        """
+        Cherche les éléments critiques du graphe.
+        
+        Returns:
+            (points d'articulation, ponts) : nœuds et arêtes dont la
+            suppression déconnecte une partie du graphe
+        """
+        return articulation_points(self.graph), bridges(self.graph)
     
-    def get_graph_info(self) -> dict:
+    def get_graph_info(self, time_budget: float = INFO_TIME_BUDGET, extended: bool = True) -> dict:
         """
         Retourne des informations sur le graphe.
         
+        Les statistiques de base (nombres de nœuds et d'arêtes, connexité,
+        densité, degrés) sont tenues à jour par le graphe à chaque
+        modification (core.graph_stats) : les lire après un ajout coûte
+        O(1), même sur un graphe d'un million d'arêtes. Les autres
+        (triangles, diamètre, rayon) sont recalculées : voir
+        get_extended_info().
+        
+        Args:
+            time_budget: Budget en secondes pour le diamètre et le rayon
+            extended: False pour les seules statistiques de base
+        
         Returns:
-            Dictionnaire avec des stats (nb nœuds, arêtes, connexité...)
+            Dictionnaire avec des stats (nb nœuds, arêtes, connexité...).
+            Diamètre et rayon sont des bornes (inférieure, supérieure),
+            égales si la valeur est exacte, et None pour un graphe orienté.
         
         Exemple:
             {
                 'nodes': 5,
                 'edges': 7,
                 'connected': True,
-                'density': 0.7
+                'components': 1,
+                'density': 0.7,
+                'degree_histogram': {2: 2, 3: 2, 4: 1},
+                'min_degree': 2,
+                'max_degree': 4,
+                'mean_degree': 2.8,
+                'triangles': 2,
+                'transitivity': 0.6,
+                'diameter': (3, 3),
+                'radius': (2, 2)
             }
+        
+        Note:
+            Les statistiques de base sont à lire depuis le thread qui
+            modifie le graphe ; get_extended_info() peut tourner dans le
+            pool de calcul (submit).
+        """
+        info = graph_stats(self.graph).summary()
+        if extended:
+            info.update(self.get_extended_info(time_budget))
+        return info
+    
+    def get_extended_info(self, time_budget: float = INFO_TIME_BUDGET) -> dict:
         """
-        # TODO: implémenter
-        # density = 2 * edges / (nodes * (nodes - 1)) pour graphe non orienté
-        pass
+        Statistiques recalculées à chaque appel : triangles, transitivité,
+        diamètre et rayon (voir get_graph_info()).
+        
+        Args:
+            time_budget: Budget en secondes pour le diamètre et le rayon
+        
+        Returns:
+            {triangles, transitivity, diameter, radius}
+        """
+        info = {
+            'triangles': sum(triangle_counts(self.graph).values()) // 3,
+            'transitivity': transitivity(self.graph),
+            'diameter': None,
+            'radius': None,
+        }
+        if not self.graph.is_directed():
+            info['diameter'] = diameter_bounds(self.graph, time_budget / 2)
+            info['radius'] = radius_bounds(self.graph, time_budget=time_budget / 2)
+        return info
+    
+    def get_cache_stats(self) -> dict:
+        """Retourne les statistiques du cache des parcours (hits, misses...)."""
+        return result_cache.stats()
+    
+    def _check_start(self, start: str) -> None:
+        """Vérifie que le graphe n'est pas vide et que start existe."""
+        if len(self.graph) == 0:
+            raise ValueError("Le graphe est vide")
+        if not self.graph.has_node(start):
+            raise ValueError(f"Le nœud '{start}' n'existe pas")
@@ -0,0 +1,616 @@
+"""
+Module ui.layout
+----------------
+Disposition par forces (Fruchterman-Reingold), alternative à la
+disposition circulaire de auto_layout() pour les graphes de plus de
+quelques dizaines de nœuds.
+
+Chaque itération applique trois forces puis déplace chaque nœud d'au
+plus la « température » courante, qui décroît linéairement jusqu'à 0 :
+- attraction le long des arêtes : d² / k (k = longueur idéale d'arête) ;
+- répulsion entre toutes les paires : k² / d, approchée par Barnes-Hut ;
+- une faible gravité vers le centre, qui empêche les composantes non
+  connexes de s'éloigner indéfiniment.
+
+Barnes-Hut : les positions sont rangées dans un quadtree implicite de
+profondeur ~log4(n) (niveau l = grille 2^l × 2^l sur le carré englobant).
+Vue depuis un nœud, une case de côté s dont le centre de masse est à une
+distance d < s / theta est ouverte (ses sous-cases sont examinées) ;
+sinon elle compte comme un seul point de masse égale à son nombre de
+nœuds. Coût O(n log n) par itération au lieu de O(n²).
+
+Deux implémentations du même calcul :
+- pur Python : parcours du quadtree nœud par nœud ;
+- NumPy (si installé) : le parcours est fait niveau par niveau pour
+  tous les nœuds à la fois, sur des tableaux de paires (nœud, case).
+force_layout() choisit NumPy à partir de VECTORIZE_THRESHOLD nœuds.
+
+Le calcul s'arrête après iterations itérations ou à l'expiration du
+budget de temps : la disposition obtenue jusque-là est retournée.
+ForceLayout expose le même calcul itération par itération, pour un
+calcul en arrière-plan avec affichage progressif.
+
+Après l'ajout de quelques nœuds ou arêtes, incremental_layout() ne
+recalcule pas tout : les nœuds sans position sont placés près de leurs
+voisins déjà placés (ou dans un espace libre), puis seul leur voisinage
+est détendu, les nœuds déjà placés ne bougeant que de peu. Le coût ne
+dépend que de la taille de ce voisinage.
+"""
+
+import math
+import random
+import time
+from collections import deque
+from collections.abc import Iterable
+
+from ..core import Graph
+from .render import DEFAULT_HEIGHT, DEFAULT_WIDTH, NODE_RADIUS
+from .spatial import GridIndex
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - dépend de l'environnement
+    np = None
+
+
+HAS_NUMPY = np is not None
+
+# Paramètres par défaut
+DEFAULT_ITERATIONS = 100
+DEFAULT_THETA = 1.0        # plus grand : plus rapide, moins précis
+GRAVITY = 0.05
+EPSILON = 1e-9             # distance² minimale (nœuds confondus)
+
+# Nombre de nœuds à partir duquel force_layout() utilise NumPy
+VECTORIZE_THRESHOLD = 500
+
+# Disposition incrémentale
+INCREMENTAL_ITERATIONS = 30
+RELAX_HOPS = 1             # voisinage détendu autour des nœuds ajoutés
+MAX_RELAXED = 100          # nœuds déjà placés remis en mouvement, au plus
+MAX_SHIFT = 0.5            # déplacement maximal d'un nœud déjà placé (en longueurs d'arête)
+SPACING = 3 * NODE_RADIUS  # longueur d'arête quand aucune arête n'est placée
+EDGE_SAMPLES = 200         # arêtes mesurées pour estimer la longueur d'arête
+DENSITY_MIN_NODES = 30     # nœuds placés nécessaires pour estimer leur espacement
+
+
+def force_layout(graph: Graph, width: int = 800, height: int = 600,
+                 iterations: int = DEFAULT_ITERATIONS, time_budget: float | None = None,
+                 theta: float = DEFAULT_THETA, seed: int = 0,
+                 vectorized: bool | None = None) -> dict[str, tuple[float, float]]:
+    """
+    Dispose les nœuds par forces (Fruchterman-Reingold + Barnes-Hut).
+    
+    Args:
+        graph: Le graphe (orienté ou non, poids ignorés)
+        width: Largeur du canvas (défaut: 800)
+        height: Hauteur du canvas (défaut: 600)
+        iterations: Nombre d'itérations
+        time_budget: Budget en secondes (None = toutes les itérations)
+        theta: Critère d'ouverture de Barnes-Hut (0 = calcul exact)
+        seed: Graine des positions initiales
+        vectorized: True = NumPy, False = pur Python, None = NumPy à
+                    partir de VECTORIZE_THRESHOLD nœuds s'il est installé
+    
+    Returns:
+        Dictionnaire {nœud: (x, y)}, ramené dans le canvas
+    
+    Raises:
+        ValueError: Si iterations ou theta est négatif
+        RuntimeError: Si vectorized=True sans NumPy
+    
+    Exemple:
+        >>> g = Graph()
+        >>> g.add_edge("A", "B")
+        >>> g.add_edge("B", "C")
+        >>> positions = force_layout(g, width=800, height=600)
+        >>> sorted(positions)
+        ['A', 'B', 'C']
+    
+    Note:
+        Comme auto_layout(), utilise les dimensions par défaut si
+        width < 400 ou height < 300 (Canvas non encore affiché).
+    """
+    stepper = ForceLayout(graph, width, height, iterations, theta, seed, vectorized)
+    deadline = None if time_budget is None else time.perf_counter() + time_budget
+    while stepper.step():
+        if deadline is not None and time.perf_counter() > deadline:
+            break
+    return stepper.positions()
+
+
+class ForceLayout:
+    """
+    Disposition par forces calculée itération par itération.
+    
+    Le graphe est lu une seule fois, à la construction : step() ne
+    travaille ensuite que sur des tableaux d'indices et peut donc tourner
+    dans un autre thread pendant que le graphe est modifié (voir
+    ui/background.py). force_layout() enchaîne simplement les step().
+    
+    Attributs:
+        names: Nœuds, dans l'ordre des indices
+        done: Nombre d'itérations effectuées
+        total: Nombre d'itérations prévues
+    
+    Raises:
+        ValueError: Si iterations ou theta est négatif
+        RuntimeError: Si vectorized=True sans NumPy
+    
+    Exemple:
+        >>> g = Graph()
+        >>> g.add_edge("A", "B")
+        >>> stepper = ForceLayout(g, iterations=10)
+        >>> while stepper.step():
+        ...     pass
+        >>> stepper.done, sorted(stepper.positions())
+        (10, ['A', 'B'])
+    """
+    
+    def __init__(self, graph: Graph, width: int = 800, height: int = 600,
+                 iterations: int = DEFAULT_ITERATIONS, theta: float = DEFAULT_THETA,
+                 seed: int = 0, vectorized: bool | None = None):
+        if iterations < 0:
+            raise ValueError(f"iterations doit être positif : {iterations}")
+        if theta < 0:
+            raise ValueError(f"theta doit être positif : {theta}")
+        if vectorized is None:
+            vectorized = HAS_NUMPY and len(graph) >= VECTORIZE_THRESHOLD
+        if vectorized and not HAS_NUMPY:
+            raise RuntimeError("NumPy est requis pour la disposition vectorisée")
+        self.names = graph.nodes()
+        self.done = 0
+        self.total = iterations if self.names else 0
+        self.width, self.height = width, height
+        self.theta = theta
+        self.vectorized = vectorized
+        index = {name: i for i, name in enumerate(self.names)}
+        self._edges = [(index[a], index[b]) for a, b in graph.edges() if a != b]
+        n = len(self.names)
+        
+        # Unités de calcul : k = 1, nœuds tirés dans un carré de côté √n
+        side = math.sqrt(n)
+        rng = random.Random(seed)
+        self._xs = [rng.uniform(-side / 2, side / 2) for _ in range(n)]
+        self._ys = [rng.uniform(-side / 2, side / 2) for _ in range(n)]
+        self._start = side / 10
+        if vectorized:
+            self._xs, self._ys = np.array(self._xs), np.array(self._ys)
+            self._sources = np.array([a for a, _ in self._edges], dtype=np.int64)
+            self._targets = np.array([b for _, b in self._edges], dtype=np.int64)
+    
+    def step(self) -> bool:
+        """
+        Effectue une itération.
+        
+        Returns:
+            False si toutes les itérations étaient déjà faites, True sinon
+        """
+        if self.done >= self.total:
+            return False
+        temperature = self._start * (1 - self.done / self.total)
+        if self.vectorized:
+            fx, fy = _forces_numpy(self._xs, self._ys, self._sources, self._targets, self.theta)
+            length = np.maximum(np.hypot(fx, fy), EPSILON)
+            step = np.minimum(length, temperature) / length
+            self._xs = self._xs + fx * step
+            self._ys = self._ys + fy * step
+        else:
+            xs, ys = self._xs, self._ys
+            fx, fy = _forces_python(xs, ys, self._edges, self.theta)
+            for v in range(len(xs)):
+                length = math.hypot(fx[v], fy[v])
+                if length > EPSILON:
+                    step = min(length, temperature) / length
+                    xs[v] += fx[v] * step
+                    ys[v] += fy[v] * step
+        self.done += 1
+        return True
+    
+    def positions(self) -> dict[str, tuple[float, float]]:
+        """Positions courantes {nœud: (x, y)}, ramenées dans le canvas."""
+        if not self.names:
+            return {}
+        return _fit(self.names, [float(x) for x in self._xs], [float(y) for y in self._ys],
+                    self.width, self.height)
+
+
+# ============================================================================
+# Disposition incrémentale
+# ============================================================================
+
+def incremental_layout(graph: Graph, positions: dict[str, tuple[float, float]],
+                       changed: Iterable[str] | None = None,
+                       center: tuple[float, float] = (DEFAULT_WIDTH / 2, DEFAULT_HEIGHT / 2),
+                       index: GridIndex | None = None, hops: int = RELAX_HOPS,
+                       iterations: int = INCREMENTAL_ITERATIONS,
+                       seed: int = 0) -> dict[str, tuple[float, float]]:
+    """
+    Place les nœuds sans position et détend leur voisinage.
+    
+    La longueur d'arête k est la médiane des arêtes placées autour des
+    nœuds modifiés, bornée par l'espacement moyen des nœuds
+    (GridIndex.spacing). Chaque nœud sans position est placé à distance k de
+    ses voisins déjà placés, du côté le plus dégagé ; un nœud sans voisin
+    placé va dans l'espace libre le plus proche de center. Puis les nœuds
+    placés, les nœuds de changed et leurs voisins à moins de hops arêtes
+    (au plus MAX_RELAXED) sont détendus par forces, les autres restant
+    fixes ; un nœud qui avait déjà une position ne s'en écarte pas de
+    plus de MAX_SHIFT longueurs d'arête.
+    
+    Args:
+        graph: Le graphe
+        positions: Positions connues {nœud: (x, y)} (non modifiées)
+        changed: Nœuds ajoutés et extrémités des arêtes ajoutées ; None =
+                 tous les nœuds sans position (parcours du graphe, O(n))
+        center: Point autour duquel placer les nœuds sans voisin placé
+        index: Index spatial de positions s'il existe (sinon construit, O(n))
+        hops: Rayon, en arêtes, du voisinage détendu
+        iterations: Itérations de la détente
+        seed: Graine des directions essayées
+    
+    Returns:
+        Positions des nœuds placés ou déplacés seulement, à fusionner
+        dans positions
+    
+    Raises:
+        ValueError: Si un nœud de changed n'est pas dans le graphe
+    
+    Exemple:
+        >>> g = Graph()
+        >>> g.add_edge("A", "B")
+        >>> positions = {"A": (100, 100), "B": (160, 100)}
+        >>> g.add_edge("B", "C")
+        >>> sorted(incremental_layout(g, positions, changed=["B", "C"]))
+        ['A', 'B', 'C']
+    """
+    if changed is None:
+        changed = [node for node in graph.nodes() if node not in positions]
+    changed = list(dict.fromkeys(changed))
+    for node in changed:
+        if not graph.has_node(node):
+            raise ValueError(f"le noeud n'existe pas : {node}")
+    if index is None:
+        index = GridIndex(positions)
+    rng = random.Random(seed)
+    k = _edge_length(graph, positions, changed)
+    if len(index.positions) >= DENSITY_MIN_NODES:
+        k = min(k, index.spacing())
+    
+    # 1. Placement des nouveaux nœuds, de proche en proche depuis les nœuds placés
+    placed: dict[str, tuple[float, float]] = {}
+    local = GridIndex({}, cell=k)          # index des nœuds placés ici
+    
+    def position(node: str) -> tuple[float, float] | None:
+        return placed.get(node) or positions.get(node)
+    
+    remaining = dict.fromkeys(node for node in changed if node not in positions)
+    queue = deque(node for node in remaining
+                  if any(position(other) is not None for other in _adjacent(graph, node)))
+    while remaining:
+        if not queue:
+            queue.append(next(iter(remaining)))
+        node = queue.popleft()
+        if node not in remaining:
+            continue
+        anchors = [position(other) for other in _adjacent(graph, node)]
+        anchors = [anchor for anchor in anchors if anchor is not None]
+        if anchors:
+            spot = _near_anchors(anchors, k, rng, index, local)
+        else:
+            spot = _free_spot(center, k, index, local)
+        placed[node] = spot
+        local.add(node, *spot)
+        del remaining[node]
+        queue.extend(other for other in _adjacent(graph, node) if other in remaining)
+    
+    # 2. Voisinage détendu : nœuds placés, nœuds modifiés et leurs voisins
+    mobile = dict.fromkeys(placed)
+    frontier = [node for node in changed if node in positions]
+    mobile.update(dict.fromkeys(frontier[:MAX_RELAXED]))
+    seen = set(mobile)
+    level = list(mobile)
+    for _ in range(hops):
+        following = []
+        for node in level:
+            for other in _adjacent(graph, node):
+                if other not in seen and other in positions and len(mobile) - len(placed) < MAX_RELAXED:
+                    seen.add(other)
+                    mobile[other] = None
+                    following.append(other)
+        level = following
+    current = {node: position(node) for node in mobile}
+    origin = dict(current)
+    
+    # 3. Détente : attraction d² / k vers tous les voisins, répulsion k² / d
+    # des nœuds à moins de k (fixes : index ; mobiles : paire par paire)
+    start = k / 2
+    reach = k
+    for i in range(iterations):
+        temperature = start * (1 - i / iterations)
+        for node in mobile:
+            x, y = current[node]
+            fx = fy = 0.0
+            for other in _adjacent(graph, node):
+                if other in current:
+                    ox, oy = current[other]
+                elif other in positions:
+                    ox, oy = positions[other]
+                else:
+                    continue
+                dx, dy = ox - x, oy - y
+                d = math.hypot(dx, dy)
+                fx += dx * d / k
+                fy += dy * d / k
+            near = [positions[other] for other in index.query(x - reach, y - reach, x + reach, y + reach)
+                    if other not in mobile]
+            near.extend(current[other] for other in mobile if other != node)
+            for ox, oy in near:
+                dx, dy = x - ox, y - oy
+                d2 = max(dx * dx + dy * dy, EPSILON)
+                if d2 < reach * reach:
+                    fx += dx * k * k / d2
+                    fy += dy * k * k / d2
+            length = math.hypot(fx, fy)
+            if length <= EPSILON:
+                continue
+            step = min(length, temperature) / length
+            x, y = x + fx * step, y + fy * step
+            current[node] = _clamp(origin[node], x, y, MAX_SHIFT * k)
+    return current
+
+
+# ============================================================================
+# Fonctions internes
+# ============================================================================
+
+def _fit(names: list[str], xs: list[float], ys: list[float], width: int,
+         height: int) -> dict[str, tuple[float, float]]:
+    """Ramène les positions dans le canvas (marge d'un rayon de nœud, proportions gardées)."""
+    if width < 400 or height < 300:
+        width, height = DEFAULT_WIDTH, DEFAULT_HEIGHT
+    if not names:
+        return {}
+    min_x, min_y = min(xs), min(ys)
+    extent = max(max(xs) - min_x, max(ys) - min_y)
+    if extent == 0:
+        return {name: (width / 2, height / 2) for name in names}
+    scale = min(width - 2 * NODE_RADIUS, height - 2 * NODE_RADIUS) / extent
+    left = (width - (max(xs) - min_x) * scale) / 2
+    top = (height - (max(ys) - min_y) * scale) / 2
+    return {name: (left + (x - min_x) * scale, top + (y - min_y) * scale)
+            for name, x, y in zip(names, xs, ys)}
+
+
+def _adjacent(graph: Graph, node: str) -> list[str]:
+    """Voisins d'un nœud, prédécesseurs compris si le graphe est orienté."""
+    if graph.is_directed():
+        return graph.neighbors(node) + graph.predecessors(node)
+    return graph.neighbors(node)
+
+
+def _edge_length(graph: Graph, positions: dict[str, tuple[float, float]], nodes: list[str]) -> float:
+    """Longueur médiane des arêtes placées autour de nodes (SPACING à défaut)."""
+    lengths = []
+    for node in nodes:
+        for other in _adjacent(graph, node):
+            if other not in positions:
+                continue
+            for third in _adjacent(graph, other):
+                if third in positions and third != other:
+                    lengths.append(math.dist(positions[other], positions[third]))
+                    if len(lengths) >= EDGE_SAMPLES:
+                        break
+            if len(lengths) >= EDGE_SAMPLES:
+                break
+        if len(lengths) >= EDGE_SAMPLES:
+            break
+    lengths = [length for length in lengths if length > 0]
+    if not lengths:
+        return SPACING
+    lengths.sort()
+    return lengths[len(lengths) // 2]
+
+
+def _clearance(x: float, y: float, k: float, index: GridIndex, local: GridIndex) -> float:
+    """Distance de (x, y) au nœud le plus proche, plafonnée à k."""
+    best = k
+    for grid in (index, local):
+        for node in grid.query(x - k, y - k, x + k, y + k):
+            best = min(best, math.dist((x, y), grid.positions[node]))
+    return best
+
+
+def _near_anchors(anchors: list[tuple[float, float]], k: float, rng: random.Random,
+                  index: GridIndex, local: GridIndex) -> tuple[float, float]:
+    """Position la plus dégagée à une longueur d'arête du centre des ancres."""
+    cx = sum(x for x, _ in anchors) / len(anchors)
+    cy = sum(y for _, y in anchors) / len(anchors)
+    radius = k if len(anchors) == 1 else k / 2
+    candidates = [(cx, cy)] if len(anchors) > 1 else []
+    turn = rng.uniform(0, 2 * math.pi)
+    candidates += [(cx + radius * math.cos(turn + a * math.pi / 4), cy + radius * math.sin(turn + a * math.pi / 4))
+                   for a in range(8)]
+    return max(candidates, key=lambda spot: _clearance(*spot, k, index, local))
+
+
+def _free_spot(center: tuple[float, float], k: float, index: GridIndex,
+               local: GridIndex) -> tuple[float, float]:
+    """Premier point à au moins k de tout nœud, sur une spirale autour de center."""
+    cx, cy = center
+    ring = 0
+    while True:
+        count = max(1, round(2 * math.pi * ring))
+        for a in range(count):
+            angle = 2 * math.pi * a / count
+            x, y = cx + ring * k * math.cos(angle), cy + ring * k * math.sin(angle)
+            if _clearance(x, y, k, index, local) >= k:
+                return x, y
+        ring += 1
+
+
+def _clamp(origin: tuple[float, float], x: float, y: float, limit: float) -> tuple[float, float]:
+    """(x, y) ramené à au plus limit de origin."""
+    dx, dy = x - origin[0], y - origin[1]
+    d = math.hypot(dx, dy)
+    if d <= limit:
+        return x, y
+    return origin[0] + dx * limit / d, origin[1] + dy * limit / d
+
+
+def _depth(n: int) -> int:
+    """Profondeur du quadtree : environ un nœud par case au niveau le plus fin."""
+    return max(1, math.ceil(math.log(max(n, 2), 4)))
+
+
+def _box(min_x: float, min_y: float, max_x: float, max_y: float) -> tuple[float, float, float]:
+    """Carré englobant (x min, y min, côté), légèrement agrandi."""
+    side = max(max_x - min_x, max_y - min_y) or 1.0
+    return float(min_x), float(min_y), float(side) * (1 + 1e-9)
+
+
+def _forces_python(xs: list[float], ys: list[float], edges: list[tuple[int, int]],
+                   theta: float) -> tuple[list[float], list[float]]:
+    """Forces sur chaque nœud (répulsion Barnes-Hut, attraction, gravité), en pur Python."""
+    n = len(xs)
+    depth = _depth(n)
+    min_x, min_y, side = _box(min(xs), min(ys), max(xs), max(ys))
+    cells = 1 << depth
+    ix = [min(cells - 1, int((x - min_x) / side * cells)) for x in xs]
+    iy = [min(cells - 1, int((y - min_y) / side * cells)) for y in ys]
+    
+    # levels[l] : case (cx, cy) → [nombre, somme des x, somme des y], puis centre de masse
+    levels = [{} for _ in range(depth + 1)]
+    leaves: dict[tuple[int, int], list[int]] = {}
+    for v in range(n):
+        for level in range(depth + 1):
+            shift = depth - level
+            entry = levels[level].setdefault((ix[v] >> shift, iy[v] >> shift), [0, 0.0, 0.0])
+            entry[0] += 1
+            entry[1] += xs[v]
+            entry[2] += ys[v]
+        leaves.setdefault((ix[v], iy[v]), []).append(v)
+    for level in levels:
+        for entry in level.values():
+            entry[1] /= entry[0]
+            entry[2] /= entry[0]
+    sizes = [(side / (1 << level)) ** 2 for level in range(depth + 1)]
+    theta2 = theta * theta
+    
+    fx = [0.0] * n
+    fy = [0.0] * n
+    for v in range(n):
+        x, y = xs[v], ys[v]
+        sx = sy = 0.0
+        stack = [(0, 0, 0)]
+        while stack:
+            level, cx, cy = stack.pop()
+            count, mx, my = levels[level][cx, cy]
+            dx, dy = x - mx, y - my
+            d2 = dx * dx + dy * dy
+            shift = depth - level
+            own = ix[v] >> shift == cx and iy[v] >> shift == cy
+            if not own and (count == 1 or sizes[level] < theta2 * d2):
+                f = count / max(d2, EPSILON)
+                sx += dx * f
+                sy += dy * f
+            elif level == depth:
+                for u in leaves[cx, cy]:
+                    if u != v:
+                        dx, dy = x - xs[u], y - ys[u]
+                        f = 1 / max(dx * dx + dy * dy, EPSILON)
+                        sx += dx * f
+                        sy += dy * f
+            else:
+                children = levels[level + 1]
+                for a in (0, 1):
+                    for b in (0, 1):
+                        if (2 * cx + a, 2 * cy + b) in children:
+                            stack.append((level + 1, 2 * cx + a, 2 * cy + b))
+        fx[v] = sx - GRAVITY * x
+        fy[v] = sy - GRAVITY * y
+    
+    for a, b in edges:
+        dx, dy = xs[b] - xs[a], ys[b] - ys[a]
+        d = math.hypot(dx, dy)
+        fx[a] += dx * d
+        fy[a] += dy * d
+        fx[b] -= dx * d
+        fy[b] -= dy * d
+    return fx, fy
+
+
+def _forces_numpy(x, y, sources, targets, theta: float):
+    """
+    Même calcul que _forces_python, vectorisé.
+    
+    Le parcours du quadtree avance d'un niveau à la fois sur un tableau
+    de paires (nœud, case) : les paires acceptées ajoutent leur force,
+    les autres sont remplacées par les paires (nœud, sous-case).
+    """
+    n = len(x)
+    depth = _depth(n)
+    min_x, min_y, side = _box(x.min(), y.min(), x.max(), y.max())
+    cells = 1 << depth
+    ix = np.minimum(((x - min_x) / side * cells).astype(np.int64), cells - 1)
+    iy = np.minimum(((y - min_y) / side * cells).astype(np.int64), cells - 1)
+    
+    # Par niveau l, tableaux denses indexés par la clé cx · 2^l + cy
+    # (4^profondeur ≈ n à 4n cases) : effectifs, centres de masse, et
+    # case de chaque nœud
+    counts, centers_x, centers_y, own = [], [], [], []
+    for level in range(depth + 1):
+        shift = depth - level
+        node_keys = ((ix >> shift) << level) | (iy >> shift)
+        count = np.bincount(node_keys, minlength=1 << (2 * level))
+        occupied = np.maximum(count, 1)
+        counts.append(count)
+        centers_x.append(np.bincount(node_keys, weights=x, minlength=len(count)) / occupied)
+        centers_y.append(np.bincount(node_keys, weights=y, minlength=len(count)) / occupied)
+        own.append(node_keys)
+    
+    fx = -GRAVITY * x
+    fy = -GRAVITY * y
+    nodes = np.arange(n)
+    pairs = np.zeros(n, dtype=np.int64)     # clé de la case, au niveau courant
+    for level in range(depth + 1):
+        dx = x[nodes] - centers_x[level][pairs]
+        dy = y[nodes] - centers_y[level][pairs]
+        d2 = dx * dx + dy * dy
+        count = counts[level][pairs]
+        accept = (own[level][nodes] != pairs) & ((count == 1) | ((side / (1 << level)) ** 2 < theta * theta * d2))
+        f = count[accept] / np.maximum(d2[accept], EPSILON)
+        fx += np.bincount(nodes[accept], weights=dx[accept] * f, minlength=n)
+        fy += np.bincount(nodes[accept], weights=dy[accept] * f, minlength=n)
+        opened = ~accept
+        nodes, pairs = nodes[opened], pairs[opened]
+        if level == depth:
+            break
+        cx, cy = pairs >> level, pairs & ((1 << level) - 1)
+        children = np.concatenate([((2 * cx + a) << (level + 1)) | (2 * cy + b)
+                                   for a in (0, 1) for b in (0, 1)])
+        nodes = np.tile(nodes, 4)
+        valid = counts[level + 1][children] > 0
+        nodes, pairs = nodes[valid], children[valid]
+    
+    # Feuilles ouvertes : somme exacte sur les nœuds de la feuille
+    order = np.argsort(own[depth], kind="stable")
+    starts = np.cumsum(counts[depth]) - counts[depth]
+    sizes = counts[depth][pairs]
+    offsets = np.arange(sizes.sum()) - np.repeat(np.cumsum(sizes) - sizes, sizes)
+    others = order[np.repeat(starts[pairs], sizes) + offsets]
+    nodes = np.repeat(nodes, sizes)
+    keep = nodes != others
+    nodes, others = nodes[keep], others[keep]
+    dx = x[nodes] - x[others]
+    dy = y[nodes] - y[others]
+    f = 1 / np.maximum(dx * dx + dy * dy, EPSILON)
+    fx += np.bincount(nodes, weights=dx * f, minlength=n)
+    fy += np.bincount(nodes, weights=dy * f, minlength=n)
+    
+    dx = x[targets] - x[sources]
+    dy = y[targets] - y[sources]
+    d = np.hypot(dx, dy)
+    fx += np.bincount(sources, weights=dx * d, minlength=n) - np.bincount(targets, weights=dx * d, minlength=n)
+    fy += np.bincount(sources, weights=dy * d, minlength=n) - np.bincount(targets, weights=dy * d, minlength=n)
+    return fx, fy
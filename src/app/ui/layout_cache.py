@@ -0,0 +1,266 @@
+"""
+Module ui.layout_cache
+----------------------
+Cache sur disque des dispositions calculées.
+
+Disposer un grand graphe prend des minutes (ForceLayout) : rouvrir le
+même fichier ne doit pas tout recalculer. Les positions sont rangées
+dans un répertoire de cache, une entrée par graphe, nommée d'après son
+empreinte (core.graph_fingerprint : nœuds, arêtes, poids).
+
+- Même empreinte : les positions sont reprises telles quelles.
+- Sinon, si le graphe vient d'un fichier déjà disposé (même chemin
+  source) et en garde au moins MIN_REUSE des nœuds, les positions de
+  ces nœuds sont reprises ; l'appelant place les autres
+  (layout.incremental_layout).
+
+Éviction à chaque sauvegarde : les entrées non lues depuis MAX_AGE
+secondes sont supprimées, puis les moins récemment lues tant que le
+total dépasse MAX_BYTES (la lecture d'une entrée met à jour sa date).
+
+Format d'une entrée (écrite dans un fichier temporaire puis renommée) :
+ligne magique, en-tête JSON, noms des nœuds (liste JSON), puis les
+coordonnées x, y de chaque nœud (array de doubles).
+"""
+
+import json
+import os
+import sys
+import tempfile
+import time
+from array import array
+from pathlib import Path
+
+from ..core import Graph, graph_fingerprint
+
+
+# Taille totale maximale du cache (octets)
+MAX_BYTES = 200 * 1024 * 1024
+
+# Âge maximal d'une entrée non relue (secondes)
+MAX_AGE = 30 * 24 * 3600
+
+# Part minimale des nœuds du graphe à retrouver dans une entrée pour la reprendre
+MIN_REUSE = 0.8
+
+# Extension des entrées du cache
+ENTRY_SUFFIX = ".layout"
+
+_MAGIC = b"GXLAYOUT1\n"
+
+# Clés obligatoires de l'en-tête d'une entrée
+_HEADER_KEYS = {"fingerprint", "source", "nodes", "byteorder"}
+
+
+Positions = dict[str, tuple[float, float]]
+
+
+def default_directory() -> Path:
+    """Répertoire de cache de l'utilisateur ($XDG_CACHE_HOME, ~/.cache sinon)."""
+    root = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(root) / "explorateur-graphes" / "layouts"
+
+
+class LayoutCache:
+    """
+    Positions des nœuds sauvegardées sur disque, par empreinte de graphe.
+    
+    Args:
+        directory: Répertoire du cache (default_directory() si None),
+                   créé à la première sauvegarde
+        max_bytes: Taille totale maximale
+        max_age: Âge maximal d'une entrée non relue (secondes)
+        min_reuse: Part minimale de nœuds retrouvés pour une reprise partielle
+    
+    Exemple:
+        >>> graph = Graph()
+        >>> for city in ("Lille", "Lyon", "Nantes"):
+        ...     graph.add_edge("Paris", city)
+        >>> positions = {"Paris": (0.0, 0.0), "Lille": (10.0, -50.0),
+        ...              "Lyon": (40.0, 60.0), "Nantes": (-70.0, 20.0)}
+        >>> cache = LayoutCache("/tmp/layouts")
+        >>> path = cache.save(graph, positions, source="france.json")
+        >>> cache.load(graph, source="france.json")
+        ({'Lille': (10.0, -50.0), 'Lyon': (40.0, 60.0), 'Nantes': (-70.0, 20.0), 'Paris': (0.0, 0.0)}, True)
+        >>> graph.add_edge("Paris", "Orly")     # 4 nœuds connus sur 5 : reprise partielle
+        >>> positions, exact = cache.load(graph, source="france.json")
+        >>> exact, "Orly" in positions
+        (False, False)
+    """
+    
+    def __init__(self, directory: str | Path | None = None, max_bytes: int = MAX_BYTES,
+                 max_age: float = MAX_AGE, min_reuse: float = MIN_REUSE):
+        self.directory = Path(directory) if directory is not None else default_directory()
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.min_reuse = min_reuse
+    
+    def load(self, graph: Graph, source: str | Path | None = None,
+             fingerprint: str | None = None) -> tuple[Positions, bool] | None:
+        """
+        Positions en cache pour ce graphe.
+        
+        Args:
+            graph: Graphe à disposer
+            source: Fichier d'où vient le graphe (permet la reprise partielle)
+            fingerprint: graph_fingerprint(graph), s'il est déjà calculé
+        
+        Returns:
+            (positions, exact) : positions des nœuds de graph retrouvés, et
+            True si ce sont tous les nœuds du même graphe ; None si aucune
+            entrée n'est utilisable
+        """
+        fingerprint = fingerprint or graph_fingerprint(graph)
+        path = self._path(fingerprint)
+        if path.exists():
+            positions = self._read(path, graph)
+            if positions is not None and len(positions) == len(graph):
+                return positions, True
+        if source is None:
+            return None
+        for path in self._entries_for(source):
+            positions = self._read(path, graph)
+            if positions is not None and len(positions) >= self.min_reuse * len(graph):
+                return positions, False
+        return None
+    
+    def save(self, graph: Graph, positions: Positions, source: str | Path | None = None,
+             fingerprint: str | None = None) -> Path:
+        """
+        Sauvegarde les positions des nœuds de graph, puis applique l'éviction.
+        
+        Args:
+            graph: Graphe disposé (tous ses nœuds doivent avoir une position)
+            positions: Positions {nœud: (x, y)}
+            source: Fichier d'où vient le graphe
+            fingerprint: graph_fingerprint(graph), s'il est déjà calculé
+        
+        Returns:
+            Chemin de l'entrée écrite
+        
+        Raises:
+            ValueError: Si un nœud n'a pas de position
+            OSError: Si le répertoire du cache n'est pas accessible en écriture
+        """
+        names = graph.nodes()
+        missing = [node for node in names if node not in positions]
+        if missing:
+            raise ValueError(f"{len(missing)} nœud(s) sans position, dont '{missing[0]}'")
+        fingerprint = fingerprint or graph_fingerprint(graph)
+        header = {
+            "fingerprint": fingerprint,
+            "source": self._source_key(source),
+            "nodes": len(names),
+            "byteorder": sys.byteorder,
+        }
+        coordinates = array("d", (value for node in names for value in positions[node]))
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self._path(fingerprint)
+        fd, temporary = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(_MAGIC)
+                f.write(json.dumps(header).encode("utf-8") + b"\n")
+                f.write(json.dumps(names).encode("utf-8") + b"\n")
+                coordinates.tofile(f)
+            os.replace(temporary, path)
+        except BaseException:
+            os.unlink(temporary)
+            raise
+        self.evict(keep=path)
+        return path
+    
+    def evict(self, now: float | None = None, keep: Path | None = None) -> int:
+        """
+        Supprime les entrées trop vieilles, puis les moins récemment lues
+        tant que le cache dépasse max_bytes.
+        
+        Args:
+            now: Date de référence (time.time() si None)
+            keep: Entrée à ne jamais supprimer (celle qu'on vient d'écrire)
+        
+        Returns:
+            Nombre d'entrées supprimées
+        """
+        now = time.time() if now is None else now
+        entries = []
+        for path in self.directory.glob(f"*{ENTRY_SUFFIX}"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        entries.sort()
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for mtime, size, path in entries:
+            if path == keep or (now - mtime <= self.max_age and total <= self.max_bytes):
+                continue
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+        return removed
+    
+    def clear(self) -> None:
+        """Vide le cache."""
+        for path in self.directory.glob(f"*{ENTRY_SUFFIX}"):
+            path.unlink(missing_ok=True)
+    
+    def _path(self, fingerprint: str) -> Path:
+        return self.directory / f"{fingerprint}{ENTRY_SUFFIX}"
+    
+    @staticmethod
+    def _source_key(source: str | Path | None) -> str | None:
+        return str(Path(source).resolve()) if source is not None else None
+    
+    def _entries_for(self, source: str | Path) -> list[Path]:
+        """Entrées du même fichier source, de la plus récente à la plus ancienne."""
+        key = self._source_key(source)
+        found = []
+        for path in self.directory.glob(f"*{ENTRY_SUFFIX}"):
+            try:
+                with open(path, "rb") as f:
+                    if f.readline() != _MAGIC:
+                        continue
+                    header = json.loads(f.readline())
+                mtime = path.stat().st_mtime
+            except (OSError, ValueError):
+                continue
+            if isinstance(header, dict) and header.get("source") == key:
+                found.append((mtime, path))
+        return [path for _, path in sorted(found, reverse=True)]
+    
+    def _read(self, path: Path, graph: Graph) -> Positions | None:
+        """
+        Positions des nœuds de graph présents dans l'entrée (None si elle est
+        illisible : elle est alors supprimée). Une lecture rajeunit l'entrée.
+        """
+        try:
+            with open(path, "rb") as f:
+                if f.readline() != _MAGIC:
+                    raise ValueError("ligne magique absente")
+                header = json.loads(f.readline())
+                if not isinstance(header, dict) or not _HEADER_KEYS <= header.keys():
+                    raise ValueError("en-tête invalide")
+                names = json.loads(f.readline())
+                coordinates = array("d")
+                coordinates.fromfile(f, 2 * header["nodes"])
+            if not isinstance(names, list) or len(names) != header["nodes"]:
+                raise ValueError("nombre de nœuds incohérent")
+            if not all(isinstance(name, str) for name in names):
+                raise ValueError("nom de nœud invalide")
+            if header["byteorder"] != sys.byteorder:
+                coordinates.byteswap()
+        except (OSError, EOFError, ValueError, TypeError):
+            path.unlink(missing_ok=True)
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        nodes = graph.graph
+        return {name: (coordinates[2 * i], coordinates[2 * i + 1])
+                for i, name in enumerate(names) if name in nodes}
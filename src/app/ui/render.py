@@ -3,11 +3,35 @@ Module ui.render
 ----------------
 Fonctions pour dessiner un graphe sur un Canvas Tkinter.
 
+Le dessin est incrémental : une GraphView par Canvas garde les
+identifiants des items de chaque nœud et de chaque arête. Redessiner
+après une modification ne crée ou ne supprime que les items concernés,
+et colorer un nœud ou une arête est un simple itemconfig, au lieu
+d'empiler de nouveaux items par-dessus les anciens.
+
+La vue a un zoom et un décalage, et ne dessine que ce qui est visible :
+- seuls les nœuds dans la fenêtre, et les arêtes qui la traversent, ont
+  des items ;
+- en dessous de seuils de zoom, les étiquettes disparaissent et les
+  arêtes n'ont plus qu'un pixel d'épaisseur ;
+- une tuile de TILE_SIZE pixels trop dense pour être lisible est
+  dessinée comme un seul rectangle, d'autant plus foncé qu'elle
+  contient de nœuds.
+Le nombre d'items reste ainsi borné par la taille de la fenêtre et non
+par celle du graphe : un graphe de 100 000 nœuds reste manipulable.
+
 Palier F - Séances 7-8.
 """
 
+import itertools
+import math
+import time
 import tkinter as tk
+from collections.abc import Callable, Iterable
+from weakref import WeakKeyDictionary
+
 from ..core import Graph
+from .spatial import GridIndex
 
 
 # Constantes pour le rendu
@@ -18,6 +42,680 @@ NODE_COLOR_CURRENT = "#FF6B6B"
 EDGE_COLOR = "#95A5A6"
 EDGE_WIDTH = 2
 TEXT_COLOR = "white"
+PATH_WIDTH = 4
+SELECTION_COLOR = "#F5A623"
+SELECTION_WIDTH = 3
+HIT_MARGIN = 3             # pixels ajoutés au rayon d'un nœud pour le viser
+
+# Dimensions par défaut (Canvas pas encore affiché)
+DEFAULT_WIDTH = 800
+DEFAULT_HEIGHT = 600
+
+# Niveaux de détail selon le zoom (pixels par unité de position)
+LABEL_MIN_SCALE = 0.6      # en dessous : pas d'étiquettes
+THIN_EDGE_SCALE = 0.4      # en dessous : arêtes d'un pixel
+THIN_EDGE_WIDTH = 1
+MIN_NODE_RADIUS = 2        # les cercles rétrécissent avec le zoom, jusqu'à ce rayon
+MIN_SCALE = 0.001
+MAX_SCALE = 50.0
+ZOOM_STEP = 1.25           # facteur d'un cran de molette
+
+# Tuiles de densité : une tuile qui contient plus de DENSE_TILE_NODES
+# nœuds visibles remplace ses nœuds (et leurs arêtes) par un rectangle
+TILE_SIZE = 32
+DENSE_TILE_NODES = 16
+TILE_COLOR_LIGHT = (0xC6, 0xDB, 0xF3)
+TILE_COLOR_DARK = (0x1F, 0x4E, 0x8C)
+
+# Animation des parcours : images par seconde au plus
+ANIMATION_FPS = 30
+
+# Débit (étapes par seconde) d'une animation sans délai (delay_ms <= 0) :
+# la première image affiche tout le parcours
+UNPACED_RATE = 1e12
+
+# Les nœuds à moins de CULL_MARGIN pixels de la fenêtre sont examinés avec
+# leurs arêtes ; une arête qui traverse la fenêtre sans extrémité dans
+# cette bande mesure au moins 2·CULL_MARGIN pixels
+CULL_MARGIN = 64
+
+
+class Geometry:
+    """
+    Données du dessin qui ne dépendent que des positions « monde ».
+    
+    Pur calcul, sans Canvas : peut être construit hors du thread Tk (voir
+    ui/background.py) puis passé à GraphView.move().
+    
+    Attributs:
+        world: Positions {nœud: (x, y)} (non copiées)
+        index: Index spatial des positions
+        long_edges: Paires (longueur, arête), par longueur décroissante
+        extra: Arêtes ajoutées ou déplacées depuis la construction (leur
+               longueur n'est pas à jour dans long_edges) : toujours examinées
+    """
+    
+    def __init__(self, world: dict[str, tuple[float, float]], edges):
+        self.world = world
+        self.index = GridIndex(world)
+        self.long_edges = sorted(((math.dist(world[a], world[b]), (a, b)) for a, b in edges),
+                                 key=lambda edge: edge[0], reverse=True)
+        self.extra: set[tuple[str, str]] = set()
+
+
+class GraphView:
+    """
+    Dessin persistant de la partie visible d'un graphe sur un Canvas.
+    
+    Attributs:
+        canvas: Canvas Tkinter
+        node_items: Nœud dessiné → [id du cercle, id de l'étiquette ou None]
+        edge_items: Arête dessinée → id du trait ; clé (a, b) avec a ≤ b si
+                    le graphe n'est pas orienté
+        tile_items: Tuile dense (i, j) → (id du rectangle, nombre de nœuds)
+        positions: Positions à l'écran des nœuds dessinés
+        directed: True si les arêtes sont dessinées avec des flèches
+        scale: Zoom (pixels par unité de position)
+        offset: Décalage (x, y), en pixels, de l'origine des positions
+        selected: Nœuds sélectionnés (cerclés de SELECTION_COLOR)
+    
+    Les positions passées à sync() sont des coordonnées « monde » : un
+    nœud en (x, y) est affiché en (x·scale + offset_x, y·scale + offset_y).
+    
+    Les couleurs modifiées depuis le dernier reset_styles() sont
+    mémorisées, y compris pour les éléments hors de la fenêtre : un nœud
+    surligné qui entre dans la vue apparaît surligné.
+    
+    Souris : node_at() (nœud sous le pointeur), nodes_in() (rectangle de
+    sélection) et move_node() (glisser un nœud) passent par l'index
+    spatial des positions, tenu à jour par move_node() et update().
+    """
+    
+    def __init__(self, canvas: tk.Canvas):
+        self.canvas = canvas
+        self.node_items: dict[str, list] = {}
+        self.edge_items: dict[tuple[str, str], int] = {}
+        self.tile_items: dict[tuple[int, int], tuple[int, int]] = {}
+        self.positions: dict[str, tuple[float, float]] = {}
+        self.directed = False
+        self.scale = 1.0
+        self.offset = (0.0, 0.0)
+        self.selected: set[str] = set()
+        self._geometry = Geometry({}, [])
+        self._edges: set[tuple[str, str]] = set()
+        self._incident: dict[str, list[tuple[str, str]]] = {}
+        self._moved: set[str] = set()
+        self._node_colors: dict[str, str] = {}
+        self._edge_styles: dict[tuple[str, str], tuple[str, int]] = {}
+        self._drawn = (None, 0.0, 0.0, NODE_RADIUS, EDGE_WIDTH)   # (zoom, décalage, rayon, épaisseur)
+        self._animation: TraversalPlayer | None = None
+    
+    def sync(self, graph: Graph, positions: dict[str, tuple[int, int]]) -> None:
+        """
+        Met le dessin en accord avec le graphe et les positions.
+        
+        Reconstruit l'index spatial des nœuds et la liste des arêtes par
+        nœud (O(V + E)) ; seuls les nœuds et arêtes visibles ajoutés,
+        supprimés ou déplacés donnent lieu à des opérations sur le Canvas.
+        """
+        self.cancel_animation()
+        if graph.is_directed() != self.directed:
+            self.clear()
+            self.directed = graph.is_directed()
+        world = {node: positions[node] for node in graph.nodes() if node in positions}
+        edges = {self._key(a, b) for a, b in graph.edges() if a in world and b in world}
+        previous = self._geometry.world
+        self._moved = {node for node, position in world.items() if previous.get(node, position) != position}
+        self._geometry = Geometry(world, edges)
+        self._edges = edges
+        self._incident = {node: [] for node in world}
+        for key in edges:
+            self._incident[key[0]].append(key)
+            self._incident[key[1]].append(key)
+        self._node_colors = {node: c for node, c in self._node_colors.items() if node in world}
+        self.selected = {node for node in self.selected if node in world}
+        self._edge_styles = {key: s for key, s in self._edge_styles.items() if key in edges}
+        self.render()
+    
+    def move(self, geometry: Geometry) -> None:
+        """
+        Déplace les nœuds, le graphe étant inchangé depuis le dernier sync().
+        
+        Contrairement à sync(), rien n'est reconstruit dans le thread Tk :
+        geometry (positions de tous les nœuds, arêtes de edge_keys()) a pu
+        être calculé ailleurs. Les couleurs et l'animation en cours sont
+        conservées.
+        """
+        self._geometry = geometry
+        self._moved = geometry.world.keys()
+        self.render()
+    
+    def update(self, graph: Graph, positions: dict[str, tuple[float, float]], nodes) -> None:
+        """
+        Prend en compte quelques nœuds ajoutés ou déplacés, et les arêtes
+        ajoutées entre eux et le reste du graphe, sans tout reconstruire.
+        
+        Coût proportionnel au nombre d'arêtes de ces nœuds, plus le dessin
+        de la partie visible : à utiliser après une modification locale
+        (ajout d'un nœud, d'une arête) ; sync() reste nécessaire après une
+        suppression ou un changement de graphe.
+        
+        Args:
+            graph: Le graphe synchronisé, modifié depuis
+            positions: Positions, dont celles de tous les nœuds de nodes ;
+                       pas le dictionnaire index.positions, que update()
+                       met à jour à partir des anciennes positions
+            nodes: Nœuds ajoutés ou déplacés et extrémités des arêtes ajoutées
+        """
+        if graph.is_directed() != self.directed:
+            self.sync(graph, positions)
+            return
+        geometry = self._geometry
+        nodes = set(nodes)
+        for node in nodes:
+            if node in geometry.world:
+                geometry.index.move(node, *positions[node])
+            else:
+                geometry.index.add(node, *positions[node])
+                self._incident[node] = []
+        for node in nodes:
+            adjacent = graph.neighbors(node)
+            if self.directed:
+                adjacent += graph.predecessors(node)
+            for other in adjacent:
+                key = self._key(node, other)
+                if key not in self._edges and other in geometry.world:
+                    self._edges.add(key)
+                    self._incident[key[0]].append(key)
+                    self._incident[key[1]].append(key)
+            geometry.extra.update(self._incident[node])
+        self._moved = nodes
+        self.render()
+    
+    def to_world(self, x: float, y: float) -> tuple[float, float]:
+        """Position « monde » du point (x, y) de l'écran."""
+        return (x - self.offset[0]) / self.scale, (y - self.offset[1]) / self.scale
+    
+    def node_at(self, x: float, y: float) -> str | None:
+        """
+        Nœud sous le point (x, y) de l'écran (le plus proche s'ils sont
+        plusieurs, None s'il n'y en a aucun), à HIT_MARGIN pixels près.
+        """
+        reach = (self._drawn[3] + HIT_MARGIN) / self.scale
+        return self.index.nearest(*self.to_world(x, y), reach)
+    
+    def nodes_in(self, x0: float, y0: float, x1: float, y1: float) -> list[str]:
+        """Nœuds dont le centre est dans le rectangle de l'écran de coins (x0, y0) et (x1, y1)."""
+        (x0, y0), (x1, y1) = self.to_world(x0, y0), self.to_world(x1, y1)
+        return self.index.query(min(x0, x1), min(y0, y1), max(x0, x1), max(y0, y1))
+    
+    def move_node(self, node: str, x: float, y: float) -> tuple[float, float]:
+        """
+        Déplace un nœud au point (x, y) de l'écran et redessine ; l'index
+        spatial est mis à jour en O(1).
+        
+        Returns:
+            La nouvelle position « monde » du nœud
+        """
+        position = self.to_world(x, y)
+        self.index.move(node, *position)
+        self._geometry.extra.update(self._incident[node])
+        self._moved = {node}
+        self.render()
+        return position
+    
+    def select(self, nodes) -> None:
+        """Remplace la sélection (un itemconfig par nœud dessiné qui change d'état)."""
+        nodes = set(nodes)
+        for node in nodes.symmetric_difference(self.selected):
+            items = self.node_items.get(node)
+            if items is not None:
+                self.canvas.itemconfig(items[0], **_outline(node in nodes))
+        self.selected = nodes
+    
+    @property
+    def index(self) -> GridIndex:
+        """Index spatial des positions « monde » des nœuds synchronisés."""
+        return self._geometry.index
+    
+    def edge_keys(self) -> list[tuple[str, str]]:
+        """Arêtes du graphe synchronisé, sous la forme des clés de edge_items."""
+        return list(self._edges)
+    
+    def size(self) -> tuple[int, int]:
+        """Dimensions du Canvas (valeurs par défaut s'il n'est pas encore affiché)."""
+        width, height = self.canvas.winfo_width(), self.canvas.winfo_height()
+        if width < 2 or height < 2:
+            return DEFAULT_WIDTH, DEFAULT_HEIGHT
+        return width, height
+    
+    def pan(self, dx: float, dy: float) -> None:
+        """Déplace la vue de (dx, dy) pixels."""
+        self.offset = (self.offset[0] + dx, self.offset[1] + dy)
+        self.render()
+    
+    def zoom(self, factor: float, x: float | None = None, y: float | None = None) -> None:
+        """
+        Multiplie le zoom par factor (borné par MIN_SCALE et MAX_SCALE),
+        autour du point (x, y) de l'écran, qui reste immobile (centre du
+        Canvas par défaut).
+        """
+        width, height = self.size()
+        x = width / 2 if x is None else x
+        y = height / 2 if y is None else y
+        scale = min(MAX_SCALE, max(MIN_SCALE, self.scale * factor))
+        factor = scale / self.scale
+        self.offset = (x - (x - self.offset[0]) * factor, y - (y - self.offset[1]) * factor)
+        self.scale = scale
+        self.render()
+    
+    def reset_view(self) -> None:
+        """Revient au zoom 1, sans décalage."""
+        self.scale = 1.0
+        self.offset = (0.0, 0.0)
+        self.render()
+    
+    def render(self) -> None:
+        """
+        Redessine la partie visible pour le zoom et le décalage courants.
+        
+        Seuls les nœuds proches de la fenêtre (index spatial) et leurs
+        arêtes sont examinés, plus les arêtes assez longues pour traverser
+        la fenêtre sans extrémité proche ; les opérations sur le Canvas ne
+        concernent que les items qui apparaissent, disparaissent ou bougent.
+        """
+        width, height = self.size()
+        scale = self.scale
+        ox, oy = self.offset
+        radius = max(MIN_NODE_RADIUS, min(NODE_RADIUS, NODE_RADIUS * scale))
+        labels = scale >= LABEL_MIN_SCALE
+        edge_width = EDGE_WIDTH if scale >= THIN_EDGE_SCALE else THIN_EDGE_WIDTH
+        last_scale, last_x, last_y, _, last_width = self._drawn
+        panned = (scale, ox, oy) != (last_scale, last_x, last_y)
+        moved = self._moved
+        geometry = self._geometry
+        world = geometry.world
+        
+        # 1. Nœuds à moins de CULL_MARGIN pixels de la fenêtre ; les visibles sont
+        # regroupés par tuile (alignées sur l'origine des positions)
+        margin = CULL_MARGIN
+        near = geometry.index.query((-margin - ox) / scale, (-margin - oy) / scale,
+                                 (width + margin - ox) / scale, (height + margin - oy) / scale)
+        tiles: dict[tuple[int, int], list[str]] = {}
+        outside = []
+        step = TILE_SIZE / scale
+        left, top = (-radius - ox) / scale, (-radius - oy) / scale
+        right, bottom = (width + radius - ox) / scale, (height + radius - oy) / scale
+        for node in near:
+            x, y = world[node]
+            if left <= x <= right and top <= y <= bottom:
+                tiles.setdefault((int(x // step), int(y // step)), []).append(node)
+            else:
+                outside.append(node)
+        dense = {}
+        nodes = set()
+        for tile, members in tiles.items():
+            if len(members) > DENSE_TILE_NODES:
+                dense[tile] = len(members)
+            else:
+                nodes.update(members)
+        
+        def hidden(node: str) -> bool:
+            """Vrai si le nœud est visible mais fondu dans une tuile dense."""
+            x, y = world[node]
+            return left <= x <= right and top <= y <= bottom and (int(x // step), int(y // step)) in dense
+        
+        # 2. Arêtes : une extrémité dessinée, ou segment qui traverse la
+        # fenêtre (voir CULL_MARGIN : parmi les arêtes sans extrémité
+        # proche, seules les plus longues sont testées)
+        candidates = set()
+        for node in itertools.chain(nodes, outside):
+            candidates.update(self._incident[node])
+        for length, key in geometry.long_edges:
+            if length * scale < 2 * margin:
+                break
+            candidates.add(key)
+        candidates.update(geometry.extra)
+        screen = {}
+        for node in nodes:
+            x, y = world[node]
+            screen[node] = (x * scale + ox, y * scale + oy)
+        edges = set()
+        for key in candidates:
+            a, b = key
+            if a not in nodes and hidden(a) or b not in nodes and hidden(b):
+                continue
+            for node in key:
+                if node not in screen:
+                    x, y = world[node]
+                    screen[node] = (x * scale + ox, y * scale + oy)
+            if a in nodes or b in nodes or _crosses(screen[a], screen[b], width, height):
+                edges.add(key)
+        
+        # 3. Suppression de ce qui n'est plus visible
+        for key in [key for key in self.edge_items if key not in edges]:
+            self.canvas.delete(self.edge_items.pop(key))
+        for node in [node for node in self.node_items if node not in nodes]:
+            for item in self.node_items.pop(node):
+                if item is not None:
+                    self.canvas.delete(item)
+        for tile in [tile for tile in self.tile_items if tile not in dense]:
+            self.canvas.delete(self.tile_items.pop(tile)[0])
+        
+        # 4. Tuiles denses, sous tout le reste
+        for tile, count in dense.items():
+            x, y = tile[0] * TILE_SIZE + ox, tile[1] * TILE_SIZE + oy
+            entry = self.tile_items.get(tile)
+            if entry is None:
+                item = self.canvas.create_rectangle(x, y, x + TILE_SIZE, y + TILE_SIZE,
+                                                    fill=_tile_color(count), outline="")
+                self.canvas.tag_lower(item)
+            else:
+                item = entry[0]
+                if panned:
+                    self.canvas.coords(item, x, y, x + TILE_SIZE, y + TILE_SIZE)
+                if count != entry[1]:
+                    self.canvas.itemconfig(item, fill=_tile_color(count))
+            self.tile_items[tile] = (item, count)
+        
+        # 5. Arêtes : déplacement, épaisseur, création (sous les nœuds)
+        for key in edges:
+            a, b = key
+            item = self.edge_items.get(key)
+            if item is None:
+                color, thickness = self._edge_styles.get(key, (EDGE_COLOR, edge_width))
+                item = _draw_edge(self.canvas, screen[a], screen[b], color, thickness, self.directed, radius)
+                self.canvas.tag_lower(item)
+                self.edge_items[key] = item
+                continue
+            if panned or a in moved or b in moved:
+                self.canvas.coords(item, *_edge_coords(screen[a], screen[b], self.directed, radius))
+            if edge_width != last_width and key not in self._edge_styles:
+                self.canvas.itemconfig(item, width=edge_width)
+        
+        # 6. Nœuds : déplacement, étiquettes, création
+        for node, items in self.node_items.items():
+            x, y = screen[node]
+            if panned or node in moved:
+                self.canvas.coords(items[0], x - radius, y - radius, x + radius, y + radius)
+                if items[1] is not None:
+                    self.canvas.coords(items[1], x, y)
+            if labels and items[1] is None:
+                items[1] = self.canvas.create_text(x, y, text=node, fill=TEXT_COLOR)
+            elif not labels and items[1] is not None:
+                self.canvas.delete(items[1])
+                items[1] = None
+        for node in nodes - self.node_items.keys():
+            self.node_items[node] = _draw_node(self.canvas, node, screen[node],
+                                               self._node_colors.get(node, NODE_COLOR), radius, labels,
+                                               node in self.selected)
+        
+        self.positions = {node: screen[node] for node in nodes}
+        self._moved = set()
+        self._drawn = (scale, ox, oy, radius, edge_width)
+    
+    # ========================================================================
+    # Couleurs et animation
+    # ========================================================================
+    
+    def set_node_color(self, node: str, color: str) -> None:
+        """Change la couleur d'un nœud (un itemconfig s'il est dessiné)."""
+        self._node_colors[node] = color
+        items = self.node_items.get(node)
+        if items is not None:
+            self.canvas.itemconfig(items[0], fill=color)
+    
+    def set_edge_style(self, a: str, b: str, color: str, width: int) -> None:
+        """Change la couleur et l'épaisseur d'une arête."""
+        key = self._key(a, b)
+        self._edge_styles[key] = (color, width)
+        item = self.edge_items.get(key)
+        if item is not None:
+            self.canvas.itemconfig(item, fill=color, width=width)
+    
+    def reset_styles(self) -> None:
+        """Remet les couleurs par défaut (seulement sur les items modifiés)."""
+        self.cancel_animation()
+        for node in self._node_colors:
+            items = self.node_items.get(node)
+            if items is not None:
+                self.canvas.itemconfig(items[0], fill=NODE_COLOR)
+        for key in self._edge_styles:
+            item = self.edge_items.get(key)
+            if item is not None:
+                self.canvas.itemconfig(item, fill=EDGE_COLOR, width=self._drawn[4])
+        self._node_colors.clear()
+        self._edge_styles.clear()
+    
+    def animate(self, steps: Iterable[str], delay_ms: int | None = None, duration: float | None = None,
+                total: int | None = None,
+                on_frame: Callable[[int, int | None], None] | None = None) -> "TraversalPlayer":
+        """
+        Lance la lecture animée d'un parcours (voir TraversalPlayer),
+        à une étape toutes les delay_ms ms ou en duration secondes.
+        delay_ms <= 0 : pas de délai, le parcours s'affiche aussi vite que
+        le plafond d'images le permet (en entier dès la première image).
+        L'animation précédente est arrêtée.
+        """
+        self.cancel_animation()
+        if delay_ms is None:
+            rate = None
+        elif delay_ms > 0:
+            rate = 1000 / delay_ms
+        else:
+            rate = UNPACED_RATE
+        self._animation = TraversalPlayer(self, steps, rate=rate, duration=duration, total=total,
+                                          on_frame=on_frame)
+        self._animation.play()
+        return self._animation
+    
+    @property
+    def animation(self) -> "TraversalPlayer | None":
+        """Lecture en cours ou suspendue (None après un nouveau dessin)."""
+        return self._animation
+    
+    def cancel_animation(self) -> None:
+        """Arrête l'animation en cours, s'il y en a une."""
+        if self._animation is not None:
+            self._animation.pause()
+            self._animation = None
+    
+    def clear(self) -> None:
+        """Supprime tous les items du dessin (le zoom est conservé)."""
+        self.cancel_animation()
+        for items in self.node_items.values():
+            for item in items:
+                if item is not None:
+                    self.canvas.delete(item)
+        for item in self.edge_items.values():
+            self.canvas.delete(item)
+        for item, _ in self.tile_items.values():
+            self.canvas.delete(item)
+        self.node_items.clear()
+        self.edge_items.clear()
+        self.tile_items.clear()
+        self.positions.clear()
+        self._node_colors.clear()
+        self._edge_styles.clear()
+        self.selected.clear()
+    
+    def item_count(self) -> int:
+        """Nombre d'items du Canvas appartenant au dessin."""
+        labels = sum(items[1] is not None for items in self.node_items.values())
+        return len(self.node_items) + labels + len(self.edge_items) + len(self.tile_items)
+    
+    def _key(self, a: str, b: str) -> tuple[str, str]:
+        return (a, b) if self.directed or a <= b else (b, a)
+
+
+class TraversalPlayer:
+    """
+    Lecture animée d'un parcours (ordre de visite) sur une GraphView.
+    
+    La lecture avance par images, au plus fps par seconde : chaque image
+    avance du nombre d'étapes dû depuis la précédente au débit
+    rate × speed (étapes par seconde), et peut donc colorer plusieurs
+    nœuds ; une image en retard rattrape le temps perdu. Un parcours de
+    100 000 nœuds se joue ainsi en duration secondes avec fps minuteries
+    par seconde, au lieu d'une minuterie par nœud.
+    
+    Le parcours est consommé au fil de la lecture : un générateur convient.
+    Chaque étape est un set_node_color (un itemconfig si le nœud est
+    dessiné) ; seek() ne recolore que les nœuds entre l'ancienne et la
+    nouvelle position.
+    
+    Args:
+        view: Vue où colorer les nœuds
+        steps: Nœuds dans l'ordre de visite (liste, générateur...)
+        rate: Débit en étapes par seconde
+        duration: Sinon, durée visée de la lecture (secondes), pour total
+                  étapes
+        total: Nombre d'étapes prévu (len(steps) par défaut, si défini)
+        fps: Images par seconde, au plus
+        on_frame: Appelée après chaque image et chaque seek() avec
+                  (position, total)
+        clock: Horloge en secondes (time.perf_counter par défaut)
+    
+    Attributs:
+        position: Nombre d'étapes affichées (le dernier nœud affiché est
+                  « courant », les précédents « visités »)
+        total: Nombre d'étapes (exact une fois le parcours épuisé)
+        speed: Multiplicateur du débit
+        playing: True pendant la lecture
+        finished: True une fois la dernière étape affichée
+    
+    Raises:
+        ValueError: Si ni rate ni (duration et total) ne sont connus, ou si
+                    une valeur n'est pas strictement positive
+    
+    Exemple:
+        >>> player = view.animate(bfs_generator, duration=10.0, total=len(graph))
+        >>> player.pause()
+        >>> player.seek(500)
+        >>> player.speed = 2.0
+        >>> player.play()
+    """
+    
+    def __init__(self, view: GraphView, steps: Iterable[str], rate: float | None = None,
+                 duration: float | None = None, total: int | None = None, fps: float = ANIMATION_FPS,
+                 on_frame: Callable[[int, int | None], None] | None = None, clock=time.perf_counter):
+        if total is None and hasattr(steps, "__len__"):
+            total = len(steps)
+        if rate is None:
+            if duration is None or total is None:
+                raise ValueError("rate, ou duration et total, sont nécessaires")
+            if duration <= 0:
+                raise ValueError(f"duration doit être strictement positive : {duration}")
+            rate = max(total, 1) / duration
+        if rate <= 0 or fps <= 0:
+            raise ValueError("rate et fps doivent être strictement positifs")
+        self.view = view
+        self.rate = rate
+        self.fps = fps
+        self.total = total
+        self.on_frame = on_frame
+        self.position = 0
+        self.playing = False
+        self.finished = False
+        self._speed = 1.0
+        self._steps = iter(steps)
+        self._played: list[str] = []
+        self._exhausted = False
+        self._cursor = 0.0
+        self._clock = clock
+        self._last = 0.0
+        self._job = None
+    
+    @property
+    def speed(self) -> float:
+        return self._speed
+    
+    @speed.setter
+    def speed(self, speed: float) -> None:
+        if speed <= 0:
+            raise ValueError(f"speed doit être strictement positive : {speed}")
+        self._speed = speed
+    
+    def play(self) -> None:
+        """Lance ou reprend la lecture (depuis le début si elle était finie)."""
+        if self.playing:
+            return
+        if self.finished:
+            self.seek(0)
+        self.playing = True
+        self._last = self._clock()
+        if self.position == 0:
+            self._cursor = 1.0
+            self._show(1)
+        self._schedule()
+    
+    def pause(self) -> None:
+        """Suspend la lecture (les couleurs restent)."""
+        self.playing = False
+        if self._job is not None:
+            self.view.canvas.after_cancel(self._job)
+            self._job = None
+    
+    def seek(self, position: int) -> None:
+        """Va à l'étape position (en consommant le parcours si besoin)."""
+        self._cursor = float(max(0, position))
+        self._show(int(self._cursor))
+    
+    def _interval(self) -> float:
+        """Durée d'une image : 1 / fps, mais au moins une étape par image."""
+        return max(1 / self.fps, 1 / (self.rate * self._speed))
+    
+    def _schedule(self) -> None:
+        if self.playing and not self.finished:
+            self._job = self.view.canvas.after(round(self._interval() * 1000), self._frame)
+        else:
+            self.playing = False
+    
+    def _frame(self) -> None:
+        self._job = None
+        now = self._clock()
+        elapsed = max(now - self._last, self._interval())
+        self._last = now
+        self._cursor += elapsed * self.rate * self._speed
+        self._show(int(self._cursor))
+        self._schedule()
+    
+    def _show(self, target: int) -> None:
+        """Affiche l'étape target : ne recolore que les nœuds qui changent d'état."""
+        played = self._played
+        while len(played) < target and not self._exhausted:
+            try:
+                played.append(next(self._steps))
+            except StopIteration:
+                self._exhausted = True
+                self.total = len(played)
+        target = min(target, len(played))
+        view = self.view
+        if target > self.position:
+            for node in played[max(self.position - 1, 0):target - 1]:
+                view.set_node_color(node, NODE_COLOR_VISITED)
+        else:
+            for node in played[target:self.position]:
+                view.set_node_color(node, NODE_COLOR)
+        self.position = target
+        self.finished = self._exhausted and target == len(played)
+        if target > 0:
+            view.set_node_color(played[target - 1], NODE_COLOR_VISITED if self.finished else NODE_COLOR_CURRENT)
+        if self.on_frame is not None:
+            self.on_frame(self.position, self.total)
+
+
+# Une vue par Canvas, créée au premier dessin
+_views: "WeakKeyDictionary[tk.Canvas, GraphView]" = WeakKeyDictionary()
+
+
+def view_for(canvas: tk.Canvas) -> GraphView:
+    """Retourne la GraphView du Canvas, créée si besoin."""
+    view = _views.get(canvas)
+    if view is None:
+        view = GraphView(canvas)
+        _views[canvas] = view
+    return view
 
 
 def draw_graph(canvas: tk.Canvas, graph: Graph, positions: dict[str, tuple[int, int]]):
@@ -33,23 +731,16 @@ def draw_graph(canvas: tk.Canvas, graph: Graph, positions: dict[str, tuple[int,
         >>> canvas = tk.Canvas(root, width=800, height=600)
         >>> positions = {"A": (100, 100), "B": (200, 100)}
         >>> draw_graph(canvas, my_graph, positions)
-    """
-    # TODO: implémenter
-    # Algorithme:
-    # 1. Effacer le canvas
-    # 2. Dessiner toutes les arêtes (lignes)
-    # 3. Dessiner tous les nœuds (cercles + texte)
-    
-    # Astuce pour dessiner un cercle:
-    # canvas.create_oval(x-r, y-r, x+r, y+r, fill=color)
     
-    # Astuce pour dessiner une ligne:
-    # canvas.create_line(x1, y1, x2, y2, width=width, fill=color)
-    
-    # Astuce pour dessiner du texte:
-    # canvas.create_text(x, y, text=label, fill=color)
-    
-    pass
+    Note:
+        Le dessin précédent est mis à jour (GraphView.sync), pas effacé :
+        seuls les éléments ajoutés, supprimés ou déplacés sont redessinés,
+        et les surlignages sont retirés. Le zoom et le décalage de la vue
+        (GraphView.zoom, GraphView.pan) s'appliquent aux positions.
+    """
+    view = view_for(canvas)
+    view.sync(graph, positions)
+    view.reset_styles()
 
 
 def highlight_path(canvas: tk.Canvas, path: list[str], positions: dict[str, tuple[int, int]]):
@@ -62,30 +753,64 @@ def highlight_path(canvas: tk.Canvas, path: list[str], positions: dict[str, tupl
         positions: Positions des nœuds
     
     Note:
-        Cette fonction redessine les nœuds du chemin en couleur différente.
+        Le graphe doit avoir été dessiné par draw_graph() : seules les
+        couleurs des items existants changent.
+    """
+    view = view_for(canvas)
+    for a, b in zip(path, path[1:]):
+        view.set_edge_style(a, b, NODE_COLOR_VISITED, PATH_WIDTH)
+    for node in path:
+        view.set_node_color(node, NODE_COLOR_VISITED)
+
+
+def highlight_critical(canvas: tk.Canvas, points: list[str], bridges: list[tuple[str, str]],
+                       positions: dict[str, tuple[int, int]]):
+    """
+    Surligne les points d'articulation et les ponts du graphe.
+    
+    Args:
+        canvas: Canvas Tkinter
+        points: Points d'articulation
+        bridges: Ponts (a, b)
+        positions: Positions des nœuds
     """
-    # TODO: implémenter
-    # Astuce : redessiner les nœuds du chemin avec NODE_COLOR_VISITED
-    pass
+    view = view_for(canvas)
+    for a, b in bridges:
+        view.set_edge_style(a, b, NODE_COLOR_CURRENT, PATH_WIDTH)
+    for node in points:
+        view.set_node_color(node, NODE_COLOR_CURRENT)
 
 
-def animate_traversal(canvas: tk.Canvas, order: list[str], positions: dict[str, tuple[int, int]], delay_ms: int = 500):
+def animate_traversal(canvas: tk.Canvas, order: Iterable[str], positions: dict[str, tuple[int, int]],
+                      delay_ms: int = 500, duration: float | None = None, total: int | None = None,
+                      on_frame: Callable[[int, int | None], None] | None = None) -> TraversalPlayer:
     """
     Anime un parcours DFS/BFS nœud par nœud.
     
     Args:
         canvas: Canvas Tkinter
-        order: Ordre de visite des nœuds
+        order: Ordre de visite des nœuds (liste ou générateur)
         positions: Positions des nœuds
-        delay_ms: Délai entre chaque étape (millisecondes)
+        delay_ms: Délai entre chaque étape (millisecondes ; 0 : sans délai)
+        duration: Si donné, durée totale de l'animation en secondes (remplace
+                  delay_ms) : plusieurs nœuds par image si besoin
+        total: Nombre d'étapes si order n'a pas de len()
+        on_frame: Appelée après chaque image avec (position, total)
+    
+    Returns:
+        Le TraversalPlayer de l'animation (pause, seek, vitesse)
     
     Note:
-        Utilise canvas.after() pour créer une animation.
+        Utilise canvas.after() pour créer une animation, à ANIMATION_FPS
+        images par seconde au plus ; chaque étape recolore des nœuds
+        existants (itemconfig), en O(1). Un nouveau dessin ou une nouvelle
+        animation arrête celle en cours.
         Fonction avancée, optionnelle pour les étudiants.
     """
-    # TODO: implémenter (BONUS)
-    # Astuce : utiliser canvas.after(delay, callback)
-    pass
+    view = view_for(canvas)
+    if duration is not None:
+        return view.animate(order, duration=duration, total=total, on_frame=on_frame)
+    return view.animate(order, delay_ms, total=total, on_frame=on_frame)
 
 
 def auto_layout(graph: Graph, width: int = 800, height: int = 600) -> dict[str, tuple[int, int]]:
@@ -121,8 +846,93 @@ def auto_layout(graph: Graph, width: int = 800, height: int = 600) -> dict[str,
            - Calculer l'angle : 2π * i / N
            - Calculer position : (center_x + radius*cos(angle), center_y + radius*sin(angle))
     """
-    # TODO: implémenter
-    # Astuce : assurer les dimensions minimales
+    if width < 400 or height < 300:
+        width, height = DEFAULT_WIDTH, DEFAULT_HEIGHT
+    
+    nodes = graph.nodes()
+    if not nodes:
+        return {}
+    center_x, center_y = width / 2, height / 2
+    if len(nodes) == 1:
+        return {nodes[0]: (int(center_x), int(center_y))}
+    
+    radius = 0.4 * min(width, height)
+    positions = {}
+    for i, node in enumerate(nodes):
+        angle = 2 * math.pi * i / len(nodes)
+        positions[node] = (
+            int(center_x + radius * math.cos(angle)),
+            int(center_y + radius * math.sin(angle)),
+        )
+    return positions
 
+
+def _draw_node(canvas: tk.Canvas, node: str, position: tuple[float, float], color: str,
+               radius: float = NODE_RADIUS, label: bool = True, selected: bool = False) -> list:
+    """Dessine un nœud (cercle + étiquette) et retourne [id du cercle, id de l'étiquette ou None]."""
+    x, y = position
+    r = radius
+    oval = canvas.create_oval(x - r, y - r, x + r, y + r, fill=color, **_outline(selected))
+    text = canvas.create_text(x, y, text=node, fill=TEXT_COLOR) if label else None
+    return [oval, text]
+
+
+def _outline(selected: bool) -> dict:
+    """Options du contour d'un cercle de nœud, sélectionné ou non."""
+    if selected:
+        return {"outline": SELECTION_COLOR, "width": SELECTION_WIDTH}
+    return {"outline": "", "width": 1}
+
+
+def _draw_edge(canvas: tk.Canvas, a: tuple[float, float], b: tuple[float, float], color: str, width: int,
+               arrow: bool = False, radius: float = NODE_RADIUS) -> int:
+    """
+    Dessine une arête entre deux positions et retourne l'id du trait.
     
-    pass
+    Avec arrow=True (graphe orienté), le trait s'arrête au bord du cercle
+    de b (de rayon radius) et se termine par une flèche.
+    """
+    options = {"arrow": tk.LAST} if arrow else {}
+    return canvas.create_line(*_edge_coords(a, b, arrow, radius), fill=color, width=width, **options)
+
+
+def _edge_coords(a: tuple[float, float], b: tuple[float, float], arrow: bool,
+                 radius: float = NODE_RADIUS) -> tuple[float, float, float, float]:
+    """Extrémités du trait d'une arête (raccourci jusqu'au bord de b si flèche)."""
+    if not arrow:
+        return a[0], a[1], b[0], b[1]
+    length = math.hypot(b[0] - a[0], b[1] - a[1]) or 1
+    shrink = radius / length
+    return a[0], a[1], b[0] - (b[0] - a[0]) * shrink, b[1] - (b[1] - a[1]) * shrink
+
+
+def _crosses(a: tuple[float, float], b: tuple[float, float], width: int, height: int) -> bool:
+    """
+    Vrai si le segment ab traverse le rectangle [0, width] × [0, height]
+    (découpage de Liang-Barsky).
+    """
+    x, y = a
+    if x < 0 and b[0] < 0 or x > width and b[0] > width or y < 0 and b[1] < 0 or y > height and b[1] > height:
+        return False
+    dx, dy = b[0] - x, b[1] - y
+    enter, leave = 0.0, 1.0
+    for step, room in ((-dx, x), (dx, width - x), (-dy, y), (dy, height - y)):
+        if step == 0:
+            if room < 0:
+                return False
+            continue
+        t = room / step
+        if step < 0:
+            enter = max(enter, t)
+        else:
+            leave = min(leave, t)
+        if enter > leave:
+            return False
+    return True
+
+
+def _tile_color(count: int) -> str:
+    """Couleur d'une tuile dense : plus foncée à mesure que count augmente (échelle log)."""
+    t = min(1.0, math.log2(count / DENSE_TILE_NODES) / 6)
+    return "#" + "".join(f"{round(light + (dark - light) * t):02X}"
+                         for light, dark in zip(TILE_COLOR_LIGHT, TILE_COLOR_DARK))
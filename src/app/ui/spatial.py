@@ -0,0 +1,148 @@
+"""
+Module ui.spatial
+-----------------
+Index spatial des positions des nœuds : grille de cases carrées.
+
+Retrouver les nœuds d'une zone (partie visible du Canvas, rectangle de
+sélection) ou le nœud sous la souris ne parcourt que les cases qui la
+recouvrent, au lieu de tous les nœuds. La taille des cases est choisie pour qu'une case contienne
+en moyenne NODES_PER_CELL nœuds.
+"""
+
+import math
+
+
+# Nombre moyen de nœuds par case visé par défaut
+NODES_PER_CELL = 4
+
+
+class GridIndex:
+    """
+    Grille de cases carrées : case (i, j) → nœuds dont la position y tombe.
+    
+    Attributs:
+        positions: Positions {nœud: (x, y)} indexées (non copiées)
+        cell: Côté d'une case, dans l'unité des positions
+        cells: Case (i, j) → liste des nœuds de la case (cases vides absentes)
+    
+    add() et move() tiennent l'index à jour quand un nœud est ajouté ou
+    déplacé, en O(1) ; la taille des cases n'est pas recalculée.
+    
+    Exemple:
+        >>> index = GridIndex({"A": (0, 0), "B": (50, 50), "C": (300, 10)})
+        >>> sorted(index.query(-10, -10, 100, 100))
+        ['A', 'B']
+        >>> index.nearest(45, 52, radius=10)
+        'B'
+    """
+    
+    def __init__(self, positions: dict[str, tuple[float, float]], cell: float | None = None):
+        self.positions = positions
+        self.cell = cell or _cell_size(positions)
+        self.cells: dict[tuple[int, int], list[str]] = {}
+        for node, (x, y) in positions.items():
+            self.cells.setdefault(self._cell_of(x, y), []).append(node)
+        columns = [i for i, _ in self.cells] or [0]
+        rows = [j for _, j in self.cells] or [0]
+        self._bounds = (min(columns), min(rows), max(columns), max(rows))
+    
+    def query(self, x0: float, y0: float, x1: float, y1: float) -> list[str]:
+        """
+        Nœuds dont la position est dans le rectangle [x0, x1] × [y0, y1].
+        
+        Seules les cases qui recouvrent le rectangle (limité aux cases
+        occupées) sont parcourues ; seuls les nœuds des cases du bord sont
+        testés un à un.
+        """
+        # Rectangle qui contient entièrement les cases occupées : tous les nœuds
+        cell, (b0, c0, b1, c1) = self.cell, self._bounds
+        if x0 <= b0 * cell and y0 <= c0 * cell and x1 >= (b1 + 1) * cell and y1 >= (c1 + 1) * cell:
+            return list(self.positions)
+        i0, j0 = self._cell_of(x0, y0)
+        i1, j1 = self._cell_of(x1, y1)
+        i0, j0 = max(i0, self._bounds[0]), max(j0, self._bounds[1])
+        i1, j1 = min(i1, self._bounds[2]), min(j1, self._bounds[3])
+        if (i1 - i0 + 1) * (j1 - j0 + 1) > len(self.cells):
+            cells = [(key, members) for key, members in self.cells.items()
+                     if i0 <= key[0] <= i1 and j0 <= key[1] <= j1]
+        else:
+            cells = [((i, j), self.cells[i, j]) for i in range(i0, i1 + 1) for j in range(j0, j1 + 1)
+                     if (i, j) in self.cells]
+        found = []
+        positions = self.positions
+        for (i, j), members in cells:
+            if i0 < i < i1 and j0 < j < j1:
+                found.extend(members)
+                continue
+            for node in members:
+                x, y = positions[node]
+                if x0 <= x <= x1 and y0 <= y <= y1:
+                    found.append(node)
+        return found
+    
+    def nearest(self, x: float, y: float, radius: float) -> str | None:
+        """
+        Nœud le plus proche de (x, y) à une distance d'au plus radius (None
+        s'il n'y en a pas) : ne parcourt que les cases du carré de côté
+        2·radius centré sur le point.
+        """
+        best, best_distance = None, radius
+        for node in self.query(x - radius, y - radius, x + radius, y + radius):
+            distance = math.dist((x, y), self.positions[node])
+            if distance <= best_distance:
+                best, best_distance = node, distance
+        return best
+    
+    def spacing(self) -> float:
+        """
+        Espacement moyen des nœuds : côté de la part de chaque nœud dans le
+        rectangle des cases occupées (estimation en O(1), 0 si vide).
+        """
+        if not self.positions:
+            return 0.0
+        i0, j0, i1, j1 = self._bounds
+        return self.cell * math.sqrt((i1 - i0 + 1) * (j1 - j0 + 1) / len(self.positions))
+    
+    def add(self, node: str, x: float, y: float) -> None:
+        """Ajoute un nœud (positions[node] est mis à jour)."""
+        self.positions[node] = (x, y)
+        cell = self._cell_of(x, y)
+        self.cells.setdefault(cell, []).append(node)
+        self._extend(cell)
+    
+    def move(self, node: str, x: float, y: float) -> None:
+        """Déplace un nœud indexé (positions[node] est mis à jour)."""
+        old = self._cell_of(*self.positions[node])
+        self.positions[node] = (x, y)
+        cell = self._cell_of(x, y)
+        if cell != old:
+            members = self.cells[old]
+            members.remove(node)
+            if not members:
+                del self.cells[old]
+            self.cells.setdefault(cell, []).append(node)
+            self._extend(cell)
+    
+    def _extend(self, cell: tuple[int, int]) -> None:
+        """Agrandit les bornes des cases occupées (elles ne rétrécissent jamais)."""
+        i, j = cell
+        i0, j0, i1, j1 = self._bounds
+        if len(self.positions) == 1:
+            self._bounds = (i, j, i, j)
+        else:
+            self._bounds = (min(i0, i), min(j0, j), max(i1, i), max(j1, j))
+    
+    def _cell_of(self, x: float, y: float) -> tuple[int, int]:
+        return math.floor(x / self.cell), math.floor(y / self.cell)
+
+
+def _cell_size(positions: dict[str, tuple[float, float]]) -> float:
+    """Côté de case donnant NODES_PER_CELL nœuds par case en moyenne (1 si dégénéré)."""
+    if not positions:
+        return 1.0
+    xs = [x for x, _ in positions.values()]
+    ys = [y for _, y in positions.values()]
+    width, height = max(xs) - min(xs), max(ys) - min(ys)
+    area = width * height or max(width, height) ** 2
+    side = math.sqrt(area * NODES_PER_CELL / len(positions))
+    return side if side > 0 and math.isfinite(side) else 1.0
@@ -0,0 +1,182 @@
+"""
+Tests pour la recherche A* guidée par les positions des nœuds.
+
+Commandes:
+    pytest tests/test_astar.py -v
+    pytest -m avance
+"""
+
+import random
+from pathlib import Path
+
+import pytest
+from src.app.core import (
+    Graph,
+    a_star_path,
+    bfs_path,
+    coordinate_heuristic,
+    dijkstra_path,
+    haversine_distance,
+    load_graph,
+    path_weight,
+    shortest_path,
+)
+from src.app.core.io import dict_to_graph, graph_to_dict
+
+EXAMPLE = Path(__file__).resolve().parents[1] / "example_graph.json"
+
+
+def zero(node: str, goal: str) -> float:
+    """Heuristique nulle : A* se comporte comme Dijkstra."""
+    return 0
+
+
+@pytest.fixture
+def road():
+    """Petit réseau routier : grille perturbée, poids = longueur du tronçon."""
+    rng = random.Random(5)
+    g = Graph()
+    side = 15
+    points = {}
+    for y in range(side):
+        for x in range(side):
+            name = f"n{y * side + x:03d}"
+            g.add_node(name)
+            points[name] = (x + rng.uniform(-0.3, 0.3), y + rng.uniform(-0.3, 0.3))
+            g.set_position(name, *points[name])
+    for a in points:
+        for b in points:
+            (x1, y1), (x2, y2) = points[a], points[b]
+            d = ((x1 - x2) ** 2 + (y1 - y2) ** 2) ** 0.5
+            if a < b and d < 1.3 and rng.random() < 0.8:
+                g.add_edge(a, b, round(d * rng.uniform(1, 1.5), 3))
+    return g
+
+
+# ============================================================================
+# Positions dans Graph et dans le JSON
+# ============================================================================
+
+@pytest.mark.avance
+def test_positions(linear_graph):
+    """Position optionnelle par nœud, oubliée avec le nœud."""
+    assert linear_graph.position("A") is None
+    assert not linear_graph.has_positions()
+    for i, node in enumerate("ABCD"):
+        linear_graph.set_position(node, i, 0)
+    assert linear_graph.position("C") == (2, 0)
+    assert linear_graph.has_positions()
+    linear_graph.remove_node("D")
+    linear_graph.add_node("D")
+    assert linear_graph.position("D") is None
+
+
+@pytest.mark.avance
+def test_invalid_positions(linear_graph):
+    """Nœud inexistant : ValueError ; coordonnée non numérique : TypeError."""
+    with pytest.raises(ValueError):
+        linear_graph.set_position("X", 0, 0)
+    with pytest.raises(TypeError):
+        linear_graph.set_position("A", "0", 0)
+    with pytest.raises(ValueError):
+        dict_to_graph({"nodes": ["A"], "edges": [], "positions": {"A": [1]}})
+
+
+@pytest.mark.avance
+def test_positions_json_roundtrip():
+    """Positions et drapeau geographic survivent à l'export JSON."""
+    cities = load_graph(EXAMPLE)
+    assert cities.geographic
+    data = graph_to_dict(cities)
+    assert data["positions"]["Paris"] == [2.3522, 48.8566]
+    loaded = dict_to_graph(data)
+    assert loaded.geographic
+    assert loaded.position("Lyon") == cities.position("Lyon")
+
+
+# ============================================================================
+# Heuristique
+# ============================================================================
+
+@pytest.mark.avance
+def test_haversine_distance():
+    """Paris–Lyon : environ 392 km à vol d'oiseau."""
+    assert haversine_distance((2.3522, 48.8566), (4.8357, 45.764)) == pytest.approx(392, abs=1)
+
+
+@pytest.mark.avance
+def test_heuristic_is_consistent(road):
+    """h(u) ≤ w(u, v) + h(v) pour toute arête : condition d'optimalité d'A*."""
+    heuristic = coordinate_heuristic(road)
+    goal = road.nodes()[-1]
+    for a, b in road.edges():
+        assert heuristic(a, goal) <= road.weight(a, b) + heuristic(b, goal) + 1e-9
+        assert heuristic(b, goal) <= road.weight(a, b) + heuristic(a, goal) + 1e-9
+
+
+@pytest.mark.avance
+def test_heuristic_requires_all_positions(linear_graph):
+    """Sans position pour chaque nœud, pas d'heuristique de coordonnées."""
+    linear_graph.set_position("A", 0, 0)
+    assert coordinate_heuristic(linear_graph) is None
+
+
+# ============================================================================
+# A*
+# ============================================================================
+
+@pytest.mark.avance
+def test_a_star_on_cities():
+    """Villes de example_graph.json : même chemin que Dijkstra."""
+    cities = load_graph(EXAMPLE)
+    stats = {}
+    path = a_star_path(cities, "Lille", "Marseille", stats=stats)
+    assert path == ["Lille", "Paris", "Lyon", "Marseille"]
+    assert path == dijkstra_path(cities, "Lille", "Marseille")
+    assert stats["algorithm"] == "a*"
+
+
+@pytest.mark.avance
+def test_a_star_optimal_and_expands_less(road):
+    """Poids optimal, et jamais plus de nœuds développés que Dijkstra."""
+    rng = random.Random(0)
+    nodes = road.nodes()
+    total_astar = total_dijkstra = 0
+    for _ in range(20):
+        a, b = rng.choice(nodes), rng.choice(nodes)
+        astar, dijkstra = {}, {}
+        path = a_star_path(road, a, b, stats=astar)
+        reference = a_star_path(road, a, b, heuristic=zero, stats=dijkstra)
+        assert path_weight(road, path) == pytest.approx(path_weight(road, dijkstra_path(road, a, b)))
+        assert path_weight(road, reference) == pytest.approx(path_weight(road, path))
+        total_astar += astar["expanded"]
+        total_dijkstra += dijkstra["expanded"]
+    assert total_astar < total_dijkstra
+
+
+@pytest.mark.avance
+def test_a_star_unweighted_with_layout_positions(linear_graph):
+    """Positions en pixels sur un graphe non pondéré : le chemin reste minimal."""
+    linear_graph.add_edge("A", "D")
+    for node, x in zip("ABCD", (0, 100, 500, 900)):
+        linear_graph.set_position(node, x, 0)
+    path = a_star_path(linear_graph, "A", "D")
+    assert path == bfs_path(linear_graph, "A", "D") == ["A", "D"]
+
+
+@pytest.mark.avance
+def test_a_star_fallback_without_positions(cyclic_graph):
+    """Sans coordonnées : repli sur shortest_path (BFS ici)."""
+    stats = {}
+    assert a_star_path(cyclic_graph, "A", "C", stats=stats) == shortest_path(cyclic_graph, "A", "C")
+    assert stats["algorithm"] == "bfs"
+
+
+@pytest.mark.avance
+def test_a_star_unreachable_and_errors(road):
+    """Nœud isolé : None ; nœud inexistant : ValueError."""
+    road.add_node("isolé")
+    road.set_position("isolé", 50, 50)
+    assert a_star_path(road, "n000", "isolé") is None
+    with pytest.raises(ValueError):
+        a_star_path(road, "n000", "absent")
@@ -0,0 +1,118 @@
+"""
+Tests pour la disposition en arrière-plan (ui/background.py) : le thread
+Tk est simulé par un planificateur qui exécute les rappels à la demande.
+
+Commandes:
+    pytest tests/test_background.py -v
+    pytest -m avance
+"""
+
+import time
+
+import pytest
+from src.app.core import Graph
+from src.app.ui import background
+from src.app.ui.background import LayoutWorker
+from src.app.ui.layout import ForceLayout, force_layout
+from src.app.ui.render import Geometry, GraphView
+
+from .test_render import FakeCanvas
+
+
+def ring(n):
+    g = Graph()
+    for i in range(n):
+        g.add_edge(f"N{i}", f"N{(i + 1) % n}")
+    return g
+
+
+class Recorder:
+    """Rappels du LayoutWorker : instantanés reçus et résultat final."""
+    
+    def __init__(self):
+        self.progress = []
+        self.final = None
+    
+    def on_progress(self, snapshot, done, total):
+        self.progress.append((done, total))
+    
+    def on_done(self, snapshot):
+        self.final = snapshot
+
+
+def run(canvas, worker, timeout=10.0):
+    """Fait tourner la « boucle Tk » jusqu'à la fin du calcul."""
+    deadline = time.perf_counter() + timeout
+    while worker.running:
+        assert time.perf_counter() < deadline
+        time.sleep(0.001)
+        canvas.run_pending()
+
+
+@pytest.mark.avance
+def test_final_positions_match_force_layout():
+    g = ring(40)
+    canvas, recorder = FakeCanvas(), Recorder()
+    worker = LayoutWorker(ForceLayout(g, iterations=30, vectorized=False), canvas.after,
+                          recorder.on_progress, recorder.on_done, canvas.after_cancel)
+    worker.start()
+    run(canvas, worker)
+    assert recorder.final == force_layout(g, iterations=30, vectorized=False)
+
+
+@pytest.mark.avance
+def test_progress_snapshots(monkeypatch):
+    """Des instantanés intermédiaires arrivent, dans l'ordre, avant le résultat."""
+    monkeypatch.setattr(background, "SNAPSHOT_INTERVAL", 0.0)
+    monkeypatch.setattr(background, "POLL_INTERVAL_MS", 0)
+    g = ring(200)
+    canvas, recorder = FakeCanvas(), Recorder()
+    worker = LayoutWorker(ForceLayout(g, iterations=40, vectorized=False), canvas.after,
+                          recorder.on_progress, recorder.on_done, canvas.after_cancel,
+                          prepare=len)
+    worker.start()
+    run(canvas, worker)
+    assert recorder.progress
+    done = [d for d, _ in recorder.progress]
+    assert done == sorted(done) and done[-1] < 40
+    assert {total for _, total in recorder.progress} == {40}
+    assert recorder.final == 200
+
+
+@pytest.mark.avance
+def test_cancel_stops_thread_and_callbacks():
+    g = ring(300)
+    canvas, recorder = FakeCanvas(), Recorder()
+    stepper = ForceLayout(g, iterations=100_000, vectorized=False)
+    worker = LayoutWorker(stepper, canvas.after, recorder.on_progress, recorder.on_done, canvas.after_cancel)
+    worker.start()
+    time.sleep(0.05)
+    worker.cancel()
+    worker.join(timeout=10)
+    canvas.run_pending()
+    assert not worker.running
+    assert stepper.done < stepper.total
+    assert canvas.pending == {}
+    assert recorder.final is None
+
+
+@pytest.mark.avance
+def test_view_move_keeps_items_and_styles():
+    """GraphView.move() déplace les items existants sans perdre les couleurs."""
+    g = ring(12)
+    canvas = FakeCanvas()
+    view = GraphView(canvas)
+    stepper = ForceLayout(g, iterations=10, vectorized=False)
+    view.sync(g, stepper.positions())
+    view.set_node_color("N0", "red")
+    items = dict(view.node_items)
+    while stepper.step():
+        pass
+    positions = stepper.positions()
+    view.move(Geometry(positions, view.edge_keys()))
+    assert view.node_items == items
+    assert canvas.items[items["N0"][0]]["fill"] == "red"
+    for node, (x, y) in positions.items():
+        assert view.positions[node] == pytest.approx((x, y))
+        x0, y0, x1, y1 = canvas.items[items[node][0]]["coords"]
+        assert ((x0 + x1) / 2, (y0 + y1) / 2) == pytest.approx((x, y))
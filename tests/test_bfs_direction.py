@@ -0,0 +1,109 @@
+"""
+Tests pour le BFS à optimisation de direction (top-down / bottom-up).
+
+Le moteur doit produire exactement le même ordre que bfs() en mode
+ordonné, et les mêmes couches en mode relâché.
+
+Commandes:
+    pytest tests/test_bfs_direction.py -v
+    pytest -m avance
+"""
+
+import random
+
+import pytest
+from src.app.core import Graph, bfs, bfs_direction_optimizing
+
+
+def random_graph(n: int, edges: int, seed: int) -> Graph:
+    """Graphe aléatoire à n nœuds nommés n000, n001... (ordre alpha = numérique)."""
+    rng = random.Random(seed)
+    g = Graph()
+    for i in range(n):
+        g.add_node(f"n{i:03d}")
+    for _ in range(edges):
+        g.add_edge(f"n{rng.randrange(n):03d}", f"n{rng.randrange(n):03d}")
+    return g
+
+
+def layers(graph: Graph, order: list[str]) -> list[set[str]]:
+    """Découpe un ordre BFS en couches (distance au premier nœud)."""
+    distance = {order[0]: 0}
+    for node in order:
+        for neighbor in graph.neighbors(node):
+            distance.setdefault(neighbor, distance[node] + 1)
+    result = []
+    for node in order:
+        if distance[node] == len(result):
+            result.append(set())
+        result[distance[node]].add(node)
+    return result
+
+
+# ============================================================================
+# Équivalence avec bfs()
+# ============================================================================
+
+@pytest.mark.avance
+def test_direction_optimizing_tree_graph():
+    """Même ordre que bfs() sur un petit arbre."""
+    g = Graph()
+    g.add_edge("A", "B")
+    g.add_edge("A", "C")
+    g.add_edge("B", "D")
+    g.add_edge("C", "E")
+    assert bfs_direction_optimizing(g, "A") == ["A", "B", "C", "D", "E"]
+
+
+@pytest.mark.avance
+@pytest.mark.parametrize("seed", range(20))
+def test_direction_optimizing_matches_bfs(seed):
+    """Mode ordonné : ordre identique à bfs(), même en forçant le bottom-up."""
+    g = random_graph(80, 240, seed)
+    start = g.nodes()[seed % len(g)]
+    expected = bfs(g, start)
+    # alpha=1 bascule en bottom-up dès la première couche
+    assert bfs_direction_optimizing(g, start, alpha=1, beta=1000) == expected
+    assert bfs_direction_optimizing(g, start) == expected
+
+
+@pytest.mark.avance
+@pytest.mark.parametrize("seed", range(10))
+def test_direction_optimizing_relaxed_keeps_layers(seed):
+    """Mode relâché : mêmes couches, ordre libre à l'intérieur d'une couche."""
+    g = random_graph(80, 240, seed)
+    start = g.nodes()[0]
+    expected = bfs(g, start)
+    result = bfs_direction_optimizing(g, start, ordered=False, alpha=1, beta=1000)
+    assert len(result) == len(expected)
+    assert layers(g, result) == layers(g, expected)
+
+
+@pytest.mark.avance
+def test_direction_optimizing_disconnected():
+    """Seule la composante du départ est visitée."""
+    g = Graph()
+    g.add_edge("A", "B")
+    g.add_edge("C", "D")
+    assert bfs_direction_optimizing(g, "A", alpha=1) == ["A", "B"]
+
+
+@pytest.mark.avance
+def test_direction_optimizing_nonexistent_start():
+    """Nœud de départ inexistant : ValueError, comme bfs()."""
+    g = Graph()
+    g.add_node("A")
+    with pytest.raises(ValueError):
+        bfs_direction_optimizing(g, "X")
+
+
+@pytest.mark.avance
+def test_direction_optimizing_follows_mutations():
+    """L'instantané indexé gardé entre deux appels suit les modifications du graphe."""
+    g = random_graph(60, 150, 7)
+    start = g.nodes()[0]
+    assert bfs_direction_optimizing(g, start) == bfs(g, start)
+    g.add_edge(start, "zz")
+    g.remove_node(g.nodes()[1])
+    assert bfs_direction_optimizing(g, start) == bfs(g, start)
+    assert "zz" in bfs_direction_optimizing(g, start, ordered=False)
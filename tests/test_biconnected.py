@@ -0,0 +1,150 @@
+"""
+Tests pour les points d'articulation, les ponts et les composantes
+biconnexes.
+
+Commandes:
+    pytest tests/test_biconnected.py -v
+    pytest -m avance
+"""
+
+import random
+
+import pytest
+from src.app.core import (
+    DiGraph,
+    Graph,
+    articulation_points,
+    biconnected_components,
+    bridges,
+    connected_components,
+    induced_subgraph,
+)
+
+
+@pytest.fixture
+def two_triangles():
+    """
+    Deux triangles reliés par un pont C-D :
+        A - B       E - F
+         \\ /         \\ /
+          C ------- D
+    """
+    g = Graph()
+    for a, b in [("A", "B"), ("B", "C"), ("C", "A"),
+                 ("C", "D"),
+                 ("D", "E"), ("E", "F"), ("F", "D")]:
+        g.add_edge(a, b)
+    return g
+
+
+def random_graph(seed: int) -> Graph:
+    rng = random.Random(seed)
+    n = rng.randrange(1, 14)
+    names = [f"n{i:02d}" for i in range(n)]
+    g = Graph()
+    for name in names:
+        g.add_node(name)
+    for _ in range(rng.randrange(0, 2 * n)):
+        a, b = rng.choice(names), rng.choice(names)
+        if a != b:
+            g.add_edge(a, b)
+    return g
+
+
+def component_count(graph: Graph) -> int:
+    return len(connected_components(graph))
+
+
+# ============================================================================
+# Cas simples
+# ============================================================================
+
+@pytest.mark.avance
+def test_two_triangles(two_triangles):
+    """C et D sont critiques, C-D est l'unique pont, trois blocs."""
+    assert articulation_points(two_triangles) == ["C", "D"]
+    assert bridges(two_triangles) == [("C", "D")]
+    assert biconnected_components(two_triangles) == [
+        ["A", "B", "C"], ["C", "D"], ["D", "E", "F"],
+    ]
+
+
+@pytest.mark.avance
+def test_linear_graph(linear_graph):
+    """Sur une ligne, chaque arête est un pont et chaque nœud interne critique."""
+    assert articulation_points(linear_graph) == ["B", "C"]
+    assert bridges(linear_graph) == [("A", "B"), ("B", "C"), ("C", "D")]
+    assert len(biconnected_components(linear_graph)) == 3
+
+
+@pytest.mark.avance
+def test_cycle_and_isolated_node():
+    """Un cycle n'a ni point d'articulation ni pont ; un nœud isolé n'a pas de bloc."""
+    g = Graph()
+    for a, b in [("A", "B"), ("B", "C"), ("C", "D"), ("D", "A")]:
+        g.add_edge(a, b)
+    g.add_node("Z")
+    assert articulation_points(g) == []
+    assert bridges(g) == []
+    assert biconnected_components(g) == [["A", "B", "C", "D"]]
+    assert articulation_points(Graph()) == []
+
+
+@pytest.mark.avance
+def test_digraph_uses_underlying_graph():
+    """Sur un DiGraph, le sens des arcs est ignoré."""
+    g = DiGraph()
+    g.add_edge("A", "B")
+    g.add_edge("C", "B")
+    g.add_edge("B", "A")
+    assert articulation_points(g) == ["B"]
+    assert bridges(g) == [("A", "B"), ("B", "C")]
+
+
+@pytest.mark.avance
+def test_deep_graph_without_recursion():
+    """Une longue chaîne ne dépasse pas la limite de récursion."""
+    g = Graph()
+    for i in range(5000):
+        g.add_edge(f"n{i:05d}", f"n{i + 1:05d}")
+    assert len(articulation_points(g)) == 4999
+    assert len(bridges(g)) == 5000
+
+
+# ============================================================================
+# Comparaison avec la force brute
+# ============================================================================
+
+@pytest.mark.avance
+@pytest.mark.parametrize("seed", range(20))
+def test_matches_brute_force(seed):
+    """Retirer un point d'articulation (ou un pont) augmente le nombre de composantes."""
+    g = random_graph(seed)
+    base = component_count(g)
+    expected_points = [
+        v for v in g.nodes()
+        if component_count(induced_subgraph(g, set(g.nodes()) - {v})) > base
+    ]
+    expected_bridges = []
+    for a, b in g.edges():
+        h = induced_subgraph(g, g.nodes())
+        h.remove_edge(a, b)
+        if component_count(h) > base:
+            expected_bridges.append(tuple(sorted((a, b))))
+    assert articulation_points(g) == expected_points
+    assert bridges(g) == sorted(expected_bridges)
+
+
+@pytest.mark.avance
+@pytest.mark.parametrize("seed", range(10))
+def test_blocks_partition_edges(seed):
+    """Chaque arête appartient à exactement un bloc ; les blocs partagés se coupent en un point d'articulation."""
+    g = random_graph(seed)
+    blocks = [set(block) for block in biconnected_components(g)]
+    for a, b in g.edges():
+        assert sum(1 for block in blocks if a in block and b in block) == 1
+    points = set(articulation_points(g))
+    for i, first in enumerate(blocks):
+        for second in blocks[i + 1:]:
+            shared = first & second
+            assert len(shared) <= 1 and shared <= points
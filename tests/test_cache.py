@@ -0,0 +1,129 @@
+"""
+Tests pour le cache versionné des résultats (ResultCache).
+
+Commandes:
+    pytest tests/test_cache.py -v
+    pytest -m avance
+"""
+
+import pytest
+from src.app.core import Graph, ResultCache, bfs, dfs, shortest_path
+
+
+@pytest.fixture
+def cache():
+    """Cache neuf, indépendant du cache partagé."""
+    return ResultCache(max_entries=4, max_size=100)
+
+
+# ============================================================================
+# Version du graphe
+# ============================================================================
+
+@pytest.mark.avance
+def test_version_changes_on_mutation():
+    """Chaque modification effective change la version."""
+    g = Graph()
+    versions = [g.version]
+    g.add_node("A")
+    versions.append(g.version)
+    g.add_edge("A", "B")
+    versions.append(g.version)
+    g.remove_edge("A", "B")
+    versions.append(g.version)
+    g.remove_node("B")
+    versions.append(g.version)
+    assert len(set(versions)) == len(versions)
+
+
+@pytest.mark.avance
+def test_version_unchanged_by_noop():
+    """Ajouter un nœud ou une arête existante ne change pas la version."""
+    g = Graph()
+    g.add_edge("A", "B")
+    version = g.version
+    g.add_node("A")
+    g.add_edge("B", "A")
+    assert g.version == version
+
+
+@pytest.mark.avance
+def test_versions_unique_across_graphs():
+    """Deux graphes distincts n'ont jamais la même version."""
+    assert Graph().version != Graph().version
+
+
+# ============================================================================
+# Comportement du cache
+# ============================================================================
+
+@pytest.mark.avance
+def test_cache_hit_and_miss(cache, diamond_graph):
+    """Le second appel identique est servi par le cache."""
+    assert cache.call(bfs, diamond_graph, "A") == ["A", "B", "C", "D"]
+    assert cache.call(bfs, diamond_graph, "A") == ["A", "B", "C", "D"]
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["hit_rate"] == 0.5
+
+
+@pytest.mark.avance
+def test_cache_key_includes_function_and_args(cache, diamond_graph):
+    """Fonctions et arguments différents ne partagent pas d'entrée."""
+    cache.call(bfs, diamond_graph, "A")
+    cache.call(dfs, diamond_graph, "A")
+    cache.call(bfs, diamond_graph, "B")
+    assert cache.stats()["misses"] == 3
+    assert cache.call(dfs, diamond_graph, "A") == dfs(diamond_graph, "A")
+
+
+@pytest.mark.avance
+def test_cache_invalidated_by_mutation(cache, linear_graph):
+    """Après modification du graphe, le résultat est recalculé."""
+    assert cache.call(shortest_path, linear_graph, "A", "D") == ["A", "B", "C", "D"]
+    linear_graph.add_edge("A", "D")
+    assert cache.call(shortest_path, linear_graph, "A", "D") == ["A", "D"]
+    assert cache.stats()["hits"] == 0
+
+
+@pytest.mark.avance
+def test_cache_returns_copies(cache, diamond_graph):
+    """Modifier un résultat rendu ne corrompt pas le cache."""
+    result = cache.call(bfs, diamond_graph, "A")
+    result.append("Z")
+    assert cache.call(bfs, diamond_graph, "A") == ["A", "B", "C", "D"]
+
+
+@pytest.mark.avance
+def test_cache_lru_eviction_by_entries(cache, complete_graph):
+    """Au-delà de max_entries, l'entrée la moins récente est évincée."""
+    for node in ["A", "B", "C", "D"]:
+        cache.call(bfs, complete_graph, node)
+    cache.call(bfs, complete_graph, "A")      # A redevient la plus récente
+    cache.call(dfs, complete_graph, "A")      # évince bfs("B")
+    assert len(cache) == 4
+    assert cache.stats()["evictions"] == 1
+    cache.call(bfs, complete_graph, "A")
+    cache.call(bfs, complete_graph, "B")
+    assert cache.stats()["hits"] == 2
+    assert cache.stats()["misses"] == 6
+
+
+@pytest.mark.avance
+def test_cache_size_accounting(diamond_graph):
+    """La taille totale suit la somme des len des résultats."""
+    cache = ResultCache(max_entries=100, max_size=6)
+    cache.call(bfs, diamond_graph, "A")
+    assert cache.size == 4
+    cache.call(shortest_path, diamond_graph, "A", "D")   # 3 de plus → éviction
+    assert cache.size == 3
+    assert cache.stats()["evictions"] == 1
+
+
+@pytest.mark.avance
+def test_cache_does_not_store_errors(cache, diamond_graph):
+    """Une exception est propagée et rien n'est mis en cache."""
+    with pytest.raises(ValueError):
+        cache.call(bfs, diamond_graph, "X")
+    assert len(cache) == 0
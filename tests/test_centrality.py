@@ -0,0 +1,134 @@
+"""
+Tests pour la centralité d'intermédiarité (core/centrality.py).
+
+Commandes:
+    pytest tests/test_centrality.py -v
+    pytest -m avance
+"""
+
+import random
+
+import pytest
+from src.app.core import DiGraph, Graph, betweenness_centrality
+
+
+def random_graph(seed: int, directed: bool = False) -> Graph:
+    rng = random.Random(seed)
+    g = DiGraph() if directed else Graph()
+    for i in range(12):
+        g.add_node(f"n{i:02d}")
+    for _ in range(22):
+        a, b = rng.randrange(12), rng.randrange(12)
+        if a != b:
+            g.add_edge(f"n{a:02d}", f"n{b:02d}")
+    return g
+
+
+def brute_force_betweenness(graph: Graph) -> dict[str, float]:
+    """
+    Définition directe : somme sur les paires (s, t) de sigma_st(v) / sigma_st,
+    avec sigma_st(v) = sigma_sv · sigma_vt si v est sur un plus court chemin.
+    """
+    nodes = graph.nodes()
+    distance, sigma = {}, {}
+    for s in nodes:
+        distance[s], sigma[s] = {s: 0}, {s: 1}
+        frontier = [s]
+        while frontier:
+            following = []
+            for v in frontier:
+                for w in graph.neighbors(v):
+                    if w not in distance[s]:
+                        distance[s][w] = distance[s][v] + 1
+                        sigma[s][w] = 0
+                        following.append(w)
+                    if distance[s][w] == distance[s][v] + 1:
+                        sigma[s][w] += sigma[s][v]
+            frontier = following
+    scores = dict.fromkeys(nodes, 0.0)
+    for s in nodes:
+        for t, d in distance[s].items():
+            for v in nodes:
+                if v in (s, t) or v not in distance[s] or t not in distance[v]:
+                    continue
+                if distance[s][v] + distance[v][t] == d:
+                    scores[v] += sigma[s][v] * sigma[v][t] / sigma[s][t]
+    if not graph.is_directed():
+        scores = {v: value / 2 for v, value in scores.items()}
+    return scores
+
+
+# ============================================================================
+# Calcul exact
+# ============================================================================
+
+@pytest.mark.avance
+def test_star_center():
+    """Le centre d'une étoile est sur tous les chemins entre feuilles."""
+    g = Graph()
+    for leaf in "BCDE":
+        g.add_edge("A", leaf)
+    scores = betweenness_centrality(g)
+    assert scores["A"] == pytest.approx(1.0)
+    assert scores["B"] == 0.0
+    assert betweenness_centrality(g, normalized=False)["A"] == pytest.approx(6.0)
+
+
+@pytest.mark.avance
+def test_empty_and_tiny_graphs(linear_graph):
+    """Graphe vide : dictionnaire vide ; ligne : nœuds internes seulement."""
+    assert betweenness_centrality(Graph()) == {}
+    scores = betweenness_centrality(linear_graph, normalized=False)
+    assert scores == {"A": 0.0, "B": 2.0, "C": 2.0, "D": 0.0}
+
+
+@pytest.mark.avance
+@pytest.mark.parametrize("directed", [False, True])
+@pytest.mark.parametrize("seed", range(8))
+def test_matches_definition(seed, directed):
+    """Brandes donne les mêmes scores que la définition (chemins multiples compris)."""
+    g = random_graph(seed, directed)
+    expected = brute_force_betweenness(g)
+    scores = betweenness_centrality(g, normalized=False)
+    assert scores == pytest.approx(expected)
+
+
+# ============================================================================
+# Échantillonnage et parallélisme
+# ============================================================================
+
+@pytest.mark.avance
+def test_sampling_all_sources_is_exact():
+    """Autant d'échantillons que de nœuds : résultat exact."""
+    g = random_graph(1)
+    assert betweenness_centrality(g, samples=100) == pytest.approx(betweenness_centrality(g))
+
+
+@pytest.mark.avance
+def test_sampling_is_reproducible_and_close():
+    """Même graine, même estimation ; l'estimation reste proche du score exact."""
+    g = Graph()
+    for i in range(30):
+        g.add_edge(f"c{i:02d}", f"c{(i + 1) % 30:02d}")
+        g.add_edge(f"c{i:02d}", f"f{i:02d}")
+    first = betweenness_centrality(g, samples=40, seed=3)
+    assert first == betweenness_centrality(g, samples=40, seed=3)
+    exact = betweenness_centrality(g)
+    assert max(first, key=first.get).startswith("c")
+    assert sum(abs(first[v] - exact[v]) for v in exact) / len(exact) < 0.05
+
+
+@pytest.mark.avance
+def test_process_pool_matches_single_process():
+    """Répartir les sources entre processus ne change pas le résultat."""
+    g = random_graph(2)
+    assert betweenness_centrality(g, workers=2) == pytest.approx(betweenness_centrality(g))
+
+
+@pytest.mark.avance
+def test_invalid_arguments(linear_graph):
+    """samples et workers doivent être strictement positifs."""
+    with pytest.raises(ValueError):
+        betweenness_centrality(linear_graph, samples=0)
+    with pytest.raises(ValueError):
+        betweenness_centrality(linear_graph, workers=0)
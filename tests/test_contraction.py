@@ -0,0 +1,162 @@
+"""
+Tests pour les hiérarchies de contraction (core/contraction.py).
+
+Commandes:
+    pytest tests/test_contraction.py -v
+    pytest -m avance
+"""
+
+import json
+import math
+import random
+
+import pytest
+from src.app.core import (
+    ContractionHierarchy,
+    ContractionRouter,
+    Graph,
+    dijkstra_distances,
+    path_weight,
+    save_graph,
+)
+from src.app.core.contraction import INDEX_SUFFIX
+
+
+def random_weighted_graph(seed: int, n: int = 60, m: int = 120) -> Graph:
+    """Graphe pondéré aléatoire, éventuellement non connexe."""
+    rng = random.Random(seed)
+    g = Graph()
+    for i in range(n):
+        g.add_node(f"n{i:02d}")
+    for _ in range(m):
+        g.add_edge(f"n{rng.randrange(n):02d}", f"n{rng.randrange(n):02d}", rng.randint(1, 20))
+    return g
+
+
+@pytest.fixture
+def cities():
+    """Villes de example_graph.json avec leurs distances routières."""
+    g = Graph()
+    g.add_edge("Paris", "Lyon", 465)
+    g.add_edge("Paris", "Lille", 225)
+    g.add_edge("Lyon", "Marseille", 315)
+    g.add_edge("Bordeaux", "Lyon", 555)
+    return g
+
+
+# ============================================================================
+# Requêtes
+# ============================================================================
+
+@pytest.mark.avance
+def test_query_on_cities(cities):
+    """Chemin déplié et distance sur le petit réseau de villes."""
+    hierarchy = ContractionHierarchy.build(cities)
+    distance, path, _ = hierarchy.query("Lille", "Marseille")
+    assert path == ["Lille", "Paris", "Lyon", "Marseille"]
+    assert distance == 1005
+    assert hierarchy.query("Lyon", "Lyon")[:2] == (0, ["Lyon"])
+
+
+@pytest.mark.avance
+@pytest.mark.parametrize("seed", range(6))
+def test_matches_dijkstra(seed):
+    """Distances identiques à Dijkstra, chemins valides de même poids."""
+    graph = random_weighted_graph(seed)
+    hierarchy = ContractionHierarchy.build(graph)
+    nodes = graph.nodes()
+    for a in nodes[::6]:
+        expected = dijkstra_distances(graph, a)
+        for b in nodes[::5]:
+            distance, path, _ = hierarchy.query(a, b)
+            assert distance == expected.get(b, math.inf)
+            if path is None:
+                assert b not in expected
+            else:
+                assert path[0] == a and path[-1] == b
+                assert path_weight(graph, path) == distance
+
+
+@pytest.mark.avance
+def test_shortcuts_on_a_line():
+    """Contracter le milieu d'une ligne ajoute un raccourci, déplié à la requête."""
+    g = Graph()
+    for a, b in [("A", "B"), ("B", "C"), ("C", "D"), ("D", "E")]:
+        g.add_edge(a, b, 2)
+    hierarchy = ContractionHierarchy.build(g)
+    assert hierarchy.shortcut_count() >= 1
+    assert hierarchy.shortest_path("A", "E") == ["A", "B", "C", "D", "E"]
+    assert hierarchy.distance("E", "A") == 8
+
+
+# ============================================================================
+# Routeur et persistance
+# ============================================================================
+
+@pytest.mark.avance
+def test_router_unknown_node_and_unreachable(cities):
+    """Nœud inexistant : ValueError ; nœud isolé : None."""
+    cities.add_node("Brest")
+    router = ContractionRouter(cities)
+    assert router.distance("Paris", "Brest") is None
+    assert router.shortest_path("Paris", "Brest") is None
+    with pytest.raises(ValueError):
+        router.distance("Paris", "Nantes")
+
+
+@pytest.mark.avance
+def test_router_rebuilds_after_mutation(cities):
+    """La hiérarchie est reconstruite paresseusement quand le graphe change."""
+    router = ContractionRouter(cities)
+    assert router.distance("Lille", "Lyon") == 690
+    first = router.hierarchy
+    cities.add_edge("Lille", "Lyon", 650)
+    assert router.distance("Lille", "Lyon") == 650
+    assert router.hierarchy is not first
+
+
+@pytest.mark.avance
+def test_hierarchy_saved_next_to_graph(tmp_path):
+    """La hiérarchie est écrite à côté du graphe puis relue à l'identique."""
+    graph = random_weighted_graph(1)
+    graph_file = tmp_path / "routes.json"
+    save_graph(graph, graph_file)
+    router = ContractionRouter.for_file(graph, graph_file)
+    built = router.hierarchy
+    index_file = tmp_path / ("routes" + INDEX_SUFFIX)
+    assert index_file.exists()
+
+    loaded = ContractionHierarchy.load(index_file, graph)
+    assert loaded.rank == built.rank
+    assert loaded.targets == built.targets
+    assert loaded.weights == built.weights
+    assert loaded.query("n00", "n42") == built.query("n00", "n42")
+
+
+@pytest.mark.avance
+def test_stale_hierarchy_file_is_rejected(cities, tmp_path):
+    """Une hiérarchie d'un autre graphe (ou d'autres poids) est refusée."""
+    index_file = tmp_path / ("villes" + INDEX_SUFFIX)
+    ContractionHierarchy.build(cities).save(index_file)
+    cities.add_edge("Paris", "Lyon", 400)
+    with pytest.raises(ValueError):
+        ContractionHierarchy.load(index_file, cities)
+
+    router = ContractionRouter(cities, index_path=index_file)
+    assert router.distance("Lille", "Marseille") == 940
+    assert ContractionHierarchy.load(index_file, cities).fingerprint == router.hierarchy.fingerprint
+
+
+@pytest.mark.avance
+@pytest.mark.parametrize("header", [{"nodes": 3}, [1, 2]])
+def test_incomplete_header_is_rejected(cities, tmp_path, header):
+    """Un en-tête incomplet lève ValueError, puis la hiérarchie est reconstruite."""
+    index_file = tmp_path / ("villes" + INDEX_SUFFIX)
+    ContractionHierarchy.build(cities).save(index_file)
+    magic, _, arrays = index_file.read_bytes().split(b"\n", 2)
+    index_file.write_bytes(magic + b"\n" + json.dumps(header).encode() + b"\n" + arrays)
+    with pytest.raises(ValueError, match="en-tête invalide"):
+        ContractionHierarchy.load(index_file, cities)
+
+    router = ContractionRouter(cities, index_path=index_file)
+    assert router.distance("Lille", "Marseille") == 1005
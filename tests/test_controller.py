@@ -0,0 +1,128 @@
+"""
+Tests pour les calculs en arrière-plan du contrôleur (ui/controller.py) et
+leur suivi depuis la boucle Tk (ui/background.py, FutureWatcher).
+
+Commandes:
+    pytest tests/test_controller.py -v
+    pytest -m avance
+"""
+
+import threading
+import time
+
+import pytest
+from src.app.core import Graph
+from src.app.ui.background import FutureWatcher
+from src.app.ui.controller import GraphController
+
+from .test_render import FakeCanvas
+
+
+def path(n):
+    g = Graph()
+    for i in range(n - 1):
+        g.add_edge(f"N{i}", f"N{i + 1}")
+    return g
+
+
+def blocking():
+    """Méthode qui attend un signal : un calcul « long », maîtrisé par le test."""
+    release = threading.Event()
+    
+    def wait(value):
+        release.wait(10)
+        return value
+    
+    return wait, release
+
+
+def run(canvas, watcher, timeout=10.0):
+    """Fait tourner la « boucle Tk » jusqu'à la remise du résultat."""
+    deadline = time.perf_counter() + timeout
+    while watcher.running:
+        assert time.perf_counter() < deadline
+        time.sleep(0.001)
+        canvas.run_pending()
+
+
+@pytest.fixture
+def controller(simple_graph):
+    controller = GraphController(simple_graph)
+    yield controller
+    controller.close()
+
+
+@pytest.mark.avance
+def test_submit_matches_synchronous_methods(controller):
+    assert controller.submit(controller.execute_dfs, "A").result(5) == controller.execute_dfs("A")
+    assert controller.submit(controller.execute_bfs, "C").result(5) == controller.execute_bfs("C")
+    assert controller.submit(controller.find_shortest_path, "A", "C").result(5) == ["A", "B", "C"]
+    assert controller.submit(controller.check_connectivity).result(5) is True
+    with pytest.raises(ValueError):
+        controller.submit(controller.execute_dfs, "Z").result(5)
+
+
+@pytest.mark.avance
+def test_new_run_or_graph_change_cancels_stale_run(controller):
+    wait, release = blocking()
+    first = controller.submit(wait, "premier")
+    second = controller.submit(controller.execute_bfs, "A")
+    assert first.cancelled()
+    assert second.result(5) == ["A", "B", "C"]
+    
+    stale = controller.submit(wait, "périmé")
+    controller.graph.add_node("D")    # modification sans passer par cancel()
+    release.set()
+    deadline = time.perf_counter() + 5
+    while not stale.done():
+        assert time.perf_counter() < deadline
+        time.sleep(0.001)
+    assert stale.cancelled() and not controller.busy
+
+
+@pytest.mark.avance
+def test_watcher_delivers_result_in_tk_loop(controller):
+    canvas, results, ticks = FakeCanvas(), [], []
+    wait, release = blocking()
+    future = controller.submit(wait, "fini")
+    watcher = FutureWatcher(future, canvas.after, results.append, on_tick=ticks.append,
+                            unschedule=canvas.after_cancel)
+    watcher.start()
+    for _ in range(3):
+        canvas.run_pending()
+    assert results == [] and len(ticks) == 3
+    release.set()
+    run(canvas, watcher)
+    assert results == ["fini"]
+    assert ticks == sorted(ticks) and watcher.elapsed >= ticks[-1]
+
+
+@pytest.mark.avance
+def test_watcher_errors_and_abort(controller):
+    canvas, errors, cancelled = FakeCanvas(), [], []
+    watcher = FutureWatcher(controller.submit(controller.execute_bfs, "Z"), canvas.after,
+                            pytest.fail, on_error=errors.append, unschedule=canvas.after_cancel)
+    watcher.start()
+    run(canvas, watcher)
+    assert isinstance(errors[0], ValueError)
+    
+    wait, release = blocking()
+    watcher = FutureWatcher(controller.submit(wait, 1), canvas.after, pytest.fail,
+                            on_cancel=lambda: cancelled.append(True), unschedule=canvas.after_cancel)
+    watcher.start()
+    watcher.cancel()
+    release.set()
+    assert not watcher.running and canvas.pending == {}
+    assert cancelled == [] and not controller.busy
+
+
+@pytest.mark.avance
+def test_graph_info_is_incremental(controller):
+    info = controller.get_graph_info(extended=False)
+    assert info['degree_histogram'] == {1: 2, 2: 1} and info['components'] == 1
+    assert 'triangles' not in info
+    controller.graph.add_edge("D", "E")
+    info = controller.get_graph_info()
+    assert (info['nodes'], info['edges'], info['components']) == (5, 3, 2)
+    assert info['mean_degree'] == pytest.approx(6 / 5)
+    assert info['triangles'] == 0 and info['diameter'] is not None
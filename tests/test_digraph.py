@@ -0,0 +1,195 @@
+"""
+Tests pour les graphes orientés (DiGraph) et les composantes fortement
+connexes.
+
+Commandes:
+    pytest tests/test_digraph.py -v
+    pytest -m avance
+"""
+
+import random
+
+import pytest
+from src.app.core import (
+    DiGraph,
+    Graph,
+    bfs,
+    bfs_direction_optimizing,
+    bfs_path,
+    connected_components,
+    dfs,
+    dijkstra_path,
+    induced_subgraph,
+    is_connected,
+    reachable_from,
+    shortest_path,
+    strongly_connected_components,
+)
+from src.app.core.io import dict_to_graph, graph_fingerprint, graph_to_dict
+
+
+@pytest.fixture
+def dependencies():
+    """
+    Graphe de dépendances :
+        A → B → C → A   (cycle)
+        C → D → E
+        E → D           (cycle)
+        F isolé
+    """
+    g = DiGraph()
+    for a, b in [("A", "B"), ("B", "C"), ("C", "A"), ("C", "D"), ("D", "E"), ("E", "D")]:
+        g.add_edge(a, b)
+    g.add_node("F")
+    return g
+
+
+def random_digraph(seed: int, n: int = 40, m: int = 70) -> DiGraph:
+    rng = random.Random(seed)
+    g = DiGraph()
+    for i in range(n):
+        g.add_node(f"n{i:02d}")
+    for _ in range(m):
+        g.add_edge(f"n{rng.randrange(n):02d}", f"n{rng.randrange(n):02d}")
+    return g
+
+
+# ============================================================================
+# Structure DiGraph
+# ============================================================================
+
+@pytest.mark.avance
+def test_digraph_arcs_are_one_way():
+    """add_edge(a, b) ne crée que l'arc a → b."""
+    g = DiGraph()
+    g.add_edge("A", "B")
+    assert g.has_edge("A", "B")
+    assert not g.has_edge("B", "A")
+    assert g.neighbors("B") == []
+    assert g.predecessors("B") == ["A"]
+    assert g.is_directed() and not Graph().is_directed()
+    g.add_edge("B", "A")
+    assert g.edges() == [("A", "B"), ("B", "A")]
+
+
+@pytest.mark.avance
+def test_digraph_removal(dependencies):
+    """Supprimer un nœud retire ses arcs entrants et sortants."""
+    dependencies.remove_node("C")
+    assert dependencies.neighbors("B") == []
+    assert dependencies.predecessors("A") == []
+    assert dependencies.predecessors("D") == ["E"]
+    dependencies.remove_edge("D", "E")
+    assert dependencies.has_edge("E", "D")
+    with pytest.raises(ValueError):
+        dependencies.remove_edge("D", "E")
+
+
+@pytest.mark.avance
+def test_digraph_weights_are_per_arc():
+    """Chaque sens porte son propre poids."""
+    g = DiGraph()
+    g.add_edge("A", "B", 3)
+    g.add_edge("B", "A", 5)
+    assert g.weight("A", "B") == 3
+    assert g.weight("B", "A") == 5
+    g.remove_node("B")
+    assert not g.is_weighted()
+
+
+@pytest.mark.avance
+def test_digraph_json_roundtrip(dependencies):
+    """Le sens des arcs survit à l'export JSON et change l'empreinte."""
+    data = graph_to_dict(dependencies)
+    assert data["directed"] is True
+    loaded = dict_to_graph(data)
+    assert isinstance(loaded, DiGraph)
+    assert loaded.edges() == dependencies.edges()
+    undirected = dict_to_graph({"nodes": data["nodes"], "edges": data["edges"]})
+    assert graph_fingerprint(undirected) != graph_fingerprint(loaded)
+
+
+# ============================================================================
+# Parcours et chemins
+# ============================================================================
+
+@pytest.mark.avance
+def test_traversals_follow_arcs(dependencies):
+    """DFS, BFS et reachable_from suivent le sens des arcs."""
+    assert dfs(dependencies, "D") == ["D", "E"]
+    assert bfs(dependencies, "A") == ["A", "B", "C", "D", "E"]
+    assert bfs_direction_optimizing(dependencies, "A") == bfs(dependencies, "A")
+    assert reachable_from(dependencies, "E") == {"D", "E"}
+
+
+@pytest.mark.avance
+def test_paths_follow_arcs(dependencies):
+    """Chemins orientés : C → A existe, A → C passe par B."""
+    assert bfs_path(dependencies, "C", "A") == ["C", "A"]
+    assert shortest_path(dependencies, "A", "C") == ["A", "B", "C"]
+    assert bfs_path(dependencies, "D", "A") is None
+    dependencies.add_edge("A", "C", 10)
+    assert dijkstra_path(dependencies, "A", "C") == ["A", "B", "C"]
+
+
+@pytest.mark.avance
+def test_weak_connectivity(dependencies):
+    """connected_components / is_connected ignorent le sens des arcs."""
+    assert connected_components(dependencies) == [["A", "B", "C", "D", "E"], ["F"]]
+    assert not is_connected(dependencies)
+    dependencies.add_edge("F", "A")
+    assert is_connected(dependencies)
+
+
+@pytest.mark.avance
+def test_induced_subgraph_keeps_direction(dependencies):
+    """Le sous-graphe induit d'un DiGraph est un DiGraph."""
+    sub = induced_subgraph(dependencies, {"A", "B", "C"})
+    assert isinstance(sub, DiGraph)
+    assert sub.edges() == [("A", "B"), ("B", "C"), ("C", "A")]
+
+
+# ============================================================================
+# Composantes fortement connexes
+# ============================================================================
+
+@pytest.mark.avance
+def test_scc_dependencies(dependencies):
+    """Cycles regroupés, dans l'ordre topologique inverse."""
+    assert strongly_connected_components(dependencies) == [["D", "E"], ["A", "B", "C"], ["F"]]
+
+
+@pytest.mark.avance
+def test_scc_undirected_equals_components(disconnected_graph):
+    """Sur un Graph non orienté, SCC = composantes connexes."""
+    assert sorted(strongly_connected_components(disconnected_graph)) == \
+        connected_components(disconnected_graph)
+
+
+@pytest.mark.avance
+@pytest.mark.parametrize("seed", range(8))
+def test_scc_matches_mutual_reachability(seed):
+    """Même composante ⇔ chacun atteint l'autre ; ordre topologique inverse."""
+    g = random_digraph(seed)
+    components = strongly_connected_components(g)
+    assert sorted(n for c in components for n in c) == g.nodes()
+    reach = {node: reachable_from(g, node) for node in g.nodes()}
+    rank = {node: i for i, c in enumerate(components) for node in c}
+    for a in g.nodes():
+        for b in g.nodes():
+            mutual = b in reach[a] and a in reach[b]
+            assert mutual == (rank[a] == rank[b])
+    for a, b in g.edges():
+        assert rank[b] <= rank[a]
+
+
+@pytest.mark.avance
+def test_scc_long_cycle_without_recursion():
+    """Un cycle de 100 000 nœuds ne dépasse pas la limite de récursion."""
+    n = 100_000
+    g = DiGraph()
+    for i in range(n):
+        g.add_edge(f"v{i:06d}", f"v{(i + 1) % n:06d}")
+    components = strongly_connected_components(g)
+    assert len(components) == 1
+    assert len(components[0]) == n
@@ -0,0 +1,169 @@
+"""
+Tests pour les arêtes pondérées et Dijkstra.
+
+Commandes:
+    pytest tests/test_dijkstra.py -v
+    pytest -m avance
+"""
+
+import itertools
+import math
+import random
+
+import pytest
+from src.app.core import (
+    Graph,
+    dijkstra_distances,
+    dijkstra_path,
+    path_weight,
+    shortest_path,
+)
+from src.app.core.io import dict_to_graph, graph_to_dict
+
+
+@pytest.fixture
+def cities():
+    """Villes de example_graph.json avec leurs distances routières."""
+    g = Graph()
+    g.add_edge("Paris", "Lyon", 465)
+    g.add_edge("Paris", "Lille", 225)
+    g.add_edge("Lyon", "Marseille", 315)
+    g.add_edge("Bordeaux", "Lyon", 555)
+    return g
+
+
+def brute_force_distance(graph: Graph, start: str, goal: str) -> float:
+    """Plus petit poids parmi tous les chemins simples (petits graphes)."""
+    best = math.inf
+    others = [n for n in graph.nodes() if n not in (start, goal)]
+    for size in range(len(others) + 1):
+        for middle in itertools.permutations(others, size):
+            path = [start, *middle, goal] if start != goal else [start]
+            if all(graph.has_edge(a, b) for a, b in zip(path, path[1:])):
+                best = min(best, path_weight(graph, path))
+    return best
+
+
+# ============================================================================
+# Poids dans Graph
+# ============================================================================
+
+@pytest.mark.avance
+def test_weight_default_and_explicit():
+    """Sans poids explicite, une arête vaut 1 et le graphe n'est pas pondéré."""
+    g = Graph()
+    g.add_edge("A", "B")
+    assert g.weight("A", "B") == 1
+    assert not g.is_weighted()
+    g.add_edge("B", "C", 2.5)
+    assert g.weight("C", "B") == 2.5
+    assert g.is_weighted()
+    assert g.weighted_neighbors("B") == [("A", 1), ("C", 2.5)]
+
+
+@pytest.mark.avance
+def test_weight_update_and_removal():
+    """Mettre à jour ou supprimer une arête met à jour les poids."""
+    g = Graph()
+    g.add_edge("A", "B", 3)
+    version = g.version
+    g.add_edge("B", "A", 4)
+    assert g.weight("A", "B") == 4
+    assert g.version != version
+    g.remove_edge("A", "B")
+    assert not g.is_weighted()
+    g.add_edge("A", "C", 1)
+    g.remove_node("C")
+    assert not g.is_weighted()
+
+
+@pytest.mark.avance
+def test_invalid_weight():
+    """Poids négatif ou non numérique : erreur, graphe inchangé."""
+    g = Graph()
+    with pytest.raises(ValueError):
+        g.add_edge("A", "B", -1)
+    with pytest.raises(TypeError):
+        g.add_edge("A", "B", "loin")
+    assert len(g) == 0
+
+
+# ============================================================================
+# Dijkstra
+# ============================================================================
+
+@pytest.mark.avance
+def test_dijkstra_distances(cities):
+    """Distances pondérées depuis Paris."""
+    assert dijkstra_distances(cities, "Paris") == {
+        "Paris": 0,
+        "Lille": 225,
+        "Lyon": 465,
+        "Marseille": 780,
+        "Bordeaux": 1020,
+    }
+
+
+@pytest.mark.avance
+def test_dijkstra_prefers_lighter_path():
+    """Un chemin plus long en arêtes mais plus léger est préféré."""
+    g = Graph()
+    g.add_edge("A", "B", 1)
+    g.add_edge("B", "C", 1)
+    g.add_edge("A", "C", 5)
+    assert dijkstra_path(g, "A", "C") == ["A", "B", "C"]
+
+
+@pytest.mark.avance
+def test_dijkstra_unreachable_and_errors(cities):
+    """Nœud non atteignable : None ; nœud inexistant : ValueError."""
+    cities.add_node("Brest")
+    assert dijkstra_path(cities, "Paris", "Brest") is None
+    assert "Brest" not in dijkstra_distances(cities, "Paris")
+    with pytest.raises(ValueError):
+        dijkstra_path(cities, "Paris", "Nantes")
+
+
+@pytest.mark.avance
+@pytest.mark.parametrize("seed", range(10))
+def test_dijkstra_matches_brute_force(seed):
+    """Sur de petits graphes aléatoires, Dijkstra trouve le poids optimal."""
+    rng = random.Random(seed)
+    g = Graph()
+    for _ in range(12):
+        g.add_edge(rng.choice("ABCDEF"), rng.choice("ABCDEF"), rng.randint(1, 9))
+    start, goal = sorted(g.nodes())[0], sorted(g.nodes())[-1]
+    expected = brute_force_distance(g, start, goal)
+    path = dijkstra_path(g, start, goal)
+    assert path_weight(g, path) == expected
+    assert dijkstra_distances(g, start).get(goal, math.inf) == expected
+
+
+@pytest.mark.avance
+def test_shortest_path_dispatches_on_weights(cities):
+    """shortest_path utilise Dijkstra dès que le graphe est pondéré."""
+    cities.add_edge("Bordeaux", "Paris", 585)
+    assert shortest_path(cities, "Bordeaux", "Marseille") == ["Bordeaux", "Lyon", "Marseille"]
+    cities.add_edge("Bordeaux", "Marseille", 2000)
+    assert shortest_path(cities, "Bordeaux", "Marseille") == ["Bordeaux", "Lyon", "Marseille"]
+
+
+# ============================================================================
+# Format JSON pondéré
+# ============================================================================
+
+@pytest.mark.avance
+def test_weighted_json_roundtrip(cities):
+    """Les poids survivent à graph_to_dict / dict_to_graph."""
+    data = graph_to_dict(cities)
+    assert ["Lyon", "Paris", 465] in data["edges"]
+    loaded = dict_to_graph(data)
+    assert loaded.weight("Paris", "Lyon") == 465
+    assert dijkstra_distances(loaded, "Paris") == dijkstra_distances(cities, "Paris")
+
+
+@pytest.mark.avance
+def test_weighted_json_invalid_weight():
+    """Un poids non numérique est refusé."""
+    with pytest.raises(ValueError):
+        dict_to_graph({"nodes": ["A", "B"], "edges": [["A", "B", "x"]]})
@@ -0,0 +1,145 @@
+"""
+Tests pour le diamètre, le rayon et les excentricités (core/eccentricity.py).
+
+Commandes:
+    pytest tests/test_eccentricity.py -v
+    pytest -m avance
+"""
+
+import random
+
+import pytest
+from src.app.core import (
+    DiGraph,
+    Graph,
+    bfs_path,
+    connected_components,
+    diameter,
+    diameter_bounds,
+    eccentricity_bounds,
+    radius_bounds,
+    reachable_from,
+)
+from src.app.core.eccentricity import format_bounds
+
+
+def random_graph(seed: int, size: int = 40) -> Graph:
+    rng = random.Random(seed)
+    n = rng.randrange(1, size)
+    names = [f"n{i:02d}" for i in range(n)]
+    g = Graph()
+    for name in names:
+        g.add_node(name)
+    for _ in range(rng.randrange(0, 2 * n)):
+        a, b = rng.choice(names), rng.choice(names)
+        if a != b:
+            g.add_edge(a, b)
+    return g
+
+
+def grid(width: int, height: int) -> Graph:
+    g = Graph()
+    for x in range(width):
+        for y in range(height):
+            if x + 1 < width:
+                g.add_edge(f"{x:02d},{y:02d}", f"{x + 1:02d},{y:02d}")
+            if y + 1 < height:
+                g.add_edge(f"{x:02d},{y:02d}", f"{x:02d},{y + 1:02d}")
+    return g
+
+
+def brute_force_eccentricities(graph: Graph) -> dict[str, int]:
+    """Excentricité par plus courts chemins vers chaque nœud atteignable (petits graphes)."""
+    return {
+        node: max(len(bfs_path(graph, node, other)) - 1 for other in reachable_from(graph, node))
+        for node in graph.nodes()
+    }
+
+
+# ============================================================================
+# Diamètre
+# ============================================================================
+
+@pytest.mark.avance
+def test_diameter_simple_cases(linear_graph):
+    """Ligne, grille, graphe vide et nœud isolé."""
+    assert diameter(linear_graph) == 3
+    assert diameter(grid(6, 4)) == 8
+    assert diameter(Graph()) == 0
+    g = Graph()
+    g.add_node("A")
+    assert diameter(g) == 0
+
+
+@pytest.mark.avance
+def test_diameter_of_disconnected_graph(linear_graph):
+    """Le diamètre est celui de la plus grande composante (en distance)."""
+    linear_graph.add_edge("X", "Y")
+    assert diameter(linear_graph) == 3
+
+
+@pytest.mark.avance
+@pytest.mark.parametrize("seed", range(25))
+def test_diameter_matches_brute_force(seed):
+    """Même diamètre que le maximum des excentricités calculées par BFS."""
+    g = random_graph(seed)
+    assert diameter(g) == max(brute_force_eccentricities(g).values())
+
+
+@pytest.mark.avance
+@pytest.mark.parametrize("seed", range(5))
+def test_zero_budget_gives_valid_bounds(seed):
+    """Budget épuisé : les bornes encadrent toujours le vrai diamètre."""
+    g = random_graph(seed, size=80)
+    low, high = diameter_bounds(g, time_budget=0)
+    assert low <= diameter(g) <= high
+
+
+@pytest.mark.avance
+def test_diameter_rejects_digraph():
+    """Le diamètre suppose des distances symétriques."""
+    g = DiGraph()
+    g.add_edge("A", "B")
+    with pytest.raises(TypeError):
+        diameter(g)
+
+
+# ============================================================================
+# Excentricités et rayon
+# ============================================================================
+
+@pytest.mark.avance
+@pytest.mark.parametrize("seed", range(15))
+def test_eccentricity_bounds_frame_true_values(seed):
+    """Chaque excentricité est encadrée, y compris avec une seule source."""
+    g = random_graph(seed)
+    exact = brute_force_eccentricities(g)
+    bounds = eccentricity_bounds(g, samples=1 + seed % 3, seed=seed)
+    assert bounds.keys() == exact.keys()
+    for node, (low, high) in bounds.items():
+        assert low <= exact[node] <= high
+
+
+@pytest.mark.avance
+def test_enough_samples_give_exact_values(linear_graph):
+    """Si toutes les sources sont échantillonnées, les bornes sont exactes."""
+    bounds = eccentricity_bounds(linear_graph, samples=len(linear_graph))
+    assert bounds == {"A": (3, 3), "B": (2, 2), "C": (2, 2), "D": (3, 3)}
+
+
+@pytest.mark.avance
+@pytest.mark.parametrize("seed", range(10))
+def test_radius_bounds(seed):
+    """Le rayon de la plus grande composante est encadré."""
+    g = random_graph(seed)
+    exact = brute_force_eccentricities(g)
+    largest = max(connected_components(g), key=len)
+    low, high = radius_bounds(g, samples=3, seed=seed)
+    assert low <= min(exact[node] for node in largest) <= high
+
+
+@pytest.mark.avance
+def test_format_bounds():
+    """Valeur exacte seule, sinon l'intervalle."""
+    assert format_bounds((4, 4)) == "4"
+    assert format_bounds((4, 6)) == "entre 4 et 6"
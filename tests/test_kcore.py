@@ -0,0 +1,117 @@
+"""
+Tests pour la décomposition en k-cœurs.
+
+Commandes:
+    pytest tests/test_kcore.py -v
+    pytest -m avance
+"""
+
+import random
+from pathlib import Path
+
+import pytest
+from src.app.core import DiGraph, Graph, core_numbers, k_core
+from src.app.core.io import load_graph
+
+EXAMPLE = Path(__file__).resolve().parents[1] / "example_graph.json"
+
+
+def random_graph(seed: int) -> Graph:
+    rng = random.Random(seed)
+    n = rng.randrange(1, 30)
+    g = Graph()
+    for i in range(n):
+        g.add_node(f"n{i:02d}")
+    for _ in range(rng.randrange(0, 4 * n)):
+        g.add_edge(f"n{rng.randrange(n):02d}", f"n{rng.randrange(n):02d}")
+    return g
+
+
+def brute_force_cores(graph: Graph) -> dict[str, int]:
+    """Pour chaque k, retire itérativement les nœuds de degré < k."""
+    cores = dict.fromkeys(graph.nodes(), 0)
+    k = 1
+    while True:
+        alive = set(graph.nodes())
+        changed = True
+        while changed:
+            changed = False
+            for node in sorted(alive):
+                if len([n for n in graph.neighbors(node) if n in alive and n != node]) < k:
+                    alive.discard(node)
+                    changed = True
+        if not alive:
+            return cores
+        for node in alive:
+            cores[node] = k
+        k += 1
+
+
+@pytest.fixture
+def triangle_with_tail():
+    """Triangle A-B-C, queue C-D-E, nœud isolé F."""
+    g = Graph()
+    for a, b in [("A", "B"), ("B", "C"), ("C", "A"), ("C", "D"), ("D", "E")]:
+        g.add_edge(a, b)
+    g.add_node("F")
+    return g
+
+
+@pytest.mark.avance
+def test_core_numbers(triangle_with_tail):
+    """Triangle : 2 ; queue : 1 ; nœud isolé : 0."""
+    assert core_numbers(triangle_with_tail) == {"A": 2, "B": 2, "C": 2, "D": 1, "E": 1, "F": 0}
+    assert core_numbers(Graph()) == {}
+
+
+@pytest.mark.avance
+def test_k_core_extraction(triangle_with_tail):
+    """Le k-cœur est le sous-graphe induit par les nœuds de nombre de cœur ≥ k."""
+    core = k_core(triangle_with_tail, 2)
+    assert core.nodes() == ["A", "B", "C"]
+    assert len(core.edges()) == 3
+    assert len(k_core(triangle_with_tail, 0)) == 6
+    assert len(k_core(triangle_with_tail, 3)) == 0
+    with pytest.raises(ValueError):
+        k_core(triangle_with_tail, -1)
+
+
+@pytest.mark.avance
+def test_clique_core():
+    """Dans une clique de 5 nœuds, chaque nœud a 4 voisins."""
+    g = Graph()
+    for a in "ABCDE":
+        for b in "ABCDE":
+            if a < b:
+                g.add_edge(a, b)
+    assert set(core_numbers(g).values()) == {4}
+
+
+@pytest.mark.avance
+@pytest.mark.parametrize("seed", range(20))
+def test_matches_brute_force(seed):
+    """Même résultat que l'épluchage naïf (boucles comprises, ignorées)."""
+    g = random_graph(seed)
+    assert core_numbers(g) == brute_force_cores(g)
+
+
+@pytest.mark.avance
+def test_digraph_uses_underlying_graph():
+    """Sur un DiGraph, a → b et b → a ne comptent qu'une fois."""
+    g = DiGraph()
+    for a, b in [("A", "B"), ("B", "A"), ("B", "C"), ("C", "A")]:
+        g.add_edge(a, b)
+    assert core_numbers(g) == {"A": 2, "B": 2, "C": 2}
+    assert k_core(g, 2).has_edge("B", "A")
+
+
+@pytest.mark.avance
+def test_k_core_keeps_weights_and_positions():
+    """Poids et positions (utiles au rendu) survivent à l'extraction."""
+    graph = load_graph(EXAMPLE)
+    core = k_core(graph, 1)
+    assert core.geographic == graph.geographic
+    for node in core.nodes():
+        assert core.position(node) == graph.position(node)
+    for a, b in core.edges():
+        assert core.weight(a, b) == graph.weight(a, b)
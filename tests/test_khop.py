@@ -0,0 +1,125 @@
+"""
+Tests pour les parcours à profondeur limitée et le voisinage à k sauts.
+
+Commandes:
+    pytest tests/test_khop.py -v
+    pytest -m avance
+"""
+
+import random
+
+import pytest
+from src.app.core import (
+    Graph,
+    bfs,
+    bfs_limited,
+    dfs_limited,
+    k_hop_neighborhood,
+    induced_subgraph,
+)
+
+
+def distances(graph: Graph, start: str) -> dict[str, int]:
+    """Distances en nombre d'arêtes (référence, via bfs)."""
+    dist = {start: 0}
+    for node in bfs(graph, start):
+        for neighbor in graph.neighbors(node):
+            dist.setdefault(neighbor, dist[node] + 1)
+    return dist
+
+
+@pytest.fixture
+def random_graph():
+    rng = random.Random(7)
+    g = Graph()
+    for _ in range(150):
+        g.add_edge(f"n{rng.randrange(60):02d}", f"n{rng.randrange(60):02d}")
+    return g
+
+
+# ============================================================================
+# bfs_limited / k_hop_neighborhood
+# ============================================================================
+
+@pytest.mark.avance
+def test_bfs_limited_linear(linear_graph):
+    """La profondeur borne le nombre d'arêtes depuis le départ."""
+    assert bfs_limited(linear_graph, "A", 0) == ["A"]
+    assert bfs_limited(linear_graph, "A", 2) == ["A", "B", "C"]
+    assert bfs_limited(linear_graph, "A", 10) == ["A", "B", "C", "D"]
+
+
+@pytest.mark.avance
+@pytest.mark.parametrize("k", range(5))
+def test_bfs_limited_is_bfs_prefix(random_graph, k):
+    """Le résultat est le préfixe de bfs() des nœuds à distance ≤ k."""
+    start = random_graph.nodes()[0]
+    dist = distances(random_graph, start)
+    expected = [node for node in bfs(random_graph, start) if dist[node] <= k]
+    assert bfs_limited(random_graph, start, k) == expected
+
+
+@pytest.mark.avance
+def test_k_hop_neighborhood(cyclic_graph):
+    """Voisinage à 1 saut dans un cycle A-B-C-D-A."""
+    assert k_hop_neighborhood(cyclic_graph, "A", 1) == {"A", "B", "D"}
+    assert k_hop_neighborhood(cyclic_graph, "A", 2) == {"A", "B", "C", "D"}
+
+
+@pytest.mark.avance
+def test_limited_invalid_arguments(linear_graph):
+    """Départ inexistant ou profondeur négative : ValueError."""
+    with pytest.raises(ValueError):
+        bfs_limited(linear_graph, "X", 1)
+    with pytest.raises(ValueError):
+        dfs_limited(linear_graph, "A", -1)
+
+
+# ============================================================================
+# dfs_limited
+# ============================================================================
+
+@pytest.mark.avance
+def test_dfs_limited_order(diamond_graph):
+    """Ordre DFS (voisins alphabétiques) tant que la borne n'intervient pas."""
+    assert dfs_limited(diamond_graph, "A", 5) == ["A", "B", "D", "C"]
+
+
+@pytest.mark.avance
+def test_dfs_limited_revisits_shallower():
+    """Un nœud atteint d'abord trop profond est ré-étendu depuis un chemin court."""
+    g = Graph()
+    g.add_edge("A", "B")
+    g.add_edge("B", "C")
+    g.add_edge("A", "C")
+    g.add_edge("C", "D")
+    assert dfs_limited(g, "A", 2) == ["A", "B", "C", "D"]
+
+
+@pytest.mark.avance
+@pytest.mark.parametrize("k", range(5))
+def test_dfs_limited_covers_k_hop(random_graph, k):
+    """dfs_limited visite exactement le voisinage à k sauts, sans doublon."""
+    start = random_graph.nodes()[0]
+    result = dfs_limited(random_graph, start, k)
+    assert len(result) == len(set(result))
+    assert set(result) == k_hop_neighborhood(random_graph, start, k)
+
+
+# ============================================================================
+# induced_subgraph
+# ============================================================================
+
+@pytest.mark.avance
+def test_induced_subgraph(complete_graph):
+    """Sous-graphe induit : nœuds gardés et arêtes entre eux seulement."""
+    sub = induced_subgraph(complete_graph, {"A", "B", "C"})
+    assert sub.nodes() == ["A", "B", "C"]
+    assert sub.edges() == [("A", "B"), ("A", "C"), ("B", "C")]
+
+
+@pytest.mark.avance
+def test_induced_subgraph_of_neighborhood(linear_graph):
+    """Combinaison voisinage + sous-graphe induit."""
+    sub = induced_subgraph(linear_graph, k_hop_neighborhood(linear_graph, "B", 1))
+    assert sub.edges() == [("A", "B"), ("B", "C")]
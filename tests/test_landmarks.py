@@ -0,0 +1,151 @@
+"""
+Tests pour l'oracle de distances par repères (core/landmarks.py).
+
+Commandes:
+    pytest tests/test_landmarks.py -v
+    pytest -m avance
+"""
+
+import json
+import math
+import random
+
+import pytest
+from src.app.core import DistanceOracle, Graph, LandmarkIndex, bfs_path, save_graph
+from src.app.core.landmarks import INDEX_SUFFIX
+
+
+@pytest.fixture
+def random_graph():
+    """Graphe aléatoire à plusieurs composantes."""
+    rng = random.Random(3)
+    g = Graph()
+    for i in range(80):
+        g.add_node(f"n{i:02d}")
+    for _ in range(110):
+        g.add_edge(f"n{rng.randrange(80):02d}", f"n{rng.randrange(80):02d}")
+    return g
+
+
+# ============================================================================
+# Bornes
+# ============================================================================
+
+@pytest.mark.avance
+def test_bounds_on_linear_graph(linear_graph):
+    """Avec un repère à une extrémité, les bornes sont exactes sur une ligne."""
+    index = LandmarkIndex.build(linear_graph, count=2)
+    assert index.bounds("A", "D") == (3, 3)
+    assert index.lower_bound("B", "C") == 1
+
+
+@pytest.mark.avance
+def test_bounds_frame_true_distance(random_graph):
+    """borne inférieure ≤ distance ≤ borne supérieure pour toutes les paires."""
+    index = LandmarkIndex.build(random_graph, count=4)
+    nodes = random_graph.nodes()
+    for a in nodes[::7]:
+        for b in nodes[::5]:
+            path = bfs_path(random_graph, a, b)
+            lower, upper = index.bounds(a, b)
+            if path is None:
+                assert lower == math.inf
+            else:
+                assert lower <= len(path) - 1 <= upper
+
+
+@pytest.mark.avance
+def test_compact_tables(random_graph):
+    """Tables sur 16 bits : 2 octets par nœud et par repère."""
+    index = LandmarkIndex.build(random_graph, count=4)
+    assert index.memory_bytes() == 2 * len(random_graph) * len(index.landmarks)
+
+
+# ============================================================================
+# Distances exactes (ALT)
+# ============================================================================
+
+@pytest.mark.avance
+def test_oracle_matches_bfs_path(random_graph):
+    """Distance et chemin de même longueur que bfs_path()."""
+    oracle = DistanceOracle(random_graph, landmarks=4)
+    nodes = random_graph.nodes()
+    for a in nodes[::9]:
+        for b in nodes[::4]:
+            expected = bfs_path(random_graph, a, b)
+            path = oracle.shortest_path(a, b)
+            if expected is None:
+                assert path is None
+                assert oracle.distance(a, b) is None
+            else:
+                assert len(path) == len(expected)
+                assert path[0] == a and path[-1] == b
+                assert all(random_graph.has_edge(x, y) for x, y in zip(path, path[1:]))
+                assert oracle.distance(a, b) == len(expected) - 1
+
+
+@pytest.mark.avance
+def test_oracle_unknown_node(linear_graph):
+    """Nœud inexistant : ValueError, comme shortest_path()."""
+    with pytest.raises(ValueError):
+        DistanceOracle(linear_graph).distance("A", "X")
+
+
+@pytest.mark.avance
+def test_oracle_rebuilds_after_mutation(linear_graph):
+    """L'index est reconstruit paresseusement quand le graphe change."""
+    oracle = DistanceOracle(linear_graph, landmarks=2)
+    assert oracle.distance("A", "D") == 3
+    first = oracle.index
+    linear_graph.add_edge("A", "D")
+    assert oracle.distance("A", "D") == 1
+    assert oracle.index is not first
+
+
+# ============================================================================
+# Persistance à côté du fichier du graphe
+# ============================================================================
+
+@pytest.mark.avance
+def test_index_saved_next_to_graph(random_graph, tmp_path):
+    """L'index est écrit à côté du graphe puis relu à l'identique."""
+    graph_file = tmp_path / "villes.json"
+    save_graph(random_graph, graph_file)
+    oracle = DistanceOracle.for_file(random_graph, graph_file, landmarks=3)
+    built = oracle.index
+    index_file = tmp_path / ("villes" + INDEX_SUFFIX)
+    assert index_file.exists()
+
+    loaded = LandmarkIndex.load(index_file, random_graph)
+    assert loaded.landmarks == built.landmarks
+    assert loaded.tables == built.tables
+
+
+@pytest.mark.avance
+def test_stale_index_file_is_rejected(linear_graph, tmp_path):
+    """Un index d'un autre graphe est refusé au chargement, puis reconstruit."""
+    index_file = tmp_path / ("g" + INDEX_SUFFIX)
+    LandmarkIndex.build(linear_graph, count=2).save(index_file)
+    linear_graph.add_edge("D", "E")
+    with pytest.raises(ValueError):
+        LandmarkIndex.load(index_file, linear_graph)
+
+    oracle = DistanceOracle(linear_graph, landmarks=2, index_path=index_file)
+    assert oracle.distance("A", "E") == 4
+    assert LandmarkIndex.load(index_file, linear_graph).fingerprint == oracle.index.fingerprint
+
+
+@pytest.mark.avance
+def test_incomplete_header_is_rejected(linear_graph, tmp_path):
+    """Un en-tête sans une des clés attendues lève ValueError, puis l'index est reconstruit."""
+    index_file = tmp_path / ("g" + INDEX_SUFFIX)
+    LandmarkIndex.build(linear_graph, count=2).save(index_file)
+    magic, header, tables = index_file.read_bytes().split(b"\n", 2)
+    header = json.loads(header)
+    del header["byteorder"]
+    index_file.write_bytes(magic + b"\n" + json.dumps(header).encode() + b"\n" + tables)
+    with pytest.raises(ValueError, match="en-tête invalide"):
+        LandmarkIndex.load(index_file, linear_graph)
+
+    oracle = DistanceOracle(linear_graph, landmarks=2, index_path=index_file)
+    assert oracle.distance("A", "D") == 3
@@ -0,0 +1,167 @@
+"""
+Tests pour la disposition par forces (ui/layout.py).
+
+Commandes:
+    pytest tests/test_layout.py -v
+    pytest -m avance
+"""
+
+import math
+import random
+
+import pytest
+from src.app.core import Graph
+from src.app.ui import layout
+from src.app.ui.layout import ForceLayout, force_layout, incremental_layout
+from src.app.ui.render import NODE_RADIUS
+
+
+def grid(side):
+    g = Graph()
+    for i in range(side):
+        for j in range(side):
+            g.add_node(f"{i}-{j}")
+            if i:
+                g.add_edge(f"{i}-{j}", f"{i - 1}-{j}")
+            if j:
+                g.add_edge(f"{i}-{j}", f"{i}-{j - 1}")
+    return g
+
+
+def edge_ratio(g, positions):
+    """Longueur moyenne des arêtes / distance moyenne entre deux nœuds."""
+    edges = g.edges()
+    nodes = g.nodes()
+    mean_edge = sum(math.dist(positions[a], positions[b]) for a, b in edges) / len(edges)
+    pairs = [(a, b) for a in nodes for b in nodes if a < b]
+    mean_pair = sum(math.dist(positions[a], positions[b]) for a, b in pairs) / len(pairs)
+    return mean_edge / mean_pair
+
+
+@pytest.mark.avance
+def test_positions_fit_the_canvas(simple_graph):
+    positions = force_layout(simple_graph, width=800, height=600, iterations=20)
+    assert set(positions) == set(simple_graph.nodes())
+    for x, y in positions.values():
+        assert NODE_RADIUS - 1e-9 <= x <= 800 - NODE_RADIUS + 1e-9
+        assert NODE_RADIUS - 1e-9 <= y <= 600 - NODE_RADIUS + 1e-9
+
+
+@pytest.mark.avance
+def test_small_and_empty_graphs():
+    assert force_layout(Graph()) == {}
+    g = Graph()
+    g.add_node("A")
+    assert force_layout(g) == {"A": (400, 300)}
+
+
+@pytest.mark.avance
+def test_same_seed_same_layout(simple_graph):
+    assert force_layout(simple_graph, seed=3) == force_layout(simple_graph, seed=3)
+
+
+@pytest.mark.avance
+def test_neighbors_end_up_close():
+    """Sur une grille, les arêtes deviennent bien plus courtes que la distance moyenne."""
+    g = grid(8)
+    before = edge_ratio(g, force_layout(g, iterations=0, vectorized=False))
+    after = edge_ratio(g, force_layout(g, iterations=150, vectorized=False))
+    assert after < 0.35 < before
+
+
+@pytest.mark.avance
+def test_exact_repulsion_with_zero_theta():
+    """theta = 0 : la répulsion Barnes-Hut est le calcul exact sur toutes les paires."""
+    rng = random.Random(1)
+    xs = [rng.uniform(0, 10) for _ in range(60)]
+    ys = [rng.uniform(0, 10) for _ in range(60)]
+    fx, fy = layout._forces_python(xs, ys, [], 0.0)
+    for v in range(60):
+        ex = -layout.GRAVITY * xs[v] + sum((xs[v] - xs[u]) / ((xs[v] - xs[u]) ** 2 + (ys[v] - ys[u]) ** 2)
+                                           for u in range(60) if u != v)
+        assert fx[v] == pytest.approx(ex)
+
+
+@pytest.mark.avance
+def test_vectorized_matches_python():
+    """Les deux implémentations calculent les mêmes forces, donc la même disposition."""
+    pytest.importorskip("numpy")
+    rng = random.Random(2)
+    g = Graph()
+    for i in range(300):
+        g.add_edge(f"N{i}", f"N{rng.randrange(300)}")
+    slow = force_layout(g, iterations=5, vectorized=False)
+    fast = force_layout(g, iterations=5, vectorized=True)
+    for node in g.nodes():
+        assert fast[node] == pytest.approx(slow[node], abs=1e-6)
+
+
+@pytest.mark.avance
+def test_time_budget_stops_early():
+    g = grid(15)
+    positions = force_layout(g, iterations=10_000, time_budget=0.05)
+    assert len(positions) == len(g)
+
+
+@pytest.mark.avance
+def test_invalid_arguments(simple_graph, monkeypatch):
+    with pytest.raises(ValueError):
+        force_layout(simple_graph, iterations=-1)
+    with pytest.raises(ValueError):
+        force_layout(simple_graph, theta=-0.5)
+    monkeypatch.setattr(layout, "HAS_NUMPY", False)
+    with pytest.raises(RuntimeError):
+        force_layout(simple_graph, vectorized=True)
+
+
+@pytest.mark.avance
+def test_stepper_matches_force_layout(simple_graph):
+    """ForceLayout itération par itération donne la même disposition que force_layout()."""
+    stepper = ForceLayout(simple_graph, iterations=25, seed=4)
+    snapshots = []
+    while stepper.step():
+        snapshots.append(stepper.positions())
+    assert stepper.done == stepper.total == len(snapshots) == 25
+    assert not stepper.step()
+    assert snapshots[-1] == force_layout(simple_graph, iterations=25, seed=4)
+    assert ForceLayout(Graph()).total == 0
+
+
+@pytest.mark.avance
+def test_incremental_places_new_node_near_neighbor():
+    """Le nouveau nœud est placé près de son voisin ; seul le voisinage bouge."""
+    g = grid(10)
+    positions = force_layout(g, iterations=100, vectorized=False)
+    g.add_edge("new", "5-5")
+    moved = incremental_layout(g, positions, ["new", "5-5"])
+    k = sorted(math.dist(positions[a], positions[b]) for a, b in grid(10).edges())[90]
+    assert set(moved) == {"new", "5-5", *g.neighbors("5-5")}
+    assert math.dist(moved["new"], moved["5-5"]) < 2 * k
+    for node in moved.keys() - {"new"}:
+        assert math.dist(moved[node], positions[node]) <= layout.MAX_SHIFT * k + 1e-9
+
+
+@pytest.mark.avance
+def test_incremental_new_component_in_free_space():
+    """Des nœuds sans voisin placé vont dans un espace libre, sans chevauchement."""
+    g = Graph()
+    positions = {}
+    for i in range(5):
+        g.add_node(f"N{i}")
+        positions.update(incremental_layout(g, positions, [f"N{i}"], center=(400, 300)))
+    assert set(positions) == set(g.nodes())
+    assert positions["N0"] == (400, 300)
+    for a in positions:
+        for b in positions:
+            if a < b:
+                assert math.dist(positions[a], positions[b]) >= layout.SPACING * (1 - layout.MAX_SHIFT) - 1e-9
+    g.add_edge("P", "Q")
+    g.add_edge("Q", "R")
+    moved = incremental_layout(g, positions)
+    assert set(moved) == {"P", "Q", "R"}
+
+
+@pytest.mark.avance
+def test_incremental_unknown_node(simple_graph):
+    with pytest.raises(ValueError):
+        incremental_layout(simple_graph, {}, ["Z"])
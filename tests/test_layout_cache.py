@@ -0,0 +1,97 @@
+"""
+Tests pour le cache des dispositions sur disque (ui/layout_cache.py).
+
+Commandes:
+    pytest tests/test_layout_cache.py -v
+    pytest -m avance
+"""
+
+import json
+import os
+import time
+
+import pytest
+from src.app.core import Graph
+from src.app.ui.layout import force_layout, incremental_layout
+from src.app.ui.layout_cache import LayoutCache
+
+from .test_layout import grid
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return LayoutCache(tmp_path / "layouts")
+
+
+@pytest.mark.avance
+def test_exact_hit_returns_saved_positions(cache):
+    g = grid(6)
+    positions = force_layout(g, iterations=10, vectorized=False)
+    assert cache.load(g) is None
+    cache.save(g, positions)
+    assert cache.load(grid(6)) == (positions, True)    # même structure, autre objet
+
+
+@pytest.mark.avance
+def test_partial_reuse_for_same_source(cache, tmp_path):
+    g = grid(10)
+    positions = force_layout(g, iterations=10, vectorized=False)
+    cache.save(g, positions, source=tmp_path / "grille.json")
+    g.add_edge("new", "5-5")
+    g.remove_node("0-0")
+    assert cache.load(g) is None
+    assert cache.load(g, source=tmp_path / "autre.json") is None
+    reused, exact = cache.load(g, source=tmp_path / "grille.json")
+    assert not exact
+    assert reused == {node: positions[node] for node in g.nodes() if node != "new"}
+    reused.update(incremental_layout(g, reused))
+    assert set(reused) == set(g.nodes())
+    
+    # Trop de nœuds nouveaux : rien n'est repris
+    for i in range(30):
+        g.add_node(f"extra{i}")
+    assert cache.load(g, source=tmp_path / "grille.json") is None
+
+
+@pytest.mark.avance
+def test_eviction_by_age_and_size(cache):
+    graphs = [grid(side) for side in (3, 4, 5)]
+    paths = [cache.save(g, force_layout(g, iterations=1, vectorized=False)) for g in graphs]
+    now = time.time()
+    os.utime(paths[0], (now - 2 * cache.max_age, now - 2 * cache.max_age))
+    os.utime(paths[1], (now - 60, now - 60))
+    assert cache.evict() == 1
+    assert not paths[0].exists() and paths[1].exists()
+    
+    cache.max_bytes = paths[2].stat().st_size
+    assert cache.evict() == 1
+    assert not paths[1].exists() and paths[2].exists()
+
+
+@pytest.mark.avance
+def test_invalid_entries(cache):
+    g = grid(3)
+    with pytest.raises(ValueError):
+        cache.save(g, {"0-0": (1.0, 2.0)})
+    path = cache.save(g, force_layout(g, iterations=1, vectorized=False))
+    path.write_bytes(path.read_bytes()[:-8])    # tronquée
+    assert cache.load(g) is None
+    assert not path.exists()
+    assert LayoutCache(cache.directory).load(Graph()) is None
+
+
+@pytest.mark.avance
+@pytest.mark.parametrize("line, content", [
+    (1, b'{"nodes": 9, "fingerprint": "x", "source": null}'),    # sans byteorder
+    (1, b'[9, "little"]'),
+    (2, json.dumps([["0-0"]] + [f"{i}-{j}" for i in range(3) for j in range(3)][1:]).encode()),
+])
+def test_invalid_header(cache, tmp_path, line, content):
+    g = grid(3)
+    source = tmp_path / "grille.json"
+    path = cache.save(g, force_layout(g, iterations=1, vectorized=False), source=source)
+    lines = path.read_bytes().split(b"\n", 3)
+    lines[line] = content
+    path.write_bytes(b"\n".join(lines))
+    assert cache.load(g, source=source) is None
+    assert not path.exists()
@@ -0,0 +1,95 @@
+"""
+Tests pour l'index d'atteignabilité (core/reachability.py).
+
+Commandes:
+    pytest tests/test_reachability.py -v
+    pytest -m avance
+"""
+
+import random
+
+import pytest
+from src.app.core import DiGraph, ReachabilityIndex, can_reach, reachable_from
+from src.app.core.reachability import reachability_index
+
+
+def random_digraph(seed: int, n: int = 50) -> DiGraph:
+    """Graphe orienté aléatoire, avec cycles et nœuds isolés."""
+    rng = random.Random(seed)
+    g = DiGraph()
+    for i in range(n):
+        g.add_node(f"n{i:02d}")
+    for _ in range(rng.randrange(30, 100)):
+        g.add_edge(f"n{rng.randrange(n):02d}", f"n{rng.randrange(n):02d}")
+    return g
+
+
+@pytest.fixture
+def dependencies():
+    """A → B → C → A (cycle), C → D → E."""
+    g = DiGraph()
+    for a, b in [("A", "B"), ("B", "C"), ("C", "A"), ("C", "D"), ("D", "E")]:
+        g.add_edge(a, b)
+    return g
+
+
+@pytest.mark.avance
+@pytest.mark.parametrize("method", ["bitset", "intervals"])
+def test_condensation(dependencies, method):
+    """Le cycle A-B-C forme une composante ; le DAG a 3 sommets."""
+    index = ReachabilityIndex(dependencies, method=method)
+    assert index.component_count() == 3
+    assert index.can_reach("B", "A")
+    assert index.can_reach("A", "E")
+    assert not index.can_reach("E", "A")
+    assert index.reachable_from("D") == {"D", "E"}
+
+
+@pytest.mark.avance
+@pytest.mark.parametrize("method", ["bitset", "intervals"])
+@pytest.mark.parametrize("seed", range(6))
+def test_matches_traversal(method, seed):
+    """can_reach et reachable_from identiques à un parcours."""
+    g = random_digraph(seed)
+    index = ReachabilityIndex(g, method=method, seed=seed)
+    for a in g.nodes():
+        expected = reachable_from(g, a)
+        assert index.reachable_from(a) == expected
+        for b in g.nodes():
+            assert index.can_reach(a, b) == (b in expected)
+
+
+@pytest.mark.avance
+def test_auto_method_and_memory(dependencies):
+    """Petit graphe : "auto" choisit la fermeture ; mémoire comptabilisée."""
+    index = ReachabilityIndex(dependencies)
+    assert index.method == "bitset"
+    assert index.memory_bytes() > 0
+    intervals = ReachabilityIndex(dependencies, method="intervals", intervals=2)
+    assert len(intervals.lows) == 2
+    assert intervals.memory_bytes() == 2 * 2 * 3 * intervals.lows[0].itemsize
+    with pytest.raises(ValueError):
+        ReachabilityIndex(dependencies, method="2-hop")
+
+
+@pytest.mark.avance
+def test_can_reach_cached_per_version(dependencies):
+    """L'index partagé est réutilisé, puis reconstruit après modification."""
+    assert not can_reach(dependencies, "E", "A")
+    first = reachability_index(dependencies)
+    assert can_reach(dependencies, "A", "D")
+    assert reachability_index(dependencies) is first
+    dependencies.add_edge("E", "A")
+    assert can_reach(dependencies, "E", "A")
+    assert reachability_index(dependencies) is not first
+    with pytest.raises(ValueError):
+        can_reach(dependencies, "A", "Z")
+
+
+@pytest.mark.avance
+def test_undirected_graph(disconnected_graph):
+    """Sur un Graph non orienté : même composante connexe."""
+    index = ReachabilityIndex(disconnected_graph)
+    assert index.component_count() == 2
+    assert index.can_reach("B", "A")
+    assert not index.can_reach("A", "C")
@@ -0,0 +1,581 @@
+"""
+Tests pour le dessin incrémental (ui/render.py), sur un faux Canvas qui
+enregistre les items : pas besoin d'affichage.
+
+Commandes:
+    pytest tests/test_render.py -v
+    pytest -m avance
+"""
+
+import itertools
+import math
+import random
+
+import pytest
+from src.app.core import DiGraph, Graph
+from src.app.ui.render import (
+    DENSE_TILE_NODES,
+    EDGE_COLOR,
+    EDGE_WIDTH,
+    LABEL_MIN_SCALE,
+    NODE_COLOR,
+    NODE_COLOR_CURRENT,
+    NODE_COLOR_VISITED,
+    PATH_WIDTH,
+    SELECTION_COLOR,
+    THIN_EDGE_WIDTH,
+    GraphView,
+    TraversalPlayer,
+    animate_traversal,
+    auto_layout,
+    draw_graph,
+    highlight_path,
+    view_for,
+)
+from src.app.ui.spatial import GridIndex
+
+
+class FakeCanvas:
+    """Canvas minimal : items en mémoire, compteur d'opérations."""
+    
+    def __init__(self, width=800, height=600):
+        self.width = width
+        self.height = height
+        self.items = {}
+        self.ids = itertools.count(1)
+        self.operations = 0
+        self.pending = {}
+    
+    def _create(self, kind, coords, options):
+        self.operations += 1
+        item = next(self.ids)
+        self.items[item] = {"kind": kind, "coords": list(coords), **options}
+        return item
+    
+    def create_oval(self, *coords, **options):
+        return self._create("oval", coords, options)
+    
+    def create_text(self, *coords, **options):
+        return self._create("text", coords, options)
+    
+    def create_line(self, *coords, **options):
+        return self._create("line", coords, options)
+    
+    def create_rectangle(self, *coords, **options):
+        return self._create("rectangle", coords, options)
+    
+    def delete(self, item):
+        self.operations += 1
+        del self.items[item]
+    
+    def coords(self, item, *coords):
+        self.operations += 1
+        self.items[item]["coords"] = list(coords)
+    
+    def itemconfig(self, item, **options):
+        self.operations += 1
+        self.items[item].update(options)
+    
+    def tag_lower(self, item):
+        self.operations += 1
+    
+    def winfo_width(self):
+        return self.width
+    
+    def winfo_height(self):
+        return self.height
+    
+    def after(self, delay_ms, callback, *args):
+        token = f"after#{len(self.pending)}"
+        self.pending[token] = (callback, args)
+        return token
+    
+    def after_cancel(self, token):
+        del self.pending[token]
+    
+    def run_pending(self):
+        """Exécute les rappels en attente (une étape d'animation)."""
+        pending, self.pending = self.pending, {}
+        for callback, args in pending.values():
+            callback(*args)
+
+
+def fill(canvas, kind):
+    return sorted(item["fill"] for item in canvas.items.values() if item["kind"] == kind)
+
+
+@pytest.fixture
+def canvas():
+    return FakeCanvas()
+
+
+@pytest.mark.avance
+def test_draw_registers_items(canvas, simple_graph):
+    """Un cercle et une étiquette par nœud, un trait par arête."""
+    positions = auto_layout(simple_graph)
+    draw_graph(canvas, simple_graph, positions)
+    view = view_for(canvas)
+    assert len(canvas.items) == view.item_count() == 2 * len(simple_graph) + len(simple_graph.edges())
+    assert set(view.node_items) == set(simple_graph.nodes())
+
+
+@pytest.mark.avance
+def test_redraw_does_not_grow(canvas, simple_graph):
+    """Redessiner et surligner ne crée pas de nouveaux items."""
+    positions = auto_layout(simple_graph)
+    draw_graph(canvas, simple_graph, positions)
+    count = len(canvas.items)
+    for _ in range(5):
+        draw_graph(canvas, simple_graph, positions)
+        highlight_path(canvas, ["A", "B", "C"], positions)
+    assert len(canvas.items) == count
+
+
+@pytest.mark.avance
+def test_edits_touch_only_affected_items(canvas, linear_graph):
+    """Ajouter ou supprimer une arête : une seule opération de création ou de suppression."""
+    positions = {node: (40 * i, 0) for i, node in enumerate("ABCDE")}
+    draw_graph(canvas, linear_graph, positions)
+    view = view_for(canvas)
+    
+    linear_graph.add_edge("A", "D")
+    canvas.operations = 0
+    draw_graph(canvas, linear_graph, positions)
+    assert canvas.operations == 2          # create_line + tag_lower
+    
+    linear_graph.remove_edge("B", "C")
+    canvas.operations = 0
+    draw_graph(canvas, linear_graph, positions)
+    assert canvas.operations == 1
+    assert ("B", "C") not in view.edge_items
+    
+    linear_graph.add_edge("D", "E")
+    draw_graph(canvas, linear_graph, positions)
+    linear_graph.remove_node("A")
+    draw_graph(canvas, linear_graph, positions)
+    assert set(view.node_items) == {"B", "C", "D", "E"}
+    assert len(canvas.items) == view.item_count()
+
+
+@pytest.mark.avance
+def test_moved_node_updates_coordinates(canvas, linear_graph):
+    """Déplacer un nœud met à jour ses items et ses arêtes, sans recréation."""
+    positions = {node: (40 * i, 0) for i, node in enumerate("ABCD")}
+    draw_graph(canvas, linear_graph, positions)
+    view = view_for(canvas)
+    items = set(canvas.items)
+    draw_graph(canvas, linear_graph, {**positions, "B": (40, 100)})
+    assert set(canvas.items) == items
+    assert canvas.items[view.node_items["B"][1]]["coords"] == [40, 100]
+    assert canvas.items[view.edge_items[("A", "B")]]["coords"] == [0, 0, 40, 100]
+
+
+@pytest.mark.avance
+def test_highlight_and_reset_use_itemconfig(canvas, linear_graph):
+    """Surligner change les couleurs ; redessiner les remet par défaut."""
+    positions = auto_layout(linear_graph)
+    draw_graph(canvas, linear_graph, positions)
+    canvas.operations = 0
+    highlight_path(canvas, ["A", "B", "C"], positions)
+    assert canvas.operations == 5          # 2 arêtes + 3 nœuds
+    edge = canvas.items[view_for(canvas).edge_items[("A", "B")]]
+    assert edge["fill"] == NODE_COLOR_VISITED and edge["width"] == PATH_WIDTH
+    
+    canvas.operations = 0
+    draw_graph(canvas, linear_graph, positions)
+    assert canvas.operations == 5
+    assert set(fill(canvas, "oval")) == {NODE_COLOR}
+    assert set(fill(canvas, "line")) == {EDGE_COLOR}
+
+
+@pytest.mark.avance
+def test_animation_steps_are_constant_time(canvas, linear_graph):
+    """Chaque étape recolore au plus deux nœuds ; un nouveau dessin l'arrête."""
+    positions = auto_layout(linear_graph)
+    draw_graph(canvas, linear_graph, positions)
+    animate_traversal(canvas, ["A", "B", "C", "D"], positions)
+    canvas.operations = 0
+    canvas.run_pending()
+    assert canvas.operations == 2
+    assert fill(canvas, "oval").count(NODE_COLOR_CURRENT) == 1
+    
+    draw_graph(canvas, linear_graph, positions)
+    assert canvas.pending == {}
+    assert set(fill(canvas, "oval")) == {NODE_COLOR}
+
+
+@pytest.mark.avance
+def test_switching_to_digraph_redraws_arrows(canvas, linear_graph):
+    """Passer à un graphe orienté redessine les arêtes avec des flèches."""
+    positions = {node: (40 * i, 0) for i, node in enumerate("ABCD")}
+    draw_graph(canvas, linear_graph, positions)
+    g = DiGraph()
+    g.add_edge("B", "A")
+    draw_graph(canvas, g, positions)
+    view = view_for(canvas)
+    assert list(view.edge_items) == [("B", "A")]
+    line = canvas.items[view.edge_items[("B", "A")]]
+    assert line["arrow"] == "last"
+    assert len(canvas.items) == view.item_count() == 5
+
+
+def kinds(canvas):
+    return sorted(item["kind"] for item in canvas.items.values())
+
+
+def grid(side, spacing):
+    """Grille side × side : graphe et positions (espacées de spacing)."""
+    g = Graph()
+    positions = {}
+    for i in range(side):
+        for j in range(side):
+            node = f"{i}-{j}"
+            g.add_node(node)
+            positions[node] = (i * spacing, j * spacing)
+            if i:
+                g.add_edge(node, f"{i - 1}-{j}")
+            if j:
+                g.add_edge(node, f"{i}-{j - 1}")
+    return g, positions
+
+
+@pytest.mark.avance
+def test_only_visible_part_is_drawn(canvas):
+    """Seuls les nœuds dans la fenêtre ont des items ; le déplacement les fait apparaître."""
+    g = Graph()
+    g.add_edge("A", "B")
+    g.add_node("C")
+    positions = {"A": (100, 100), "B": (200, 100), "C": (3000, 100)}
+    draw_graph(canvas, g, positions)
+    view = view_for(canvas)
+    assert set(view.node_items) == {"A", "B"}
+    view.pan(-2800, 0)
+    assert set(view.node_items) == {"C"}
+    assert view.edge_items == {}
+    assert len(canvas.items) == view.item_count() == 2
+
+
+@pytest.mark.avance
+def test_edge_crossing_the_window_is_drawn(canvas):
+    """Une arête dont les deux extrémités sont hors de la fenêtre, mais qui la traverse."""
+    g = Graph()
+    g.add_edge("A", "B")
+    g.add_edge("C", "D")
+    positions = {"A": (-1000, 300), "B": (2000, 300), "C": (-1000, -50), "D": (2000, -50)}
+    draw_graph(canvas, g, positions)
+    view = view_for(canvas)
+    assert view.node_items == {}
+    assert list(view.edge_items) == [("A", "B")]
+
+
+@pytest.mark.avance
+def test_zoom_levels_of_detail(canvas, linear_graph):
+    """Dézoomer retire les étiquettes et amincit les arêtes ; zoomer les rétablit."""
+    positions = {node: (100 + 100 * i, 100) for i, node in enumerate("ABCD")}
+    draw_graph(canvas, linear_graph, positions)
+    view = view_for(canvas)
+    view.zoom(LABEL_MIN_SCALE / 2, 0, 0)
+    assert "text" not in kinds(canvas)
+    assert {item["width"] for item in canvas.items.values() if item["kind"] == "line"} == {THIN_EDGE_WIDTH}
+    assert len(canvas.items) == view.item_count() == 4 + 3
+    
+    view.zoom(2 / LABEL_MIN_SCALE, 0, 0)
+    assert kinds(canvas).count("text") == 4
+    assert {item["width"] for item in canvas.items.values() if item["kind"] == "line"} == {EDGE_WIDTH}
+
+
+@pytest.mark.avance
+def test_zoom_keeps_point_under_cursor(canvas, linear_graph):
+    """Le point sous le pointeur reste immobile pendant le zoom."""
+    positions = {node: (100 + 100 * i, 100) for i, node in enumerate("ABCD")}
+    draw_graph(canvas, linear_graph, positions)
+    view = view_for(canvas)
+    view.zoom(3, 200, 100)
+    assert view.positions["B"] == (200, 100)
+    assert view.positions["C"] == (500, 100)
+
+
+@pytest.mark.avance
+def test_dense_region_becomes_a_tile(canvas):
+    """Une zone trop dense est dessinée comme une tuile, puis détaillée en zoomant."""
+    g = Graph()
+    positions = {}
+    for i in range(4 * DENSE_TILE_NODES):
+        g.add_node(f"N{i}")
+        positions[f"N{i}"] = (100 + i % 8, 100 + i // 8)
+    g.add_edge("N0", "N1")
+    draw_graph(canvas, g, positions)
+    view = view_for(canvas)
+    assert kinds(canvas) == ["rectangle"]
+    assert view.node_items == {} and view.edge_items == {}
+    
+    view.zoom(20, 100, 100)
+    assert view.tile_items == {}
+    assert len(view.node_items) > 0 and ("N0", "N1") in view.edge_items
+    assert len(canvas.items) == view.item_count()
+
+
+@pytest.mark.avance
+def test_styles_apply_to_culled_nodes(canvas):
+    """Un nœud surligné hors de la fenêtre apparaît surligné quand il y entre."""
+    g = Graph()
+    g.add_edge("A", "B")
+    draw_graph(canvas, g, {"A": (100, 100), "B": (2000, 100)})
+    highlight_path(canvas, ["A", "B"], {})
+    view = view_for(canvas)
+    view.pan(-1800, 0)
+    assert canvas.items[view.node_items["B"][0]]["fill"] == NODE_COLOR_VISITED
+    assert canvas.items[view.edge_items[("A", "B")]]["width"] == PATH_WIDTH
+
+
+@pytest.mark.avance
+def test_large_graph_items_are_bounded(canvas):
+    """Sur une grande grille, le nombre d'items dépend de la fenêtre, pas du graphe."""
+    g, positions = grid(150, 40)
+    draw_graph(canvas, g, positions)
+    view = view_for(canvas)
+    assert len(view.node_items) < 21 * 16 + 60
+    view.zoom(0.01)
+    assert view.node_items == {} and len(view.tile_items) > 0
+    assert len(canvas.items) == view.item_count() < 100
+    view.reset_view()
+    canvas.operations = 0
+    view.pan(-40, 0)
+    assert canvas.operations < 3 * len(canvas.items)
+
+
+@pytest.mark.avance
+def test_grid_index_query_matches_scan():
+    """La requête rectangle de la grille donne les mêmes nœuds qu'un parcours complet."""
+    rng = random.Random(3)
+    positions = {f"N{i}": (rng.uniform(-500, 500), rng.uniform(0, 300)) for i in range(2000)}
+    index = GridIndex(positions)
+    for _ in range(50):
+        x0, x1 = sorted(rng.uniform(-700, 700) for _ in range(2))
+        y0, y1 = sorted(rng.uniform(-100, 400) for _ in range(2))
+        expected = {n for n, (x, y) in positions.items() if x0 <= x <= x1 and y0 <= y <= y1}
+        assert set(index.query(x0, y0, x1, y1)) == expected
+    assert GridIndex({}).query(0, 0, 10, 10) == []
+
+
+@pytest.mark.avance
+def test_grid_index_query_partial_cover():
+    """Peu de nœuds, peu de cases : un rectangle qui chevauche les cases du bord ne prend pas tout."""
+    index = GridIndex({"A": (0, 0), "B": (50, 50), "C": (300, 10)})
+    assert index.query(100, 0, 400, 100) == ["C"]
+    assert sorted(index.query(-1, -1, 400, 100)) == ["A", "B", "C"]
+    rng = random.Random(5)
+    for _ in range(20):
+        positions = {f"N{i}": (rng.uniform(0, 500), rng.uniform(0, 500)) for i in range(12)}
+        index = GridIndex(positions)
+        x0, x1 = sorted(rng.uniform(-100, 600) for _ in range(2))
+        y0, y1 = sorted(rng.uniform(-100, 600) for _ in range(2))
+        expected = {n for n, (x, y) in positions.items() if x0 <= x <= x1 and y0 <= y <= y1}
+        assert set(index.query(x0, y0, x1, y1)) == expected
+
+
+@pytest.mark.avance
+def test_grid_index_add_and_move():
+    """L'index reste exact après des ajouts et des déplacements."""
+    rng = random.Random(4)
+    index = GridIndex({f"N{i}": (rng.uniform(0, 100), rng.uniform(0, 100)) for i in range(200)})
+    for i in range(50):
+        index.add(f"M{i}", rng.uniform(-300, 300), rng.uniform(-300, 300))
+        index.move(f"N{i}", rng.uniform(-300, 300), rng.uniform(-300, 300))
+    positions = index.positions
+    for _ in range(50):
+        x0, x1 = sorted(rng.uniform(-400, 400) for _ in range(2))
+        y0, y1 = sorted(rng.uniform(-400, 400) for _ in range(2))
+        expected = {n for n, (x, y) in positions.items() if x0 <= x <= x1 and y0 <= y <= y1}
+        assert set(index.query(x0, y0, x1, y1)) == expected
+    assert set(index.query(-1000, -1000, 1000, 1000)) == set(positions)
+
+
+@pytest.mark.avance
+def test_view_update_matches_sync():
+    """update() après un ajout local dessine comme un sync() complet."""
+    g, positions = grid(6, 60)
+    canvas = FakeCanvas()
+    view = GraphView(canvas)
+    view.sync(g, positions)
+    view.pan(-1000, 0)
+    # Arête entre deux nœuds hors de la fenêtre, qui la traverse
+    g.add_edge("X", "0-0")
+    g.add_edge("Y", "5-5")
+    g.add_edge("X", "Y")
+    moved = {**positions, "X": (500, 300), "Y": (2000, 300), "0-0": (10, 10)}
+    view.update(g, moved, ["X", "Y", "0-0", "5-5"])
+    fresh = GraphView(FakeCanvas())
+    fresh.offset = view.offset
+    fresh.sync(g, moved)
+    assert set(view.node_items) == set(fresh.node_items)
+    assert set(view.edge_items) == set(fresh.edge_items)
+    assert ("X", "Y") in view.edge_items
+    for node, items in view.node_items.items():
+        assert canvas.items[items[0]]["coords"] == fresh.canvas.items[fresh.node_items[node][0]]["coords"]
+    assert view.index.query(499, 299, 501, 301) == ["X"]
+
+
+@pytest.mark.avance
+def test_grid_index_nearest_matches_scan():
+    rng = random.Random(5)
+    positions = {f"N{i}": (rng.uniform(0, 1000), rng.uniform(0, 1000)) for i in range(1000)}
+    index = GridIndex(positions)
+    for _ in range(100):
+        x, y, radius = rng.uniform(-50, 1050), rng.uniform(-50, 1050), rng.uniform(1, 60)
+        near = [(math.dist((x, y), p), n) for n, p in positions.items() if math.dist((x, y), p) <= radius]
+        assert index.nearest(x, y, radius) == (min(near)[1] if near else None)
+
+
+@pytest.mark.avance
+def test_hit_testing_follows_zoom_and_pan(canvas):
+    g, positions = grid(10, 50)
+    view = GraphView(canvas)
+    view.sync(g, positions)
+    view.zoom(2, 0, 0)
+    view.pan(-30, 40)
+    x, y = positions["3-4"]
+    sx, sy = x * view.scale + view.offset[0], y * view.scale + view.offset[1]
+    assert view.node_at(sx + 5, sy - 5) == "3-4"
+    assert view.node_at(sx + 50, sy) is None       # entre deux nœuds (100 px à l'écran)
+    selected = view.nodes_in(sx + 150, sy + 150, sx - 10, sy - 10)
+    assert sorted(selected) == sorted(f"{i}-{j}" for i in (3, 4) for j in (4, 5))
+
+
+@pytest.mark.avance
+def test_select_and_drag_node(canvas):
+    """La sélection cercle les nœuds (même dessinés plus tard) ; glisser déplace nœud et arêtes."""
+    g, positions = grid(20, 50)
+    view = GraphView(canvas)
+    view.sync(g, positions)
+    view.select({"0-0", "19-19"})
+    assert canvas.items[view.node_items["0-0"][0]]["outline"] == SELECTION_COLOR
+    assert "19-19" not in view.node_items                # hors de la fenêtre
+    view.pan(-600, -400)
+    assert canvas.items[view.node_items["19-19"][0]]["outline"] == SELECTION_COLOR
+    view.select({"19-19"})
+    view.reset_view()
+    assert canvas.items[view.node_items["0-0"][0]]["outline"] == ""
+    
+    edge = view.edge_items[("0-0", "0-1")]
+    assert view.move_node("0-0", 200, 120) == (200, 120)
+    x0, y0, x1, y1 = canvas.items[view.node_items["0-0"][0]]["coords"]
+    assert ((x0 + x1) / 2, (y0 + y1) / 2) == (200, 120)
+    assert canvas.items[edge]["coords"] == [200, 120, 0, 50]
+    assert view.node_at(200, 120) == "0-0"
+    assert view.node_at(0, 0) is None
+
+
+@pytest.mark.avance
+def test_nodes_in_partial_rectangle(canvas, simple_graph):
+    """Sélection au rectangle sur un petit graphe : seuls les nœuds couverts, zoom compris."""
+    view = GraphView(canvas)
+    view.sync(simple_graph, {"A": (0, 0), "B": (50, 50), "C": (300, 10)})
+    assert view.nodes_in(400, 100, 100, 0) == ["C"]
+    assert sorted(view.nodes_in(-10, -10, 60, 60)) == ["A", "B"]
+    view.zoom(2, 0, 0)
+    assert view.nodes_in(80, 80, 120, 120) == ["B"]
+    assert view.nodes_in(200, 200, 400, 400) == []
+
+
+class FakeClock:
+    """Horloge avancée à la main."""
+    
+    def __init__(self):
+        self.now = 0.0
+    
+    def __call__(self):
+        return self.now
+
+
+def counting(n, consumed):
+    """Générateur de n étapes qui compte celles consommées."""
+    for i in range(n):
+        consumed.append(i)
+        yield f"N{i}"
+
+
+@pytest.mark.avance
+def test_player_batches_steps_per_frame(canvas):
+    """100 000 étapes en 10 s à 30 images/s : ~300 images, une minuterie à la fois."""
+    clock, consumed = FakeClock(), []
+    player = TraversalPlayer(GraphView(canvas), counting(100_000, consumed), duration=10.0,
+                             total=100_000, clock=clock)
+    player.play()
+    frames = 0
+    while player.playing:
+        assert len(canvas.pending) == 1
+        clock.now += 1 / 30
+        canvas.run_pending()
+        frames += 1
+        if frames == 30:
+            assert player.position == pytest.approx(10_000, abs=5)
+            assert len(consumed) == player.position        # consommé au fil de la lecture
+    assert player.finished and player.total == 100_000
+    assert 299 <= frames <= 302
+    assert canvas.pending == {}
+
+
+@pytest.mark.avance
+def test_player_pause_resume_seek_speed(canvas, linear_graph):
+    positions = {node: (40 * i, 0) for i, node in enumerate("ABCD")}
+    draw_graph(canvas, linear_graph, positions)
+    view = view_for(canvas)
+    clock = FakeClock()
+    player = TraversalPlayer(view, iter("ABCD"), rate=1.0, total=4, clock=clock)
+    frames = []
+    player.on_frame = lambda position, total: frames.append(position)
+    player.play()
+    assert player.position == 1
+    
+    player.pause()
+    assert canvas.pending == {}
+    clock.now += 100                                   # le temps en pause ne compte pas
+    player.play()
+    clock.now += 1
+    canvas.run_pending()
+    assert player.position == 2
+    
+    player.seek(4)
+    color = {node: canvas.items[view.node_items[node][0]]["fill"] for node in "ABCD"}
+    assert color == {"A": NODE_COLOR_VISITED, "B": NODE_COLOR_VISITED, "C": NODE_COLOR_VISITED,
+                     "D": NODE_COLOR_CURRENT}
+    player.seek(1)
+    color = {node: canvas.items[view.node_items[node][0]]["fill"] for node in "ABCD"}
+    assert color == {"A": NODE_COLOR_CURRENT, "B": NODE_COLOR, "C": NODE_COLOR, "D": NODE_COLOR}
+    
+    player.speed = 2.0
+    clock.now += 1
+    canvas.run_pending()
+    assert player.position == 3
+    assert frames == [1, 2, 4, 1, 3]
+    with pytest.raises(ValueError):
+        player.speed = 0
+
+
+@pytest.mark.avance
+def test_animation_without_delay(canvas, linear_graph):
+    """delay_ms=0 : tout le parcours dès la première image."""
+    positions = {node: (40 * i, 0) for i, node in enumerate("ABCD")}
+    draw_graph(canvas, linear_graph, positions)
+    view = view_for(canvas)
+    player = animate_traversal(canvas, iter("ABCD"), positions, delay_ms=0)
+    assert player.position == 1
+    canvas.run_pending()
+    assert player.finished and player.total == 4
+    assert canvas.items[view.node_items["D"][0]]["fill"] == NODE_COLOR_VISITED
+    assert canvas.pending == {}
+
+
+@pytest.mark.avance
+def test_player_late_frame_catches_up(canvas):
+    clock = FakeClock()
+    player = TraversalPlayer(GraphView(canvas), [f"N{i}" for i in range(1000)], rate=100.0, clock=clock)
+    player.play()
+    clock.now += 2.0                                   # image très en retard
+    canvas.run_pending()
+    assert player.position == 201
+    clock.now += 20.0
+    canvas.run_pending()
+    assert player.position == 1000 and player.finished
+    assert canvas.pending == {}
@@ -0,0 +1,107 @@
+"""
+Tests pour les statistiques incrémentales (core/stats.py) : après chaque
+modification, elles doivent valoir un recalcul complet.
+
+Commandes:
+    pytest tests/test_stats.py -v
+    pytest -m avance
+"""
+
+import random
+from collections import Counter
+
+import pytest
+from src.app.core import DiGraph, Graph, GraphStats, connected_components, graph_stats
+
+
+def degree(graph: Graph, node: str) -> int:
+    if graph.is_directed():
+        return len(graph.neighbors(node)) + len(graph.predecessors(node))
+    return len(graph.neighbors(node))
+
+
+def from_scratch(graph: Graph) -> dict:
+    """Statistiques recalculées sans rien réutiliser."""
+    degrees = [degree(graph, node) for node in graph.nodes()]
+    n, e = len(graph), len(graph.edges())
+    possible = n * (n - 1) if graph.is_directed() else n * (n - 1) / 2
+    components = len(connected_components(graph))
+    return {
+        'nodes': n,
+        'edges': e,
+        'connected': components <= 1,
+        'components': components,
+        'density': e / possible if n > 1 else 0.0,
+        'degree_histogram': dict(sorted(Counter(degrees).items())),
+        'min_degree': min(degrees, default=0),
+        'max_degree': max(degrees, default=0),
+        'mean_degree': sum(degrees) / n if n else 0.0,
+    }
+
+
+def check(stats: GraphStats, graph: Graph) -> None:
+    summary, expected = stats.summary(), from_scratch(graph)
+    for key in ('density', 'mean_degree'):
+        assert summary.pop(key) == pytest.approx(expected.pop(key))
+    assert summary == expected
+
+
+def mutate(graph: Graph, rng: random.Random, names: int = 15) -> None:
+    """Une modification au hasard (ajouts plus fréquents que suppressions)."""
+    nodes = graph.nodes()
+    action = rng.random()
+    if action < 0.15 or not nodes:
+        graph.add_node(f"n{rng.randrange(names)}")
+    elif action < 0.7:
+        graph.add_edge(f"n{rng.randrange(names)}", rng.choice(nodes))
+    elif action < 0.85 and graph.edges():
+        graph.remove_edge(*rng.choice(graph.edges()))
+    else:
+        graph.remove_node(rng.choice(nodes))
+
+
+@pytest.mark.avance
+@pytest.mark.parametrize("kind", [Graph, DiGraph])
+def test_stats_follow_random_mutations(kind):
+    rng = random.Random(7)
+    for _ in range(20):
+        g = kind()
+        stats = graph_stats(g)
+        for _ in range(60):
+            mutate(g, rng)
+            # Lire les composantes une fois sur deux : l'union-find reste
+            # parfois périmé sur plusieurs modifications
+            if rng.random() < 0.5:
+                check(stats, g)
+        check(stats, g)
+
+
+@pytest.mark.avance
+def test_attached_once_and_initial_state(simple_graph):
+    stats = graph_stats(simple_graph)
+    assert graph_stats(simple_graph) is stats
+    check(stats, simple_graph)
+    assert GraphStats(Graph()).summary()['connected'] is True
+    simple_graph.add_edge("C", "C")     # boucle : degré +1, rien d'autre
+    assert stats.degree_histogram == {1: 1, 2: 2}
+    simple_graph.remove_edge("C", "C")
+    assert stats._valid
+
+
+@pytest.mark.avance
+def test_additions_keep_union_find_valid():
+    """Sans suppression d'arête, les composantes ne sont jamais recalculées."""
+    g = Graph()
+    stats = graph_stats(g)
+    assert stats.components == 0
+    for i in range(200):
+        g.add_node(f"n{i}")
+        assert stats.components == i + 1
+    for i in range(1, 200, 2):
+        g.add_edge(f"n{i - 1}", f"n{i}")
+    g.remove_node("n0")                  # n1 perd son voisin : composantes à recalculer
+    assert not stats._valid
+    assert stats.components == 100
+    g.add_node("isolated")
+    g.remove_node("isolated")
+    assert stats._valid and stats.components == 100
@@ -0,0 +1,120 @@
+"""
+Tests pour le comptage de triangles et le clustering (core/triangles.py).
+
+Commandes:
+    pytest tests/test_triangles.py -v
+    pytest -m avance
+"""
+
+import itertools
+import random
+
+import pytest
+from src.app.core import (
+    DiGraph,
+    Graph,
+    average_clustering,
+    clustering,
+    transitivity,
+    triangle_counts,
+)
+
+
+def random_graph(seed: int) -> Graph:
+    rng = random.Random(seed)
+    n = rng.randrange(1, 25)
+    g = Graph()
+    for i in range(n):
+        g.add_node(f"n{i:02d}")
+    for _ in range(rng.randrange(0, 5 * n)):
+        g.add_edge(f"n{rng.randrange(n):02d}", f"n{rng.randrange(n):02d}")
+    return g
+
+
+def brute_force_triangles(graph: Graph) -> dict[str, int]:
+    """Teste tous les triplets de nœuds distincts."""
+    counts = dict.fromkeys(graph.nodes(), 0)
+    for a, b, c in itertools.combinations(graph.nodes(), 3):
+        if graph.has_edge(a, b) and graph.has_edge(b, c) and graph.has_edge(a, c):
+            for node in (a, b, c):
+                counts[node] += 1
+    return counts
+
+
+@pytest.fixture
+def kite():
+    """
+    Deux triangles partageant l'arête B-C, plus une queue D-E :
+        A - B
+        | / |
+        C - D - E
+    """
+    g = Graph()
+    for a, b in [("A", "B"), ("A", "C"), ("B", "C"), ("B", "D"), ("C", "D"), ("D", "E")]:
+        g.add_edge(a, b)
+    return g
+
+
+@pytest.mark.avance
+def test_kite_counts(kite):
+    """Triangles par nœud, clustering local et global."""
+    assert triangle_counts(kite) == {"A": 1, "B": 2, "C": 2, "D": 1, "E": 0}
+    local = clustering(kite)
+    assert local["A"] == 1.0
+    assert local["B"] == pytest.approx(2 / 3)
+    assert local["D"] == pytest.approx(1 / 3)
+    assert local["E"] == 0.0
+    # 2 triangles, chemins de longueur 2 : 1 + 3 + 3 + 3 + 0
+    assert transitivity(kite) == pytest.approx(6 / 10)
+    assert average_clustering(kite) == pytest.approx((1 + 2 / 3 + 2 / 3 + 1 / 3) / 5)
+
+
+@pytest.mark.avance
+def test_empty_and_triangle_free(linear_graph):
+    """Sans triangle (ou sans nœud), tout vaut 0."""
+    assert triangle_counts(Graph()) == {}
+    assert transitivity(Graph()) == 0.0
+    assert average_clustering(Graph()) == 0.0
+    assert set(triangle_counts(linear_graph).values()) == {0}
+    assert transitivity(linear_graph) == 0.0
+
+
+@pytest.mark.avance
+def test_hub_with_clique():
+    """Un hub relié à une clique : tous les triangles sont trouvés une fois."""
+    g = Graph()
+    leaves = [f"l{i}" for i in range(6)]
+    for a, b in itertools.combinations(leaves, 2):
+        g.add_edge(a, b)
+    for leaf in leaves:
+        g.add_edge("hub", leaf)
+    assert triangle_counts(g)["hub"] == 15
+    assert sum(triangle_counts(g).values()) == 3 * 35
+    assert clustering(g)["hub"] == 1.0
+
+
+@pytest.mark.avance
+@pytest.mark.parametrize("seed", range(20))
+def test_matches_brute_force(seed):
+    """Même résultat que le test de tous les triplets (boucles ignorées)."""
+    g = random_graph(seed)
+    assert triangle_counts(g) == brute_force_triangles(g)
+
+
+@pytest.mark.avance
+def test_digraph_uses_underlying_graph():
+    """Sur un DiGraph, a → b et b → a forment une seule arête."""
+    g = DiGraph()
+    for a, b in [("A", "B"), ("B", "A"), ("B", "C"), ("C", "A")]:
+        g.add_edge(a, b)
+    assert triangle_counts(g) == {"A": 1, "B": 1, "C": 1}
+    assert clustering(g) == {"A": 1.0, "B": 1.0, "C": 1.0}
+
+
+@pytest.mark.avance
+def test_process_pool_matches_single_process():
+    """Répartir les nœuds entre processus ne change pas le résultat."""
+    g = random_graph(4)
+    assert triangle_counts(g, workers=2) == triangle_counts(g)
+    with pytest.raises(ValueError):
+        triangle_counts(g, workers=0)
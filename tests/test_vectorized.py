@@ -0,0 +1,133 @@
+"""
+Tests pour le moteur vectorisé NumPy (core/vectorized.py).
+
+Le moteur doit donner exactement les mêmes résultats que le chemin
+pur Python. Ces tests sont ignorés si NumPy n'est pas installé.
+
+Commandes:
+    pytest tests/test_vectorized.py -v
+    pytest -m avance
+"""
+
+import random
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from src.app.core import (
+    Graph,
+    bfs,
+    connected_components,
+    is_connected,
+    reachable_from,
+)
+from src.app.core import vectorized
+
+
+def random_graph(n: int, edges: int, seed: int) -> Graph:
+    """Graphe aléatoire, souvent non connexe pour edges ≈ n."""
+    rng = random.Random(seed)
+    g = Graph()
+    for i in range(n):
+        g.add_node(f"n{i:03d}")
+    for _ in range(edges):
+        g.add_edge(f"n{rng.randrange(n):03d}", f"n{rng.randrange(n):03d}")
+    return g
+
+
+@pytest.fixture
+def force_vectorized(monkeypatch):
+    """Force la délégation au moteur vectorisé quelle que soit la taille."""
+    monkeypatch.setattr(vectorized, "VECTORIZE_THRESHOLD", 0)
+
+
+# ============================================================================
+# Équivalence avec le chemin pur Python
+# ============================================================================
+
+@pytest.mark.avance
+@pytest.mark.parametrize("seed", range(15))
+def test_vectorized_bfs_matches_python(seed):
+    """Même ordre de visite que bfs()."""
+    g = random_graph(100, 130, seed)
+    start = g.nodes()[seed]
+    assert vectorized.bfs(g, start) == bfs(g, start)
+
+
+@pytest.mark.avance
+@pytest.mark.parametrize("seed", range(15))
+def test_vectorized_reachable_matches_python(seed):
+    """Même ensemble atteignable que reachable_from()."""
+    g = random_graph(100, 90, seed)
+    start = g.nodes()[seed]
+    assert vectorized.reachable_from(g, start) == reachable_from(g, start)
+
+
+@pytest.mark.avance
+@pytest.mark.parametrize("seed", range(15))
+def test_vectorized_components_match_python(seed):
+    """Mêmes composantes, dans le même ordre, que connected_components()."""
+    g = random_graph(100, 80, seed)
+    assert vectorized.connected_components(g) == connected_components(g)
+    assert vectorized.is_connected(g) == is_connected(g)
+
+
+@pytest.mark.avance
+def test_vectorized_long_path():
+    """Composante de grand diamètre (propagation + saut de pointeurs)."""
+    g = Graph()
+    names = [f"n{i:04d}" for i in range(500)]
+    random.Random(0).shuffle(names)
+    for a, b in zip(names, names[1:]):
+        g.add_edge(a, b)
+    assert vectorized.connected_components(g) == [sorted(names)]
+
+
+@pytest.mark.avance
+def test_vectorized_empty_and_isolated():
+    """Graphe vide et nœuds isolés."""
+    assert vectorized.connected_components(Graph()) == []
+    assert vectorized.is_connected(Graph()) is True
+    g = Graph()
+    g.add_node("B")
+    g.add_node("A")
+    assert vectorized.connected_components(g) == [["A"], ["B"]]
+    assert vectorized.bfs(g, "A") == ["A"]
+
+
+# ============================================================================
+# Délégation automatique et instantané CSR
+# ============================================================================
+
+@pytest.mark.avance
+def test_dispatch_above_threshold(force_vectorized, diamond_graph):
+    """Au-delà du seuil, les fonctions publiques passent par le moteur."""
+    assert vectorized.should_vectorize(diamond_graph)
+    assert bfs(diamond_graph, "A") == ["A", "B", "C", "D"]
+    assert reachable_from(diamond_graph, "A") == {"A", "B", "C", "D"}
+    assert is_connected(diamond_graph) is True
+
+
+@pytest.mark.avance
+def test_dispatch_keeps_validation(force_vectorized):
+    """Un départ inexistant lève toujours ValueError."""
+    g = Graph()
+    g.add_node("A")
+    with pytest.raises(ValueError):
+        bfs(g, "X")
+    with pytest.raises(ValueError):
+        reachable_from(g, "X")
+
+
+@pytest.mark.avance
+def test_snapshot_invalidated_on_mutation():
+    """L'instantané CSR est reconstruit quand le graphe change."""
+    g = Graph()
+    g.add_edge("A", "B")
+    first = vectorized.csr_snapshot(g)
+    assert vectorized.csr_snapshot(g) is first
+    g.add_edge("B", "C")
+    second = vectorized.csr_snapshot(g)
+    assert second is not first
+    assert vectorized.bfs(g, "A") == ["A", "B", "C"]